@@ -0,0 +1,467 @@
+"""
+Asyncio front end for the wire protocol APIs (mysql, postgres, mongodb).
+
+Sockets are handled by one event loop: it accepts connections, reads incoming data and frames it into
+protocol messages. Only complete messages are passed to the bounded pool of worker threads, where the usual
+request handler processes them. So idle connections do not hold threads and thousands of them can be kept open.
+
+The server is enabled per API in config:
+    "api": {
+        "mysql": {
+            ...
+            "server": {
+                "type": "async",
+                "max_connections": 4096,  # connections over the limit wait in the listen backlog
+                "idle_timeout": 28800,    # seconds, connection without requests is closed
+                "workers": 32,            # threads which execute queries
+                "read_timeout": 60,       # seconds to wait for the rest of started message
+                "read_buffer_size": 4194304,
+                "write_buffer_size": 1048576
+            }
+        }
+    }
+
+TLS and connections through the cloud gateway are not supported by the async server.
+"""
+import os
+import time
+import socket
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import mindsdb.interfaces.storage.db as db
+from mindsdb.utilities import log
+from mindsdb.utilities.context import context as ctx
+
+logger = log.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 4096
+# the same as default wait_timeout of mysql
+DEFAULT_IDLE_TIMEOUT = 8 * 60 * 60
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+DEFAULT_READ_TIMEOUT = 60
+DEFAULT_READ_BUFFER_SIZE = 4 * 1024 * 1024
+DEFAULT_WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+def is_async_server(api_config: dict) -> bool:
+    server_config = api_config.get('server') or {}
+    return server_config.get('type') == 'async'
+
+
+class AsyncRequestHandler:
+    """
+    Mixin for socketserver request handler which is served by AsyncServer.
+
+    Creation of handler runs 'start' (handshake) instead of the whole connection loop.
+    Then 'process_message' is called for every message framed by 'message_length': it reads and processes
+    one message and returns False if connection has to be closed.
+    The mixin goes first in bases, so 'process_message' of the handler is not overridden here.
+    """
+
+    # if True, handler is started right after connection, otherwise after the first data from client
+    server_speaks_first = False
+
+    started = False
+
+    def handle(self):
+        self.started = self.start() is not False
+
+    def finish(self):
+        # connection is closed by server
+        pass
+
+    @staticmethod
+    def message_length(buffer: bytearray) -> Optional[int]:
+        """
+        Length of the first message in buffer
+        :return: length of message or None if it is unknown yet
+        """
+        raise NotImplementedError
+
+    def start(self) -> bool:
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class BridgeSocket:
+    """
+    Socket-like object which is used by handler in worker thread.
+    Data is received and sent by event loop.
+    """
+
+    def __init__(self, connection: 'AsyncConnection'):
+        self._connection = connection
+        self._cond = threading.Condition()
+        self._buffer = bytearray()
+        self._pending = 0
+        self._write_paused = False
+        self.closed = False
+
+    def _wait(self, predicate, timeout: float):
+        # must be called under lock
+        if not self._cond.wait_for(lambda: self.closed or predicate(), timeout):
+            raise socket.timeout('timed out')
+
+    # loop side
+
+    def feed(self, data: bytes) -> int:
+        with self._cond:
+            self._buffer.extend(data)
+            self._cond.notify_all()
+            return len(self._buffer)
+
+    def set_write_paused(self, paused: bool):
+        with self._cond:
+            self._write_paused = paused
+            self._cond.notify_all()
+
+    def written(self, size: int):
+        with self._cond:
+            self._pending -= size
+            self._cond.notify_all()
+
+    def set_closed(self):
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+    def ready(self, message_length) -> bool:
+        """Is there complete message in the buffer"""
+        with self._cond:
+            if len(self._buffer) == 0:
+                return False
+            if len(self._buffer) >= self._connection.read_buffer_size:
+                # message is too big for the buffer, it has to be read in parts
+                return True
+            length = message_length(self._buffer)
+            return length is not None and len(self._buffer) >= length
+
+    def buffer_size(self) -> int:
+        with self._cond:
+            return len(self._buffer)
+
+    # worker side
+
+    def recv(self, size: int, flags: int = 0) -> bytes:
+        with self._cond:
+            self._wait(lambda: len(self._buffer) > 0, self._connection.read_timeout)
+            data = bytes(self._buffer[:size])
+            if not flags & socket.MSG_PEEK:
+                del self._buffer[:size]
+        if len(data) > 0:
+            self._connection.consumed()
+        return data
+
+    def read(self, size: int) -> bytes:
+        chunks = []
+        while size > 0:
+            chunk = self.recv(size)
+            if len(chunk) == 0:
+                break
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b''.join(chunks)
+
+    def sendall(self, data: bytes):
+        data = bytes(data)
+        with self._cond:
+            self._wait(
+                lambda: not self._write_paused and self._pending < self._connection.write_buffer_size,
+                self._connection.read_timeout
+            )
+            if self.closed:
+                raise BrokenPipeError('connection is closed')
+            self._pending += len(data)
+        self._connection.write(data)
+
+    def send(self, data: bytes) -> int:
+        self.sendall(data)
+        return len(data)
+
+    def write(self, data: bytes) -> int:
+        return self.send(data)
+
+    def flush(self):
+        pass
+
+    def getpeername(self):
+        return self._connection.address
+
+    def setsockopt(self, *args):
+        pass
+
+    def settimeout(self, timeout):
+        pass
+
+    def close(self):
+        self._connection.close_threadsafe()
+
+
+class AsyncConnection(asyncio.Protocol):
+    def __init__(self, server: 'AsyncServer', address):
+        self.server = server
+        self.address = address
+        self.read_timeout = server.read_timeout
+        self.read_buffer_size = server.read_buffer_size
+        self.write_buffer_size = server.write_buffer_size
+
+        self.bridge = BridgeSocket(self)
+        self.handler = None
+        self.transport = None
+        self.last_activity = time.monotonic()
+        self._loop = None
+        self._context = None
+        self._busy = False
+        self._started = False
+        self._reading_paused = False
+        self._lost = False
+        self._cleaned = False
+
+    # event loop callbacks
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self._loop = asyncio.get_running_loop()
+        transport.set_write_buffer_limits(high=self.write_buffer_size)
+        self.server.connections.add(self)
+        if self.server.handler_class.server_speaks_first:
+            self._dispatch(self._start)
+
+    def data_received(self, data: bytes):
+        self.last_activity = time.monotonic()
+        if self.bridge.feed(data) >= self.read_buffer_size and not self._reading_paused:
+            self._reading_paused = True
+            self.transport.pause_reading()
+        self._schedule()
+
+    def eof_received(self):
+        self.bridge.set_closed()
+        return False
+
+    def pause_writing(self):
+        self.bridge.set_write_paused(True)
+
+    def resume_writing(self):
+        self.bridge.set_write_paused(False)
+
+    def connection_lost(self, exc):
+        self._lost = True
+        self.bridge.set_closed()
+        self.server.connections.discard(self)
+        self.server.release_slot()
+        if not self._busy:
+            self._cleanup()
+
+    # scheduling of handler calls
+
+    def _schedule(self):
+        if self._busy or self._lost:
+            return
+        if not self._started:
+            if self.bridge.buffer_size() > 0:
+                self._dispatch(self._start)
+        elif self.bridge.ready(self.handler.message_length):
+            self._dispatch(self.handler.process_message)
+
+    def _dispatch(self, func):
+        self._busy = True
+        try:
+            future = self._loop.run_in_executor(self.server.executor, self._run, func)
+        except RuntimeError:
+            # executor is shut down
+            self._busy = False
+            self.transport.close()
+            return
+        future.add_done_callback(self._done)
+
+    def _run(self, func) -> bool:
+        # executed in worker thread
+        if self._context is None:
+            ctx.set_default()
+        else:
+            ctx.load(self._context)
+        try:
+            return func() is not False
+        except ConnectionError as e:
+            logger.debug(f'Connection {self.address} is closed: {e}')
+            return False
+        except Exception:
+            logger.exception(f'Error in connection {self.address}:')
+            return False
+        finally:
+            self._context = ctx.dump()
+            db.session.close()
+
+    def _start(self) -> bool:
+        self.handler = self.server.handler_class(self.bridge, self.address, self.server)
+        return self.handler.started
+
+    def _done(self, future):
+        self._busy = False
+        self._started = True
+        self.last_activity = time.monotonic()
+        if self._lost:
+            self._cleanup()
+            return
+        if future.cancelled() or future.result() is False:
+            self.transport.close()
+            return
+        self._resume_reading()
+        self._schedule()
+
+    def _cleanup(self):
+        if self._cleaned:
+            return
+        self._cleaned = True
+        if self.handler is not None:
+            try:
+                self._loop.run_in_executor(self.server.executor, self._run, self.handler.close)
+            except RuntimeError:
+                pass
+
+    def _resume_reading(self):
+        if self._reading_paused and self.bridge.buffer_size() < self.read_buffer_size:
+            self._reading_paused = False
+            if not self.transport.is_closing():
+                self.transport.resume_reading()
+
+    def _write(self, data: bytes):
+        if not self.transport.is_closing():
+            self.transport.write(data)
+        self.bridge.written(len(data))
+
+    def is_idle(self, now: float, timeout: float) -> bool:
+        return not self._busy and now - self.last_activity > timeout
+
+    # called from worker thread
+
+    def write(self, data: bytes):
+        self._loop.call_soon_threadsafe(self._write, data)
+
+    def consumed(self):
+        if self._reading_paused:
+            self._loop.call_soon_threadsafe(self._resume_reading)
+
+    def close_threadsafe(self):
+        self._loop.call_soon_threadsafe(self.transport.close)
+
+
+class AsyncServer:
+    """
+    Server with interface of socketserver.TCPServer, handler class must be subclass of AsyncRequestHandler.
+    Attributes which are used by handler (check_auth, etc) are set to the server object as usual.
+    """
+
+    def __init__(self, server_address, handler_class, server_config: Optional[dict] = None):
+        server_config = server_config or {}
+        self.handler_class = handler_class
+        self.max_connections = int(server_config.get('max_connections', DEFAULT_MAX_CONNECTIONS))
+        self.idle_timeout = server_config.get('idle_timeout', DEFAULT_IDLE_TIMEOUT)
+        self.workers = int(server_config.get('workers', DEFAULT_WORKERS))
+        self.read_timeout = server_config.get('read_timeout', DEFAULT_READ_TIMEOUT)
+        self.read_buffer_size = int(server_config.get('read_buffer_size', DEFAULT_READ_BUFFER_SIZE))
+        self.write_buffer_size = int(server_config.get('write_buffer_size', DEFAULT_WRITE_BUFFER_SIZE))
+
+        self.connections = set()
+        self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='async_server_worker')
+
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.socket.bind(server_address)
+        self.server_address = self.socket.getsockname()
+        self.socket.listen(socket.SOMAXCONN)
+        self.socket.setblocking(False)
+
+        self._loop = None
+        self._stop = None
+        self._slots = None
+        self._shutdown_request = False
+        self._is_shut_down = threading.Event()
+        self._is_shut_down.set()
+
+    def serve_forever(self):
+        self._is_shut_down.clear()
+        self._loop = asyncio.new_event_loop()
+        try:
+            self._loop.run_until_complete(self._serve())
+        finally:
+            self._loop.close()
+            self._loop = None
+            self._shutdown_request = False
+            self._is_shut_down.set()
+
+    async def _serve(self):
+        self._stop = asyncio.Event()
+        self._slots = asyncio.Semaphore(self.max_connections)
+        if self._shutdown_request:
+            return
+        logger.info(
+            f'Async server is listening on {self.server_address}, max connections: {self.max_connections},'
+            f' workers: {self.workers}'
+        )
+        tasks = [asyncio.create_task(self._accept())]
+        if self.idle_timeout:
+            tasks.append(asyncio.create_task(self._close_idle()))
+
+        await self._stop.wait()
+
+        for task in tasks:
+            task.cancel()
+        for connection in list(self.connections):
+            connection.bridge.set_closed()
+            connection.transport.close()
+        await asyncio.sleep(0)
+
+    async def _accept(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            # connections over the limit wait in the backlog of the listening socket
+            await self._slots.acquire()
+            try:
+                sock, address = await loop.sock_accept(self.socket)
+            except OSError as e:
+                self._slots.release()
+                logger.warning(f'Failed to accept connection: {e}')
+                await asyncio.sleep(0.1)
+                continue
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            try:
+                await loop.connect_accepted_socket(lambda: AsyncConnection(self, address), sock)
+            except OSError as e:
+                self._slots.release()
+                sock.close()
+                logger.warning(f'Failed to open connection {address}: {e}')
+
+    async def _close_idle(self):
+        while True:
+            await asyncio.sleep(min(self.idle_timeout, 1))
+            now = time.monotonic()
+            for connection in list(self.connections):
+                if connection.is_idle(now, self.idle_timeout):
+                    logger.debug(f'Connection {connection.address} is closed by idle timeout')
+                    connection.transport.close()
+
+    def release_slot(self):
+        self._slots.release()
+
+    def shutdown(self):
+        self._shutdown_request = True
+        loop = self._loop
+        if loop is not None:
+            loop.call_soon_threadsafe(lambda: self._stop is not None and self._stop.set())
+        self._is_shut_down.wait()
+
+    def server_close(self):
+        self.socket.close()
+        self.executor.shutdown(wait=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.server_close()
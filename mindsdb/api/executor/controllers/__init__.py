@@ -1 +1,2 @@
 from .session_controller import SessionController
+from .session_pool import SessionPool, session_pool
@@ -31,10 +31,7 @@ class SessionController:
         Initialize the session
         """
         self.api_type = api_type
-        self.username = None
-        self.auth = False
         self.logging = logger
-        self.database = None
 
         self.config = Config()
 
@@ -55,6 +52,19 @@ class SessionController:
         self.datahub = init_datahub(self)
         self.agents_controller = AgentsController()
 
+        # set if session is taken from SessionPool
+        self.pool_key = None
+        self.catalog_version = None
+
+        self.reset()
+
+    def reset(self):
+        """
+        Resets state of the connection, controllers and datahub are kept
+        """
+        self.username = None
+        self.auth = False
+        self.database = None
         self.prepared_stmts = {}
         self.packet_sequence_number = 0
         self.profiling = False
@@ -0,0 +1,107 @@
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from sqlalchemy import func, select
+
+from mindsdb.interfaces.storage import db
+from mindsdb.utilities import log
+from mindsdb.utilities.context import context as ctx
+
+from .session_controller import SessionController
+
+logger = log.getLogger(__name__)
+
+# idle sessions kept for one key
+MAX_SESSIONS_PER_KEY = 8
+# count of keys (company, user) in the pool
+MAX_KEYS = 256
+
+
+def get_catalog_version(company_id) -> tuple:
+    """
+    Fingerprint of the catalog of the company: it is changed when database, project or ml engine
+    is created, altered or deleted
+    """
+    fingerprint = []
+    for table in (db.Integration, db.Project):
+        for column in (func.count(table.id), func.max(table.id), func.max(table.updated_at)):
+            fingerprint.append(
+                select(column).where(table.company_id == company_id).scalar_subquery()
+            )
+    return tuple(db.session.execute(select(*fingerprint)).one())
+
+
+class SessionPool:
+    """
+    Pool of sessions for short-lived requests (http sql api).
+
+    Creation of SessionController is expensive: it makes all controllers and the datahub. Pool keeps idle sessions
+    by (company_id, user_class) and resets their state before reuse. Session is not reused if catalog was changed
+    after the session was taken from the pool.
+
+    Usage:
+        with session_pool.session() as session:
+            ...
+    """
+
+    def __init__(self, max_sessions_per_key: int = MAX_SESSIONS_PER_KEY, max_keys: int = MAX_KEYS):
+        self.max_sessions_per_key = max_sessions_per_key
+        self.max_keys = max_keys
+        # key -> list of (catalog_version, session)
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_key() -> tuple:
+        return ctx.company_id, ctx.user_class
+
+    def acquire(self) -> SessionController:
+        key = self._get_key()
+        version = get_catalog_version(ctx.company_id)
+
+        session = None
+        with self._lock:
+            idle = self._sessions.get(key)
+            if idle:
+                self._sessions.move_to_end(key)
+                # sessions with outdated catalog are dropped
+                while idle and session is None:
+                    session_version, item = idle.pop()
+                    if session_version == version:
+                        session = item
+
+        if session is None:
+            session = SessionController()
+        else:
+            session.reset()
+        session.pool_key = key
+        session.catalog_version = version
+        return session
+
+    def release(self, session: SessionController):
+        key = getattr(session, 'pool_key', None)
+        if key is None:
+            return
+        with self._lock:
+            idle = self._sessions.setdefault(key, [])
+            self._sessions.move_to_end(key)
+            if len(idle) < self.max_sessions_per_key:
+                idle.append((session.catalog_version, session))
+            while len(self._sessions) > self.max_keys:
+                self._sessions.popitem(last=False)
+
+    @contextmanager
+    def session(self):
+        session = self.acquire()
+        try:
+            yield session
+        finally:
+            self.release(session)
+
+    def clear(self):
+        with self._lock:
+            self._sessions.clear()
+
+
+session_pool = SessionPool()
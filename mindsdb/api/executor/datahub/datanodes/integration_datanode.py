@@ -13,6 +13,7 @@ from mindsdb_sql.parser.ast import Insert, Identifier, CreateTable, TableColumn,
 from mindsdb.api.executor.datahub.datanodes.datanode import DataNode
 from mindsdb.api.executor.data_types.response_type import RESPONSE_TYPE
 from mindsdb.api.executor.datahub.classes.tables_row import TablesRow
+from mindsdb.api.executor.datahub.metadata_catalog import metadata_catalog
 from mindsdb.api.executor.sql_query.result_set import ResultSet
 from mindsdb.integrations.utilities.utils import get_class_name
 from mindsdb.metrics import metrics
@@ -21,6 +22,9 @@ from mindsdb.utilities.profiler import profiler
 
 logger = log.getLogger(__name__)
 
+# max count of rows in one INSERT query, if handler doesn't have native insert
+INSERT_BATCH_SIZE = 1000
+
 
 class DBHandlerException(Exception):
     pass
@@ -95,6 +99,7 @@ class IntegrationDataNode(DataNode):
             if_exists=if_exists
         )
         result = self._query(drop_ast)
+        metadata_catalog.invalidate(self.integration_name.lower())
         if result.type == RESPONSE_TYPE.ERROR:
             raise Exception(result.error_message)
 
@@ -144,6 +149,7 @@ class IntegrationDataNode(DataNode):
                 is_replace=is_replace
             )
             result = self._query(create_table_ast)
+            metadata_catalog.invalidate(self.integration_name.lower())
             if result.type == RESPONSE_TYPE.ERROR:
                 raise Exception(result.error_message)
 
@@ -181,21 +187,25 @@ class IntegrationDataNode(DataNode):
             # not need to insert
             return
 
-        insert_ast = Insert(
-            table=table_name,
-            columns=insert_columns,
-            values=values,
-            is_plain=True
-        )
+        # insert by batches: huge query could exceed max size of the packet
+        for start in range(0, len(values), INSERT_BATCH_SIZE):
+            insert_ast = Insert(
+                table=table_name,
+                columns=insert_columns,
+                values=values[start:start + INSERT_BATCH_SIZE],
+                is_plain=True
+            )
 
-        try:
-            result = self._query(insert_ast)
-        except Exception as e:
-            msg = f'[{self.ds_type}/{self.integration_name}]: {str(e)}'
-            raise DBHandlerException(msg) from e
+            try:
+                result = self._query(insert_ast)
+            except Exception as e:
+                msg = f'[{self.ds_type}/{self.integration_name}]: {str(e)}'
+                raise DBHandlerException(msg) from e
 
-        if result.type == RESPONSE_TYPE.ERROR:
-            raise Exception(result.error_message)
+            if result.type == RESPONSE_TYPE.ERROR:
+                raise Exception(result.error_message)
+            logger.debug(f'Inserted {min(start + INSERT_BATCH_SIZE, len(values))} of {len(values)} rows '
+                         f'into {self.integration_name}.{table_name}')
 
     def _query(self, query):
         time_before_query = time.perf_counter()
@@ -1,3 +1,4 @@
+from functools import partial
 
 import pandas as pd
 from mindsdb_sql.parser.ast import BinaryOperation, Constant, Identifier, Select
@@ -8,6 +9,7 @@ from mindsdb.api.executor.datahub.classes.tables_row import (
     TABLES_ROW_TYPE,
     TablesRow,
 )
+from mindsdb.api.executor.datahub.metadata_catalog import metadata_catalog
 from mindsdb.utilities import log
 
 logger = log.getLogger(__name__)
@@ -126,17 +128,19 @@ class TablesTable(Table):
                 row.TABLE_SCHEMA = ds_name
                 data.append(row.to_list())
 
-        for ds_name in inf_schema.get_integrations_names():
-            if target_table is not None and target_table != ds_name:
+        # tables of integrations are fetched in parallel and cached
+        requests = {
+            (ds_name, 'tables'): partial(cls._get_integration_tables, inf_schema, ds_name)
+            for ds_name in inf_schema.get_integrations_names()
+            if target_table is None or target_table == ds_name
+        }
+        results = metadata_catalog.get_many(requests)
+        for ds_name, item in requests.keys():
+            ds_tables = results[(ds_name, item)]
+            if isinstance(ds_tables, Exception):
+                logger.error(f"Can't get tables from '{ds_name}': {ds_tables}")
                 continue
-            try:
-                ds = inf_schema.get(ds_name)
-                ds_tables = ds.get_tables()
-                for row in ds_tables:
-                    row.TABLE_SCHEMA = ds_name
-                    data.append(row.to_list())
-            except Exception:
-                logger.error(f"Can't get tables from '{ds_name}'")
+            data.extend(ds_tables)
 
         for project_name in inf_schema.get_projects_names():
             if target_table is not None and target_table != project_name:
@@ -150,6 +154,15 @@ class TablesTable(Table):
         df = pd.DataFrame(data, columns=cls.columns)
         return df
 
+    @staticmethod
+    def _get_integration_tables(inf_schema, ds_name: str) -> list:
+        ds = inf_schema.get(ds_name)
+        data = []
+        for row in ds.get_tables():
+            row.TABLE_SCHEMA = ds_name
+            data.append(row.to_list())
+        return data
+
 
 class ColumnsTable(Table):
 
@@ -293,22 +306,30 @@ class ColumnsTable(Table):
         if databases is None:
             databases = ['information_schema', 'mindsdb', 'files']
 
+        # columns of integrations are fetched in parallel and cached
+        integrations_names = set(inf_schema.get_integrations_names())
+        requests = {
+            (db_name.lower(), 'columns'): partial(cls._get_tables_columns, inf_schema, db_name)
+            for db_name in databases
+            if db_name.lower() in integrations_names
+        }
+        results = metadata_catalog.get_many(requests)
+
         for db_name in databases:
             if db_name == 'information_schema':
                 tables = {
                     table_name: table.columns
                     for table_name, table in inf_schema.tables.items()
                 }
-            else:
-                dn = inf_schema.get(db_name)
-                if dn is None:
+            elif (db_name.lower(), 'columns') in requests:
+                tables = results[(db_name.lower(), 'columns')]
+                if isinstance(tables, Exception):
+                    logger.error(f"Can't get columns from '{db_name}': {tables}")
                     continue
-                tables = {}
-                for table_row in dn.get_tables():
-                    tables[table_row.TABLE_NAME] = [
-                        col['name']
-                        for col in dn.get_table_columns(table_row.TABLE_NAME)
-                    ]
+            else:
+                tables = cls._get_tables_columns(inf_schema, db_name)
+            if tables is None:
+                continue
 
             for table_name, table_columns in tables.items():
                 for i, column_name in enumerate(table_columns):
@@ -322,6 +343,19 @@ class ColumnsTable(Table):
         df = pd.DataFrame(result, columns=cls.columns)
         return df
 
+    @staticmethod
+    def _get_tables_columns(inf_schema, db_name: str) -> dict:
+        dn = inf_schema.get(db_name)
+        if dn is None:
+            return None
+        tables = {}
+        for table_row in dn.get_tables():
+            tables[table_row.TABLE_NAME] = [
+                col['name']
+                for col in dn.get_table_columns(table_row.TABLE_NAME)
+            ]
+        return tables
+
 
 class EventsTable(Table):
     name = "EVENTS"
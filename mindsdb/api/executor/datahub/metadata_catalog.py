@@ -0,0 +1,154 @@
+import time
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from mindsdb.interfaces.storage import db
+from mindsdb.utilities import log
+from mindsdb.utilities.context import context as ctx
+
+logger = log.getLogger(__name__)
+
+# cached metadata older than this is returned and refreshed in background
+CATALOG_TTL_SECONDS = 300
+# max time to wait for metadata of integration which is not in cache
+CATALOG_FETCH_TIMEOUT = 10
+CATALOG_MAX_WORKERS = 16
+
+
+class MetadataCatalog:
+    """
+    Cache of metadata (lists of tables and columns) of integrations, per company.
+
+    Metadata is fetched from integrations in parallel. If an integration doesn't respond in time,
+    it is skipped and its metadata is added to the cache when it is fetched. Outdated metadata is
+    returned as is and refreshed in background.
+
+    Metadata of the company is dropped when the catalog of the company is changed (database is created,
+    altered or deleted), metadata of the integration - when table is created or dropped in it.
+
+    Usage:
+        results = metadata_catalog.get_many({
+            (integration_name, 'tables'): fetch_tables,
+        })
+    """
+
+    def __init__(self, ttl: int = CATALOG_TTL_SECONDS, timeout: int = CATALOG_FETCH_TIMEOUT,
+                 max_workers: int = CATALOG_MAX_WORKERS):
+        self.ttl = ttl
+        self.timeout = timeout
+        self.max_workers = max_workers
+
+        # (company_id, integration_name, item) -> (created_at, value)
+        self._data = {}
+        # (company_id, integration_name, item) -> Future
+        self._pending = {}
+        # company_id -> catalog version
+        self._versions = {}
+        # (company_id, integration_name) -> count of invalidations, to not store results fetched before
+        self._generations = {}
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def _get_catalog_version(self, company_id) -> tuple:
+        # imported here to avoid circular import
+        from mindsdb.api.executor.controllers.session_pool import get_catalog_version
+        return get_catalog_version(company_id)
+
+    def _check_version(self, company_id):
+        version = self._get_catalog_version(company_id)
+        with self._lock:
+            if self._versions.get(company_id) != version:
+                self._versions[company_id] = version
+                self._drop(company_id)
+
+    def _drop(self, company_id, integration_name: Optional[str] = None):
+        # has to be called under the lock
+        for key in list(self._data.keys()) + list(self._pending.keys()):
+            if key[0] == company_id and (integration_name is None or key[1] == integration_name):
+                self._data.pop(key, None)
+                self._pending.pop(key, None)
+                generation_key = key[:2]
+                self._generations[generation_key] = self._generations.get(generation_key, 0) + 1
+
+    def _submit(self, cache_key: tuple, fetch: Callable) -> Future:
+        with self._lock:
+            future = self._pending.get(cache_key)
+            if future is not None:
+                return future
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix='metadata_catalog'
+                )
+            generation = self._generations.get(cache_key[:2], 0)
+
+            context = contextvars.copy_context()
+
+            def _run():
+                try:
+                    value = context.run(fetch)
+                    with self._lock:
+                        if self._generations.get(cache_key[:2], 0) == generation:
+                            self._data[cache_key] = (time.time(), value)
+                    return value
+                finally:
+                    db.session.remove()
+                    with self._lock:
+                        if self._pending.get(cache_key) is future:
+                            self._pending.pop(cache_key)
+
+            future = self._executor.submit(_run)
+            self._pending[cache_key] = future
+            return future
+
+    def get_many(self, requests: Dict[Hashable, Callable], timeout: Optional[float] = None) -> Dict[Hashable, Any]:
+        """
+        Gets metadata from the cache or fetches it in parallel
+
+        :param requests: {(integration_name, item): function to fetch the item}
+        :param timeout: max time to wait for items which are not in cache, default is CATALOG_FETCH_TIMEOUT
+        :return: {(integration_name, item): value}, value is exception if item wasn't fetched
+        """
+        if timeout is None:
+            timeout = self.timeout
+        company_id = ctx.company_id
+        self._check_version(company_id)
+
+        results, futures = {}, {}
+        now = time.time()
+        for key, fetch in requests.items():
+            cache_key = (company_id, *key)
+            with self._lock:
+                cached = self._data.get(cache_key)
+            if cached is None:
+                futures[key] = self._submit(cache_key, fetch)
+                continue
+            created_at, value = cached
+            if now - created_at > self.ttl:
+                self._submit(cache_key, fetch)
+            results[key] = value
+
+        deadline = time.time() + timeout
+        for key, future in futures.items():
+            try:
+                results[key] = future.result(timeout=max(deadline - time.time(), 0))
+            except Exception as e:
+                if not future.done():
+                    e = TimeoutError(f'Metadata of {key[0]} is not fetched in {timeout} seconds')
+                results[key] = e
+        return results
+
+    def invalidate(self, integration_name: str):
+        """Drops cached metadata of the integration, it is fetched again on next request"""
+        with self._lock:
+            self._drop(ctx.company_id, integration_name)
+
+    def refresh(self):
+        """Drops all cached metadata of the current company"""
+        with self._lock:
+            self._drop(ctx.company_id)
+
+
+metadata_catalog = MetadataCatalog()
@@ -4,6 +4,9 @@ import numpy as np
 import pandas as pd
 
 from mindsdb.api.executor.exceptions import WrongArgumentError
+from mindsdb.integrations.libs.vector_column import (
+    VECTOR_TYPE, is_vector_column, vector_column_to_text, vector_column_to_lists
+)
 
 
 class Column:
@@ -66,12 +69,15 @@ class ResultSet:
         columns_dtypes = list(df.dtypes)
 
         for i, col in enumerate(df.columns):
+            col_type = columns_dtypes[i]
+            if is_vector_column(df.iloc[:, i]):
+                col_type = VECTOR_TYPE
             self._columns.append(Column(
                 name=col,
                 table_name=table_name,
                 table_alias=table_alias,
                 database=database,
-                type=columns_dtypes[i]
+                type=col_type
             ))
 
         # rename columns to indexes
@@ -201,7 +207,11 @@ class ResultSet:
     def set_col_type(self, col_idx, type_name):
         self.columns[col_idx].type = type_name
         if self._df is not None:
-            self._df[col_idx] = self._df[col_idx].astype(type_name)
+            if type_name == 'str' and is_vector_column(self._df[col_idx]):
+                # str(array) truncates long vectors
+                self._df[col_idx] = vector_column_to_text(self._df[col_idx])
+            else:
+                self._df[col_idx] = self._df[col_idx].astype(type_name)
 
     # --- records ---
 
@@ -236,9 +246,21 @@ class ResultSet:
 
         if len(self.get_raw_df()) == 0:
             return []
+
+        # vectors are kept binary until the output
+        df = self.get_raw_df()
+        vector_columns = [name for name in df.columns if is_vector_column(df[name])]
+        if len(vector_columns) > 0:
+            df = df.copy()
+            for name in vector_columns:
+                if json_types:
+                    df[name] = vector_column_to_lists(df[name])
+                else:
+                    df[name] = vector_column_to_text(df[name])
+
         # output for APIs. simplify types
         if json_types:
-            df = self.get_raw_df().copy()
+            df = df.copy()
             for name, dtype in df.dtypes.to_dict().items():
                 if pd.api.types.is_datetime64_any_dtype(dtype):
                     df[name] = df[name].dt.strftime("%Y-%m-%d %H:%M:%S.%f")
@@ -246,7 +268,7 @@ class ResultSet:
             return df.to_records(index=False).tolist()
 
         # slower but keep timestamp type
-        return self._df.to_dict('split')['data']
+        return df.to_dict('split')['data']
 
     def get_column_values(self, col_idx):
         # get by column index
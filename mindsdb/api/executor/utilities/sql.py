@@ -13,6 +13,7 @@ from mindsdb_sql.parser.ast import (
     Function, Constant
 )
 from mindsdb.utilities.functions import resolve_table_identifier, resolve_model_identifier
+from mindsdb.integrations.libs.vector_column import is_vector_column, to_vector_column
 
 from mindsdb.utilities import log
 from mindsdb.utilities.json_encoder import CustomJSONEncoder
@@ -90,17 +91,15 @@ def query_df_with_type_infer_fallback(query_str: str, dataframes: dict, user_fun
     return result_df, description
 
 
-def query_df(df, query, session=None):
-    """ Perform simple query ('select' from one table, without subqueries and joins) on DataFrame.
-
-        Args:
-            df (pandas.DataFrame): data
-            query (mindsdb_sql.parser.ast.Select | str): select query
+def _render_query(query, session=None):
+    """ Adapts simple select query to duckdb, table in the query is replaced with 'df'
 
         Returns:
-            pandas.DataFrame
+            str: rendered query
+            str: name of the table in the query
+            set: names of columns which are used in json functions
+            user functions of the session
     """
-
     if isinstance(query, str):
         query_ast = parse_sql(query)
     else:
@@ -150,6 +149,44 @@ def query_df(df, query, session=None):
 
     query_traversal(query_ast, adapt_query)
 
+    render = SqlalchemyRender('postgres')
+    try:
+        query_str = render.get_string(query_ast, with_failback=False)
+    except Exception as e:
+        logger.error(
+            f"Exception during query casting to 'postgres' dialect. Query: {str(query)}. Error: {e}"
+        )
+        query_str = render.get_string(query_ast, with_failback=True)
+
+    return query_str, table_name, json_columns, user_functions
+
+
+def _rename_result_columns(result_df, description):
+    # duckdb makes names of columns unique, restore them from description
+    result_df = result_df.replace({np.nan: None})
+
+    new_column_names = {}
+    real_column_names = [x[0] for x in description]
+    for i, duck_column_name in enumerate(result_df.columns):
+        new_column_names[duck_column_name] = real_column_names[i]
+    return result_df.rename(
+        new_column_names,
+        axis='columns'
+    )
+
+
+def query_df(df, query, session=None):
+    """ Perform simple query ('select' from one table, without subqueries and joins) on DataFrame.
+
+        Args:
+            df (pandas.DataFrame): data
+            query (mindsdb_sql.parser.ast.Select | str): select query
+
+        Returns:
+            pandas.DataFrame
+    """
+    query_str, table_name, json_columns, user_functions = _render_query(query, session)
+
     # convert json columns
     encoder = CustomJSONEncoder()
 
@@ -163,15 +200,6 @@ def query_df(df, query, session=None):
     for column in json_columns:
         df[column] = df[column].apply(_convert)
 
-    render = SqlalchemyRender('postgres')
-    try:
-        query_str = render.get_string(query_ast, with_failback=False)
-    except Exception as e:
-        logger.error(
-            f"Exception during query casting to 'postgres' dialect. Query: {str(query)}. Error: {e}"
-        )
-        query_str = render.get_string(query_ast, with_failback=True)
-
     # workaround to prevent duckdb.TypeMismatchException
     if len(df) > 0:
         if table_name.lower() in ('models', 'predictors'):
@@ -181,15 +209,46 @@ def query_df(df, query, session=None):
             if 'CONNECTION_DATA' in df.columns:
                 df = df.astype({'CONNECTION_DATA': 'string'})
 
+    # duckdb returns vectors as lists of float64
+    vector_columns = set(name for name in df.columns if is_vector_column(df[name]))
+
     result_df, description = query_df_with_type_infer_fallback(query_str, {'df': df}, user_functions=user_functions)
-    result_df = result_df.replace({np.nan: None})
+    result_df = _rename_result_columns(result_df, description)
 
-    new_column_names = {}
-    real_column_names = [x[0] for x in description]
-    for i, duck_column_name in enumerate(result_df.columns):
-        new_column_names[duck_column_name] = real_column_names[i]
-    result_df = result_df.rename(
-        new_column_names,
-        axis='columns'
-    )
+    result_columns = list(result_df.columns)
+    for name in vector_columns.intersection(result_columns):
+        if result_columns.count(name) != 1 or result_df[name].dtype != object:
+            continue
+        try:
+            result_df[name] = to_vector_column(result_df[name])
+        except (ValueError, TypeError):
+            # column was replaced by an expression with the same name
+            pass
     return result_df
+
+
+def query_parquet(file_path, query, session=None):
+    """ Perform simple query ('select' from one table, without subqueries and joins) on parquet file.
+        Only used columns are read from the file, filters and limit are applied during the scan.
+
+        Args:
+            file_path (str): path to parquet file
+            query (mindsdb_sql.parser.ast.Select | str): select query
+
+        Returns:
+            pandas.DataFrame
+    """
+    query_str, _table_name, _json_columns, user_functions = _render_query(query, session)
+
+    con = duckdb.connect(database=':memory:')
+    try:
+        if user_functions:
+            user_functions.register(con)
+        file_path = str(file_path).replace("'", "''")
+        con.execute(f"create view df as select * from read_parquet('{file_path}')")
+        result_df = con.execute(query_str).fetchdf()
+        description = con.description
+    finally:
+        con.close()
+
+    return _rename_result_columns(result_df, description)
@@ -6,6 +6,7 @@ from flask_restx import Resource
 import mindsdb.utilities.hooks as hooks
 import mindsdb.utilities.profiler as profiler
 from mindsdb.api.http.namespaces.configs.sql import ns_conf
+from mindsdb.api.executor.controllers import session_pool
 from mindsdb.api.mysql.mysql_proxy.classes.fake_mysql_proxy import FakeMysqlProxy
 from mindsdb.api.executor.data_types.response_type import (
     RESPONSE_TYPE as SQL_RESPONSE_TYPE,
@@ -42,8 +43,8 @@ class Query(Resource):
         profiler.set_meta(
             query=query, api="http", environment=Config().get("environment")
         )
-        with profiler.Context("http_query_processing"):
-            mysql_proxy = FakeMysqlProxy()
+        with profiler.Context("http_query_processing"), session_pool.session() as session:
+            mysql_proxy = FakeMysqlProxy(session=session)
             mysql_proxy.set_context(context)
             try:
                 result = mysql_proxy.process_query(query)
@@ -0,0 +1,173 @@
+import time
+import random
+import threading
+
+import bson
+from bson.int64 import Int64
+from bson.codec_options import CodecOptions, TypeRegistry
+
+from mindsdb.utilities import log
+
+logger = log.getLogger(__name__)
+
+# the same as default values of mongod
+DEFAULT_BATCH_SIZE = 101
+DEFAULT_CURSOR_TIMEOUT = 10 * 60
+MAX_BSON_SIZE = 16 * 1024 * 1024
+# space for the rest of response document
+BATCH_SIZE_RESERVE = 16 * 1024
+
+# used only to estimate size of documents
+SIZE_CODEC_OPTIONS = CodecOptions(type_registry=TypeRegistry(fallback_encoder=str))
+
+
+class CursorNotFound(Exception):
+    code = 43
+    code_name = 'CursorNotFound'
+
+
+class Cursor:
+    def __init__(self, cursor_id: int, ns: str, rows: list, owner):
+        self.id = cursor_id
+        self.ns = ns
+        self.rows = rows
+        self.position = 0
+        self.owner = owner
+        self.last_used = time.monotonic()
+
+    def next_batch(self, batch_size: int = None) -> list:
+        """
+        Returns next batch of rows, limited by batch_size and max size of BSON document
+        """
+        batch = []
+        total_size = 0
+        max_size = MAX_BSON_SIZE - BATCH_SIZE_RESERVE
+        while self.position < len(self.rows):
+            if batch_size and len(batch) >= batch_size:
+                break
+            row = self.rows[self.position]
+            size = len(bson.encode(row, codec_options=SIZE_CODEC_OPTIONS))
+            if len(batch) > 0 and total_size + size > max_size:
+                break
+            batch.append(row)
+            total_size += size
+            self.position += 1
+        self.last_used = time.monotonic()
+        return batch
+
+    @property
+    def exhausted(self) -> bool:
+        return self.position >= len(self.rows)
+
+
+class CursorRegistry:
+    """
+    Open cursors of the server.
+    The rows which didn't fit into the first batch are kept here and returned by getMore command.
+
+    Cursor belongs to the session where it was created: logical session (lsid of the command) if client uses it,
+    otherwise the connection. Cursors unused longer than timeout are closed
+    """
+
+    def __init__(self, timeout: float = DEFAULT_CURSOR_TIMEOUT):
+        self.timeout = timeout
+        self._cursors = {}
+        self._lock = threading.Lock()
+
+    def _close_idle(self):
+        # must be called under lock
+        now = time.monotonic()
+        for cursor_id in [
+            cursor_id
+            for cursor_id, cursor in self._cursors.items()
+            if now - cursor.last_used > self.timeout
+        ]:
+            logger.debug(f'Cursor {cursor_id} is closed by timeout')
+            del self._cursors[cursor_id]
+
+    def _new_id(self) -> int:
+        while True:
+            cursor_id = random.randint(1, 2 ** 63 - 1)
+            if cursor_id not in self._cursors:
+                return cursor_id
+
+    def create(self, ns: str, rows: list, owner, batch_size: int = None, single_batch: bool = False) -> dict:
+        """
+        Makes first batch of the cursor, cursor is registered only if there are rows left after it
+
+        :param ns: namespace of cursor: db.collection
+        :param rows: all rows of the result
+        :param owner: session of the cursor
+        :param batch_size: count of rows in the first batch
+        :param single_batch: close cursor after the first batch
+        :return: cursor document for response
+        """
+        if batch_size is None and not single_batch:
+            batch_size = DEFAULT_BATCH_SIZE
+        cursor = Cursor(0, ns, rows, owner)
+        first_batch = cursor.next_batch(batch_size)
+
+        if not single_batch and not cursor.exhausted:
+            with self._lock:
+                self._close_idle()
+                cursor.id = self._new_id()
+                self._cursors[cursor.id] = cursor
+
+        return {
+            'id': Int64(cursor.id),
+            'ns': ns,
+            'firstBatch': first_batch
+        }
+
+    def get_more(self, cursor_id: int, owner, batch_size: int = None) -> dict:
+        """
+        Next batch of the cursor, cursor is closed when all rows are returned
+        :return: cursor document for response
+        """
+        with self._lock:
+            self._close_idle()
+            cursor = self._cursors.get(cursor_id)
+            if cursor is None or cursor.owner != owner:
+                raise CursorNotFound(f'cursor id {cursor_id} not found')
+
+        next_batch = cursor.next_batch(batch_size)
+
+        if cursor.exhausted:
+            with self._lock:
+                self._cursors.pop(cursor_id, None)
+            cursor_id = 0
+
+        return {
+            'id': Int64(cursor_id),
+            'ns': cursor.ns,
+            'nextBatch': next_batch
+        }
+
+    def kill(self, cursor_ids: list, owner) -> tuple:
+        """
+        Closes cursors
+        :return: lists of closed and not found cursors ids
+        """
+        killed, not_found = [], []
+        with self._lock:
+            for cursor_id in cursor_ids:
+                cursor = self._cursors.get(cursor_id)
+                if cursor is None or cursor.owner != owner:
+                    not_found.append(cursor_id)
+                else:
+                    del self._cursors[cursor_id]
+                    killed.append(cursor_id)
+        return killed, not_found
+
+    def kill_session(self, owner):
+        """Closes all cursors of the session"""
+        with self._lock:
+            for cursor_id in [
+                cursor_id
+                for cursor_id, cursor in self._cursors.items()
+                if cursor.owner == owner
+            ]:
+                del self._cursors[cursor_id]
+
+    def __len__(self):
+        return len(self._cursors)
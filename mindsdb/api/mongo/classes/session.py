@@ -1,3 +1,4 @@
+import uuid
 import base64
 
 from mindsdb.api.mongo.classes.scram import Scram
@@ -8,6 +9,25 @@ class Session():
         self.config = server_mindsdb_env['config']
         self.mindsdb_env = {'company_id': None}
         self.mindsdb_env.update(server_mindsdb_env)
+        self.id = uuid.uuid4().hex
+
+    def get_cursor_owner(self, query, lsid=None):
+        """
+        Cursors belong to logical session of the client if it is used, otherwise to connection
+        """
+        if lsid is None:
+            lsid = query.get('lsid')
+        if isinstance(lsid, dict) and lsid.get('id') is not None:
+            session_id = lsid['id']
+        else:
+            session_id = self.id
+        return self.mindsdb_env['company_id'], session_id
+
+    def close_cursors(self):
+        """Closes cursors of the connection"""
+        cursors = self.mindsdb_env.get('cursors')
+        if cursors is not None:
+            cursors.kill_session(self.get_cursor_owner({}))
 
     def init_scram(self, method):
         self.scram = Scram(method=method, get_salted_password=self.get_salted_password)
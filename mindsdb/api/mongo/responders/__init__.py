@@ -14,6 +14,8 @@ from .db_stats import responder as responder_db_stats
 from .coll_stats import responder as responder_coll_stats
 from .count import responder as responder_count
 from .aggregate import responder as responder_aggregate
+from .get_more import responder as responder_get_more
+from .kill_cursors import responder as responder_kill_cursors
 from .get_free_monitoring_status import responder as responder_get_free_monitoring_status
 from .end_sessions import responder as responder_end_sessions
 from .ping import responder as responder_ping
@@ -52,6 +54,8 @@ responders = [
     responder_coll_stats,
     responder_count,
     responder_aggregate,
+    responder_get_more,
+    responder_kill_cursors,
     responder_get_free_monitoring_status,
     responder_end_sessions,
     responder_ping,
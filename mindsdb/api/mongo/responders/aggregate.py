@@ -1,5 +1,3 @@
-from bson.int64 import Int64
-
 from mindsdb_sql.parser.ast import Identifier, Insert, CreateTable
 
 from mindsdb.api.mongo.classes import Responder
@@ -76,11 +74,12 @@ class Responce(Responder):
         else:
             raise NotImplementedError
 
-        cursor = {
-            'id': Int64(0),
-            'ns': f"{db}.$cmd.{collection}",
-            'firstBatch': data
-        }
+        cursor = mindsdb_env['cursors'].create(
+            ns=f"{db}.$cmd.{collection}",
+            rows=data,
+            owner=session.get_cursor_owner(query),
+            batch_size=query.get('cursor', {}).get('batchSize') or None
+        )
         return {
             'cursor': cursor,
             'ok': 1
@@ -5,9 +5,14 @@ import mindsdb.api.mongo.functions as helpers
 class Responce(Responder):
     when = {'endSessions': helpers.is_true}
 
-    result = {
-        'ok': 1
-    }
+    def result(self, query, request_env, mindsdb_env, session):
+        # cursors of ended sessions are closed
+        for lsid in query['endSessions']:
+            mindsdb_env['cursors'].kill_session(session.get_cursor_owner(query, lsid=lsid))
+
+        return {
+            'ok': 1
+        }
 
 
 responder = Responce()
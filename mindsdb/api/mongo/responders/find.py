@@ -161,11 +161,13 @@ class Responce(Responder):
 
         db = mindsdb_env['config']['api']['mongodb']['database']
 
-        cursor = {
-            'id': Int64(0),
-            'ns': f"{db}.$cmd.{query['find']}",
-            'firstBatch': data
-        }
+        cursor = mindsdb_env['cursors'].create(
+            ns=f"{db}.$cmd.{query['find']}",
+            rows=data,
+            owner=session.get_cursor_owner(query),
+            batch_size=query.get('batchSize') or None,
+            single_batch=query.get('singleBatch', False)
+        )
         return {
             'cursor': cursor,
             'ok': 1
@@ -0,0 +1,29 @@
+from mindsdb.api.mongo.classes import Responder, CursorNotFound
+import mindsdb.api.mongo.functions as helpers
+
+
+class Responce(Responder):
+    when = {'getMore': helpers.is_true}
+
+    def result(self, query, request_env, mindsdb_env, session):
+        try:
+            cursor = mindsdb_env['cursors'].get_more(
+                cursor_id=int(query['getMore']),
+                owner=session.get_cursor_owner(query),
+                batch_size=query.get('batchSize') or None
+            )
+        except CursorNotFound as e:
+            return {
+                'ok': 0,
+                'errmsg': str(e),
+                'code': e.code,
+                'codeName': e.code_name
+            }
+
+        return {
+            'cursor': cursor,
+            'ok': 1
+        }
+
+
+responder = Responce()
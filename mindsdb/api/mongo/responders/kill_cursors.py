@@ -0,0 +1,25 @@
+from bson.int64 import Int64
+
+from mindsdb.api.mongo.classes import Responder
+import mindsdb.api.mongo.functions as helpers
+
+
+class Responce(Responder):
+    when = {'killCursors': helpers.is_true}
+
+    def result(self, query, request_env, mindsdb_env, session):
+        killed, not_found = mindsdb_env['cursors'].kill(
+            cursor_ids=[int(cursor_id) for cursor_id in query.get('cursors', [])],
+            owner=session.get_cursor_owner(query)
+        )
+
+        return {
+            'cursorsKilled': [Int64(cursor_id) for cursor_id in killed],
+            'cursorsNotFound': [Int64(cursor_id) for cursor_id in not_found],
+            'cursorsAlive': [],
+            'cursorsUnknown': [],
+            'ok': 1
+        }
+
+
+responder = Responce()
@@ -13,7 +13,9 @@ import numpy as np
 import datetime as dt
 
 import mindsdb.api.mongo.functions as helpers
-from mindsdb.api.mongo.classes import RespondersCollection, Session
+from mindsdb.api.common.async_server import AsyncRequestHandler, AsyncServer, is_async_server
+from mindsdb.api.mongo.classes import RespondersCollection, Session, CursorRegistry
+from mindsdb.api.mongo.classes.cursors import DEFAULT_CURSOR_TIMEOUT
 from mindsdb.interfaces.storage import db
 from mindsdb.interfaces.model.model_controller import ModelController
 from mindsdb.interfaces.database.integrations import integration_controller
@@ -262,6 +264,14 @@ class MongoRequestHandler(SocketServer.BaseRequestHandler):
         self.request = ssl_socket
 
     def handle(self):
+        self.start_session()
+
+        while self.process_message():
+            db.session.close()
+
+        self.session.close_cursors()
+
+    def start_session(self):
         ctx.set_default()
         logger.debug('connect')
         logger.debug(str(self.server.socket))
@@ -273,22 +283,25 @@ class MongoRequestHandler(SocketServer.BaseRequestHandler):
             # TLS 'client hello' starts from \x16
             self._init_ssl()
 
-        while True:
-            header = self._read_bytes(16)
-            if header is False:
-                # connection closed by client
-                break
-            length, pos = unpack(INT, header)
-            request_id, pos = unpack(INT, header, pos)
-            response_to, pos = unpack(INT, header, pos)
-            opcode, pos = unpack(INT, header, pos)
-            logger.debug(f'GET length={length} id={request_id} opcode={opcode}')
-            msg_bytes = self._read_bytes(length - pos)
-            answer = self.get_answer(request_id, opcode, msg_bytes)
-            if answer is not None:
-                self.request.send(answer)
-
-            db.session.close()
+    def process_message(self):
+        """
+        Reads one message and sends answer to it
+        :return: False if connection is closed by client
+        """
+        header = self._read_bytes(16)
+        if header is False:
+            # connection closed by client
+            return False
+        length, pos = unpack(INT, header)
+        request_id, pos = unpack(INT, header, pos)
+        response_to, pos = unpack(INT, header, pos)
+        opcode, pos = unpack(INT, header, pos)
+        logger.debug(f'GET length={length} id={request_id} opcode={opcode}')
+        msg_bytes = self._read_bytes(length - pos)
+        answer = self.get_answer(request_id, opcode, msg_bytes)
+        if answer is not None:
+            self.request.send(answer)
+        return True
 
     def get_answer(self, request_id, opcode, msg_bytes):
         if opcode not in self.server.operationsHandlersMap:
@@ -324,22 +337,41 @@ class MongoRequestHandler(SocketServer.BaseRequestHandler):
         return buffer
 
 
-class MongoServer(SocketServer.ThreadingMixIn, SocketServer.TCPServer):
-    def __init__(self, config):
-        mongodb_config = config['api'].get('mongodb')
-        assert mongodb_config is not None, 'is no mongodb config!'
-        host = mongodb_config['host']
-        port = mongodb_config['port']
-        logger.debug(f'start mongo server on {host}:{port}')
+class AsyncMongoRequestHandler(AsyncRequestHandler, MongoRequestHandler):
+    """
+    MongoRequestHandler served by AsyncServer: message is header and body of operation
+    """
+
+    def _init_ssl(self):
+        logger.warning('TLS connection is rejected: it is not supported by async server')
+        raise ConnectionAbortedError('TLS is not supported by async server')
+
+    @staticmethod
+    def message_length(buffer):
+        if len(buffer) < 4:
+            return None
+        return unpack(INT, buffer)[0]
 
-        super().__init__((host, int(port)), MongoRequestHandler)
+    def start(self):
+        self.start_session()
+        return True
 
+    def close(self):
+        self.session.close_cursors()
+
+
+class MongoServerMixin:
+    def init_mongo_env(self, config):
+        mongodb_config = config['api']['mongodb']
         self.mindsdb_env = {
             'config': config,
             'model_controller': ModelController(),
             'integration_controller': integration_controller,
             'project_controller': ProjectController(),
-            'database_controller': DatabaseController()
+            'database_controller': DatabaseController(),
+            'cursors': CursorRegistry(
+                timeout=mongodb_config.get('cursor_timeout', DEFAULT_CURSOR_TIMEOUT)
+            )
         }
 
         respondersCollection = RespondersCollection()
@@ -382,7 +414,32 @@ class MongoServer(SocketServer.ThreadingMixIn, SocketServer.TCPServer):
         respondersCollection.responders += responders
 
 
+def get_server_address(config):
+    mongodb_config = config['api'].get('mongodb')
+    assert mongodb_config is not None, 'is no mongodb config!'
+    host = mongodb_config['host']
+    port = mongodb_config['port']
+    logger.debug(f'start mongo server on {host}:{port}')
+    return host, int(port)
+
+
+class MongoServer(MongoServerMixin, SocketServer.ThreadingMixIn, SocketServer.TCPServer):
+    def __init__(self, config):
+        super().__init__(get_server_address(config), MongoRequestHandler)
+        self.init_mongo_env(config)
+
+
+class AsyncMongoServer(MongoServerMixin, AsyncServer):
+    def __init__(self, config):
+        super().__init__(get_server_address(config), AsyncMongoRequestHandler, config['api']['mongodb'].get('server'))
+        self.init_mongo_env(config)
+
+
 def run_server(config):
-    SocketServer.TCPServer.allow_reuse_address = True
-    with MongoServer(config) as srv:
+    if is_async_server(config['api']['mongodb']):
+        server_class = AsyncMongoServer
+    else:
+        SocketServer.TCPServer.allow_reuse_address = True
+        server_class = MongoServer
+    with server_class(config) as srv:
         srv.serve_forever()
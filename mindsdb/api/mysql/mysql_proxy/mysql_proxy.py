@@ -28,6 +28,7 @@ from pandas.api import types as pd_types
 
 import mindsdb.utilities.hooks as hooks
 import mindsdb.utilities.profiler as profiler
+from mindsdb.api.common.async_server import AsyncRequestHandler, AsyncServer, is_async_server
 from mindsdb.api.mysql.mysql_proxy.classes.client_capabilities import ClentCapabilities
 from mindsdb.api.mysql.mysql_proxy.classes.server_capabilities import (
     server_capabilities,
@@ -64,6 +65,7 @@ from mindsdb.api.mysql.mysql_proxy.libs.constants.mysql import (
     COMMANDS,
     DEFAULT_AUTH_METHOD,
     ERR,
+    MAX_PACKET_SIZE,
     SERVER_STATUS,
     TYPES,
     getConstName,
@@ -649,6 +651,16 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
         Handle new incoming connections
         :return:
         """
+        if self.start_session() is False:
+            return
+        while self.process_command():
+            pass
+
+    def start_session(self):
+        """
+        Init session of new connection and make handshake
+        :return: False if connection has to be closed
+        """
         ctx.set_default()
 
         self.server.hook_before_handle()
@@ -661,7 +673,7 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
         self.init_session()
         if cloud_connection["is_cloud"] is False:
             if self.handshake() is False:
-                return
+                return False
         else:
             ctx.user_class = cloud_connection["user_class"]
             ctx.email_confirmed = cloud_connection["email_confirmed"]
@@ -671,161 +683,167 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
             self.session.database = cloud_connection["database"]
             self.session.username = "cloud"
             self.session.auth = True
+        return True
 
-        while True:
-            logger.debug("Got a new packet")
-            p = self.packet(CommandPacket)
-
-            try:
-                success = p.get()
-            except Exception:
-                logger.error("Session closed, on packet read error")
-                logger.error(traceback.format_exc())
-                return
+    def process_command(self):
+        """
+        Read and answer one command packet
+        :return: False if connection has to be closed
+        """
+        logger.debug("Got a new packet")
+        p = self.packet(CommandPacket)
 
-            if success is False:
-                logger.debug("Session closed by client")
-                return
+        try:
+            success = p.get()
+        except Exception:
+            logger.error("Session closed, on packet read error")
+            logger.error(traceback.format_exc())
+            return False
 
-            logger.debug(
-                "Command TYPE: {type}".format(type=getConstName(COMMANDS, p.type.value))
-            )
+        if success is False:
+            logger.debug("Session closed by client")
+            return False
 
-            command_names = {
-                COMMANDS.COM_QUERY: "COM_QUERY",
-                COMMANDS.COM_STMT_PREPARE: "COM_STMT_PREPARE",
-                COMMANDS.COM_STMT_EXECUTE: "COM_STMT_EXECUTE",
-                COMMANDS.COM_STMT_FETCH: "COM_STMT_FETCH",
-                COMMANDS.COM_STMT_CLOSE: "COM_STMT_CLOSE",
-                COMMANDS.COM_QUIT: "COM_QUIT",
-                COMMANDS.COM_INIT_DB: "COM_INIT_DB",
-                COMMANDS.COM_FIELD_LIST: "COM_FIELD_LIST",
-            }
+        logger.debug(
+            "Command TYPE: {type}".format(type=getConstName(COMMANDS, p.type.value))
+        )
 
-            command_name = command_names.get(p.type.value, f"UNKNOWN {p.type.value}")
-            sql = None
-            response = None
-            error_type = None
-            error_code = None
-            error_text = None
-            error_traceback = None
+        command_names = {
+            COMMANDS.COM_QUERY: "COM_QUERY",
+            COMMANDS.COM_STMT_PREPARE: "COM_STMT_PREPARE",
+            COMMANDS.COM_STMT_EXECUTE: "COM_STMT_EXECUTE",
+            COMMANDS.COM_STMT_FETCH: "COM_STMT_FETCH",
+            COMMANDS.COM_STMT_CLOSE: "COM_STMT_CLOSE",
+            COMMANDS.COM_QUIT: "COM_QUIT",
+            COMMANDS.COM_INIT_DB: "COM_INIT_DB",
+            COMMANDS.COM_FIELD_LIST: "COM_FIELD_LIST",
+        }
 
-            try:
-                if p.type.value == COMMANDS.COM_QUERY:
-                    sql = self.decode_utf(p.sql.value)
-                    sql = SqlStatementParser.clear_sql(sql)
-                    logger.debug(f"COM_QUERY: {sql}")
-                    profiler.set_meta(
-                        query=sql, api="mysql", environment=Config().get("environment")
-                    )
-                    with profiler.Context("mysql_query_processing"):
-                        response = self.process_query(sql)
-                elif p.type.value == COMMANDS.COM_STMT_PREPARE:
-                    sql = self.decode_utf(p.sql.value)
-                    self.answer_stmt_prepare(sql)
-                elif p.type.value == COMMANDS.COM_STMT_EXECUTE:
-                    self.answer_stmt_execute(p.stmt_id.value, p.parameters)
-                elif p.type.value == COMMANDS.COM_STMT_FETCH:
-                    self.answer_stmt_fetch(p.stmt_id.value, p.limit.value)
-                elif p.type.value == COMMANDS.COM_STMT_CLOSE:
-                    self.answer_stmt_close(p.stmt_id.value)
-                elif p.type.value == COMMANDS.COM_QUIT:
-                    logger.debug("Session closed, on client disconnect")
-                    self.session = None
-                    break
-                elif p.type.value == COMMANDS.COM_INIT_DB:
-                    new_database = p.database.value.decode()
-
-                    executor = Executor(session=self.session, sqlserver=self)
-                    executor.change_default_db(new_database)
-
-                    response = SQLAnswer(RESPONSE_TYPE.OK)
-                elif p.type.value == COMMANDS.COM_FIELD_LIST:
-                    # this command is deprecated, but console client still use it.
-                    response = SQLAnswer(RESPONSE_TYPE.OK)
-                else:
-                    logger.warning("Command has no specific handler, return OK msg")
-                    logger.debug(str(p))
-                    # p.pprintPacket() TODO: Make a version of print packet
-                    # that sends it to debug instead
-                    response = SQLAnswer(RESPONSE_TYPE.OK)
-
-            except SqlApiException as e:
-                # classified error
-                error_type = "expected"
-
-                response = SQLAnswer(
-                    resp_type=RESPONSE_TYPE.ERROR,
-                    error_code=e.err_code,
-                    error_message=str(e),
-                )
+        command_name = command_names.get(p.type.value, f"UNKNOWN {p.type.value}")
+        sql = None
+        response = None
+        error_type = None
+        error_code = None
+        error_text = None
+        error_traceback = None
 
-            except exec_exc.ExecutorException as e:
-                # unclassified
-                error_type = "expected"
-
-                if isinstance(e, exec_exc.NotSupportedYet):
-                    error_code = ERR.ER_NOT_SUPPORTED_YET
-                elif isinstance(e, exec_exc.KeyColumnDoesNotExist):
-                    error_code = ERR.ER_KEY_COLUMN_DOES_NOT_EXIST
-                elif isinstance(e, exec_exc.TableNotExistError):
-                    error_code = ERR.ER_TABLE_EXISTS_ERROR
-                elif isinstance(e, exec_exc.WrongArgumentError):
-                    error_code = ERR.ER_WRONG_ARGUMENTS
-                elif isinstance(e, exec_exc.LogicError):
-                    error_code = ERR.ER_WRONG_USAGE
-                elif isinstance(e, (exec_exc.BadDbError, exec_exc.BadTableError)):
-                    error_code = ERR.ER_BAD_DB_ERROR
-                else:
-                    error_code = ERR.ER_SYNTAX_ERROR
-
-                response = SQLAnswer(
-                    resp_type=RESPONSE_TYPE.ERROR,
-                    error_code=error_code,
-                    error_message=str(e),
-                )
-            except exec_exc.UnknownError as e:
-                # unclassified
-                error_type = "unexpected"
-
-                response = SQLAnswer(
-                    resp_type=RESPONSE_TYPE.ERROR,
-                    error_code=ERR.ER_UNKNOWN_ERROR,
-                    error_message=str(e),
+        try:
+            if p.type.value == COMMANDS.COM_QUERY:
+                sql = self.decode_utf(p.sql.value)
+                sql = SqlStatementParser.clear_sql(sql)
+                logger.debug(f"COM_QUERY: {sql}")
+                profiler.set_meta(
+                    query=sql, api="mysql", environment=Config().get("environment")
                 )
+                with profiler.Context("mysql_query_processing"):
+                    response = self.process_query(sql)
+            elif p.type.value == COMMANDS.COM_STMT_PREPARE:
+                sql = self.decode_utf(p.sql.value)
+                self.answer_stmt_prepare(sql)
+            elif p.type.value == COMMANDS.COM_STMT_EXECUTE:
+                self.answer_stmt_execute(p.stmt_id.value, p.parameters)
+            elif p.type.value == COMMANDS.COM_STMT_FETCH:
+                self.answer_stmt_fetch(p.stmt_id.value, p.limit.value)
+            elif p.type.value == COMMANDS.COM_STMT_CLOSE:
+                self.answer_stmt_close(p.stmt_id.value)
+            elif p.type.value == COMMANDS.COM_QUIT:
+                logger.debug("Session closed, on client disconnect")
+                self.session = None
+                return False
+            elif p.type.value == COMMANDS.COM_INIT_DB:
+                new_database = p.database.value.decode()
+
+                executor = Executor(session=self.session, sqlserver=self)
+                executor.change_default_db(new_database)
+
+                response = SQLAnswer(RESPONSE_TYPE.OK)
+            elif p.type.value == COMMANDS.COM_FIELD_LIST:
+                # this command is deprecated, but console client still use it.
+                response = SQLAnswer(RESPONSE_TYPE.OK)
+            else:
+                logger.warning("Command has no specific handler, return OK msg")
+                logger.debug(str(p))
+                # p.pprintPacket() TODO: Make a version of print packet
+                # that sends it to debug instead
+                response = SQLAnswer(RESPONSE_TYPE.OK)
+
+        except SqlApiException as e:
+            # classified error
+            error_type = "expected"
+
+            response = SQLAnswer(
+                resp_type=RESPONSE_TYPE.ERROR,
+                error_code=e.err_code,
+                error_message=str(e),
+            )
 
-            except Exception as e:
-                # any other exception
-                error_type = "unexpected"
-                error_traceback = traceback.format_exc()
-                logger.error(
-                    f"ERROR while executing query\n" f"{error_traceback}\n" f"{e}"
-                )
+        except exec_exc.ExecutorException as e:
+            # unclassified
+            error_type = "expected"
+
+            if isinstance(e, exec_exc.NotSupportedYet):
+                error_code = ERR.ER_NOT_SUPPORTED_YET
+            elif isinstance(e, exec_exc.KeyColumnDoesNotExist):
+                error_code = ERR.ER_KEY_COLUMN_DOES_NOT_EXIST
+            elif isinstance(e, exec_exc.TableNotExistError):
+                error_code = ERR.ER_TABLE_EXISTS_ERROR
+            elif isinstance(e, exec_exc.WrongArgumentError):
+                error_code = ERR.ER_WRONG_ARGUMENTS
+            elif isinstance(e, exec_exc.LogicError):
+                error_code = ERR.ER_WRONG_USAGE
+            elif isinstance(e, (exec_exc.BadDbError, exec_exc.BadTableError)):
+                error_code = ERR.ER_BAD_DB_ERROR
+            else:
                 error_code = ERR.ER_SYNTAX_ERROR
-                response = SQLAnswer(
-                    resp_type=RESPONSE_TYPE.ERROR,
-                    error_code=error_code,
-                    error_message=str(e),
-                )
 
-            if response is not None:
-                self.send_query_answer(response)
-                if response.type == RESPONSE_TYPE.ERROR:
-                    error_text = response.error_message
-                    error_code = response.error_code
-                    error_type = error_type or "expected"
-
-            hooks.after_api_query(
-                company_id=ctx.company_id,
-                api="mysql",
-                command=command_name,
-                payload=sql,
-                error_type=error_type,
+            response = SQLAnswer(
+                resp_type=RESPONSE_TYPE.ERROR,
                 error_code=error_code,
-                error_text=error_text,
-                traceback=error_traceback,
+                error_message=str(e),
+            )
+        except exec_exc.UnknownError as e:
+            # unclassified
+            error_type = "unexpected"
+
+            response = SQLAnswer(
+                resp_type=RESPONSE_TYPE.ERROR,
+                error_code=ERR.ER_UNKNOWN_ERROR,
+                error_message=str(e),
             )
 
+        except Exception as e:
+            # any other exception
+            error_type = "unexpected"
+            error_traceback = traceback.format_exc()
+            logger.error(
+                f"ERROR while executing query\n" f"{error_traceback}\n" f"{e}"
+            )
+            error_code = ERR.ER_SYNTAX_ERROR
+            response = SQLAnswer(
+                resp_type=RESPONSE_TYPE.ERROR,
+                error_code=error_code,
+                error_message=str(e),
+            )
+
+        if response is not None:
+            self.send_query_answer(response)
+            if response.type == RESPONSE_TYPE.ERROR:
+                error_text = response.error_message
+                error_code = response.error_code
+                error_type = error_type or "expected"
+
+        hooks.after_api_query(
+            company_id=ctx.company_id,
+            api="mysql",
+            command=command_name,
+            payload=sql,
+            error_type=error_type,
+            error_code=error_code,
+            error_text=error_text,
+            traceback=error_traceback,
+        )
+        return True
+
     def packet(self, packetClass=Packet, **kwargs):
         """
         Factory method for packets
@@ -883,16 +901,21 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
         elif not os.path.exists(cert_path):
             logger.error("Certificate defined in 'certificate_path' setting does not exist")
 
-        # TODO make it session local
-        server_capabilities.set(CAPABILITIES.CLIENT_SSL, config["api"]["mysql"]["ssl"])
-
         host = config["api"]["mysql"]["host"]
         port = int(config["api"]["mysql"]["port"])
 
         logger.info(f"Starting MindsDB Mysql proxy server on tcp://{host}:{port}")
 
-        SocketServer.TCPServer.allow_reuse_address = True
-        server = SocketServer.ThreadingTCPServer((host, port), MysqlProxy)
+        if is_async_server(config["api"]["mysql"]):
+            # TLS is not supported by async server
+            server_capabilities.set(CAPABILITIES.CLIENT_SSL, False)
+            server = AsyncServer((host, port), AsyncMysqlProxy, config["api"]["mysql"]["server"])
+        else:
+            # TODO make it session local
+            server_capabilities.set(CAPABILITIES.CLIENT_SSL, config["api"]["mysql"]["ssl"])
+
+            SocketServer.TCPServer.allow_reuse_address = True
+            server = SocketServer.ThreadingTCPServer((host, port), MysqlProxy)
         server.mindsdb_config = config
         server.check_auth = partial(check_auth, config=config)
         server.cert_path = cert_path
@@ -905,3 +928,29 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
         # interrupt the program with Ctrl-C
         logger.info("Waiting for incoming connections...")
         server.serve_forever()
+
+
+class AsyncMysqlProxy(AsyncRequestHandler, MysqlProxy):
+    """
+    MysqlProxy served by AsyncServer: message is a command packet
+    """
+
+    server_speaks_first = True
+
+    @staticmethod
+    def message_length(buffer):
+        length = 0
+        while True:
+            if len(buffer) < length + 4:
+                return None
+            packet_length = int.from_bytes(buffer[length:length + 3], 'little')
+            length += 4 + packet_length
+            # packets of max size are continued by the next packet
+            if packet_length != MAX_PACKET_SIZE:
+                return length
+
+    def start(self):
+        return self.start_session()
+
+    def process_message(self):
+        return self.process_command()
@@ -10,9 +10,30 @@ from mindsdb.api.executor import SQLQuery, Column
 from mindsdb.api.mysql.mysql_proxy.utilities.lightwood_dtype import dtype
 from mindsdb.api.executor.command_executor import ExecuteCommands
 from mindsdb.api.mysql.mysql_proxy.utilities import SqlApiException
+from mindsdb.api.mysql.mysql_proxy.libs.constants.mysql import TYPES
 from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_fields import POSTGRES_TYPES
 from mindsdb.utilities import log
 
+# mysql protocol type -> postgres type, other mysql types are sent as text
+MYSQL_TO_POSTGRES_TYPES = {
+    TYPES.MYSQL_TYPE_TINY: POSTGRES_TYPES.INT,
+    TYPES.MYSQL_TYPE_SHORT: POSTGRES_TYPES.INT,
+    TYPES.MYSQL_TYPE_INT24: POSTGRES_TYPES.INT,
+    TYPES.MYSQL_TYPE_LONG: POSTGRES_TYPES.INT,
+    TYPES.MYSQL_TYPE_YEAR: POSTGRES_TYPES.INT,
+    TYPES.MYSQL_TYPE_LONGLONG: POSTGRES_TYPES.LONG,
+    TYPES.MYSQL_TYPE_FLOAT: POSTGRES_TYPES.DOUBLE,
+    TYPES.MYSQL_TYPE_DOUBLE: POSTGRES_TYPES.DOUBLE,
+    TYPES.MYSQL_TYPE_DECIMAL: POSTGRES_TYPES.DOUBLE,
+    TYPES.MYSQL_TYPE_NEWDECIMAL: POSTGRES_TYPES.DOUBLE,
+    TYPES.MYSQL_TYPE_DATE: POSTGRES_TYPES.DATE,
+    TYPES.MYSQL_TYPE_NEWDATE: POSTGRES_TYPES.DATE,
+    TYPES.MYSQL_TYPE_DATETIME: POSTGRES_TYPES.DATETIME,
+    TYPES.MYSQL_TYPE_DATETIME2: POSTGRES_TYPES.DATETIME,
+    TYPES.MYSQL_TYPE_TIMESTAMP: POSTGRES_TYPES.DATETIME,
+    TYPES.MYSQL_TYPE_TIMESTAMP2: POSTGRES_TYPES.DATETIME,
+}
+
 
 class Executor:
     def __init__(self, session, proxy_server, charset=None):
@@ -90,7 +111,8 @@ class Executor:
         self.is_executed = True
 
         if ret.data is not None:
-            self.data = ret.data.to_lists()
+            # result is kept as table, it is encoded column-wise for output
+            self.data = ret.data
             self.columns = ret.data.columns
 
         self.state_track = ret.state_track
@@ -99,7 +121,7 @@ class Executor:
         params = {
             "columns": self.to_postgres_columns(self.columns),
             "params": self.to_postgres_columns(self.params),
-            "data": self.data,
+            "data": None if self.data is None else self.data.to_lists(),
             "state_track": self.state_track,
             "server_status": self.server_status,
             "is_executed": self.is_executed,
@@ -122,10 +144,12 @@ class Executor:
             column_type = POSTGRES_TYPES.VARCHAR
             # is already in mysql protocol type?
             if isinstance(field_type, int):
-                column_type = POSTGRES_TYPES.INT
+                column_type = MYSQL_TO_POSTGRES_TYPES.get(field_type, POSTGRES_TYPES.VARCHAR)
             # pandas checks
             elif isinstance(field_type, np_dtype):
-                if pd_types.is_integer_dtype(field_type):
+                if pd_types.is_bool_dtype(field_type):
+                    column_type = POSTGRES_TYPES.BOOL
+                elif pd_types.is_integer_dtype(field_type):
                     column_type = POSTGRES_TYPES.LONG
                 elif pd_types.is_numeric_dtype(field_type):
                     column_type = POSTGRES_TYPES.DOUBLE
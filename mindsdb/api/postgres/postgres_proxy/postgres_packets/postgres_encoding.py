@@ -0,0 +1,209 @@
+"""
+Column-wise encoding of result table to DataRow messages.
+
+Converter is chosen once per column by declared postgres type and dtype of the column,
+the whole column is converted at once. Every cell is stored with its length prefix,
+so a DataRow message is a concatenation of cells of the row.
+"""
+import json
+import struct
+import datetime
+from typing import Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from pandas.api import types as pd_types
+
+from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_fields import POSTGRES_TYPES, PostgresField
+from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_message_identifiers import \
+    PostgresBackendMessageIdentifier
+from mindsdb.integrations.libs.vector_column import is_vector_column, vector_column_to_text
+
+TEXT_FORMAT = 0
+BINARY_FORMAT = 1
+
+# size of data written to the socket at once
+CHUNK_SIZE = 64 * 1024
+
+NULL_CELL = struct.pack('!i', -1)
+
+# binary format of timestamp and date: time from 2000-01-01
+POSTGRES_EPOCH = np.datetime64('2000-01-01T00:00:00', 'us')
+POSTGRES_EPOCH_DATE = np.datetime64('2000-01-01', 'D')
+
+# types which have binary format different from text
+BINARY_DTYPES = {
+    POSTGRES_TYPES.INT: '>i4',
+    POSTGRES_TYPES.LONG: '>i8',
+    POSTGRES_TYPES.DOUBLE: '>f8',
+    POSTGRES_TYPES.DATETIME: '>i8',
+    POSTGRES_TYPES.DATE: '>i4',
+    POSTGRES_TYPES.BOOL: '>i1',
+}
+
+
+def _value_to_text(value) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (bool, np.bool_)):
+        return 'true' if value else 'false'
+    if isinstance(value, (float, np.floating)):
+        if np.isnan(value):
+            return None
+        if np.isinf(value):
+            return 'Infinity' if value > 0 else '-Infinity'
+        return str(value)
+    if isinstance(value, datetime.datetime):
+        if pd.isna(value):
+            return None
+        return value.isoformat(sep=' ')
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    if isinstance(value, (list, dict)):
+        return json.dumps(value)
+    if isinstance(value, np.ndarray):
+        return json.dumps(value.tolist())
+    if isinstance(value, bytes):
+        return value.decode(errors='replace')
+    if value is pd.NaT or value is pd.NA:
+        return None
+    return str(value)
+
+
+def column_to_text(column: pd.Series) -> pd.Series:
+    """
+    Converts column to text representation, missing values are None
+    """
+    if is_vector_column(column):
+        return vector_column_to_text(column)
+
+    dtype = column.dtype
+    if pd_types.is_bool_dtype(dtype):
+        return pd.Series(np.where(column.to_numpy(dtype=bool), 'true', 'false'), index=column.index, dtype=object)
+
+    if pd_types.is_integer_dtype(dtype) and not pd_types.is_extension_array_dtype(dtype):
+        return column.astype(str).astype(object)
+
+    if pd_types.is_float_dtype(dtype):
+        values = column.astype(str).astype(object)
+        values[np.isposinf(column)] = 'Infinity'
+        values[np.isneginf(column)] = '-Infinity'
+        values[column.isna()] = None
+        return values
+
+    if pd_types.is_datetime64_any_dtype(dtype):
+        if column.dt.tz is not None:
+            column = column.dt.tz_convert(None)
+        values = column.to_numpy(dtype='datetime64[us]')
+        mask = column.isna().to_numpy()
+        # fraction of seconds is shown only if it is present
+        unit = 's'
+        if (values[~mask].astype(np.int64) % 1_000_000 != 0).any():
+            unit = 'us'
+        values = pd.Series(np.datetime_as_string(values, unit=unit), index=column.index, dtype=object)
+        values = values.str.replace('T', ' ', n=1, regex=False)
+        values[mask] = None
+        return values
+
+    return pd.Series([_value_to_text(value) for value in column], index=column.index, dtype=object)
+
+
+def _text_cells(values: Sequence[Optional[str]], charset: str) -> List[bytes]:
+    cells = []
+    for value in values:
+        if value is None:
+            cells.append(NULL_CELL)
+        else:
+            value = value.encode(charset)
+            cells.append(struct.pack('!i', len(value)) + value)
+    return cells
+
+
+def _binary_cells(column: pd.Series, postgres_type: POSTGRES_TYPES) -> List[bytes]:
+    """
+    Binary format of fixed-size types. Values which can't be converted to the type are sent as NULL
+    """
+    if postgres_type in (POSTGRES_TYPES.DATETIME, POSTGRES_TYPES.DATE):
+        values = pd.to_datetime(column, errors='coerce')
+        if getattr(values.dt, 'tz', None) is not None:
+            values = values.dt.tz_convert(None)
+        mask = values.notna().to_numpy()
+        if postgres_type == POSTGRES_TYPES.DATETIME:
+            values = values[mask].to_numpy(dtype='datetime64[us]') - POSTGRES_EPOCH
+        else:
+            values = values[mask].to_numpy(dtype='datetime64[D]') - POSTGRES_EPOCH_DATE
+        values = values.astype(np.int64)
+    else:
+        if pd_types.is_bool_dtype(column.dtype):
+            values = column.astype(float)
+        else:
+            values = pd.to_numeric(column, errors='coerce')
+        mask = values.notna().to_numpy().copy()
+        values = values[mask].to_numpy()
+        if postgres_type != POSTGRES_TYPES.DOUBLE:
+            # values out of range of the type are sent as NULL
+            limits = np.iinfo(np.dtype(BINARY_DTYPES[postgres_type]))
+            in_range = (values >= limits.min) & (values <= limits.max)
+            mask[mask] = in_range
+            values = values[in_range].astype(np.int64)
+
+    # every cell is length and value
+    item_dtype = np.dtype(BINARY_DTYPES[postgres_type])
+    cells = np.empty(len(values), dtype=[('length', '>i4'), ('value', item_dtype)])
+    cells['length'] = item_dtype.itemsize
+    cells['value'] = values
+    data = cells.tobytes()
+    size = cells.dtype.itemsize
+
+    result = [NULL_CELL] * len(column)
+    positions = np.flatnonzero(mask)
+    for i, position in enumerate(positions):
+        result[position] = data[i * size: (i + 1) * size]
+    return result
+
+
+def encode_column(column: pd.Series, field: PostgresField, charset: str = 'utf8') -> List[bytes]:
+    """
+    Encodes column to cells of DataRow message
+    :param column: values of the column
+    :param field: field from RowDescription, defines type and format of values
+    :param charset: charset of text values
+    :return: list of encoded cells (length + value)
+    """
+    postgres_type = getattr(field, 'postgres_type', POSTGRES_TYPES.VARCHAR)
+    if field.format_code == BINARY_FORMAT and postgres_type in BINARY_DTYPES:
+        return _binary_cells(column, postgres_type)
+    # binary format of text is the same as text format
+    return _text_cells(column_to_text(column), charset)
+
+
+def iter_data_rows(
+    df: pd.DataFrame, fields: Sequence[PostgresField], charset: str = 'utf8', chunk_size: int = CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Encodes dataframe to sequence of DataRow messages
+    :return: chunks of bytes, every chunk contains several messages
+    """
+    identifier = PostgresBackendMessageIdentifier.DATA_ROW.value
+    num_cols = struct.pack('!h', len(df.columns))
+
+    columns = [
+        encode_column(df.iloc[:, i], fields[i], charset)
+        for i in range(len(df.columns))
+    ]
+
+    chunk = []
+    chunk_len = 0
+    for cells in zip(*columns):
+        body = b''.join(cells)
+        # length includes itself and count of columns
+        chunk.append(identifier + struct.pack('!i', len(body) + 6) + num_cols + body)
+        chunk_len += len(body) + 7
+        if chunk_len >= chunk_size:
+            yield b''.join(chunk)
+            chunk = []
+            chunk_len = 0
+    if len(chunk) > 0:
+        yield b''.join(chunk)
@@ -19,6 +19,16 @@ class GenericField(PostgresField):
                          column_id=column_id)
 
 
+class TypedField(PostgresField):
+    """Field of one of POSTGRES_TYPES, values are encoded in text (format_code=0) or binary (format_code=1) format"""
+    def __init__(self, name: str, postgres_type: 'POSTGRES_TYPES', format_code: int = 0, table_id: int = 0,
+                 column_id: int = 0):
+        object_id, dt_size = POSTGRES_TYPE_OIDS[postgres_type]
+        super().__init__(name=name, object_id=object_id, dt_size=dt_size, type_modifier=-1, format_code=format_code,
+                         table_id=table_id, column_id=column_id)
+        self.postgres_type = postgres_type
+
+
 class IntField(PostgresField):
     def __init__(self, name: str, table_id: int = 0, column_id: int = 0):
         super().__init__(name=name, object_id=23, dt_size=4, type_modifier=-1, format_code=0, table_id=table_id,
@@ -32,3 +42,16 @@ class POSTGRES_TYPES(Enum):
     DOUBLE = 3
     DATETIME = 4
     DATE = 5
+    BOOL = 6
+
+
+# oid and size of the types, as in pg_type
+POSTGRES_TYPE_OIDS = {
+    POSTGRES_TYPES.VARCHAR: (25, -1),  # text
+    POSTGRES_TYPES.INT: (23, 4),  # int4
+    POSTGRES_TYPES.LONG: (20, 8),  # int8
+    POSTGRES_TYPES.DOUBLE: (701, 8),  # float8
+    POSTGRES_TYPES.DATETIME: (1114, 8),  # timestamp
+    POSTGRES_TYPES.DATE: (1082, 4),  # date
+    POSTGRES_TYPES.BOOL: (16, 1),  # bool
+}
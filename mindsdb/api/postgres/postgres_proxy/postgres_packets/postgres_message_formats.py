@@ -1,7 +1,10 @@
 from typing import BinaryIO, Sequence, Dict, Type
 
+import pandas as pd
+
 from mindsdb.api.mysql.mysql_proxy.classes.sql_statement_parser import SqlStatementParser
 from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_fields import PostgresField
+from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_encoding import iter_data_rows
 from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_message import PostgresMessage
 from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_message_identifiers import \
     PostgresBackendMessageIdentifier, PostgresFrontendMessageIdentifier, PostgresAuthType
@@ -411,6 +414,25 @@ class DataRow(PostgresMessage):
                 .write(write_file=write_file)
 
 
+class DataRows(PostgresMessage):
+    """
+    Sequence of DataRow messages for all rows of the result table.
+    Values are encoded column-wise by type and format of the fields, messages are written in chunks."""
+
+    def __init__(self, df: pd.DataFrame, fields: Sequence[PostgresField], charset: str = 'utf8'):
+        self.identifier = PostgresBackendMessageIdentifier.DATA_ROW
+        self.backend_capable = True
+        self.frontend_capable = False
+        self.df = df
+        self.fields = fields
+        self.charset = charset
+        super().__init__()
+
+    def send_internal(self, write_file: BinaryIO):
+        for chunk in iter_data_rows(self.df, self.fields, self.charset):
+            write_file.write(chunk)
+
+
 class NegotiateProtocolVersion(PostgresMessage):
     """
     NegotiateProtocolVersion (B)
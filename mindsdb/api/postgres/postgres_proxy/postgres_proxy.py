@@ -1,15 +1,14 @@
 import base64
-import datetime
 import os
-import json
 import select
 import socketserver
 import struct
 import sys
 from functools import partial
 import socket
-from typing import Callable, Dict, Type, Any, Iterable, Sequence
+from typing import Callable, Dict, Type, Any, Iterable, Sequence, Optional
 
+from mindsdb.api.common.async_server import AsyncRequestHandler, AsyncServer, is_async_server
 from mindsdb.api.executor.controllers import SessionController
 from mindsdb.api.postgres.postgres_proxy.executor import Executor
 from mindsdb.api.mysql.mysql_proxy.libs.constants.mysql import CHARSET_NUMBERS
@@ -17,9 +16,9 @@ from mindsdb.api.executor.data_types.response_type import RESPONSE_TYPE
 from mindsdb.api.common.check_auth import check_auth
 from mindsdb.api.mysql.mysql_proxy.mysql_proxy import SQLAnswer
 from mindsdb.api.postgres.postgres_proxy.postgres_packets.errors import POSTGRES_SYNTAX_ERROR_CODE
-from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_fields import GenericField, PostgresField
+from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_fields import TypedField, PostgresField
 from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_message_formats import Terminate, \
-    Query, AuthenticationClearTextPassword, AuthenticationOk, RowDescriptions, DataRow, CommandComplete, \
+    Query, AuthenticationClearTextPassword, AuthenticationOk, RowDescriptions, DataRows, CommandComplete, \
     ReadyForQuery, ConnectionFailure, ParameterStatus, Error, Execute, Bind, Parse, Sync, ParseComplete, \
     InvalidSQLStatementName, BindComplete, Describe, DataException, ParameterDescription
 from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_message import PostgresMessage
@@ -52,7 +51,10 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
         super().__init__(request, client_address, server)
 
     def handle(self) -> None:
+        if self.start_session():
+            self.main_loop()
 
+    def start_session(self) -> bool:
         ctx.set_default()
         self.init_session()
         self.logger.debug('handle new incoming connection')
@@ -80,7 +82,8 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
         if started:
             self.logger.debug("connection started")
             self.send_initial_data()
-            self.main_loop()
+            self.send_ready()
+        return started
 
     def is_cloud_connection(self):
         """ Determine source of connection. Must be call before handshake.
@@ -171,6 +174,11 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
         # TODO Should check validity of statement here and not at parse stage
         portal = statement.copy()
         portal["bind"] = message
+        executor = statement["executor"]
+        portal["fields"] = self.to_postgres_fields(
+            executor.to_postgres_columns(executor.columns),
+            result_format_codes=message.result_format_codes
+        )
         if message.name:
             self.named_portals[message.name] = portal
         else:
@@ -201,7 +209,11 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
             self.send(DataException(message="Describe did not have correct type. Can be 'P' or 'S'"))
             return True
 
-        fields = self.to_postgres_fields(describing["executor"].columns)
+        fields = describing.get("fields")
+        if fields is None:
+            # format of statement result is not known yet: text
+            executor = describing["executor"]
+            fields = self.to_postgres_fields(executor.to_postgres_columns(executor.columns))
         self.send(RowDescriptions(fields=fields))
         return True
 
@@ -218,7 +230,9 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
         params = portal["bind"].parameters
         executor.stmt_execute(param_values=params)
         sql_answer = self.return_executor_data(executor)
-        self.respond_from_sql_answer(sql=executor.sql, sql_answer=sql_answer, row_descs=False)
+        self.respond_from_sql_answer(
+            sql=executor.sql, sql_answer=sql_answer, row_descs=False, fields=portal.get("fields")
+        )
         return True
 
     def sync(self, message: Sync):
@@ -351,14 +365,16 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
             sql: str = sql.decode(encoding)
         return strip_null_byte(sql).strip(';')
 
-    def return_table(self, sql_answer: SQLAnswer, row_descs=True):
-        fields = self.to_postgres_fields(sql_answer.columns)
-        rows = self.to_postgres_rows(sql_answer.data)
+    def return_table(self, sql_answer: SQLAnswer, row_descs=True, fields: Optional[Sequence[PostgresField]] = None):
+        # fields which were sent to client in RowDescription (for extended query) define the format of values
+        if fields is None or len(fields) != len(sql_answer.columns):
+            fields = self.to_postgres_fields(sql_answer.columns)
+        df = sql_answer.data.get_raw_df()
         if row_descs:
             self.send(RowDescriptions(fields=fields))
-        self.send(DataRow(rows=rows))
+        self.send(DataRows(df=df, fields=fields, charset=self.charset))
         encoding = self.get_encoding()
-        tag = ('SELECT %s' % str(len(rows))).encode(encoding)
+        tag = ('SELECT %s' % str(len(df))).encode(encoding)
         self.send(CommandComplete(tag=tag))
         return True
 
@@ -374,59 +390,43 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
         self.send_ready()
         return True
 
-    def respond_from_sql_answer(self, sql, sql_answer: SQLAnswer, row_descs=True) -> bool:
+    def respond_from_sql_answer(
+        self, sql, sql_answer: SQLAnswer, row_descs=True, fields: Optional[Sequence[PostgresField]] = None
+    ) -> bool:
         # TODO Add command complete passthrough for Complex Queries that exceed row limit in one go
         rows = 0
-        if sql_answer.data:
+        if sql_answer.data is not None:
             rows = len(sql_answer.data)
         if RESPONSE_TYPE.OK == sql_answer.type:
             return self.return_ok(sql, rows=rows)
         elif RESPONSE_TYPE.TABLE == sql_answer.type:
-            return self.return_table(sql_answer, row_descs=row_descs)
+            return self.return_table(sql_answer, row_descs=row_descs, fields=fields)
         elif RESPONSE_TYPE.ERROR == sql_answer.type:
             return self.return_error(sql_answer)
 
     @staticmethod
-    def to_postgres_fields(columns: Iterable[Dict[str, Any]]) -> Sequence[PostgresField]:
+    def to_postgres_fields(
+        columns: Iterable[Dict[str, Any]], result_format_codes: Sequence[int] = None
+    ) -> Sequence[PostgresField]:
+        columns = list(columns)
+        # no codes: text format for all columns, one code: is applied to all columns
+        if not result_format_codes:
+            format_codes = [0] * len(columns)
+        elif len(result_format_codes) == 1:
+            format_codes = list(result_format_codes) * len(columns)
+        else:
+            format_codes = result_format_codes
+
         fields = []
-        i = 0
-        for column in columns:
-            fields.append(GenericField(
+        for i, column in enumerate(columns):
+            fields.append(TypedField(
                 name=column['name'],
-                object_id=column['type'].value,
+                postgres_type=column['type'],
+                format_code=format_codes[i],
                 column_id=i
             ))
-            i += 1
         return fields
 
-    def to_postgres_rows(self, rows: Iterable[Iterable[Any]]) -> Sequence[Sequence[bytes]]:
-        p_rows = []
-        for row in rows:
-            p_row = []
-            for column in row:
-                if column is None:
-                    column = ""
-                elif type(column) == int or type(column) == float:
-                    column = str(column)
-                elif type(column) == list or type(column) == dict:
-                    column = json.dumps(column)
-                if isinstance(column, datetime.date) or isinstance(column, datetime.datetime):
-                    try:
-                        column = datetime.datetime.strftime(column, '%Y-%m-%d')
-                    except ValueError:
-                        try:
-                            column = datetime.datetime.strftime(column, '%Y-%m-%dT%H:%M:%S')
-                        except ValueError:
-                            column = datetime.datetime.strptime(column, '%Y-%m-%dT%H:%M:%S.%f')
-                if isinstance(column, bool):
-                    if column:
-                        column = "true"
-                    else:
-                        column = "false"
-                p_row.append(column.encode(encoding=self.charset))
-            p_rows.append(p_row)
-        return p_rows
-
     def send_initial_data(self):
         server_encoding = self.charset.encode(self.charset)
         client_encoding = self.user_parameters.get(b'client_encoding', server_encoding)
@@ -434,6 +434,9 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
         self.send(ParameterStatus(name=b"server_version", value=b"14.6"))
         self.send(ParameterStatus(name=b"server_encoding", value=server_encoding))
         self.send(ParameterStatus(name=b"client_encoding", value=client_encoding))
+        # dates and timestamps are sent in ISO format
+        self.send(ParameterStatus(name=b"DateStyle", value=b"ISO, MDY"))
+        self.send(ParameterStatus(name=b"integer_datetimes", value=b"on"))
         # TODO Send Parameters to complete set on 55.2.7 Asynchronous Operations E.G. - At present there is a
         #  hard-wired set of parameters for which ParameterStatus will be generated: they are server_version,
         #  server_encoding, client_encoding, application_name, default_transaction_read_only, in_hot_standby,
@@ -446,25 +449,28 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
         self.send(ReadyForQuery(transaction_status=self.transaction_status))
 
     def main_loop(self):
-        self.send_ready()
-        while True:
-            message: PostgresMessage = self.client_buffer.read_message()
-            if message is None:  # Empty Data, Buffer done
-                break
-            tof = type(message)
-            if tof in self.message_map:
-                res = self.message_map[tof](message)
-                if not res:
-                    break
-            else:
-                self.logger.warning("Ignoring unsupported message type %s" % tof)
+        while self.process_message():
+            pass
+
+    def process_message(self) -> bool:
+        message: PostgresMessage = self.client_buffer.read_message()
+        if message is None:  # Empty Data, Buffer done
+            return False
+        tof = type(message)
+        if tof in self.message_map:
+            return bool(self.message_map[tof](message))
+        self.logger.warning("Ignoring unsupported message type %s" % tof)
+        return True
 
     @staticmethod
     def startProxy():
         config = Config()
         host = config['api']['postgres']['host']
         port = int(config['api']['postgres']['port'])
-        server = TcpServer((host, port), PostgresProxyHandler)
+        if is_async_server(config['api']['postgres']):
+            server = AsyncServer((host, port), AsyncPostgresProxyHandler, config['api']['postgres']['server'])
+        else:
+            server = TcpServer((host, port), PostgresProxyHandler)
         server.connection_id = 0
         server.mindsdb_config = config
         server.check_auth = partial(check_auth, config=config)
@@ -475,5 +481,26 @@ class TcpServer(socketserver.ThreadingTCPServer):
     allow_reuse_address = True
 
 
+class AsyncPostgresProxyHandler(AsyncRequestHandler, PostgresProxyHandler):
+    """
+    PostgresProxyHandler served by AsyncServer: message is identifier, length and body
+    """
+
+    def setup(self):
+        self.connection = self.request
+        self.rfile = self.request
+        self.wfile = self.request
+
+    @staticmethod
+    def message_length(buffer):
+        if len(buffer) < 5:
+            return None
+        # length doesn't include identifier
+        return struct.unpack('!i', buffer[1:5])[0] + 1
+
+    def start(self):
+        return self.start_session()
+
+
 if __name__ == "__main__":
     PostgresProxyHandler.startProxy()
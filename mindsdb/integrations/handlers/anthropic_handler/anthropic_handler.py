@@ -5,6 +5,7 @@ import pandas as pd
 from anthropic import AI_PROMPT, HUMAN_PROMPT, Anthropic
 
 from mindsdb.integrations.libs.base import BaseMLEngine
+from mindsdb.integrations.libs.llm.response_cache import LLMResponseCache, is_cache_enabled
 from mindsdb.utilities import log
 from mindsdb.utilities.config import Config
 
@@ -70,7 +71,22 @@ class AnthropicHandler(BaseMLEngine):
 
         result_df = pd.DataFrame()
 
-        result_df["predictions"] = df[input_column].apply(self.predict_answer)
+        if is_cache_enabled(args["using"]):
+            response_cache = LLMResponseCache(
+                self.name,
+                args["using"]["model"],
+                {
+                    "max_tokens": args["using"]["max_tokens"],
+                    "temperature": args["using"].get("temperature"),
+                },
+                ttl=args["using"].get("cache_ttl"),
+            )
+            result_df["predictions"] = response_cache.complete(
+                df[input_column].tolist(),
+                lambda texts: [self.predict_answer(text) for text in texts]
+            )
+        else:
+            result_df["predictions"] = df[input_column].apply(self.predict_answer)
 
         result_df = result_df.rename(columns={"predictions": args["target"]})
 
@@ -84,12 +100,17 @@ class AnthropicHandler(BaseMLEngine):
 
         args = self.model_storage.json_get("args")
 
+        params = {}
+        if args["using"].get("temperature") is not None:
+            params["temperature"] = args["using"]["temperature"]
+
         message = self.connection.messages.create(
             model=args["using"]["model"],
             max_tokens=args["using"]["max_tokens"],
             messages=[
                 {"role": "user", "content": text}
-            ]
+            ],
+            **params
         )
 
         content_blocks = message.content
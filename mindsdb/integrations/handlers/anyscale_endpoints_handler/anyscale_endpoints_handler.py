@@ -18,6 +18,8 @@ class AnyscaleEndpointsHandler(OpenAIHandler):
     """
 
     name = 'anyscale_endpoints'
+    # data for fine-tuning is split and validated in memory
+    accepts_training_data = False
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
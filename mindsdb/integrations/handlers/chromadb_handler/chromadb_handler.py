@@ -15,6 +15,7 @@ from mindsdb.integrations.libs.vectordatabase_handler import (
     TableField,
     VectorStoreHandler,
 )
+from mindsdb.integrations.libs.vector_column import to_vector_column, vectors_to_matrix
 from mindsdb.interfaces.storage.model_fs import HandlerStorage
 from mindsdb.utilities import log
 
@@ -308,6 +309,9 @@ class ChromaDBHandler(VectorStoreHandler):
             TableField.EMBEDDINGS.value: embeddings,
         }
 
+        if embeddings is not None:
+            payload[TableField.EMBEDDINGS.value] = to_vector_column(embeddings)
+
         if columns is not None:
             payload = {column: payload[column] for column in columns}
 
@@ -336,6 +340,7 @@ class ChromaDBHandler(VectorStoreHandler):
         # convert to dict
 
         data = data.to_dict(orient="list")
+        data[TableField.EMBEDDINGS.value] = vectors_to_matrix(data[TableField.EMBEDDINGS.value]).tolist()
 
         collection.upsert(
             ids=data[TableField.ID.value],
@@ -364,6 +369,7 @@ class ChromaDBHandler(VectorStoreHandler):
         data.dropna(axis=1, inplace=True)
 
         data = data.to_dict(orient="list")
+        data[TableField.EMBEDDINGS.value] = vectors_to_matrix(data[TableField.EMBEDDINGS.value]).tolist()
 
         collection.update(
             ids=data[TableField.ID.value],
@@ -1,10 +1,13 @@
 import time
 
 import duckdb
-from typing import Any
+from typing import Any, Iterator, Optional
 
-from mindsdb.integrations.libs.base import DatabaseHandler
+import pandas as pd
+
+from mindsdb.integrations.libs.base import DatabaseHandler, DEFAULT_FETCH_BATCH_SIZE
 from mindsdb.integrations.libs.response import RESPONSE_TYPE, HandlerResponse, HandlerStatusResponse
+from mindsdb.integrations.utilities.utils import rows_to_df
 from mindsdb_sql.parser.ast.base import ASTNode
 from mindsdb_sql.render.sqlalchemy_render import SqlalchemyRender
 
@@ -51,6 +54,35 @@ class DummyHandler(DatabaseHandler):
         con.close()
         return HandlerResponse(RESPONSE_TYPE.TABLE, result_df)
 
+    def native_query_batches(self, query: Any, batch_size: int = DEFAULT_FETCH_BATCH_SIZE,
+                             limit: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Receive raw query and yield its result by batches fetched from the cursor
+
+        Args:
+            query (Any): query in native format
+            batch_size (int): max count of rows in a batch
+            limit (int): stop fetching after this count of rows
+
+        Returns:
+            Iterator[pd.DataFrame]: batches of the result
+        """
+        con = duckdb.connect(self.db_path)
+        try:
+            cursor = con.execute(query)
+            columns = [column[0] for column in cursor.description]
+            fetched = 0
+            while True:
+                size = batch_size if limit is None else min(batch_size, limit - fetched)
+                rows = cursor.fetchmany(size) if size > 0 else []
+                if len(rows) == 0 and fetched > 0:
+                    break
+                fetched += len(rows)
+                yield rows_to_df(rows, columns, [None] * len(columns))
+                if size == 0 or len(rows) < size:
+                    break
+        finally:
+            con.close()
+
     def query(self, query: ASTNode) -> HandlerResponse:
         """Receive query as AST (abstract syntax tree) and act upon it somehow.
 
@@ -6,6 +6,7 @@ import tempfile
 import traceback
 from io import BytesIO, StringIO
 from pathlib import Path
+from typing import List, Optional, Tuple
 from urllib.parse import urlparse
 
 import filetype
@@ -17,7 +18,7 @@ from mindsdb_sql.parser.ast import DropTables, Select
 from mindsdb_sql.parser.ast.base import ASTNode
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 
-from mindsdb.api.executor.utilities.sql import query_df
+from mindsdb.api.executor.utilities.sql import query_df, query_parquet
 from mindsdb.integrations.libs.base import DatabaseHandler
 from mindsdb.integrations.libs.response import RESPONSE_TYPE
 from mindsdb.integrations.libs.response import HandlerResponse as Response
@@ -29,13 +30,36 @@ logger = log.getLogger(__name__)
 DEFAULT_CHUNK_SIZE = 500
 DEFAULT_CHUNK_OVERLAP = 250
 
+# size of the beginning of the file used to detect format, encoding and dialect
+SAMPLE_SIZE = 64 * 1024
+# size of the block of csv file parsed at once in streaming mode
+CSV_BLOCK_SIZE = 16 * 1024 * 1024
+
+
+EMPTY_VALUES = ["", " ", "  ", "NaN", "nan", "NA"]
+
 
 def clean_cell(val):
-    if str(val) in ["", " ", "  ", "NaN", "nan", "NA"]:
+    if str(val) in EMPTY_VALUES:
         return None
     return val
 
 
+def clean_empty_values(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Replaces empty values with None, the same as applying clean_cell to every cell, but column-wise.
+    Only object columns can contain such values
+    """
+    for i in range(len(df.columns)):
+        column = df.iloc[:, i]
+        if column.dtype != object:
+            continue
+        mask = column.isin(EMPTY_VALUES) | column.isna()
+        if mask.any():
+            df.isetitem(i, column.where(~mask, None).infer_objects())
+    return df
+
+
 class FileHandler(DatabaseHandler):
     """
     Handler for files
@@ -91,6 +115,18 @@ class FileHandler(DatabaseHandler):
             return Response(RESPONSE_TYPE.OK)
         elif type(query) is Select:
             table_name = query.from_table.parts[-1]
+
+            # columnar copy is made with default parsing parameters
+            if (
+                self.custom_parser is None
+                and self.chunk_size == DEFAULT_CHUNK_SIZE
+                and self.chunk_overlap == DEFAULT_CHUNK_OVERLAP
+            ):
+                columnar_path = self.file_controller.get_columnar_file_path(table_name)
+                if columnar_path is not None:
+                    result_df = query_parquet(columnar_path, query)
+                    return Response(RESPONSE_TYPE.TABLE, data_frame=result_df)
+
             file_path = self.file_controller.get_file_path(table_name)
             df, _columns = self._handle_source(
                 file_path,
@@ -188,12 +224,116 @@ class FileHandler(DatabaseHandler):
         header = df.columns.values.tolist()
 
         df = df.rename(columns={key: key.strip() for key in header})
-        df = df.applymap(clean_cell)
+        df = clean_empty_values(df)
 
         header = [x.strip() for x in header]
         col_map = dict((col, col) for col in header)
         return df, col_map
 
+    @staticmethod
+    def _stream_csv_source(file_path, output_path) -> Optional[Tuple[int, List[str]]]:
+        """
+        Converts csv file to parquet block by block, without loading the whole file in memory.
+        Format, encoding and dialect are detected from the beginning of the file, types of
+        columns - from the first block.
+
+        :param file_path: path to the source file
+        :param output_path: path to the parquet file
+        :return: count of rows and names of columns, or None if file can't be streamed.
+            In this case file has to be loaded with `_handle_source`
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pa_csv
+            import pyarrow.parquet as pq
+        except ImportError:
+            return None
+
+        with open(file_path, "rb") as fp:
+            sample = fp.read(SAMPLE_SIZE)
+
+        suffix = Path(file_path).suffix.strip(".").lower()
+        if suffix != "csv":
+            if suffix in ("json", "xlsx", "parquet", "txt", "pdf"):
+                return None
+            if sample.startswith(b"PAR1") or FileHandler.is_it_xlsx(file_path):
+                return None
+
+        if sample.startswith(codecs.BOM_UTF8):
+            encoding = "utf-8"
+            sample = sample[len(codecs.BOM_UTF8):]
+        else:
+            best_meta = from_bytes(sample[: 32 * 1024], steps=32, chunk_size=1024, explain=False).best()
+            if best_meta is None:
+                return None
+            encoding = best_meta.encoding
+            if encoding == "ascii":
+                # non-ascii chars can be after the sample
+                encoding = "utf-8"
+        # the sample can end in the middle of a char
+        sample_str = sample.decode(encoding, errors="ignore")
+
+        if suffix != "csv":
+            if sample_str.lstrip().startswith(("{", "[")) or not FileHandler.is_it_csv(StringIO(sample_str)):
+                return None
+
+        dialect = FileHandler._get_csv_dialect(StringIO(sample_str))
+        if dialect is None:
+            return None
+
+        read_options = pa_csv.ReadOptions(encoding=encoding, block_size=CSV_BLOCK_SIZE)
+        parse_options = pa_csv.ParseOptions(
+            delimiter=dialect.delimiter,
+            quote_char=dialect.quotechar or '"',
+            double_quote=True,
+            newlines_in_values=True,
+        )
+        # the same values are empty for pandas.read_csv and clean_empty_values
+        null_values = pa_csv.ConvertOptions().null_values + ["None", "<NA>"] + EMPTY_VALUES
+        writer = None
+        try:
+            reader = pa_csv.open_csv(
+                file_path, read_options=read_options, parse_options=parse_options,
+                convert_options=pa_csv.ConvertOptions(null_values=null_values, strings_can_be_null=True)
+            )
+            column_names = [name.strip() for name in reader.schema.names]
+            if "" in column_names or len(set(column_names)) != len(column_names):
+                # pandas gives names to such columns
+                return None
+
+            # pandas doesn't parse dates, keep them as strings
+            temporal_columns = {
+                field.name: pa.string()
+                for field in reader.schema
+                if pa.types.is_temporal(field.type)
+            }
+            if len(temporal_columns) > 0:
+                reader.close()
+                reader = pa_csv.open_csv(
+                    file_path, read_options=read_options, parse_options=parse_options,
+                    convert_options=pa_csv.ConvertOptions(
+                        null_values=null_values, strings_can_be_null=True, column_types=temporal_columns
+                    )
+                )
+
+            schema = pa.schema([field.with_name(name) for field, name in zip(reader.schema, column_names)])
+            writer = pq.ParquetWriter(str(output_path), schema)
+            row_count = 0
+            for batch in reader:
+                writer.write_batch(pa.RecordBatch.from_arrays(batch.columns, schema=schema))
+                row_count += batch.num_rows
+            writer.close()
+            writer = None
+        except Exception as e:
+            # for example: type of column is changed after the first block
+            logger.debug(f"Can't stream csv file, it will be loaded at once: {e}")
+            if writer is not None:
+                writer.close()
+            Path(output_path).unlink(missing_ok=True)
+            return None
+
+        return row_count, column_names
+
     @staticmethod
     def is_it_parquet(data: BytesIO) -> bool:
         # Check first and last 4 bytes equal to PAR1.
@@ -141,6 +141,36 @@ class TestIsItX:
             assert FileHandler.is_it_parquet(BytesIO(fh.read())) is result
 
 
+def get_file_controller():
+    # Configure mindsdb and set up the file controller
+    # Ideally this would be a lot simpler..
+    db_file = tempfile.mkstemp(prefix="mindsdb_db_")[1]
+    config = {"storage_db": "sqlite:///" + db_file}
+    fdi, cfg_file = tempfile.mkstemp(prefix="mindsdb_conf_")
+    with os.fdopen(fdi, "w") as fd:
+        json.dump(config, fd)
+    os.environ["MINDSDB_CONFIG_PATH"] = cfg_file
+
+    from mindsdb.utilities.config import Config
+
+    Config()
+    from mindsdb.interfaces.storage import db
+
+    db.init()
+    db.session.rollback()
+    db.Base.metadata.drop_all(db.engine)
+
+    # create
+    db.Base.metadata.create_all(db.engine)
+
+    # fill with data
+    r = db.Integration(name="files", data={}, engine="files")
+    db.session.add(r)
+    db.session.flush()
+
+    return FileController()
+
+
 class TestQuery:
     """Tests all of the scenarios relating to the query() function"""
 
@@ -179,34 +209,7 @@ class TestQuery:
             os.remove(csv_tmp)
         shutil.copy(csv_file, csv_tmp)
 
-        # Configure mindsdb and set up the file controller
-        # Ideally this would be a lot simpler..
-        db_file = tempfile.mkstemp(prefix="mindsdb_db_")[1]
-        config = {"storage_db": "sqlite:///" + db_file}
-        fdi, cfg_file = tempfile.mkstemp(prefix="mindsdb_conf_")
-        with os.fdopen(fdi, "w") as fd:
-            json.dump(config, fd)
-        os.environ["MINDSDB_CONFIG_PATH"] = cfg_file
-
-        from mindsdb.utilities.config import Config
-
-        Config()
-        from mindsdb.interfaces.storage import db
-
-        db.init()
-        db.session.rollback()
-        db.Base.metadata.drop_all(db.engine)
-
-        # create
-        db.Base.metadata.create_all(db.engine)
-
-        # fill with data
-        r = db.Integration(name="files", data={}, engine="files")
-        db.session.add(r)
-        db.session.flush()
-        # Config #
-
-        file_controller = FileController()
+        file_controller = get_file_controller()
         file_controller.save_file(
             os.path.splitext(os.path.basename(csv_file))[0], csv_tmp
         )
@@ -226,6 +229,31 @@ class TestQuery:
         assert response.error_message is None
         assert expected_df.equals(response.data_frame)
 
+    def test_query_select_columnar(self, tmp_path):
+        """Select from parquet copy of the file"""
+        csv_path = tmp_path / "data.csv"
+        csv_path.write_text("a,b,c\n1,x,1.5\n2,NA,\n3,z,3.5\n")
+        json_path = tmp_path / "data.json"
+        json_path.write_text('[{"a": 1, "b": {"x": 1}}, {"a": 2, "b": [1]}]')
+
+        file_controller = get_file_controller()
+        file_controller.save_file("csv_table", str(csv_path))
+        file_controller.save_file("json_table", str(json_path))
+
+        assert file_controller.get_columnar_file_path("csv_table") is not None
+        # values of mixed types can't be stored in parquet
+        assert file_controller.get_columnar_file_path("json_table") is None
+
+        file_handler = FileHandler(file_controller=file_controller)
+        response = file_handler.native_query("select c, b from csv_table where a > 1 order by a limit 5")
+        assert response.type == RESPONSE_TYPE.TABLE
+        assert response.data_frame.columns.tolist() == ["c", "b"]
+        assert response.data_frame.values.tolist() == [[None, None], [3.5, "z"]]
+
+        # file without parquet copy is read as before
+        response = file_handler.native_query("select * from json_table")
+        assert response.data_frame["a"].tolist() == [1, 2]
+
     def test_query_bad_type(self):
         """Test an invalid query type for files"""
         file_handler = FileHandler(file_controller=MockFileController())
@@ -293,6 +321,42 @@ def test_handle_source(file_path, expected_columns):
         assert df.values.tolist() == test_file_content[1:]
 
 
+@pytest.mark.parametrize(
+    "file_path,can_be_streamed",
+    [
+        (lazy_fixture("csv_file"), True),
+        (lazy_fixture("xlsx_file"), False),
+        (lazy_fixture("json_file"), False),
+        (lazy_fixture("parquet_file"), False),
+        (lazy_fixture("txt_file"), False),
+    ],
+)
+def test_stream_csv_source(file_path, can_be_streamed, tmp_path):
+    output_path = tmp_path / "table.parquet"
+    result = FileHandler._stream_csv_source(file_path, output_path)
+    if not can_be_streamed:
+        assert result is None
+        assert not output_path.exists()
+        return
+
+    assert result == (len(test_file_content) - 1, test_file_content[0])
+    df = pandas.read_parquet(output_path)
+    assert df.values.tolist() == test_file_content[1:]
+
+
+def test_stream_csv_source_type_changed(tmp_path):
+    # type of the column is detected by the first block
+    file_path = tmp_path / "data.csv"
+    file_path.write_text("a,b\n" + "1,x\n" * 100 + "y,z\n")
+    output_path = tmp_path / "table.parquet"
+    with patch("mindsdb.integrations.handlers.file_handler.file_handler.CSV_BLOCK_SIZE", 64):
+        assert FileHandler._stream_csv_source(str(file_path), output_path) is None
+    assert not output_path.exists()
+
+    df, _ = FileHandler._handle_source(str(file_path))
+    assert len(df) == 101
+
+
 @pytest.mark.parametrize(
     "file_path,expected_file_type,expected_delimiter,expected_data_type",
     [
@@ -1,16 +1,46 @@
 import copy
 import importlib
-from typing import Dict, Union
+import threading
+from itertools import chain
+from typing import Dict, List, Optional, Union
 
 import pandas as pd
 from langchain.embeddings.base import Embeddings
 from pandas import DataFrame
 
 from mindsdb.integrations.libs.base import BaseMLEngine
+from mindsdb.integrations.libs.llm.response_cache import LLMResponseCache, is_cache_enabled
+from mindsdb.integrations.libs.llm.scheduler import RequestScheduler
 from mindsdb.utilities import log
+from mindsdb.utilities.cache import json_checksum
 
 logger = log.getLogger(__name__)
 
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_MAX_RETRIES = 3
+# seconds before the first retry, doubled on every next one
+DEFAULT_RETRY_BACKOFF = 1.0
+
+# args of the handler, they are not passed to the embedding class
+HANDLER_ARGS = (
+    "input_columns", "cache_responses", "cache_ttl",
+    "batch_size", "max_batch_tokens", "max_concurrency", "max_retries",
+)
+
+# models which are loaded into memory of the process, loaded model is reused by all predictions
+LOCAL_EMBEDDING_CLASSES = (
+    "HuggingFaceEmbeddings",
+    "HuggingFaceBgeEmbeddings",
+    "HuggingFaceInstructEmbeddings",
+    "SentenceTransformerEmbeddings",
+    "FastEmbedEmbeddings",
+    "GPT4AllEmbeddings",
+    "LlamaCppEmbeddings",
+)
+_local_models = {}
+_local_models_lock = threading.Lock()
+
 # construct the embedding model name to the class mapping
 # we try to import all embedding models from langchain_community.embeddings
 # for each class, we get a more user friendly name for it
@@ -73,14 +103,102 @@ def construct_model_from_args(args: Dict) -> Embeddings:
         class_name = EMBEDDING_MODELS[class_name]
     MODEL_CLASS = get_langchain_class(class_name)
     serialized_dict = copy.deepcopy(args)
-    serialized_dict.pop("input_columns", None)
-    model = MODEL_CLASS(**serialized_dict)
+    for key in HANDLER_ARGS:
+        serialized_dict.pop(key, None)
+
+    if class_name in LOCAL_EMBEDDING_CLASSES:
+        key = json_checksum({"class": class_name, "args": serialized_dict})
+        # lock is held while model is loading: the same model is not loaded twice
+        with _local_models_lock:
+            model = _local_models.get(key)
+            if model is None:
+                model = MODEL_CLASS(**serialized_dict)
+                _local_models[key] = model
+    else:
+        model = MODEL_CLASS(**serialized_dict)
     if target is not None:
         args["target"] = target
     args["class"] = class_name
     return model
 
 
+def estimate_tokens(text: str) -> int:
+    """Approximate count of tokens, about 4 chars per token"""
+    return len(text) // 4 + 1
+
+
+def split_into_batches(
+    texts: List[str], batch_size: int = DEFAULT_BATCH_SIZE, max_batch_tokens: Optional[int] = None
+) -> List[List[str]]:
+    """
+    Splits texts into batches limited by count of texts and estimated count of tokens.
+    Text bigger than token limit is sent in separate batch
+    """
+    batches = []
+    batch, batch_tokens = [], 0
+    for text in texts:
+        tokens = estimate_tokens(text) if max_batch_tokens else 0
+        if len(batch) > 0 and (
+            len(batch) >= batch_size
+            or (max_batch_tokens and batch_tokens + tokens > max_batch_tokens)
+        ):
+            batches.append(batch)
+            batch, batch_tokens = [], 0
+        batch.append(text)
+        batch_tokens += tokens
+    if len(batch) > 0:
+        batches.append(batch)
+    return batches
+
+
+def is_retryable_error(e: Exception) -> bool:
+    """Rate limits, server errors, connection errors and timeouts"""
+    status_code = getattr(e, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(e, "response", None), "status_code", None)
+    if isinstance(status_code, int):
+        return status_code == 429 or status_code >= 500
+    if isinstance(e, (ConnectionError, TimeoutError)):
+        return True
+    # errors of http clients: openai.APIConnectionError, requests.Timeout, httpx.TimeoutException, ...
+    return any(
+        cls.__name__.endswith(("ConnectionError", "Timeout", "TimeoutError", "TimeoutException"))
+        for cls in type(e).__mro__
+    )
+
+
+def embed_documents(
+    model: Embeddings,
+    texts: List[str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_batch_tokens: Optional[int] = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+) -> List[List[float]]:
+    """
+    Embeds texts in batches. Batches are sent in parallel, failed batch is retried independently.
+    Embeddings are returned in the order of texts
+    """
+    if len(texts) == 0:
+        return []
+    batches = split_into_batches(texts, batch_size, max_batch_tokens)
+
+    if type(model).__name__ in LOCAL_EMBEDDING_CLASSES:
+        # model is computed in this process, threads don't speed it up
+        max_concurrency = 1
+
+    scheduler = RequestScheduler(
+        max_concurrency=max_concurrency,
+        max_retries=max_retries,
+        initial_backoff=retry_backoff,
+        is_rate_limit_error=is_retryable_error,
+    )
+    results = scheduler.run(model.embed_documents, batches)
+    logger.debug(f"Embedded {len(texts)} texts in {len(batches)} batches: {scheduler.get_metrics()}")
+    return list(chain.from_iterable(results))
+
+
 class LangchainEmbeddingHandler(BaseMLEngine):
     """
     Bridge class to connect langchain.embeddings module to mindsDB
@@ -157,28 +275,49 @@ class LangchainEmbeddingHandler(BaseMLEngine):
             )
 
         # convert each row into a document
-        df_texts = df[input_columns].apply(self.row_to_document, axis=1)
-        embeddings = model.embed_documents(df_texts.tolist())
+        df_texts = self.rows_to_documents(df[input_columns])
+
+        def embed(texts):
+            return embed_documents(
+                model,
+                texts,
+                batch_size=int(user_args.get("batch_size") or DEFAULT_BATCH_SIZE),
+                max_batch_tokens=user_args.get("max_batch_tokens") and int(user_args["max_batch_tokens"]),
+                max_concurrency=int(user_args.get("max_concurrency") or DEFAULT_MAX_CONCURRENCY),
+                max_retries=int(user_args.get("max_retries", DEFAULT_MAX_RETRIES)),
+            )
+
+        if is_cache_enabled(user_args):
+            # embeddings don't depend on sampling params, they always can be cached
+            response_cache = LLMResponseCache(
+                "langchain_embedding",
+                user_args["class"],
+                {k: v for k, v in user_args.items() if k not in ("input_columns", "target")},
+                ttl=user_args.get("cache_ttl"),
+                deterministic=True,
+            )
+            embeddings = response_cache.complete(df_texts.tolist(), embed)
+        else:
+            embeddings = embed(df_texts.tolist())
 
         # create a new dataframe with the embeddings
         df_embeddings = df.copy().assign(**{target: embeddings})
 
         return df_embeddings
 
-    def row_to_document(self, row: pd.Series) -> str:
+    def rows_to_documents(self, df: DataFrame) -> pd.Series:
         """
-        Convert a row in the input dataframe into a document
-
-        Default implementation is to concatenate all the columns
+        Converts every row of the dataframe into a document: all the columns are concatenated
         in the form of
         field1: value1\nfield2: value2\n...
         """
-        fields = row.index.tolist()
-        values = row.values.tolist()
-        document = "\n".join(
-            [f"{field}: {value}" for field, value in zip(fields, values)]
-        )
-        return document
+        documents = None
+        for column in df.columns:
+            part = f"{column}: " + df[column].astype(str)
+            documents = part if documents is None else documents + "\n" + part
+        if documents is None:
+            return pd.Series([""] * len(df), index=df.index, dtype=str)
+        return documents
 
     def finetune(
         self, df: Union[DataFrame, None] = None, args: Union[Dict, None] = None
@@ -1,4 +1,3 @@
-from concurrent.futures import as_completed, TimeoutError
 from typing import Optional, Dict
 import re
 
@@ -13,11 +12,14 @@ import numpy as np
 import pandas as pd
 
 from mindsdb.interfaces.agents.safe_output_parser import SafeOutputParser
+from mindsdb.interfaces.agents.batch_runner import AgentBatchRunner
+from mindsdb.interfaces.agents.callback_handlers import SchedulerCallbackHandler
 from mindsdb.interfaces.agents.langchain_agent import (
-    get_llm_provider, get_embedding_model_provider, create_chat_model, get_chat_model_params
+    get_llm_provider, get_embedding_model_provider, create_chat_model, get_chat_model_params, get_agent_scheduler
 )
 
 from mindsdb.interfaces.agents.constants import (
+    DEFAULT_AGENT_MAX_WORKERS,
     DEFAULT_AGENT_TIMEOUT_SECONDS,
     DEFAULT_AGENT_TOOLS,
     DEFAULT_AGENT_TYPE,
@@ -35,7 +37,6 @@ from mindsdb.integrations.handlers.langchain_embedding_handler.langchain_embeddi
 from mindsdb.integrations.handlers.openai_handler.constants import CHAT_MODELS  # noqa, for dependency checker
 
 from mindsdb.utilities import log
-from mindsdb.utilities.context_executor import ContextThreadPoolExecutor
 
 _PARSING_ERROR_PREFIXES = ['An output parsing error occured', 'Could not parse LLM output']
 
@@ -232,11 +233,15 @@ AI: {response}'''
                 # Just add prompt
                 prompts.append(row[user_column])
 
+        # limits of LLM are applied to every request of agent to LLM
+        scheduler = get_agent_scheduler(args)
+        callbacks = [SchedulerCallbackHandler(scheduler)] if scheduler is not None else []
+
         def _invoke_agent_executor_with_prompt(agent_executor, prompt):
             if not prompt:
                 return ''
             try:
-                answer = agent_executor.invoke(prompt)
+                answer = agent_executor.invoke(prompt, config={'callbacks': callbacks})
             except Exception as e:
                 answer = str(e)
                 if not answer.startswith("Could not parse LLM output: `"):
@@ -248,20 +253,15 @@ AI: {response}'''
                 return agent_executor.run(prompt)
             return answer['output']
 
-        completions = []
-        # max_workers defaults to number of processors on the machine multiplied by 5.
-        # https://docs.python.org/3/library/concurrent.futures.html#concurrent.futures.ThreadPoolExecutor
-        max_workers = args.get('max_workers', None)
-        agent_timeout_seconds = args.get('timeout', DEFAULT_AGENT_TIMEOUT_SECONDS)
-        executor = ContextThreadPoolExecutor(max_workers=max_workers)
-        futures = [executor.submit(_invoke_agent_executor_with_prompt, agent, prompt) for prompt in prompts]
-        try:
-            for future in as_completed(futures, timeout=agent_timeout_seconds):
-                completions.append(future.result())
-        except TimeoutError:
-            completions.append("I'm sorry! I couldn't come up with a response in time. Please try again.")
-        # Can't use ThreadPoolExecutor as context manager since we need wait=False.
-        executor.shutdown(wait=False)
+        # results are in order of prompts, every prompt has own timeout
+        timeout_message = "I'm sorry! I couldn't come up with a response in time. Please try again."
+        runner = AgentBatchRunner(
+            lambda prompt: _invoke_agent_executor_with_prompt(agent, prompt),
+            max_workers=args.get('max_workers') or DEFAULT_AGENT_MAX_WORKERS,
+            timeout=args.get('timeout', DEFAULT_AGENT_TIMEOUT_SECONDS),
+            on_timeout=lambda: timeout_message,
+        )
+        completions = runner.run(prompts)
 
         # Add null completion for empty prompts
         for i in sorted(empty_prompt_ids)[:-1]:
@@ -17,7 +17,6 @@ from mindsdb.integrations.libs.base import BaseMLEngine
 # from mindsdb.utilities.hooks import after_predict as after_predict_hook
 from mindsdb.interfaces.model.functions import get_model_record
 from mindsdb.interfaces.storage.json import get_json_storage
-from mindsdb.utilities.functions import cast_row_types
 
 from .functions import run_finetune, run_learn
 
@@ -125,8 +124,6 @@ class LightwoodHandler(BaseMLEngine):
                 # note: return here once ml engine executor supports non-target named outputs
                 predictions = predictions[['prediction']]
 
-            predictions = predictions.to_dict(orient='records')
-
             # TODO!!!
             # after_predict_hook(
             #     company_id=self.company_id,
@@ -138,81 +135,16 @@ class LightwoodHandler(BaseMLEngine):
 
             # region format result
             target = args['target']
-            explain_arr = []
-            pred_dicts = []
-            for i, row in enumerate(predictions):
-                values = {
-                    'predicted_value': row['prediction'],
-                    'confidence': row.get('confidence', None),
-                    'anomaly': row.get('anomaly', None),
-                    'truth': row.get('truth', None),
-                }
-
-                if predictor.supports_proba:
-                    for cls in predictor.statistical_analysis.train_observed_classes:
-                        if row.get(f'__mdb_proba_{cls}', False):
-                            values[f'probability_class_{cls}'] = round(
-                                row[f'__mdb_proba_{cls}'], 4
-                            )
-
-                for block in predictor.analysis_blocks:
-                    if type(block).__name__ == 'ShapleyValues':
-                        cols = block.columns
-                        values['shap_base_response'] = round(
-                            row['shap_base_response'], 4
-                        )
-                        values['shap_final_response'] = round(
-                            row['shap_final_response'], 4
-                        )
-                        for col in cols:
-                            values[f'shap_contribution_{col}'] = round(
-                                row[f'shap_contribution_{col}'], 4
-                            )
-
-                if 'lower' in row:
-                    values['confidence_lower_bound'] = row.get('lower', None)
-                    values['confidence_upper_bound'] = row.get('upper', None)
-
-                obj = {target: values}
-                explain_arr.append(obj)
-
-                td = {'predicted_value': row['prediction']}
-                for col in df.columns:
-                    if col in row:
-                        td[col] = row[col]
-                    elif f'order_{col}' in row:
-                        td[col] = row[f'order_{col}']
-                    elif f'group_{col}' in row:
-                        td[col] = row[f'group_{col}']
-                    else:
-                        orginal_index = row.get('original_index')
-                        if orginal_index is None:
-                            orginal_index = i
-                        td[col] = df.iloc[orginal_index][col]
-                pred_dicts.append({target: td})
-
-            new_pred_dicts = []
-            for row in pred_dicts:
-                new_row = {}
-                for key in row:
-                    new_row.update(row[key])
-                    new_row[key] = new_row['predicted_value']
-                del new_row['predicted_value']
-                new_pred_dicts.append(new_row)
-            pred_dicts = new_pred_dicts
-
-            columns = list(dtype_dict.keys())
-            predicted_columns = target
-            if not isinstance(predicted_columns, list):
-                predicted_columns = [predicted_columns]
+            predictions = predictions.reset_index(drop=True)
+            explain_df = self._get_explain_df(predictor, predictions)
+            explanations = explain_df.to_dict(orient='records')
+            pred_df = self._get_pred_df(predictions, df, target)
             # endregion
 
-            original_target_values = {}
-            for col in predicted_columns:
-                df = df.reset_index()
-                original_target_values[col + '_original'] = []
-                for _index, row in df.iterrows():
-                    original_target_values[col + '_original'].append(row.get(col))
+            if target in df.columns:
+                original_values = df[target].tolist()
+            else:
+                original_values = [None] * len(df)
 
             # region transform ts predictions
             timeseries_settings = learn_args.get(
@@ -220,6 +152,10 @@ class LightwoodHandler(BaseMLEngine):
             )
 
             if timeseries_settings['is_timeseries'] is True:
+                # forecasts are reshaped row by row
+                pred_dicts = pred_df.to_dict(orient='records')
+                explain_arr = [{target: explanation} for explanation in explanations]
+
                 # offset forecast if have __mdb_forecast_offset > 0
                 forecast_offset = any(
                     [
@@ -367,11 +303,9 @@ class LightwoodHandler(BaseMLEngine):
                     pred_dicts.extend(data['rows'])
                     explanations.extend(data['explanations'])
 
-                original_target_values[f'{target}_original'] = []
-                for i in range(len(pred_dicts)):
-                    original_target_values[f'{target}_original'].append(
-                        explanations[i][target].get('truth', None)
-                    )
+                original_values = [
+                    explanation[target].get('truth', None) for explanation in explanations
+                ]
 
                 if dtype_dict[order_by_column] == dtype.date:
                     for row in pred_dicts:
@@ -386,53 +320,114 @@ class LightwoodHandler(BaseMLEngine):
                                 row[order_by_column]
                             )
 
-                explain_arr = explanations
+                pred_df = pd.DataFrame(pred_dicts)
+                explanations = [explanation[target] for explanation in explanations]
+                explain_df = pd.DataFrame(explanations)
             # endregion
 
             if pred_format == 'explain':
-                return explain_arr
-
-            keys = [x for x in pred_dicts[0] if x in columns]
-            min_max_keys = []
-            for col in predicted_columns:
-                if dtype_dict[col] in (dtype.integer, dtype.float, dtype.num_tsarray):
-                    min_max_keys.append(col)
-
-            data = []
-            explains = []
-            keys_to_save = [*keys, '__mindsdb_row_id', 'select_data_query', 'when_data']
-            for i, el in enumerate(pred_dicts):
-                data.append({key: el.get(key) for key in keys_to_save})
-                explains.append(explain_arr[i])
-
-            for i, row in enumerate(data):
-                cast_row_types(row, dtype_dict)
-
-                for k in original_target_values:
-                    try:
-                        row[k] = original_target_values[k][i]
-                    except Exception:
-                        row[k] = None
-
-                for column_name in columns:
-                    if column_name not in row:
-                        row[column_name] = None
-
-                explanation = explains[i]
-                for key in predicted_columns:
-                    row[key + '_confidence'] = explanation[key]['confidence']
-                    row[key + '_explain'] = json.dumps(
-                        explanation[key], cls=NumpyJSONEncoder, ensure_ascii=False
-                    )
-                    if 'anomaly' in explanation[key]:
-                        row[key + '_anomaly'] = explanation[key]['anomaly']
-                for key in min_max_keys:
-                    if 'confidence_lower_bound' in explanation[key]:
-                        row[key + '_min'] = explanation[key]['confidence_lower_bound']
-                    if 'confidence_upper_bound' in explanation[key]:
-                        row[key + '_max'] = explanation[key]['confidence_upper_bound']
-
-        return pd.DataFrame(data)
+                return [{target: explanation} for explanation in explanations]
+
+            return self._format_predictions(
+                pred_df, explain_df, explanations, original_values, target, dtype_dict
+            )
+
+    @staticmethod
+    def _get_explain_df(predictor, predictions: pd.DataFrame) -> pd.DataFrame:
+        """
+        Explanation of every prediction: confidence, probabilities of classes, shap values, bounds
+        """
+        explain_df = pd.DataFrame(index=predictions.index)
+        explain_df['predicted_value'] = predictions['prediction']
+        for name in ('confidence', 'anomaly', 'truth'):
+            explain_df[name] = predictions[name] if name in predictions.columns else None
+
+        if predictor.supports_proba:
+            for cls in predictor.statistical_analysis.train_observed_classes:
+                if f'__mdb_proba_{cls}' in predictions.columns:
+                    explain_df[f'probability_class_{cls}'] = predictions[f'__mdb_proba_{cls}'].round(4)
+
+        for block in predictor.analysis_blocks:
+            if type(block).__name__ == 'ShapleyValues':
+                shap_columns = {
+                    'shap_base_response': 'shap_base_response',
+                    'shap_final_response': 'shap_final_response',
+                }
+                for col in block.columns:
+                    shap_columns[f'shap_contribution_{col}'] = f'shap_contribution_{col}'
+                for name, col in shap_columns.items():
+                    explain_df[name] = predictions[col].round(4)
+
+        if 'lower' in predictions.columns:
+            explain_df['confidence_lower_bound'] = predictions['lower']
+            explain_df['confidence_upper_bound'] = predictions['upper'] if 'upper' in predictions.columns else None
+        return explain_df
+
+    @staticmethod
+    def _get_pred_df(predictions: pd.DataFrame, df: pd.DataFrame, target: str) -> pd.DataFrame:
+        """
+        Predicted values with input columns. Columns which are not returned by lightwood are taken from input
+        """
+        positions = np.arange(len(predictions))
+        if 'original_index' in predictions.columns:
+            original_index = predictions['original_index']
+            positions = np.where(original_index.isna(), positions, original_index.fillna(0)).astype(int)
+
+        columns = {}
+        for col in df.columns:
+            if col in predictions.columns:
+                columns[col] = predictions[col]
+            elif f'order_{col}' in predictions.columns:
+                columns[col] = predictions[f'order_{col}']
+            elif f'group_{col}' in predictions.columns:
+                columns[col] = predictions[f'group_{col}']
+            else:
+                columns[col] = df[col].iloc[positions].reset_index(drop=True)
+        columns[target] = predictions['prediction']
+        return pd.DataFrame(columns, index=predictions.index)
+
+    @staticmethod
+    def _format_predictions(
+        pred_df: pd.DataFrame,
+        explain_df: pd.DataFrame,
+        explanations: list,
+        original_values: list,
+        target: str,
+        dtype_dict: dict
+    ) -> pd.DataFrame:
+        """
+        Result of prediction: predicted values, input columns and explanation columns of the target
+        """
+        columns = list(dtype_dict.keys())
+        keys = [x for x in pred_df.columns if x in columns]
+        keys_to_save = [*keys, '__mindsdb_row_id', 'select_data_query', 'when_data']
+
+        count = len(pred_df)
+        data = pd.DataFrame(index=pd.RangeIndex(count))
+        for key in keys_to_save:
+            data[key] = pred_df[key].values if key in pred_df.columns else None
+
+        if len(original_values) != count:
+            original_values = (list(original_values) + [None] * count)[:count]
+        data[f'{target}_original'] = original_values
+
+        for column_name in columns:
+            if column_name not in data.columns:
+                data[column_name] = None
+
+        data[f'{target}_confidence'] = explain_df['confidence'].values
+        data[f'{target}_explain'] = [
+            json.dumps(explanation, cls=NumpyJSONEncoder, ensure_ascii=False)
+            for explanation in explanations
+        ]
+        if 'anomaly' in explain_df.columns:
+            data[f'{target}_anomaly'] = explain_df['anomaly'].values
+        if dtype_dict[target] in (dtype.integer, dtype.float, dtype.num_tsarray):
+            if 'confidence_lower_bound' in explain_df.columns:
+                data[f'{target}_min'] = explain_df['confidence_lower_bound'].values
+            if 'confidence_upper_bound' in explain_df.columns:
+                data[f'{target}_max'] = explain_df['confidence_upper_bound'].values
+        return data
 
     def edit_json_ai(self, name: str, json_ai: dict):
         predictor_record = get_model_record(name=name, ml_handler_name='lightwood')
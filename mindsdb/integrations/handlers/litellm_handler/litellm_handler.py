@@ -4,6 +4,7 @@ from typing import Dict, Optional, List
 import pandas as pd
 
 from mindsdb.integrations.libs.base import BaseMLEngine
+from mindsdb.integrations.libs.llm.response_cache import LLMResponseCache
 from mindsdb.utilities import log
 
 from mindsdb.integrations.handlers.litellm_handler.settings import CompletionParameters
@@ -66,21 +67,45 @@ class LiteLLMHandler(BaseMLEngine):
         # validate args
         args = CompletionParameters(**input_args).model_dump()
 
+        cache_responses = args.pop('cache_responses', None)
+        cache_ttl = args.pop('cache_ttl', None)
+
         # build messages
         self._build_messages(args, df)
 
         # remove prompt_template from args
         args.pop('prompt_template', None)
 
+        if cache_responses:
+            response_cache = LLMResponseCache(
+                self.name,
+                args['model'],
+                {k: v for k, v in args.items() if k != 'messages'},
+                ttl=cache_ttl
+            )
+            result = response_cache.complete(
+                [args['messages']],
+                lambda _: [self._completion(args)]
+            )[0]
+        else:
+            result = self._completion(args)
+
+        return pd.DataFrame({"result": result})
+
+    @staticmethod
+    def _completion(args: dict) -> List[str]:
+        """
+        Run completion, returns content of responses
+        """
         if len(args['messages']) > 1:
             # if more than one message, use batch completion
             responses = batch_completion(**args)
-            return pd.DataFrame({"result": [response.choices[0].message.content for response in responses]})
+            return [response.choices[0].message.content for response in responses]
 
         # run completion
         response = completion(**args)
 
-        return pd.DataFrame({"result": [response.choices[0].message.content]})
+        return [response.choices[0].message.content]
 
     @staticmethod
     def _prompt_to_messages(prompt: str, **kwargs) -> List[Dict]:
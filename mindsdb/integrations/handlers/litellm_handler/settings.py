@@ -33,6 +33,10 @@ class CompletionParameters(BaseModel):
     api_version: Optional[str] = None  # Version of the API to be used.
     api_key: str  # API key for authentication.
 
+    # response cache, used only with temperature = 0
+    cache_responses: Optional[bool] = None  # Cache responses for identical messages.
+    cache_ttl: Optional[int] = None  # Time to keep cached responses, in seconds.
+
     class Config:
         extra = Extra.forbid
         arbitrary_types_allowed = True
@@ -0,0 +1,9 @@
+__title__ = "MindsDB Local Vector handler"
+__package_name__ = "mindsdb_local_vector_handler"
+__version__ = "0.0.1"
+__description__ = "MindsDB built-in vector store for knowledge bases"
+__author__ = "MindsDB Inc"
+__github__ = "https://github.com/mindsdb/mindsdb"
+__pypi__ = "https://pypi.org/project/mindsdb/"
+__license__ = "MIT"
+__copyright__ = "Copyright 2024 - mindsdb"
@@ -0,0 +1,38 @@
+from collections import OrderedDict
+
+from mindsdb.integrations.libs.const import HANDLER_CONNECTION_ARG_TYPE as ARG_TYPE
+
+
+connection_args = OrderedDict(
+    persist_directory={
+        "type": ARG_TYPE.STR,
+        "description": "name of the folder in the handler storage to keep vectors",
+        "required": False,
+    },
+    metric={
+        "type": ARG_TYPE.STR,
+        "description": "distance metric: cosine (default), l2 or ip",
+        "required": False,
+    },
+    index_type={
+        "type": ARG_TYPE.STR,
+        "description": "flat (default) for exact search or ivf for approximate search",
+        "required": False,
+    },
+    nlist={
+        "type": ARG_TYPE.INT,
+        "description": "amount of clusters for ivf index",
+        "required": False,
+    },
+    nprobe={
+        "type": ARG_TYPE.INT,
+        "description": "amount of clusters scanned by ivf search",
+        "required": False,
+    },
+)
+
+connection_args_example = OrderedDict(
+    persist_directory="local_vector",
+    metric="cosine",
+    index_type="flat",
+)
@@ -0,0 +1,245 @@
+import os
+import ast
+import json
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from mindsdb.integrations.handlers.local_vector_handler.vector_index import VectorIndex
+from mindsdb.integrations.libs.response import RESPONSE_TYPE
+from mindsdb.integrations.libs.response import HandlerResponse
+from mindsdb.integrations.libs.response import HandlerResponse as Response
+from mindsdb.integrations.libs.response import HandlerStatusResponse as StatusResponse
+from mindsdb.integrations.libs.vector_column import vectors_to_matrix
+from mindsdb.integrations.libs.vectordatabase_handler import (
+    FilterCondition,
+    TableField,
+    VectorStoreHandler,
+)
+from mindsdb.interfaces.storage.model_fs import HandlerStorage
+from mindsdb.utilities import log
+
+logger = log.getLogger(__name__)
+
+
+class LocalVectorHandler(VectorStoreHandler):
+    """
+    Built-in vector store: every table is a VectorIndex in the handler storage.
+    Doesn't require external services, intended for small and medium knowledge bases
+    """
+
+    name = "local_vector"
+
+    DEFAULT_LIMIT = 10
+
+    def __init__(self, name: str, **kwargs):
+        super().__init__(name)
+        self.handler_storage = HandlerStorage(kwargs.get("integration_id"))
+
+        connection_data = kwargs.get("connection_data") or {}
+        self._folder_name = connection_data.get("persist_directory") or "local_vector"
+        self._index_params = {
+            "metric": connection_data.get("metric", "cosine"),
+            "index_type": connection_data.get("index_type", "flat"),
+            "nlist": int(connection_data.get("nlist", 100)),
+            "nprobe": int(connection_data.get("nprobe", 8)),
+        }
+        if self._index_params["metric"] not in VectorIndex.METRICS:
+            raise ValueError(f"Unknown metric: {self._index_params['metric']}, available: {VectorIndex.METRICS}")
+        if self._index_params["index_type"] not in VectorIndex.INDEX_TYPES:
+            raise ValueError(
+                f"Unknown index_type: {self._index_params['index_type']}, available: {VectorIndex.INDEX_TYPES}"
+            )
+
+        self.persist_directory = None
+        self._indexes = {}
+        self.is_connected = False
+        self.connect()
+
+    def connect(self):
+        """Get the storage folder"""
+        if self.is_connected is True:
+            return
+        self.persist_directory = self.handler_storage.folder_get(self._folder_name)
+        self.is_connected = True
+
+    def disconnect(self):
+        self._indexes = {}
+        self.is_connected = False
+
+    def check_connection(self):
+        response = StatusResponse(False)
+        try:
+            self.connect()
+            response.success = os.path.isdir(self.persist_directory)
+        except Exception as e:
+            logger.error(f"Error opening local vector storage, {e}!")
+            response.error_message = str(e)
+        return response
+
+    def _sync(self):
+        self.handler_storage.folder_sync(self._folder_name)
+
+    def _table_path(self, table_name: str) -> str:
+        return os.path.join(self.persist_directory, table_name)
+
+    def _table_exists(self, table_name: str) -> bool:
+        return os.path.exists(os.path.join(self._table_path(table_name), VectorIndex.STATE_FILE))
+
+    def _get_index(self, table_name: str, create: bool = False) -> VectorIndex:
+        index = self._indexes.get(table_name)
+        if index is not None and not index.is_outdated():
+            return index
+
+        if not self._table_exists(table_name) and not create:
+            raise Exception(f"Table {table_name} does not exist!")
+
+        index = VectorIndex(self._table_path(table_name), **self._index_params)
+        self._indexes[table_name] = index
+        return index
+
+    @staticmethod
+    def _to_vector(value) -> np.ndarray:
+        if isinstance(value, np.ndarray):
+            return value.astype(np.float32, copy=False)
+        return vectors_to_matrix([value])[0]
+
+    @staticmethod
+    def _to_metadata(value):
+        if isinstance(value, str):
+            try:
+                return json.loads(value)
+            except ValueError:
+                # python dict representation
+                return ast.literal_eval(value)
+        if value is None or (isinstance(value, float) and np.isnan(value)):
+            return None
+        return value
+
+    def _get_search_vector(self, conditions: List[FilterCondition]):
+        if conditions is None:
+            return None
+        for condition in conditions:
+            if condition.column in (TableField.EMBEDDINGS.value, TableField.SEARCH_VECTOR.value):
+                vector = self._to_vector(condition.value)
+                if vector.ndim == 2:
+                    # one vector in list: [[1, 2, 3]]
+                    vector = vector[0]
+                return vector
+        return None
+
+    def select(
+        self,
+        table_name: str,
+        columns: List[str] = None,
+        conditions: List[FilterCondition] = None,
+        offset: int = None,
+        limit: int = None,
+    ) -> pd.DataFrame:
+        index = self._get_index(table_name)
+
+        if columns is None:
+            columns = [col["name"] for col in self.SCHEMA]
+
+        mask = index.filter(conditions)
+        search_vector = self._get_search_vector(conditions)
+        offset = offset or 0
+
+        if search_vector is not None:
+            if limit is None:
+                limit = self.DEFAULT_LIMIT
+            positions, distances = index.search(search_vector, limit + offset, mask)
+            positions, distances = positions[offset:], distances[offset:]
+        else:
+            positions = np.flatnonzero(mask)
+            if limit is not None:
+                positions = positions[offset:offset + limit]
+            else:
+                positions = positions[offset:]
+            distances = None
+
+        df = index.get_rows(positions, columns)
+        # always include distance
+        if distances is not None:
+            df[TableField.DISTANCE.value] = distances
+        return df
+
+    def insert(self, table_name: str, data: pd.DataFrame):
+        id_col = TableField.ID.value
+        if id_col not in data.columns or data[id_col].isna().any():
+            # generate missing ids
+            return self.do_upsert(table_name, data.reset_index(drop=True))
+
+        index = self._get_index(table_name, create=True)
+
+        embeddings = vectors_to_matrix(data[TableField.EMBEDDINGS.value])
+
+        contents = None
+        if TableField.CONTENT.value in data.columns:
+            contents = data[TableField.CONTENT.value].tolist()
+        metadatas = None
+        if TableField.METADATA.value in data.columns:
+            metadatas = [self._to_metadata(value) for value in data[TableField.METADATA.value]]
+
+        index.add(
+            ids=data[TableField.ID.value].astype(str).tolist(),
+            embeddings=embeddings,
+            contents=contents,
+            metadatas=metadatas,
+        )
+        index.save()
+        self._sync()
+
+    def upsert(self, table_name: str, data: pd.DataFrame):
+        # rows with existing ids are replaced by the index
+        return self.insert(table_name, data)
+
+    def update(
+        self, table_name: str, data: pd.DataFrame, key_columns: List[str] = None
+    ):
+        return self.insert(table_name, data)
+
+    def delete(
+        self, table_name: str, conditions: List[FilterCondition] = None
+    ):
+        index = self._get_index(table_name)
+        index.delete(index.filter(conditions))
+        index.save()
+        self._sync()
+
+    def create_table(self, table_name: str, if_not_exists=True):
+        if self._table_exists(table_name):
+            if if_not_exists:
+                return
+            raise Exception(f"Table {table_name} already exists!")
+        index = self._get_index(table_name, create=True)
+        index.save()
+        self._sync()
+
+    def drop_table(self, table_name: str, if_exists=True):
+        if not self._table_exists(table_name):
+            if if_exists:
+                return
+            raise Exception(f"Table {table_name} does not exist!")
+        self._get_index(table_name).drop()
+        self._indexes.pop(table_name, None)
+        self._sync()
+
+    def get_tables(self) -> HandlerResponse:
+        tables = [
+            name for name in sorted(os.listdir(self.persist_directory))
+            if self._table_exists(name)
+        ]
+        return Response(
+            resp_type=RESPONSE_TYPE.TABLE,
+            data_frame=pd.DataFrame(tables, columns=["table_name"])
+        )
+
+    def get_columns(self, table_name: str) -> HandlerResponse:
+        if not self._table_exists(table_name):
+            return Response(
+                resp_type=RESPONSE_TYPE.ERROR,
+                error_message=f"Table {table_name} does not exist!",
+            )
+        return super().get_columns(table_name)
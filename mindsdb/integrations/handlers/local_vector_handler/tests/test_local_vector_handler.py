@@ -0,0 +1,106 @@
+import shutil
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from tests.unit.executor_test_base import BaseExecutorTest
+
+
+class TestLocalVectorHandler(BaseExecutorTest):
+
+    @pytest.fixture(autouse=True, scope="function")
+    def setup_method(self):
+        super().setup_method()
+        self.run_sql(
+            """
+            CREATE DATABASE local_vec
+            WITH ENGINE = "local_vector",
+            PARAMETERS = {
+                "persist_directory": "test_local_vector"
+            }
+            """
+        )
+        from mindsdb.interfaces.database.integrations import integration_controller
+        persist_directory = integration_controller.get_data_handler("local_vec").persist_directory
+        yield
+        self.run_sql("DROP DATABASE local_vec;")
+        # the handler storage is not removed with the database
+        shutil.rmtree(persist_directory, ignore_errors=True)
+
+    @patch("mindsdb.integrations.handlers.postgres_handler.Handler")
+    def test_insert_select_delete(self, postgres_handler_mock):
+        df = pd.DataFrame(
+            {
+                "id": ["id1", "id2", "id3"],
+                "content": ["first", "second", "third"],
+                "metadata": [{"test": "test1"}, {"test": "test2"}, {"test": "test1"}],
+                "embeddings": [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [1.0, 1.0, 0.0]],
+            }
+        )
+        self.set_handler(postgres_handler_mock, "pg", tables={"df": df})
+
+        self.run_sql(
+            """
+            CREATE TABLE local_vec.test_table (
+                SELECT * FROM pg.df
+            )
+            """
+        )
+
+        self.run_sql(
+            """
+            INSERT INTO local_vec.test_table (id, content, metadata, embeddings)
+            VALUES ('id4', 'fourth', '{"test": "test2", "flag": true, "empty": null}', '[0.0, 0.0, 1.0]')
+            """
+        )
+        ret = self.run_sql("SELECT * FROM local_vec.test_table")
+        assert ret.shape[0] == 4
+
+        # search
+        ret = self.run_sql(
+            """
+            SELECT id FROM local_vec.test_table
+            WHERE search_vector = '[1.0, 0.1, 0.0]'
+            LIMIT 2
+            """
+        )
+        assert list(ret["id"]) == ["id1", "id3"]
+
+        # search with metadata filter
+        ret = self.run_sql(
+            """
+            SELECT id FROM local_vec.test_table
+            WHERE search_vector = '[1.0, 0.1, 0.0]'
+            AND `metadata.test` = 'test2'
+            LIMIT 1
+            """
+        )
+        assert list(ret["id"]) == ["id2"]
+
+        self.run_sql("DELETE FROM local_vec.test_table WHERE id = 'id1'")
+        ret = self.run_sql("SELECT * FROM local_vec.test_table")
+        assert ret.shape[0] == 3
+
+        # wrong dimension
+        with pytest.raises(Exception):
+            self.run_sql(
+                """
+                INSERT INTO local_vec.test_table (id, content, embeddings)
+                VALUES ('id5', 'fifth', '[0.0, 1.0]')
+                """
+            )
+
+        self.run_sql("DROP TABLE local_vec.test_table")
+
+    def test_drop_table(self):
+        self.run_sql(
+            """
+            INSERT INTO local_vec.test_table2 (id, content, embeddings)
+            VALUES ('id1', 'first', '[0.0, 1.0]')
+            """
+        )
+        self.run_sql("DROP TABLE local_vec.test_table2")
+
+        with pytest.raises(Exception):
+            self.run_sql("DROP TABLE local_vec.test_table2")
@@ -0,0 +1,96 @@
+import tempfile
+
+import numpy as np
+import pytest
+
+from mindsdb.integrations.handlers.local_vector_handler.vector_index import VectorIndex
+from mindsdb.integrations.utilities.sql_utils import FilterCondition, FilterOperator
+
+
+@pytest.fixture
+def index_path():
+    with tempfile.TemporaryDirectory() as path:
+        yield path
+
+
+def make_index(path, count=100, dim=8, **kwargs):
+    rng = np.random.default_rng(1)
+    vectors = rng.normal(size=(count, dim)).astype(np.float32)
+    index = VectorIndex(path, **kwargs)
+    index.add(
+        ids=[str(i) for i in range(count)],
+        embeddings=vectors,
+        contents=[f'doc {i}' for i in range(count)],
+        metadatas=[{'group': i % 3, 'name': f'n{i}'} for i in range(count)],
+    )
+    return index, vectors
+
+
+class TestVectorIndex:
+
+    @pytest.mark.parametrize('metric', VectorIndex.METRICS)
+    def test_exact_search(self, index_path, metric):
+        index, vectors = make_index(index_path, metric=metric)
+
+        positions, distances = index.search(vectors[5], 3)
+        assert len(positions) == 3
+        assert list(distances) == sorted(distances)
+        if metric != 'ip':
+            assert positions[0] == 5
+
+        # compare with straightforward calculation
+        if metric == 'l2':
+            expected = np.linalg.norm(vectors - vectors[5], axis=1)
+            assert list(positions) == list(np.argsort(expected)[:3])
+
+    def test_prefilter(self, index_path):
+        index, vectors = make_index(index_path)
+
+        mask = index.filter([FilterCondition('metadata.group', FilterOperator.EQUAL, 1)])
+        positions, _ = index.search(vectors[0], 10, mask)
+        # row 0 is in other group, limit is filled only with rows from the group
+        assert len(positions) == 10
+        assert all(int(p) % 3 == 1 for p in positions)
+
+        mask = index.filter([FilterCondition('metadata.name', FilterOperator.LIKE, 'n1%')])
+        assert mask.sum() == 11
+
+        mask = index.filter([FilterCondition('id', FilterOperator.IN, ['1', '2', '500'])])
+        assert list(np.flatnonzero(mask)) == [1, 2]
+
+    def test_add_delete_persist(self, index_path):
+        index, vectors = make_index(index_path)
+
+        # replace row by id
+        index.add(ids=['5'], embeddings=vectors[6:7], contents=['new'])
+        assert len(index) == 100
+
+        index.delete(index.filter([FilterCondition('id', FilterOperator.EQUAL, '6')]))
+        assert len(index) == 99
+        index.save()
+
+        index2 = VectorIndex(index_path)
+        assert len(index2) == 99
+        positions, distances = index2.search(vectors[6], 1)
+        df = index2.get_rows(positions, ['id', 'content', 'embeddings'])
+        assert df['id'][0] == '5'
+        assert df['content'][0] == 'new'
+        assert df['embeddings'][0].dtype == np.float32
+
+        # compaction after removing most of rows
+        index2.delete(index2.filter([FilterCondition('metadata.group', FilterOperator.NOT_EQUAL, 0)]))
+        assert index2.size == len(index2)
+        positions, _ = index2.search(vectors[3], 1)
+        assert index2.get_rows(positions, ['id'])['id'][0] == '3'
+
+    def test_ivf(self, index_path):
+        index, vectors = make_index(index_path, count=2000, index_type='ivf', nlist=10, nprobe=10)
+        assert index._centroids is not None
+
+        # all clusters are probed: the same result as exact search
+        positions, _ = index.search(vectors[7], 5)
+        assert positions[0] == 7
+
+        index.save()
+        index2 = VectorIndex(index_path)
+        assert index2._centroids.shape == (10, 8)
@@ -0,0 +1,461 @@
+import os
+import re
+import json
+import shutil
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from mindsdb.integrations.libs.vectordatabase_handler import TableField
+from mindsdb.integrations.utilities.sql_utils import FilterCondition, FilterOperator
+
+
+class VectorIndex:
+    """
+    Vectors of a single table stored in a float32 matrix memory-mapped from disk.
+
+    Rows are only appended to the matrix: deleted rows are marked as not alive and
+    removed from the files on compaction. Search is exact (matmul over all candidates)
+    until an IVF index is enabled and trained, after that only rows from the `nprobe`
+    closest clusters are scored.
+
+    Folder layout:
+        vectors.npy   - matrix of shape (capacity, dim), first `size` rows are used
+        records.pkl   - id, content, metadata, alive and cluster of every row
+        centroids.npy - IVF centroids (only for index_type='ivf')
+        state.json    - dimension, size, metric and index parameters
+    """
+
+    VECTORS_FILE = 'vectors.npy'
+    RECORDS_FILE = 'records.pkl'
+    CENTROIDS_FILE = 'centroids.npy'
+    STATE_FILE = 'state.json'
+
+    METRICS = ('cosine', 'l2', 'ip')
+    INDEX_TYPES = ('flat', 'ivf')
+
+    # minimum amount of points per cluster to train ivf index
+    IVF_MIN_POINTS_PER_CLUSTER = 39
+    IVF_TRAIN_ITERATIONS = 10
+
+    def __init__(self, path: str, metric: str = 'cosine', index_type: str = 'flat',
+                 nlist: int = 100, nprobe: int = 8):
+        if metric not in self.METRICS:
+            raise ValueError(f'Unknown metric: {metric}, available: {self.METRICS}')
+        if index_type not in self.INDEX_TYPES:
+            raise ValueError(f'Unknown index type: {index_type}, available: {self.INDEX_TYPES}')
+
+        self.path = path
+        self.state = {
+            'dim': None,
+            'size': 0,
+            'metric': metric,
+            'index_type': index_type,
+            'nlist': nlist,
+            'nprobe': nprobe,
+            'trained_size': 0,
+        }
+        self._vectors = None
+        self._norms = np.empty(0, dtype=np.float32)
+        self._centroids = None
+        self._records = self._empty_records()
+        self._id_positions = {}
+        self._state_mtime = None
+
+        if os.path.exists(self._file(self.STATE_FILE)):
+            self.load()
+
+    @staticmethod
+    def _empty_records() -> pd.DataFrame:
+        return pd.DataFrame({
+            TableField.ID.value: pd.Series(dtype=object),
+            TableField.CONTENT.value: pd.Series(dtype=object),
+            TableField.METADATA.value: pd.Series(dtype=object),
+            'alive': pd.Series(dtype=bool),
+            'cluster': pd.Series(dtype=np.int32),
+        })
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, name)
+
+    @property
+    def size(self) -> int:
+        return self.state['size']
+
+    @property
+    def dim(self) -> Optional[int]:
+        return self.state['dim']
+
+    @property
+    def alive(self) -> np.ndarray:
+        return self._records['alive'].to_numpy(dtype=bool)
+
+    def __len__(self):
+        return int(self.alive.sum())
+
+    # -- persistence --
+
+    def load(self):
+        with open(self._file(self.STATE_FILE)) as fd:
+            self.state.update(json.load(fd))
+        self._state_mtime = os.path.getmtime(self._file(self.STATE_FILE))
+
+        self._records = pd.read_pickle(self._file(self.RECORDS_FILE))
+        self._id_positions = self._build_id_positions()
+
+        self._vectors = None
+        if self.dim is not None:
+            self._vectors = np.load(self._file(self.VECTORS_FILE), mmap_mode='r+')
+            self._norms = np.linalg.norm(self._vectors[:self.size], axis=1).astype(np.float32)
+
+        self._centroids = None
+        if os.path.exists(self._file(self.CENTROIDS_FILE)):
+            self._centroids = np.load(self._file(self.CENTROIDS_FILE))
+
+    def is_outdated(self) -> bool:
+        """Index files were changed by another handler instance"""
+        state_file = self._file(self.STATE_FILE)
+        if not os.path.exists(state_file):
+            return self._state_mtime is not None
+        return os.path.getmtime(state_file) != self._state_mtime
+
+    def save(self):
+        os.makedirs(self.path, exist_ok=True)
+        if self._vectors is not None:
+            self._vectors.flush()
+
+        self._atomic_write(self.RECORDS_FILE, lambda path: self._records.to_pickle(path))
+        if self._centroids is not None:
+            self._atomic_write(self.CENTROIDS_FILE, lambda path: np.save(path, self._centroids))
+        elif os.path.exists(self._file(self.CENTROIDS_FILE)):
+            os.remove(self._file(self.CENTROIDS_FILE))
+
+        def write_state(path):
+            with open(path, 'w') as fd:
+                json.dump(self.state, fd)
+
+        self._atomic_write(self.STATE_FILE, write_state)
+        self._state_mtime = os.path.getmtime(self._file(self.STATE_FILE))
+
+    def _atomic_write(self, name: str, writer):
+        # np.save appends .npy to names without it, keep extension in tmp name
+        tmp_path = self._file(f'tmp_{name}')
+        writer(tmp_path)
+        os.replace(tmp_path, self._file(name))
+
+    def drop(self):
+        self._vectors = None
+        if os.path.exists(self.path):
+            shutil.rmtree(self.path)
+
+    # -- modification --
+
+    def _build_id_positions(self) -> dict:
+        records = self._records[self._records['alive']]
+        return dict(zip(records[TableField.ID.value], records.index))
+
+    def _reserve(self, rows: int):
+        """Grow matrix file to fit `rows` more vectors"""
+        needed = self.size + rows
+        capacity = 0 if self._vectors is None else self._vectors.shape[0]
+        if needed <= capacity:
+            return
+
+        os.makedirs(self.path, exist_ok=True)
+        new_capacity = max(needed, capacity * 2, 1024)
+        tmp_path = self._file(f'tmp_{self.VECTORS_FILE}')
+        vectors = np.lib.format.open_memmap(
+            tmp_path, mode='w+', dtype=np.float32, shape=(new_capacity, self.dim)
+        )
+        if self.size > 0:
+            vectors[:self.size] = self._vectors[:self.size]
+        vectors.flush()
+        del vectors
+        self._vectors = None
+        os.replace(tmp_path, self._file(self.VECTORS_FILE))
+        self._vectors = np.load(self._file(self.VECTORS_FILE), mmap_mode='r+')
+
+    def add(self, ids: List[str], embeddings: np.ndarray, contents: list = None, metadatas: list = None):
+        """
+        Add or replace rows. Existing rows with the same ids are marked as deleted
+        """
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        if embeddings.ndim != 2:
+            raise ValueError('Embeddings must be a list of vectors with the same size')
+        if len(ids) != len(embeddings):
+            raise ValueError('Amount of ids and embeddings is different')
+        if len(ids) == 0:
+            return
+
+        if self.dim is None:
+            self.state['dim'] = int(embeddings.shape[1])
+        elif embeddings.shape[1] != self.dim:
+            raise ValueError(f'Wrong embeddings size: {embeddings.shape[1]}, table stores vectors of size {self.dim}')
+
+        self._mark_deleted([self._id_positions[i] for i in ids if i in self._id_positions])
+
+        self._reserve(len(ids))
+        start = self.size
+        end = start + len(ids)
+        self._vectors[start:end] = embeddings
+        self._norms = np.concatenate([self._norms, np.linalg.norm(embeddings, axis=1).astype(np.float32)])
+
+        clusters = np.full(len(ids), -1, dtype=np.int32)
+        if self._centroids is not None:
+            clusters = self._nearest_centroids(embeddings)
+
+        records = pd.DataFrame({
+            TableField.ID.value: list(ids),
+            TableField.CONTENT.value: contents if contents is not None else [None] * len(ids),
+            TableField.METADATA.value: metadatas if metadatas is not None else [None] * len(ids),
+            'alive': True,
+            'cluster': clusters,
+        }, index=pd.RangeIndex(start, end))
+        if len(self._records) == 0:
+            self._records = records
+        else:
+            self._records = pd.concat([self._records, records])
+
+        self._id_positions.update(zip(ids, range(start, end)))
+        self.state['size'] = end
+
+        self._maybe_train()
+
+    def _mark_deleted(self, positions):
+        if len(positions) == 0:
+            return
+        self._records.loc[positions, 'alive'] = False
+        ids = self._records.loc[positions, TableField.ID.value]
+        for id in ids:
+            self._id_positions.pop(id, None)
+
+    def delete(self, mask: np.ndarray) -> int:
+        """
+        Delete rows selected by the mask
+        :return: amount of deleted rows
+        """
+        positions = np.flatnonzero(mask & self.alive)
+        self._mark_deleted(positions)
+
+        # free space when most of rows are deleted
+        if self.size > 0 and len(self) < self.size / 2:
+            self.compact()
+        return len(positions)
+
+    def compact(self):
+        """Rewrite files only with alive rows"""
+        positions = np.flatnonzero(self.alive)
+        vectors = np.array(self._vectors[positions]) if self._vectors is not None else None
+
+        self._records = self._records.iloc[positions].reset_index(drop=True)
+        self._id_positions = self._build_id_positions()
+        self.state['size'] = 0
+        self._norms = np.empty(0, dtype=np.float32)
+
+        if vectors is not None:
+            self._vectors = None
+            os.remove(self._file(self.VECTORS_FILE))
+            self._reserve(len(vectors))
+            self._vectors[:len(vectors)] = vectors
+            self._norms = np.linalg.norm(vectors, axis=1).astype(np.float32)
+        self.state['size'] = len(positions)
+
+    # -- ivf --
+
+    def _prepare_for_clustering(self, vectors: np.ndarray) -> np.ndarray:
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if self.state['metric'] == 'cosine':
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            norms[norms == 0] = 1
+            vectors = vectors / norms
+        return vectors
+
+    def _nearest_centroids(self, vectors: np.ndarray, centroids: np.ndarray = None) -> np.ndarray:
+        if centroids is None:
+            centroids = self._centroids
+        vectors = self._prepare_for_clustering(vectors)
+        # argmin(|c|^2 - 2 * v.c) is the closest centroid by l2
+        scores = (centroids ** 2).sum(axis=1) - 2 * vectors @ centroids.T
+        return scores.argmin(axis=1).astype(np.int32)
+
+    def _maybe_train(self):
+        if self.state['index_type'] != 'ivf':
+            return
+        live_count = len(self)
+        if live_count < self.state['nlist'] * self.IVF_MIN_POINTS_PER_CLUSTER:
+            return
+        # retrain when the index has doubled since the last training
+        if self._centroids is not None and live_count < 2 * self.state['trained_size']:
+            return
+        self.train()
+
+    def train(self):
+        """Train IVF centroids with k-means and reassign all rows to clusters"""
+        nlist = self.state['nlist']
+        positions = np.flatnonzero(self.alive)
+        if len(positions) < nlist:
+            return
+
+        rng = np.random.default_rng(0)
+        sample_size = min(len(positions), nlist * 256)
+        sample = np.sort(rng.choice(positions, sample_size, replace=False))
+        data = self._prepare_for_clustering(self._vectors[sample])
+
+        centroids = data[rng.choice(len(data), nlist, replace=False)].copy()
+        for _ in range(self.IVF_TRAIN_ITERATIONS):
+            assignment = self._nearest_centroids(data, centroids)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, data)
+            counts = np.bincount(assignment, minlength=nlist)
+            non_empty = counts > 0
+            centroids[non_empty] = sums[non_empty] / counts[non_empty, None]
+
+        self._centroids = centroids.astype(np.float32)
+
+        clusters = np.full(self.size, -1, dtype=np.int32)
+        batch_size = 10000
+        for start in range(0, len(positions), batch_size):
+            batch = positions[start:start + batch_size]
+            clusters[batch] = self._nearest_centroids(self._vectors[batch])
+        self._records['cluster'] = clusters
+        self.state['trained_size'] = len(positions)
+
+    # -- search --
+
+    def filter(self, conditions: List[FilterCondition] = None) -> np.ndarray:
+        """
+        Mask of alive rows which satisfy conditions.
+        Conditions on embeddings are skipped: they are used for the search
+        """
+        mask = self.alive
+        if not conditions:
+            return mask
+
+        for condition in conditions:
+            column = condition.column
+            if column in (TableField.EMBEDDINGS.value, TableField.SEARCH_VECTOR.value):
+                continue
+
+            if column.startswith(TableField.METADATA.value + '.'):
+                key = column[len(TableField.METADATA.value) + 1:]
+                values = self._records[TableField.METADATA.value].map(
+                    lambda meta: meta.get(key) if isinstance(meta, dict) else None
+                )
+            elif column in (TableField.ID.value, TableField.CONTENT.value):
+                values = self._records[column]
+            else:
+                raise ValueError(f'Unsupported filter column: {column}')
+
+            mask = mask & _apply_operator(values, condition.op, condition.value)
+        return mask
+
+    def search(self, vector, limit: int, mask: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find `limit` closest vectors among rows allowed by the mask
+        :return: positions of rows and distances to them, ordered by distance
+        """
+        query = np.asarray(vector, dtype=np.float32).reshape(-1)
+        if self.dim is None:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        if len(query) != self.dim:
+            raise ValueError(f'Wrong search vector size: {len(query)}, table stores vectors of size {self.dim}')
+
+        if mask is None:
+            mask = self.alive
+
+        if self._centroids is not None:
+            nprobe = min(self.state['nprobe'], len(self._centroids))
+            centroids_dist = ((self._centroids - self._prepare_for_clustering(query[None, :])) ** 2).sum(axis=1)
+            probe = np.argpartition(centroids_dist, nprobe - 1)[:nprobe]
+            mask = mask & np.isin(self._records['cluster'].to_numpy(), probe)
+
+        candidates = np.flatnonzero(mask)
+        if len(candidates) == 0 or limit == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        if len(candidates) > self.size // 4:
+            # dense: one matmul over contiguous matrix is faster than gathering rows
+            distances = self._distances(query, self._vectors[:self.size], self._norms)[candidates]
+        else:
+            distances = self._distances(query, self._vectors[candidates], self._norms[candidates])
+
+        if limit is not None and limit < len(candidates):
+            top = np.argpartition(distances, limit - 1)[:limit]
+        else:
+            top = np.arange(len(candidates))
+        top = top[np.argsort(distances[top], kind='stable')]
+        return candidates[top], distances[top]
+
+    def _distances(self, query: np.ndarray, vectors: np.ndarray, norms: np.ndarray) -> np.ndarray:
+        dot = vectors @ query
+        metric = self.state['metric']
+        if metric == 'cosine':
+            denominator = norms * np.linalg.norm(query)
+            denominator[denominator == 0] = 1
+            return 1 - dot / denominator
+        elif metric == 'l2':
+            return np.sqrt(np.maximum(norms ** 2 - 2 * dot + np.dot(query, query), 0))
+        else:
+            # negative inner product, the same as pgvector's <#>
+            return -dot
+
+    def get_rows(self, positions: np.ndarray, columns: List[str]) -> pd.DataFrame:
+        """Rows at positions. Embeddings are returned as float32 arrays"""
+        records = self._records.iloc[positions]
+        data = {}
+        for column in columns:
+            if column == TableField.EMBEDDINGS.value:
+                if self._vectors is None or len(positions) == 0:
+                    data[column] = []
+                else:
+                    # rows of one contiguous matrix
+                    data[column] = list(np.array(self._vectors[positions]))
+            else:
+                data[column] = records[column].tolist()
+        return pd.DataFrame(data, columns=columns)
+
+
+def _apply_operator(values: pd.Series, op: FilterOperator, value) -> np.ndarray:
+    """Vectorized comparison of a column with a filter value"""
+    not_null = values.notna().to_numpy()
+
+    if op == FilterOperator.IS_NULL or (op == FilterOperator.IS and value is None):
+        return ~not_null
+    if op == FilterOperator.IS_NOT_NULL or (op == FilterOperator.IS_NOT and value is None):
+        return not_null
+
+    if op in (FilterOperator.IN, FilterOperator.NOT_IN):
+        result = values.isin(list(value)).to_numpy()
+        if op == FilterOperator.NOT_IN:
+            result = ~result & not_null
+        return result
+
+    if op in (FilterOperator.LIKE, FilterOperator.NOT_LIKE):
+        pattern = '^' + ''.join(
+            '.*' if char == '%' else '.' if char == '_' else re.escape(char)
+            for char in str(value)
+        ) + '$'
+        result = values.astype(str).str.match(pattern).to_numpy(dtype=bool) & not_null
+        if op == FilterOperator.NOT_LIKE:
+            result = ~result & not_null
+        return result
+
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        values = pd.to_numeric(values, errors='coerce')
+        not_null = values.notna().to_numpy()
+    else:
+        values = values.astype(str)
+        value = str(value)
+
+    operators = {
+        FilterOperator.EQUAL: values.__eq__,
+        FilterOperator.NOT_EQUAL: values.__ne__,
+        FilterOperator.LESS_THAN: values.__lt__,
+        FilterOperator.LESS_THAN_OR_EQUAL: values.__le__,
+        FilterOperator.GREATER_THAN: values.__gt__,
+        FilterOperator.GREATER_THAN_OR_EQUAL: values.__ge__,
+    }
+    if op not in operators:
+        raise NotImplementedError(f'Operator {op.value} is not supported by local vector store')
+    return operators[op](value).to_numpy(dtype=bool) & not_null
@@ -1,12 +1,17 @@
+from typing import Iterator, Optional
+
 import pandas as pd
+from pandas.api import types as pd_types
 import mysql.connector
+from mysql.connector import FieldType
 
 from mindsdb_sql import parse_sql
 from mindsdb_sql.render.sqlalchemy_render import SqlalchemyRender
 from mindsdb_sql.parser.ast.base import ASTNode
 
 from mindsdb.utilities import log
-from mindsdb.integrations.libs.base import DatabaseHandler
+from mindsdb.integrations.libs.base import DatabaseHandler, DEFAULT_FETCH_BATCH_SIZE
+from mindsdb.integrations.utilities.utils import rows_to_df
 from mindsdb.integrations.libs.response import (
     HandlerStatusResponse as StatusResponse,
     HandlerResponse as Response,
@@ -16,6 +21,20 @@ from mindsdb.integrations.handlers.mysql_handler.settings import ConnectionConfi
 
 logger = log.getLogger(__name__)
 
+INSERT_BATCH_SIZE = 10000
+
+# mysql type -> pandas dtype
+TYPES_MAP = {
+    'TINY': 'int64',
+    'SHORT': 'int64',
+    'INT24': 'int64',
+    'LONG': 'int64',
+    'LONGLONG': 'int64',
+    'YEAR': 'int64',
+    'FLOAT': 'float64',
+    'DOUBLE': 'float64',
+}
+
 
 class MySQLHandler(DatabaseHandler):
     """
@@ -64,15 +83,13 @@ class MySQLHandler(DatabaseHandler):
     def is_connected(self, value):
         pass
 
-    def connect(self):
+    def _make_connection_args(self):
         """
-        Establishes a connection to a MySQL database.
+        Makes arguments for mysql.connector.connect from the connection_data.
 
         Returns:
-            MySQLConnection: An active connection to the database.
+            dict: A dictionary containing the connection arguments.
         """
-        if self.is_connected and self.connection.is_connected():
-            return self.connection
         config = self._unpack_config()
         if 'conn_attrs' in self.connection_data:
             config['conn_attrs'] = self.connection_data['conn_attrs']
@@ -92,6 +109,18 @@ class MySQLHandler(DatabaseHandler):
                 config["ssl_cert"] = ssl_cert
             if ssl_key is not None:
                 config["ssl_key"] = ssl_key
+        return config
+
+    def connect(self):
+        """
+        Establishes a connection to a MySQL database.
+
+        Returns:
+            MySQLConnection: An active connection to the database.
+        """
+        if self.is_connected and self.connection.is_connected():
+            return self.connection
+        config = self._make_connection_args()
         try:
             connection = mysql.connector.connect(**config)
             connection.autocommit = True
@@ -148,7 +177,7 @@ class MySQLHandler(DatabaseHandler):
         connection = None
         try:
             connection = self.connect()
-            with connection.cursor(dictionary=True, buffered=True) as cur:
+            with connection.cursor(buffered=True) as cur:
                 cur.execute(query)
                 if cur.with_rows:
                     result = cur.fetchall()
@@ -175,6 +204,110 @@ class MySQLHandler(DatabaseHandler):
 
         return response
 
+    def native_query_batches(self, query: str, batch_size: int = DEFAULT_FETCH_BATCH_SIZE,
+                             limit: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """
+        Executes a SQL query using unbuffered cursor and yields the result by batches.
+        Only one batch is kept in memory, columns are converted basing on cursor description.
+        A separate connection is used, because unread result blocks the connection for other queries.
+
+        Args:
+            query (str): The SQL query to be executed.
+            batch_size (int): Max count of rows in a batch.
+            limit (int): Stop fetching after this count of rows.
+
+        Returns:
+            Iterator[pd.DataFrame]: batches of the result, nothing for queries without result.
+        """
+        connection = mysql.connector.connect(**self._make_connection_args())
+        is_read = False
+        try:
+            cur = connection.cursor(buffered=False)
+            cur.execute(query)
+            if not cur.with_rows:
+                is_read = True
+                return
+            columns = [x[0] for x in cur.description]
+            dtypes = [TYPES_MAP.get(FieldType.get_info(x[1])) for x in cur.description]
+            fetched = 0
+            while True:
+                size = batch_size if limit is None else min(batch_size, limit - fetched)
+                rows = cur.fetchmany(size) if size > 0 else []
+                is_read = len(rows) < size
+                if len(rows) == 0 and fetched > 0:
+                    break
+                fetched += len(rows)
+                yield rows_to_df(rows, columns, dtypes)
+                if size == 0 or is_read:
+                    break
+        except mysql.connector.Error as e:
+            logger.error(f'Error running query: {query} on {self.connection_data["database"]}, {e}!')
+            raise
+        finally:
+            if is_read:
+                connection.close()
+            else:
+                # rest of the result is not needed: don't read it before closing
+                connection.shutdown()
+
+    @staticmethod
+    def _df_to_rows(df: pd.DataFrame) -> list:
+        """
+        Converts dataframe to rows of python values, which can be passed to the cursor.
+
+        Args:
+            df (pd.DataFrame): The data to convert.
+
+        Returns:
+            list: list of tuples, nulls are replaced with None.
+        """
+        columns = []
+        for column_index in range(len(df.columns)):
+            col = df.iloc[:, column_index]
+            values = col.astype(object).tolist()
+            if pd_types.is_datetime64_any_dtype(col):
+                values = [value.to_pydatetime() for value in values]
+            nulls = col.isna().tolist()
+            columns.append([None if is_null else value for value, is_null in zip(values, nulls)])
+        return list(zip(*columns))
+
+    def insert(self, table_name: str, df: pd.DataFrame, batch_size: int = INSERT_BATCH_SIZE):
+        """
+        Inserts the dataframe into the table by batches.
+        Every batch is one multi-row INSERT, so it is committed as a separate transaction (connection is autocommit).
+
+        Args:
+            table_name (str): The name of the table.
+            df (pd.DataFrame): The data to insert.
+            batch_size (int): Max count of rows in one INSERT.
+        """
+        need_to_close = not self.is_connected
+        connection = self.connect()
+
+        columns = ', '.join(f'`{name}`' for name in df.columns)
+        placeholders = ', '.join(['%s'] * len(df.columns))
+        query = f'INSERT INTO `{table_name}` ({columns}) VALUES ({placeholders})'
+
+        inserted = 0
+        try:
+            with connection.cursor() as cur:
+                for start in range(0, len(df), batch_size):
+                    rows = self._df_to_rows(df.iloc[start:start + batch_size])
+                    # connector sends rows of INSERT in one statement
+                    cur.executemany(query, rows)
+                    inserted += len(rows)
+                    logger.debug(f'Inserted {inserted} of {len(df)} rows into {table_name}')
+        except mysql.connector.Error as e:
+            logger.error(
+                f'Error running insert to {table_name} on {self.database}, '
+                f'{inserted} of {len(df)} rows were inserted, {e}!'
+            )
+            # inserted batches are already committed
+            raise
+        finally:
+            if need_to_close:
+                self.disconnect()
+
     def query(self, query: ASTNode) -> Response:
         """
         Retrieve the data from the SQL statement.
@@ -29,6 +29,7 @@ def retry_with_exponential_backoff(
     exponential_base: int = 2,
     wait_errors: tuple = (openai.APITimeoutError, openai.APIConnectionError, PendingFT),
     status_errors: tuple = (openai.APIStatusError, openai.APIResponseValidationError),
+    pass_errors: tuple = (),
 ):
     """
     Wrapper to enable optional arguments. It means this decorator always needs to be called with parenthesis:
@@ -55,6 +56,7 @@ def retry_with_exponential_backoff(
             exponential_base: Base for the exponential backoff
             wait_errors: Tuple of errors to retry on
             status_errors: Tuple of status errors to raise
+            pass_errors: Tuple of errors to raise as is, to be handled by caller
 
         Returns:
             Wrapper function with exponential backoff
@@ -80,6 +82,9 @@ def retry_with_exponential_backoff(
                 try:
                     return func(*args, **kwargs)
 
+                except pass_errors:
+                    raise
+
                 except status_errors as e:
                     raise Exception(
                         f'Error status {e.status_code} raised by OpenAI API: {e.body.get("message", "Please refer to `https://platform.openai.com/docs/guides/error-codes` for more information.")}'   # noqa
@@ -152,6 +157,36 @@ def truncate_msgs_for_token_limit(messages: List[Dict], model_name: Text, max_to
     return messages
 
 
+def get_encoder(model_name: Text) -> tiktoken.core.Encoding:
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except KeyError:
+        # handlers that extend the OpenAI handler can use other models
+        return tiktoken.get_encoding('cl100k_base')
+
+
+def estimate_prompt_tokens(prompts: List[Text], model_name: Text) -> List[int]:
+    """
+    Estimates number of tokens in every prompt, to be used for tokens-per-minute limit.
+
+    Args:
+        prompts (List[Text]): List of prompts
+        model_name (Text): Model name
+
+    Returns:
+        List[int]: Number of tokens of every prompt
+    """
+    try:
+        encoder = get_encoder(model_name)
+    except Exception:
+        # encoding can't be loaded (for example, no internet access): rough estimation
+        return [len(prompt) // 4 + 1 for prompt in prompts]
+    return [
+        len(encoder.encode(prompt, disallowed_special=()))
+        for prompt in prompts
+    ]
+
+
 def count_tokens(messages: List[Dict], encoder: tiktoken.core.Encoding, model_name: Text = 'gpt-3.5-turbo-0301'):
     """
     Counts the number of tokens in a list of messages.
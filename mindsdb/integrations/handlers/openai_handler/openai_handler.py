@@ -1,12 +1,10 @@
 import os
-import math
 import json
 import shutil
 import tempfile
 import datetime
 import textwrap
 import subprocess
-import concurrent.futures
 from typing import Text, Tuple, Dict, List, Optional, Any
 import openai
 from openai import OpenAI, NotFoundError, AuthenticationError
@@ -16,9 +14,11 @@ import pandas as pd
 from mindsdb.utilities.hooks import before_openai_query, after_openai_query
 from mindsdb.utilities import log
 from mindsdb.integrations.libs.base import BaseMLEngine
+from mindsdb.integrations.libs.training_data import TrainingData
 from mindsdb.integrations.handlers.openai_handler.helpers import (
     retry_with_exponential_backoff,
     truncate_msgs_for_token_limit,
+    estimate_prompt_tokens,
     get_available_models,
     PendingFT,
 )
@@ -29,6 +29,8 @@ from mindsdb.integrations.handlers.openai_handler.constants import (
     OPENAI_API_BASE,
 )
 from mindsdb.integrations.libs.llm.utils import get_completed_prompts
+from mindsdb.integrations.libs.llm.scheduler import get_scheduler
+from mindsdb.integrations.libs.llm.response_cache import LLMResponseCache, is_cache_enabled
 from mindsdb.integrations.utilities.handler_utils import get_api_key
 
 logger = log.getLogger(__name__)
@@ -40,6 +42,8 @@ class OpenAIHandler(BaseMLEngine):
     """
 
     name = 'openai'
+    # data for fine-tuning is written to the file by batches
+    accepts_training_data = True
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -56,7 +60,9 @@ class OpenAIHandler(BaseMLEngine):
             'image',
             'embedding',
         ]
-        self.rate_limit = 60  # requests per minute
+        self.rate_limit = None  # requests per minute, without limit concurrency is adapted to rate limit errors
+        self.tokens_rate_limit = None  # tokens per minute
+        self.max_concurrency = 16
         self.max_batch_size = 20
         self.default_max_tokens = 100
         self.chat_completion_models = CHAT_MODELS
@@ -184,7 +190,12 @@ class OpenAIHandler(BaseMLEngine):
                 "temperature",
                 "openai_api_key",
                 "api_organization",
-                "api_base"
+                "api_base",
+                "rpm_limit",
+                "tpm_limit",
+                "max_concurrency",
+                "cache_responses",
+                "cache_ttl"
             }
         )
 
@@ -458,7 +469,14 @@ class OpenAIHandler(BaseMLEngine):
         api_args = {
             k: v for k, v in api_args.items() if v is not None
         }  # filter out non-specified api args
-        completion = self._completion(model_name, prompts, api_key, api_args, args, df)
+        response_cache = self._get_response_cache(model_name, api_args, args, pred_args)
+        if response_cache is not None:
+            completion = response_cache.complete(
+                prompts,
+                lambda missed_prompts: self._completion(model_name, missed_prompts, api_key, api_args, args, df)
+            )
+        else:
+            completion = self._completion(model_name, prompts, api_key, api_args, args, df)
 
         # add null completion for empty prompts
         for i in sorted(empty_prompt_ids):
@@ -485,6 +503,39 @@ class OpenAIHandler(BaseMLEngine):
 
         return pred_df
 
+    def _get_response_cache(self, model_name: Text, api_args: Dict, args: Dict, pred_args: Dict) -> Optional[LLMResponseCache]:
+        """
+        Get cache of responses if it is enabled by `cache_responses` parameter.
+        Responses are cached per prompt, so only completions which don't depend on other rows are cached:
+        embeddings, text completions and chat completions in default mode.
+
+        Args:
+            model_name (Text): OpenAI Model name.
+            api_args (Dict): OpenAI API arguments.
+            args (Dict): Parameters for the model.
+            pred_args (Dict): Parameters passed when making predictions.
+
+        Returns:
+            Optional[LLMResponseCache]: cache or None if it is not used.
+        """
+        if not is_cache_enabled({**args, **pred_args}):
+            return None
+
+        if model_name in IMAGE_MODELS:
+            return None
+        is_chat = model_name in self.chat_completion_models and model_name != 'gpt-3.5-turbo-instruct'
+        if is_chat and args.get('mode') != 'default':
+            return None
+
+        return LLMResponseCache(
+            self.name,
+            api_args.get('model', model_name),
+            {**api_args, 'api_base': args.get('api_base')},
+            ttl=pred_args.get('cache_ttl', args.get('cache_ttl')),
+            # embeddings don't depend on temperature
+            deterministic=True if model_name == 'embedding' else None,
+        )
+
     def _completion(
         self, model_name: Text, prompts: List[Text], api_key: Text, api_args: Dict, args: Dict, df: pd.DataFrame, parallel: bool = True
     ) -> List[Any]:
@@ -499,12 +550,13 @@ class OpenAIHandler(BaseMLEngine):
             - _submit_image_completion: Submit a request to the image completion endpoint of the OpenAI API.
             - _log_api_call: Log the API call made to the OpenAI API.
 
-        There are a couple checks that should be done when calling OpenAI's API:
-          - account max batch size, to maximize batch size first
-          - account rate limit, to maximize parallel calls second
+        Prompts are split into requests (batches of `max_batch_size` for completions and embeddings,
+        one prompt per request for chat and images) and sent through a request scheduler shared by the engine and model:
+          - requests/min and tokens/min limits (`rpm_limit`, `tpm_limit`), tokens are estimated with tiktoken
+          - parallel calls up to `max_concurrency`, reduced on rate limit errors
+          - rate limited requests are retried with backoff, results are returned in order of prompts
 
-        Additionally, single completion calls are done with exponential backoff to guarantee all prompts are processed,
-        because even with previous checks the tokens-per-minute limit may apply.
+        Additionally, single completion calls are done with exponential backoff on timeouts and connection errors.
 
         Args:
             model_name (Text): OpenAI Model name.
@@ -519,7 +571,7 @@ class OpenAIHandler(BaseMLEngine):
             List[Any]: List of completions. The type of completion depends on the task type.
         """
 
-        @retry_with_exponential_backoff()
+        @retry_with_exponential_backoff(pass_errors=(openai.RateLimitError,))
         def _submit_completion(model_name: Text, prompts: List[Text], api_args: Dict, args: Dict, df: pd.DataFrame) -> List[Text]:
             """
             Submit a request to the relevant completion endpoint of the OpenAI API based on the type of task.
@@ -805,61 +857,62 @@ class OpenAIHandler(BaseMLEngine):
             org=args.pop('api_organization') if 'api_organization' in args else None,
         )
 
-        try:
-            # check if simple completion works
-            completion = _submit_completion(
-                model_name, prompts, api_args, args, df
-            )
-            return completion
-        except Exception as e:
-            # else, we get the max batch size
-            if 'you can currently request up to at most a total of' in str(e):
-                pattern = 'a total of'
-                max_batch_size = int(e[e.find(pattern) + len(pattern):].split(').')[0])
-            else:
-                max_batch_size = (
-                    self.max_batch_size
-                )  # guards against changes in the API message
-
-        if not parallel:
-            completion = None
-            for i in range(math.ceil(len(prompts) / max_batch_size)):
-                partial = _submit_completion(
-                    model_name,
-                    prompts[i * max_batch_size: (i + 1) * max_batch_size],
-                    api_args,
-                    args,
-                    df,
-                )
-                if not completion:
-                    completion = partial
-                else:
-                    completion['choices'].extend(partial['choices'])
-                    for field in ('prompt_tokens', 'completion_tokens', 'total_tokens'):
-                        completion['usage'][field] += partial['usage'][field]
+        mode = args.get('mode', 'conversational')
+        is_chat = (
+            model_name in self.chat_completion_models
+            and model_name != 'gpt-3.5-turbo-instruct'
+        )
+        if is_chat and mode != 'default':
+            # rows of conversation are sent in one sequence
+            batch_size = max(len(prompts), 1)
+        elif is_chat or model_name in IMAGE_MODELS:
+            # one request per prompt
+            batch_size = 1
         else:
-            promises = []
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                for i in range(math.ceil(len(prompts) / max_batch_size)):
-                    logger.debug(
-                        f'{i * max_batch_size}:{(i+1) * max_batch_size}/{len(prompts)}'
-                    )
-                    future = executor.submit(
-                        _submit_completion,
-                        model_name,
-                        prompts[i * max_batch_size: (i + 1) * max_batch_size],
-                        api_args,
-                        args,
-                        df,
-                    )
-                    promises.append({"choices": future})
-            completion = None
-            for p in promises:
-                if not completion:
-                    completion = p['choices'].result()
-                else:
-                    completion.extend(p['choices'].result())
+            batch_size = self.max_batch_size
 
+        batches = [
+            prompts[i:i + batch_size]
+            for i in range(0, len(prompts), batch_size)
+        ]
+        if len(batches) == 0:
+            batches = [prompts]
+
+        tokens_per_minute = args.get('tpm_limit', self.tokens_rate_limit)
+
+        # estimate tokens: prompt and reserved completion tokens
+        batch_tokens = None
+        if tokens_per_minute and model_name not in IMAGE_MODELS:
+            encoding_model = api_args['model'] if model_name == 'embedding' else model_name
+            prompt_tokens = estimate_prompt_tokens(prompts, encoding_model)
+            max_tokens = api_args.get('max_tokens', 0)
+            batch_tokens = [
+                sum(prompt_tokens[i:i + batch_size]) + max_tokens * len(batch)
+                for i, batch in zip(range(0, len(prompts), batch_size), batches)
+            ]
+
+        scheduler = get_scheduler(
+            f"{self.name}:{args.get('api_base')}:{api_args.get('model', model_name)}",
+            requests_per_minute=args.get('rpm_limit', self.rate_limit),
+            tokens_per_minute=tokens_per_minute,
+            max_concurrency=args.get('max_concurrency', self.max_concurrency),
+        )
+
+        def submit(batch):
+            return _submit_completion(model_name, batch, api_args, args, df)
+
+        if parallel:
+            results = scheduler.run(submit, batches, batch_tokens)
+        else:
+            # batches are sent one by one, within the limits of the shared scheduler
+            if batch_tokens is None:
+                batch_tokens = [0] * len(batches)
+            results = [scheduler.call(submit, batch, count) for batch, count in zip(batches, batch_tokens)]
+        logger.debug(f'{self.name} requests metrics: {scheduler.get_metrics()}')
+
+        completion = []
+        for result in results:
+            completion.extend(result)
         return completion
 
     def describe(self, attribute: Optional[Text] = None) -> pd.DataFrame:
@@ -1025,14 +1078,20 @@ class OpenAIHandler(BaseMLEngine):
         Prepare the input data for fine-tuning.
 
         Args:
-            df (pd.DataFrame): Input data to fine-tune on.
+            df (pd.DataFrame | TrainingData): Input data to fine-tune on.
             temp_filename (Text): Temporary filename.
             temp_model_path (Text): Temporary model path.
 
         Returns:
             Dict: File names for the fine-tuning process.
         """
-        df.to_json(temp_model_path, orient='records', lines=True)
+        if isinstance(df, TrainingData):
+            # only one batch is loaded into memory
+            with open(temp_model_path, 'w') as fd:
+                for batch in df.iter_batches():
+                    batch.to_json(fd, orient='records', lines=True)
+        else:
+            df.to_json(temp_model_path, orient='records', lines=True)
 
         # TODO avoid subprocess usage once OpenAI enables non-CLI access, or refactor to use our own LLM utils instead
         subprocess.run(
@@ -16,6 +16,7 @@ from mindsdb.integrations.libs.vectordatabase_handler import (
     FilterCondition,
     VectorStoreHandler,
 )
+from mindsdb.integrations.libs.vector_column import to_vector_column
 from mindsdb.utilities import log
 from mindsdb.utilities.profiler import profiler
 from mindsdb.utilities.context import context as ctx
@@ -220,9 +221,9 @@ class PgVectorHandler(VectorStoreHandler, PostgresHandler):
         query = self._build_select_query(table_name, columns, conditions, limit, offset)
         result = self.raw_query(query)
 
-        # ensure embeddings are returned as string so they can be parsed by mindsdb
+        # keep embeddings binary: register_vector returns them as numpy arrays
         if "embeddings" in columns:
-            result["embeddings"] = result["embeddings"].astype(str)
+            result["embeddings"] = to_vector_column(result["embeddings"])
 
         return result
 
@@ -1,5 +1,6 @@
 import time
 import json
+from typing import Iterator, Optional
 
 import pandas as pd
 import psycopg
@@ -11,7 +12,8 @@ from mindsdb_sql import parse_sql
 from mindsdb_sql.render.sqlalchemy_render import SqlalchemyRender
 from mindsdb_sql.parser.ast.base import ASTNode
 
-from mindsdb.integrations.libs.base import DatabaseHandler
+from mindsdb.integrations.libs.base import DatabaseHandler, DEFAULT_FETCH_BATCH_SIZE
+from mindsdb.integrations.utilities.utils import rows_to_df
 from mindsdb.utilities import log
 from mindsdb.integrations.libs.response import (
     HandlerStatusResponse as StatusResponse,
@@ -24,6 +26,16 @@ logger = log.getLogger(__name__)
 
 SUBSCRIBE_SLEEP_INTERVAL = 1
 
+# postgres type -> pandas dtype
+TYPES_MAP = {
+    'int2': 'int16',
+    'int4': 'int32',
+    'int8': 'int64',
+    'numeric': 'float64',
+    'float4': 'float32',
+    'float8': 'float64'
+}
+
 
 class PostgresHandler(DatabaseHandler):
     """
@@ -149,14 +161,7 @@ class PostgresHandler(DatabaseHandler):
                 df (DataFrame)
                 description (list): psycopg cursor description
         """
-        types_map = {
-            'int2': 'int16',
-            'int4': 'int32',
-            'int8': 'int64',
-            'numeric': 'float64',
-            'float4': 'float32',
-            'float8': 'float64'
-        }
+        types_map = TYPES_MAP
         for column_index, _ in enumerate(df.columns):
             col = df.iloc[:, column_index]  # column names could be duplicated
             if str(col.dtype) == 'object':
@@ -216,6 +221,62 @@ class PostgresHandler(DatabaseHandler):
 
         return response
 
+    def _get_dtypes(self, description: list) -> list:
+        """
+        Get pandas dtypes of columns basing on postgres types
+
+            Args:
+                description (list): psycopg cursor description
+
+            Returns:
+                list: dtype of every column, None if it has to be inferred
+        """
+        dtypes = []
+        for column in description:
+            pg_type = types.get(column.type_code)
+            dtypes.append(TYPES_MAP.get(pg_type.name) if pg_type is not None else None)
+        return dtypes
+
+    def native_query_batches(self, query: str, batch_size: int = DEFAULT_FETCH_BATCH_SIZE,
+                             limit: Optional[int] = None, params=None) -> Iterator[DataFrame]:
+        """
+        Executes a SQL query using server-side cursor and yields the result by batches.
+        Only one batch is kept in memory, columns are converted basing on cursor description.
+        A separate connection is used, so the handler can run other queries while batches are consumed.
+
+        Args:
+            query (str): The SQL query to be executed, it has to return rows.
+            batch_size (int): Max count of rows in a batch.
+            limit (int): Stop fetching after this count of rows.
+            params: Parameters of the query.
+
+        Returns:
+            Iterator[DataFrame]: batches of the result.
+        """
+        connection = psycopg.connect(**self._make_connection_args())
+        try:
+            cur = connection.cursor(name='mindsdb_batches')
+            cur.itersize = batch_size
+            cur.execute(query, params)
+            columns = [x.name for x in cur.description]
+            dtypes = self._get_dtypes(cur.description)
+            fetched = 0
+            while True:
+                size = batch_size if limit is None else min(batch_size, limit - fetched)
+                rows = cur.fetchmany(size) if size > 0 else []
+                if len(rows) == 0 and fetched > 0:
+                    break
+                fetched += len(rows)
+                yield rows_to_df(rows, columns, dtypes)
+                if size == 0 or len(rows) < size:
+                    break
+        except psycopg.Error as e:
+            logger.error(f'Error running query: {query} on {self.database}, {e}!')
+            raise
+        finally:
+            # server-side cursor is closed with the connection, also if consumer stopped fetching
+            connection.close()
+
     def insert(self, table_name: str, df: pd.DataFrame):
         need_to_close = not self.is_connected
 
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import dill
 from mindsdb.integrations.libs.base import BaseMLEngine
@@ -21,6 +22,10 @@ except ImportError:
     HierarchicalReconciliation = None
 
 DEFAULT_MODEL_NAME = "AutoARIMA"
+# for less amount of series fitting in one process is faster than starting the pool of processes
+PARALLEL_MIN_SERIES = 100
+# fitted models are stored by chunks, prediction loads only chunks with requested series
+FITTED_MODELS_CHUNK_SIZE = 1000
 model_dict = {
     "AutoARIMA": AutoARIMA,
     "AutoCES": AutoCES,
@@ -52,6 +57,19 @@ def get_season_length(frequency):
     return season_dict[new_freq] if new_freq in season_dict else 1
 
 
+def get_n_jobs(model_args, df):
+    """Gets count of processes used to fit models.
+
+    Can be set by user with the "n_jobs" arg, -1 means all cores.
+    By default all cores are used if there are many series to fit.
+    """
+    if model_args.get("n_jobs") is not None:
+        return int(model_args["n_jobs"])
+    # unique_id is the index of hierarchical dataframe
+    unique_ids = df["unique_id"] if "unique_id" in df.columns else df.index
+    return -1 if unique_ids.nunique() >= PARALLEL_MIN_SERIES else 1
+
+
 def get_insample_cv_results(model_args, df):
     """Gets insample cross validation results"""
     season_length = get_season_length(model_args["frequency"]) if not model_args.get("season_length") else model_args["season_length"]  # noqa
@@ -60,7 +78,8 @@ def get_insample_cv_results(model_args, df):
     else:
         models = [model_dict[model_args["model_name"]](season_length=season_length)]
 
-    sf = StatsForecast(models, model_args["frequency"])
+    n_jobs = get_n_jobs(model_args, df)
+    sf = StatsForecast(models, model_args["frequency"], n_jobs=n_jobs)
     sf.cross_validation(model_args["horizon"], df, fitted=True)
     results_df = sf.cross_validation_fitted_values()
     return results_df.rename({"CES": "AutoCES"}, axis=1)  # Fixes a Nixtla bug
@@ -127,44 +146,96 @@ class StatsForecastHandler(BaseMLEngine):
         results_df = get_insample_cv_results(model_args, training_df)
         model_args["accuracies"] = get_model_accuracy_dict(results_df, r2_score)
         model = choose_model(model_args, results_df)
-        sf = StatsForecast([model], freq=model_args["frequency"], df=training_df)
+        n_jobs = get_n_jobs(model_args, training_df)
+        sf = StatsForecast([model], freq=model_args["frequency"], df=training_df, n_jobs=n_jobs)
         fitted_models = sf.fit().fitted_
 
         ###### persist changes to handler folder
+        # only last date of every series is required for the forecast
+        series_df = pd.DataFrame({"unique_id": sf.uids, "ds": sf.last_dates})
+        model_args["fitted_models_chunk_size"] = FITTED_MODELS_CHUNK_SIZE
         self.model_storage.json_set("model_args", model_args)
-        self.model_storage.file_set("training_df", dill.dumps(training_df))
-        self.model_storage.file_set("fitted_models", dill.dumps(fitted_models))
+        self.model_storage.file_set("series_df", dill.dumps(series_df))
+        for i in range(0, len(fitted_models), FITTED_MODELS_CHUNK_SIZE):
+            chunk = fitted_models[i:i + FITTED_MODELS_CHUNK_SIZE]
+            self.model_storage.file_set(f"fitted_models_{i // FITTED_MODELS_CHUNK_SIZE}", dill.dumps(chunk))
+        if model_args["hierarchy"] and HierarchicalReconciliation is not None:
+            # is used for reconciliation
+            self.model_storage.file_set("training_df", dill.dumps(training_df))
+
+    @staticmethod
+    def _get_groups_mask(series_df, groups):
+        # statsforecast converts numeric unique_id to numbers, compare them as strings
+        groups = pd.Series(groups, dtype=object).astype(str)
+        return series_df["unique_id"].astype(str).isin(groups).to_numpy()
+
+    def _load_fitted_models(self, model_args, groups=None):
+        """Loads fitted models of requested series.
+
+        Returns series dataframe (unique_id and last date of every series) and
+        array of fitted models of these series in the same order.
+        If groups is None: all series are loaded.
+        """
+        if "fitted_models_chunk_size" not in model_args:
+            # model was trained by previous version of the handler
+            training_df = dill.loads(self.model_storage.file_get("training_df"))
+            fitted_models = dill.loads(self.model_storage.file_get("fitted_models"))
+            sf = StatsForecast(models=[], freq=model_args["frequency"], df=training_df)
+            series_df = pd.DataFrame({"unique_id": sf.uids, "ds": sf.last_dates})
+            if groups is not None:
+                mask = self._get_groups_mask(series_df, groups)
+                series_df, fitted_models = series_df[mask], fitted_models[mask]
+            return series_df.reset_index(drop=True), fitted_models
+
+        series_df = dill.loads(self.model_storage.file_get("series_df"))
+        if groups is not None:
+            series_df = series_df[self._get_groups_mask(series_df, groups)]
+
+        chunk_size = model_args["fitted_models_chunk_size"]
+        positions = series_df.index.to_numpy()
+        chunks = []
+        for chunk_num in np.unique(positions // chunk_size):
+            chunk = dill.loads(self.model_storage.file_get(f"fitted_models_{chunk_num}"))
+            in_chunk = positions[positions // chunk_size == chunk_num]
+            chunks.append(chunk[in_chunk - chunk_num * chunk_size])
+
+        fitted_models = np.vstack(chunks) if chunks else np.empty((0, 1), dtype=object)
+        return series_df.reset_index(drop=True), fitted_models
 
     def predict(self, df, args={}):
         """Makes forecasts with the StatsForecast Handler.
 
-        StatsForecast is setup to predict for all groups, so it won't handle
-        a dataframe that's been filtered to one group very well. Instead, we make
-        the prediction for all groups then take care of the filtering after the
-        forecasting. Prediction is nearly instant.
+        Only fitted models of the groups from the input dataframe are loaded and used for
+        the forecast. Hierarchical forecasts are reconciled using all groups, after that
+        the result is filtered to the requested groups.
         """
         # Load model arguments
         model_args = self.model_storage.json_get("model_args")
-        training_df = dill.loads(self.model_storage.file_get("training_df"))
-        fitted_models = dill.loads(self.model_storage.file_get("fitted_models"))
 
         prediction_df = transform_to_nixtla_df(df, model_args)
         groups_to_keep = prediction_df["unique_id"].unique()
 
-        sf = StatsForecast(models=[], freq=model_args["frequency"], df=training_df)
+        hierarchy = model_args["hierarchy"] and HierarchicalReconciliation is not None
+        series_df, fitted_models = self._load_fitted_models(model_args, None if hierarchy else groups_to_keep)
+        if len(series_df) == 0:
+            return pd.DataFrame(columns=[model_args["order_by"], model_args["target"]] + model_args["group_by"])
+
+        # statsforecast needs only the last date of every series to make the forecast
+        sf = StatsForecast(models=[], freq=model_args["frequency"], df=series_df.assign(y=0.0))
         sf.fitted_ = fitted_models
         model_name = str(fitted_models[0][0])
         forecast_df = sf.predict(model_args["horizon"])
         forecast_df.index = forecast_df.index.astype(str)
 
-        if model_args["hierarchy"] and HierarchicalReconciliation is not None:
+        if hierarchy:
+            training_df = dill.loads(self.model_storage.file_get("training_df"))
             hier_df = dill.loads(self.model_storage.file_get("hier_df"))
             hier_dict = dill.loads(self.model_storage.file_get("hier_dict"))
             reconciled_df = reconcile_forecasts(training_df, forecast_df, hier_df, hier_dict)
             results_df = reconciled_df[reconciled_df.index.isin(groups_to_keep)]
 
         else:
-            results_df = forecast_df[forecast_df.index.isin(groups_to_keep)]
+            results_df = forecast_df
 
         result = get_results_from_nixtla_df(results_df, model_args)
         result = result.rename(columns={model_name: model_args['target']})
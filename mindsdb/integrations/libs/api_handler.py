@@ -349,6 +349,12 @@ class APIChatHandler(APIHandler):
     def get_chat_config(self):
         """Return configuration to connect to chatbot
 
+        Types of polling:
+            - message_count: table with count of messages per chat is compared with its previous state
+            - incremental: messages newer than the last seen message are fetched from chat table,
+                'cursor_col' of polling is a column which grows with every new message, default is 'time_col'
+            - realtime: new messages are received with `subscribe`
+
         Returns:
             Dict
         """
@@ -2,16 +2,18 @@ import ast
 import inspect
 import textwrap
 from _ast import AnnAssign, AugAssign
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import pandas as pd
 from mindsdb_sql.parser.ast.base import ASTNode
 from mindsdb.utilities import log
 
-from mindsdb.integrations.libs.response import HandlerResponse, HandlerStatusResponse
+from mindsdb.integrations.libs.response import HandlerResponse, HandlerStatusResponse, RESPONSE_TYPE
 
 logger = log.getLogger(__name__)
 
+DEFAULT_FETCH_BATCH_SIZE = 10000
+
 
 class BaseHandler:
     """ Base class for database handlers
@@ -64,6 +66,31 @@ class BaseHandler:
         """
         raise NotImplementedError()
 
+    def native_query_batches(self, query: Any, batch_size: int = DEFAULT_FETCH_BATCH_SIZE,
+                             limit: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Receive raw query and yield its result by batches.
+
+        Handlers which can fetch data from cursor gradually should override it to keep
+        only one batch in memory. By default, the whole result of `native_query` is one batch.
+
+        Args:
+            query (Any): query in native format
+            batch_size (int): max count of rows in a batch
+            limit (int): stop fetching after this count of rows
+
+        Returns:
+            Iterator[pd.DataFrame]: batches of the result, nothing for queries without result
+        """
+        response = self.native_query(query)
+        if response.type == RESPONSE_TYPE.ERROR:
+            raise Exception(response.error_message)
+        if response.type != RESPONSE_TYPE.TABLE:
+            return
+        df = response.data_frame
+        if limit is not None:
+            df = df.iloc[:limit]
+        yield df
+
     def query(self, query: ASTNode) -> HandlerResponse:
         """Receive query as AST (abstract syntax tree) and act upon it somehow.
 
@@ -275,6 +302,11 @@ class BaseMLEngine(ArgProbeMixin):
       - Any output produced by the ML engine is then formatted by the wrapper and passed back into the MindsDB executor, which can then morph the data to comply with the original SQL query
     """  # noqa
 
+    # If True and training data is streamed (`stream_training_data` model argument), `create` and `finetune`
+    # receive `mindsdb.integrations.libs.training_data.TrainingData` as `df` instead of a dataframe.
+    # For other engines training data is not streamed and is loaded into memory as a dataframe.
+    accepts_training_data = False
+
     def __init__(self, model_storage, engine_storage, **kwargs) -> None:
         """
         Warning: This method should not be overridden.
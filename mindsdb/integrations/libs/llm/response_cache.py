@@ -0,0 +1,146 @@
+import json
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from mindsdb.utilities import log
+from mindsdb.utilities.cache import get_cache, json_checksum, str_checksum
+from mindsdb.utilities.context import context as ctx
+
+logger = log.getLogger(__name__)
+
+DEFAULT_CACHE_TTL = 24 * 60 * 60
+_CACHE_MAX_SIZE = 5000
+
+# params which don't change the response
+IGNORED_PARAMS = (
+    'api_key', 'openai_api_key', 'anthropic_api_key', 'user', 'timeout', 'request_timeout',
+    'max_retries', 'cache_responses', 'cache_ttl', 'prompt_template',
+)
+
+_stats = {}
+_stats_lock = threading.Lock()
+
+
+def is_deterministic(params: Dict) -> bool:
+    """
+    Response can be cached only for greedy decoding: temperature is 0, single completion, no streaming
+    """
+    temperature = params.get('temperature')
+    if temperature is None or float(temperature) != 0:
+        return False
+    for key in ('n', 'best_of'):
+        if params.get(key) is not None and int(params[key]) > 1:
+            return False
+    if params.get('stream'):
+        return False
+    return True
+
+
+def normalize_prompt(prompt: Any) -> str:
+    if not isinstance(prompt, str):
+        # list of messages
+        prompt = json.dumps(prompt, sort_keys=True, default=str)
+    return prompt.replace('\r\n', '\n').strip()
+
+
+def is_cache_enabled(args: Dict) -> bool:
+    value = args.get('cache_responses', False)
+    if isinstance(value, str):
+        return value.lower() in ('true', '1')
+    return bool(value)
+
+
+def get_cache_stats() -> Dict[str, Dict]:
+    """Hits and misses of response cache by engine"""
+    with _stats_lock:
+        stats = {engine: dict(item) for engine, item in _stats.items()}
+    for item in stats.values():
+        total = item['hits'] + item['misses']
+        item['hit_rate'] = item['hits'] / total if total > 0 else 0
+    return stats
+
+
+class LLMResponseCache:
+    """
+    Cache of LLM responses, record per prompt.
+    Key is made from engine, model name, normalized prompt and parameters which change the response.
+
+    Usage:
+        cache = LLMResponseCache('openai', model_name, api_args, ttl=args.get('cache_ttl'))
+        completions = cache.complete(prompts, lambda missed_prompts: call_api(missed_prompts))
+    """
+
+    def __init__(
+        self,
+        engine: str,
+        model_name: str,
+        params: Optional[Dict] = None,
+        ttl: Optional[int] = None,
+        deterministic: Optional[bool] = None,
+    ):
+        params = {
+            key: value
+            for key, value in (params or {}).items()
+            if key not in IGNORED_PARAMS and value is not None
+        }
+        if deterministic is None:
+            deterministic = is_deterministic(params)
+        self.enabled = deterministic
+        if not self.enabled:
+            logger.debug(f'{engine} response cache is bypassed for non-deterministic parameters')
+            return
+
+        self.engine = engine
+        self._prefix = json_checksum({
+            'company_id': ctx.company_id,
+            'engine': engine,
+            'model_name': model_name,
+            'params': params,
+        })
+        self._cache = get_cache(
+            'llm_responses',
+            max_size=_CACHE_MAX_SIZE,
+            ttl=int(ttl) if ttl is not None else DEFAULT_CACHE_TTL
+        )
+
+    def _key(self, prompt: Any) -> str:
+        return str_checksum(self._prefix + normalize_prompt(prompt))
+
+    def complete(self, prompts: List[Any], func: Callable[[List[Any]], List[Any]]) -> List[Any]:
+        """
+        Returns responses for prompts, only prompts missed in cache are sent to func
+        :param prompts: list of prompts
+        :param func: gets list of prompts and returns list of responses in the same order
+        :return: list of responses
+        """
+        if not self.enabled or len(prompts) == 0:
+            return func(prompts)
+
+        keys = [self._key(prompt) for prompt in prompts]
+        results = [self._cache.get(key) for key in keys]
+
+        # identical prompts are sent once
+        missed = {}
+        for i, result in enumerate(results):
+            if result is None:
+                missed.setdefault(keys[i], []).append(i)
+
+        if len(missed) > 0:
+            positions = list(missed.values())
+            responses = func([prompts[idx[0]] for idx in positions])
+            for idx, response in zip(positions, responses):
+                for i in idx:
+                    results[i] = response
+                if response is not None:
+                    self._cache.set(keys[idx[0]], response)
+
+        hits = len(prompts) - sum(len(idx) for idx in missed.values())
+        with _stats_lock:
+            stats = _stats.setdefault(self.engine, {'hits': 0, 'misses': 0})
+            stats['hits'] += hits
+            stats['misses'] += len(prompts) - hits
+            hit_rate = stats['hits'] / (stats['hits'] + stats['misses'])
+        logger.debug(
+            f'{self.engine} response cache: {hits} of {len(prompts)} prompts found, total hit rate {hit_rate:.2f}'
+        )
+        return results
@@ -0,0 +1,268 @@
+import time
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from mindsdb.utilities import log
+
+logger = log.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Limit of units per minute (requests or tokens), refilled continuously.
+    Units are reserved in advance: the balance can be negative, caller waits until it is paid off
+    """
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60
+        self._balance = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float) -> float:
+        """
+        Reserves units
+        :return: seconds to wait before using them
+        """
+        # a request bigger than the limit is allowed to run alone
+        amount = min(amount, self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            self._balance = min(self.capacity, self._balance + (now - self._updated) * self.rate)
+            self._updated = now
+            self._balance -= amount
+            if self._balance >= 0:
+                return 0
+            return -self._balance / self.rate
+
+
+def is_rate_limit_error(e: Exception) -> bool:
+    return getattr(e, 'status_code', None) == 429
+
+
+def get_retry_after(e: Exception) -> Optional[float]:
+    """Value of retry-after header of the http error, if any"""
+    response = getattr(e, 'response', None)
+    headers = getattr(response, 'headers', None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get('retry-after'))
+    except (TypeError, ValueError):
+        return None
+
+
+class RequestScheduler:
+    """
+    Runs requests to LLM API in parallel within requests/min and tokens/min limits.
+
+    - limits are applied with token buckets, tokens of every request are estimated by caller
+    - concurrency is adaptive: halved on rate limit error and increased back after series of successful requests
+    - rate limited requests are retried with exponential backoff (or 'retry-after' of the error)
+    - results are returned in order of input items
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_concurrency: int = 16,
+        max_retries: int = 6,
+        initial_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        is_rate_limit_error: Callable[[Exception], bool] = is_rate_limit_error,
+    ):
+        self.max_retries = max_retries
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.is_rate_limit_error = is_rate_limit_error
+
+        self._condition = threading.Condition()
+        self._active = 0
+        self._success_streak = 0
+        self._request_bucket = None
+        self._token_bucket = None
+        self.max_concurrency = None
+        self.set_limits(requests_per_minute, tokens_per_minute, max_concurrency)
+
+        self._metrics = {
+            'requests': 0,
+            'failed': 0,
+            'rate_limited': 0,
+            'tokens': 0,
+            'wait_seconds': 0.0,
+            'request_seconds': 0.0,
+        }
+
+    def set_limits(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_concurrency: Optional[int] = None
+    ):
+        """Changes limits, state of unchanged limits is kept"""
+
+        def get_bucket(bucket, per_minute):
+            if not per_minute:
+                return None
+            if bucket is not None and bucket.capacity == float(per_minute):
+                return bucket
+            return TokenBucket(per_minute)
+
+        self._request_bucket = get_bucket(self._request_bucket, requests_per_minute)
+        self._token_bucket = get_bucket(self._token_bucket, tokens_per_minute)
+        if max_concurrency is not None and max_concurrency != self.max_concurrency:
+            self.max_concurrency = max(1, int(max_concurrency))
+            self._concurrency = self.max_concurrency
+
+    def get_metrics(self) -> Dict:
+        with self._condition:
+            metrics = self._metrics.copy()
+            metrics['concurrency'] = self._concurrency
+        return metrics
+
+    def run(self, func: Callable, items: List[Any], tokens: Optional[List[int]] = None) -> List[Any]:
+        """
+        Calls func(item) for every item
+        :param func: function which makes the request
+        :param items: inputs of requests
+        :param tokens: estimated tokens of every request
+        :return: list of results, in the same order as items
+        """
+        if tokens is None:
+            tokens = [0] * len(items)
+
+        if len(items) <= 1 or self.max_concurrency == 1:
+            return [self.call(func, item, count) for item, count in zip(items, tokens)]
+
+        executor = ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(items)))
+        try:
+            futures = [
+                executor.submit(self.call, func, item, count)
+                for item, count in zip(items, tokens)
+            ]
+            results = [future.result() for future in futures]
+        except Exception:
+            # don't wait for the rest of requests
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+        return results
+
+    def call(self, func: Callable, item: Any, tokens: int = 0) -> Any:
+        """
+        Calls func(item) within the limits, rate limited call is retried.
+        Can be used from own threads of caller: limits and concurrency are shared with other calls of scheduler
+        """
+        attempt = 0
+        while True:
+            self._acquire(tokens)
+            start = time.monotonic()
+            try:
+                result = func(item)
+            except Exception as e:
+                rate_limited = self.is_rate_limit_error(e)
+                self._release(start, success=False, rate_limited=rate_limited)
+                if not rate_limited or attempt >= self.max_retries:
+                    raise
+                attempt += 1
+                delay = get_retry_after(e)
+                if delay is None:
+                    delay = min(self.max_backoff, self.initial_backoff * 2 ** (attempt - 1))
+                    delay *= 1 + random.random()
+                logger.debug(f'Rate limit is reached, retry in {delay:.1f}s, attempt {attempt}')
+                time.sleep(delay)
+                continue
+
+            self._release(start, success=True)
+            return result
+
+    def acquire(self, tokens: int = 0) -> float:
+        """
+        Waits for a free slot within the limits. For requests which can't be wrapped into call(),
+        every acquire has to be followed by release
+        :return: start time of the request, to be passed to release
+        """
+        self._acquire(tokens)
+        return time.monotonic()
+
+    def release(self, start: float, error: Optional[Exception] = None):
+        """Frees the slot acquired for the request, rate limit error decreases concurrency"""
+        if error is None:
+            self._release(start, success=True)
+        else:
+            self._release(start, success=False, rate_limited=self.is_rate_limit_error(error))
+
+    def _acquire(self, tokens: int):
+        with self._condition:
+            while self._active >= self._concurrency:
+                self._condition.wait()
+            self._active += 1
+            self._metrics['requests'] += 1
+            self._metrics['tokens'] += tokens
+
+        wait = 0
+        if self._request_bucket is not None:
+            wait = self._request_bucket.reserve(1)
+        if self._token_bucket is not None and tokens > 0:
+            wait = max(wait, self._token_bucket.reserve(tokens))
+        if wait > 0:
+            time.sleep(wait)
+            with self._condition:
+                self._metrics['wait_seconds'] += wait
+
+    def _release(self, start: float, success: bool, rate_limited: bool = False):
+        with self._condition:
+            self._active -= 1
+            self._metrics['request_seconds'] += time.monotonic() - start
+            if rate_limited:
+                self._metrics['rate_limited'] += 1
+                self._concurrency = max(1, self._concurrency // 2)
+                self._success_streak = 0
+            elif not success:
+                self._metrics['failed'] += 1
+            else:
+                self._success_streak += 1
+                if self._success_streak >= self._concurrency and self._concurrency < self.max_concurrency:
+                    self._concurrency += 1
+                    self._success_streak = 0
+            self._condition.notify_all()
+
+
+_schedulers = {}
+_schedulers_lock = threading.Lock()
+
+
+def get_scheduler(
+    key: str,
+    requests_per_minute: Optional[float] = None,
+    tokens_per_minute: Optional[float] = None,
+    max_concurrency: int = 16,
+    update_limits: bool = True,
+) -> RequestScheduler:
+    """
+    Returns scheduler shared by all requests with the same key (for example engine and model),
+    so parallel queries don't exceed the limits together
+    :param update_limits: change limits of existing scheduler, otherwise limits are used only to create it
+    """
+    with _schedulers_lock:
+        scheduler = _schedulers.get(key)
+        if scheduler is None:
+            scheduler = RequestScheduler(
+                requests_per_minute=requests_per_minute,
+                tokens_per_minute=tokens_per_minute,
+                max_concurrency=max_concurrency,
+            )
+            _schedulers[key] = scheduler
+        elif update_limits:
+            scheduler.set_limits(requests_per_minute, tokens_per_minute, max_concurrency)
+    return scheduler
+
+
+def get_schedulers_metrics() -> Dict[str, Dict]:
+    with _schedulers_lock:
+        schedulers = dict(_schedulers)
+    return {key: scheduler.get_metrics() for key, scheduler in schedulers.items()}
@@ -335,6 +335,7 @@ class BaseMLEngineExec:
             data_integration_ref=None,
             fetch_data_query=None,
             join_learn_process=False,
+            stream_training_data=None,
             label=None,
             set_active=True,
             args: Optional[dict] = None
@@ -361,6 +362,8 @@ class BaseMLEngineExec:
 
         learn_args = base_predictor_record.learn_args
         learn_args['using'] = args if not learn_args.get('using', False) else {**learn_args['using'], **args}
+        if stream_training_data is not None:
+            learn_args['stream_training_data'] = stream_training_data
 
         self.create_validation(
             target=base_predictor_record.to_predict,
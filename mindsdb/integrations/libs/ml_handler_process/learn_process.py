@@ -1,7 +1,10 @@
 import importlib
+import tempfile
 import traceback
 import datetime as dt
+from typing import Iterable
 
+import pandas as pd
 from mindsdb_sql import parse_sql
 from mindsdb_sql.parser.ast import Identifier, Select, Star, NativeQuery
 
@@ -16,12 +19,27 @@ from mindsdb.interfaces.storage.model_fs import ModelStorage, HandlerStorage
 from mindsdb.interfaces.model.functions import get_model_records
 from mindsdb.integrations.utilities.utils import format_exception_error
 from mindsdb.integrations.utilities.sql_utils import make_sql_session
+from mindsdb.integrations.libs.base import BaseHandler
 from mindsdb.integrations.libs.const import PREDICTOR_STATUS
+from mindsdb.integrations.libs.training_data import (
+    TrainingData, DEFAULT_BATCH_SIZE, is_stream_enabled, is_streaming_available
+)
 from mindsdb.integrations.libs.ml_handler_process.handlers_cacher import handlers_cacher
 
 logger = log.getLogger(__name__)
 
 
+def can_fetch_batches(handler) -> bool:
+    """Handler fetches the result of native query gradually, not as a whole"""
+    return type(handler).native_query_batches is not BaseHandler.native_query_batches
+
+
+def fetch_training_data(batches: Iterable[pd.DataFrame]) -> TrainingData:
+    """Fetches the training data by batches and spills it to local files"""
+    path = tempfile.mkdtemp(prefix='training_data_', dir=Config()['paths']['tmp'])
+    return TrainingData.from_batches(batches, path=path)
+
+
 @mark_process(name='learn')
 def learn_process(data_integration_ref: dict, problem_definition: dict, fetch_data_query: str,
                   project_name: str, model_id: int, integration_id: int, base_model_id: int,
@@ -36,22 +54,55 @@ def learn_process(data_integration_ref: dict, problem_definition: dict, fetch_da
     with profiler.Context('learn_process'):
         from mindsdb.interfaces.database.database import DatabaseController
 
+        training_data = None
         try:
             target = problem_definition.get('target', None)
             training_data_df = None
+
+            module = importlib.import_module(module_path)
+
+            # check if module is imported successfully and raise exception if not
+            if module.import_error is not None:
+                raise module.import_error
+
+            stream_training_data = is_stream_enabled(problem_definition)
+            if stream_training_data and not is_streaming_available():
+                logger.warning('pyarrow is not installed, training data is loaded into memory')
+                stream_training_data = False
+            if stream_training_data and not getattr(module.Handler, 'accepts_training_data', False):
+                logger.info(f'{module.name} engine requires dataframe, training data is loaded into memory')
+                stream_training_data = False
+            if stream_training_data and (
+                data_integration_ref is None or data_integration_ref['type'] != 'integration'
+            ):
+                logger.info('Only data of integration can be streamed, training data is loaded into memory')
+                stream_training_data = False
+
             if data_integration_ref is not None:
                 database_controller = DatabaseController()
                 sql_session = make_sql_session()
                 if data_integration_ref['type'] == 'integration':
                     integration_name = database_controller.get_integration(data_integration_ref['id'])['name']
-                    query = Select(
-                        targets=[Star()],
-                        from_table=NativeQuery(
-                            integration=Identifier(integration_name),
-                            query=fetch_data_query
+                    if stream_training_data:
+                        handler = sql_session.integration_controller.get_data_handler(integration_name)
+                        if not can_fetch_batches(handler):
+                            logger.info(
+                                f'{integration_name} can not fetch data by batches, training data is loaded into memory'
+                            )
+                            stream_training_data = False
+                    if stream_training_data:
+                        # fetch by batches from the handler's cursor
+                        batches = handler.native_query_batches(fetch_data_query, batch_size=DEFAULT_BATCH_SIZE)
+                        training_data = fetch_training_data(batches)
+                    else:
+                        query = Select(
+                            targets=[Star()],
+                            from_table=NativeQuery(
+                                integration=Identifier(integration_name),
+                                query=fetch_data_query
+                            )
                         )
-                    )
-                    sqlquery = SQLQuery(query, session=sql_session)
+                        sqlquery = SQLQuery(query, session=sql_session)
                 if data_integration_ref['type'] == 'system':
                     query = Select(
                         targets=[Star()],
@@ -70,11 +121,15 @@ def learn_process(data_integration_ref: dict, problem_definition: dict, fetch_da
                     query_ast = parse_sql(fetch_data_query, dialect='mindsdb')
                     sqlquery = SQLQuery(query_ast, session=sql_session)
 
-                result = sqlquery.fetch(view='dataframe')
-                training_data_df = result['result']
+                if training_data is None:
+                    result = sqlquery.fetch(view='dataframe')
+                    training_data_df = result['result']
 
             training_data_columns_count, training_data_rows_count = 0, 0
-            if training_data_df is not None:
+            if training_data is not None:
+                training_data_columns_count = training_data.columns_count
+                training_data_rows_count = training_data.rows_count
+            elif training_data_df is not None:
                 training_data_columns_count = len(training_data_df.columns)
                 training_data_rows_count = len(training_data_df)
 
@@ -83,12 +138,6 @@ def learn_process(data_integration_ref: dict, problem_definition: dict, fetch_da
             predictor_record.training_data_rows_count = training_data_rows_count
             db.session.commit()
 
-            module = importlib.import_module(module_path)
-
-            # check if module is imported successfully and raise exception if not
-            if module.import_error is not None:
-                raise module.import_error
-
             handlerStorage = HandlerStorage(integration_id)
             modelStorage = ModelStorage(model_id)
             modelStorage.fileStorage.push()     # FIXME
@@ -105,9 +154,18 @@ def learn_process(data_integration_ref: dict, problem_definition: dict, fetch_da
             handlers_cacher[predictor_record.id] = ml_handler
 
             if not ml_handler.generative:
-                if training_data_df is not None and target not in training_data_df.columns:
+                columns = None
+                if training_data is not None:
+                    columns = training_data.columns
+                elif training_data_df is not None:
+                    columns = list(training_data_df.columns)
+                if columns is not None and target not in columns:
                     raise Exception(
-                        f'Prediction target "{target}" not found in training dataframe: {list(training_data_df.columns)}')
+                        f'Prediction target "{target}" not found in training dataframe: {columns}')
+
+            if training_data is not None:
+                # engine reads data from files by itself
+                training_data_df = training_data
 
             # create new model
             if base_model_id is None:
@@ -144,6 +202,9 @@ def learn_process(data_integration_ref: dict, problem_definition: dict, fetch_da
             predictor_record.data = {"error": error_message}
             predictor_record.status = PREDICTOR_STATUS.ERROR
             db.session.commit()
+        finally:
+            if training_data is not None:
+                training_data.close()
 
         predictor_record.training_stop_at = dt.datetime.now()
         db.session.commit()
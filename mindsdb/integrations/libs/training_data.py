@@ -0,0 +1,225 @@
+import os
+import shutil
+import tempfile
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import pandas as pd
+
+from mindsdb.utilities import log
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+
+logger = log.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 100_000
+
+
+def is_streaming_available() -> bool:
+    return pa is not None
+
+
+def is_stream_enabled(args: Dict) -> bool:
+    value = args.get('stream_training_data', False)
+    if isinstance(value, str):
+        return value.lower() in ('true', '1')
+    return bool(value)
+
+
+def _to_arrow_table(df: pd.DataFrame) -> 'pa.Table':
+    arrays = []
+    for name in df.columns:
+        series = df[name]
+        try:
+            array = pa.array(series, from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            # mixed types in object column: keep values as strings
+            array = pa.array(series.map(lambda x: None if x is None or x is pd.NA else str(x)), type=pa.string())
+        arrays.append(array)
+    return pa.Table.from_arrays(arrays, names=[str(name) for name in df.columns])
+
+
+def _unify_schemas(schemas: List['pa.Schema']) -> 'pa.Schema':
+    try:
+        return pa.unify_schemas(schemas, promote_options='permissive')
+    except TypeError:
+        # pyarrow < 14 merges only null type with others
+        return pa.unify_schemas(schemas)
+
+
+def _cast_column(column: 'pa.ChunkedArray', type_: 'pa.DataType') -> 'pa.ChunkedArray':
+    if column.type == type_:
+        return column
+    try:
+        return column.cast(type_)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        if type_ != pa.string():
+            raise
+        # nested values can't be cast to string by arrow
+        return pa.chunked_array([pa.array(
+            [None if value is None else str(value) for value in column.to_pylist()], type=pa.string()
+        )])
+
+
+class TrainingData:
+    """
+    Training data stored in local Arrow IPC files, one file per batch.
+
+    Data is written batch by batch, so only one batch is kept in memory. Row count and statistics
+    of columns (count of nulls, min and max values) are collected on the way. Handlers can read
+    the data by batches, as memory-mapped arrow table, or as a dataframe.
+
+    Usage:
+        with TrainingData.from_batches(batches) as training_data:
+            for df in training_data.iter_batches():
+                ...
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        :param path: folder to store files, temporary folder is created if not set
+        """
+        if pa is None:
+            raise ImportError('pyarrow is required to stream training data')
+        if path is None:
+            path = tempfile.mkdtemp(prefix='training_data_')
+        self.path = path
+        self.files = []
+        self.schemas = []
+        self.columns = []
+        self.rows_count = 0
+        self._stats = {}
+        self._schema = None
+
+    @classmethod
+    def from_batches(cls, batches: Iterable[pd.DataFrame], path: Optional[str] = None) -> 'TrainingData':
+        training_data = cls(path)
+        try:
+            for df in batches:
+                training_data.append(df)
+        except Exception:
+            training_data.close()
+            raise
+        return training_data
+
+    def append(self, df: pd.DataFrame):
+        if len(df.columns) == 0:
+            return
+        if len(self.files) == 0:
+            self.columns = [str(name) for name in df.columns]
+        elif [str(name) for name in df.columns] != self.columns:
+            raise ValueError(f'Columns of the batch are different: {list(df.columns)}, expected: {self.columns}')
+        if len(df) == 0 and len(self.files) > 0:
+            return
+
+        table = _to_arrow_table(df)
+        file_path = os.path.join(self.path, f'{len(self.files)}.arrow')
+        with pa.OSFile(file_path, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+        self.files.append(file_path)
+        self.schemas.append(table.schema)
+        self._schema = None
+        self.rows_count += len(table)
+        self._update_stats(table)
+
+    def _update_stats(self, table: 'pa.Table'):
+        for name, column in zip(table.column_names, table.columns):
+            stats = self._stats.setdefault(name, {'nulls': 0, 'min': None, 'max': None})
+            stats['nulls'] += column.null_count
+            if column.null_count == len(column):
+                continue
+            type_ = column.type
+            if not (pa.types.is_integer(type_) or pa.types.is_floating(type_) or pa.types.is_temporal(type_)):
+                continue
+            try:
+                min_max = pc.min_max(column)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                continue
+            min_value, max_value = min_max['min'].as_py(), min_max['max'].as_py()
+            try:
+                if stats['min'] is None or min_value < stats['min']:
+                    stats['min'] = min_value
+                if stats['max'] is None or max_value > stats['max']:
+                    stats['max'] = max_value
+            except TypeError:
+                # type of column is changed between batches
+                pass
+
+    @property
+    def columns_count(self) -> int:
+        return len(self.columns)
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Statistics of columns: {column: {'nulls': int, 'min': value, 'max': value}}"""
+        return {name: dict(self._stats[name]) for name in self.columns}
+
+    @property
+    def schema(self) -> 'pa.Schema':
+        """
+        Common schema of all batches: if a column has no values in one batch, it gets the type from others,
+        numeric types are promoted, incompatible types are converted to string
+        """
+        if self._schema is None:
+            fields = []
+            for i, name in enumerate(self.columns):
+                column_schemas = [pa.schema([schema.field(i)]) for schema in self.schemas]
+                try:
+                    fields.append(_unify_schemas(column_schemas).field(0))
+                except (pa.ArrowInvalid, pa.ArrowTypeError):
+                    fields.append(pa.field(name, pa.string()))
+            self._schema = pa.schema(fields)
+        return self._schema
+
+    def __len__(self):
+        return self.rows_count
+
+    def _read_file(self, file_path: str, columns: Optional[List[str]] = None) -> 'pa.Table':
+        table = pa.ipc.open_file(pa.memory_map(file_path, 'r')).read_all()
+        if table.schema != self.schema:
+            table = pa.Table.from_arrays(
+                [_cast_column(column, field.type) for column, field in zip(table.columns, self.schema)],
+                schema=self.schema
+            )
+        if columns is not None:
+            table = table.select(columns)
+        return table
+
+    def iter_batches(self, columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+        """
+        :param columns: columns to read, all if not set
+        :return: dataframes, one per stored batch
+        """
+        for file_path in self.files:
+            yield self._read_file(file_path, columns).to_pandas()
+
+    def to_table(self, columns: Optional[List[str]] = None) -> 'pa.Table':
+        """
+        :param columns: columns to read, all if not set
+        :return: arrow table, which is memory-mapped to the files if types of columns are the same in all batches
+        """
+        if len(self.files) == 0:
+            return self.schema.empty_table()
+        return pa.concat_tables([self._read_file(file_path, columns) for file_path in self.files])
+
+    def to_df(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        if len(self.files) == 0:
+            return pd.DataFrame(columns=self.columns if columns is None else columns)
+        return self.to_table(columns).to_pandas()
+
+    def close(self):
+        """Removes stored files"""
+        shutil.rmtree(self.path, ignore_errors=True)
+        self.files = []
+        self.schemas = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,92 @@
+import ast
+import json
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+
+# Column.type of result set columns which contain vectors
+VECTOR_TYPE = 'vector'
+
+
+def _parse_vector(value):
+    if isinstance(value, str):
+        try:
+            return json.loads(value)
+        except ValueError:
+            return ast.literal_eval(value)
+    return value
+
+
+def _is_null(value) -> bool:
+    return value is None or (isinstance(value, float) and np.isnan(value))
+
+
+def vectors_to_matrix(values: Iterable) -> np.ndarray:
+    """
+    Converts vectors (lists, arrays or strings) to 2D float32 matrix.
+    All vectors must be not null and have the same size
+    """
+    values = list(values)
+    if len(values) == 0:
+        return np.empty((0, 0), dtype=np.float32)
+    if all(isinstance(value, np.ndarray) for value in values):
+        return np.stack(values).astype(np.float32, copy=False)
+    return np.asarray([_parse_vector(value) for value in values], dtype=np.float32)
+
+
+def to_vector_column(values: Iterable, index=None) -> pd.Series:
+    """
+    Converts vectors to a series of float32 arrays.
+    All arrays are rows of one contiguous matrix, empty values are kept as None
+    """
+    if isinstance(values, pd.Series):
+        if index is None:
+            index = values.index
+        values = values.tolist()
+    else:
+        values = list(values)
+
+    not_null = [i for i, value in enumerate(values) if not _is_null(value)]
+    column = [None] * len(values)
+    if len(not_null) > 0:
+        matrix = vectors_to_matrix([values[i] for i in not_null])
+        for i, row in zip(not_null, matrix):
+            column[i] = row
+    return pd.Series(column, index=index, dtype=object)
+
+
+def is_vector_column(series: pd.Series) -> bool:
+    """Checks the first not empty value of the column"""
+    if series.dtype != object:
+        return False
+    idx = series.first_valid_index()
+    if idx is None:
+        return False
+    value = series[idx]
+    if isinstance(value, pd.Series):
+        # duplicated index
+        value = value.iloc[0]
+    return isinstance(value, np.ndarray) and value.ndim == 1
+
+
+def vector_to_text(value) -> str:
+    if _is_null(value):
+        return None
+    if isinstance(value, np.ndarray):
+        value = value.tolist()
+    return json.dumps(value)
+
+
+def vector_column_to_text(series: pd.Series) -> pd.Series:
+    """To be used when vectors are sent to a client: '[1.0, 2.0]'"""
+    return series.map(vector_to_text, na_action='ignore')
+
+
+def vector_column_to_lists(series: pd.Series) -> pd.Series:
+    """Vectors as python lists, for json output"""
+    return series.map(
+        lambda value: value.tolist() if isinstance(value, np.ndarray) else value,
+        na_action='ignore'
+    )
@@ -83,6 +83,13 @@ class VectorStoreHandler(BaseHandler):
         else:
             return value
 
+    def _value_to_python(self, value):
+        # values from other vector handlers can be already parsed (list, dict or array)
+        value = self._value_or_self(value)
+        if isinstance(value, str):
+            return ast.literal_eval(value)
+        return value
+
     def _extract_conditions(self, where_statement) -> Optional[List[FilterCondition]]:
         conditions = []
         # parse conditions
@@ -104,10 +111,12 @@ class VectorStoreHandler(BaseHandler):
                             right_hand = node.args[1].value
                     elif isinstance(node.args[1], Tuple):
                         # Constant could be actually a list i.e. [1.2, 3.2]
+                        is_vector = left_hand in (TableField.EMBEDDINGS.value, TableField.SEARCH_VECTOR.value)
                         right_hand = [
                             ast.literal_eval(item.value)
-                            if isinstance(item, Constant)
-                            and not isinstance(item.value, list)
+                            if is_vector
+                            and isinstance(item, Constant)
+                            and isinstance(item.value, str)
                             else item.value
                             for item in node.args[1].items
                         ]
@@ -202,7 +211,7 @@ class VectorStoreHandler(BaseHandler):
         if TableField.EMBEDDINGS.value in columns:
             embeddings_col_index = columns.index("embeddings")
             embeddings = [
-                ast.literal_eval(self._value_or_self(row[embeddings_col_index]))
+                self._value_to_python(row[embeddings_col_index])
                 for row in query.values
             ]
         else:
@@ -211,7 +220,7 @@ class VectorStoreHandler(BaseHandler):
         if TableField.METADATA.value in columns:
             metadata_col_index = columns.index("metadata")
             metadata = [
-                ast.literal_eval(self._value_or_self(row[metadata_col_index]))
+                self._value_to_python(row[metadata_col_index])
                 for row in query.values
             ]
         else:
@@ -20,6 +20,38 @@ DEFAULT_FREQUENCY = "D"
 DEFAULT_RECONCILER = BottomUp
 
 
+def resample_groups(df, group_by, order_by, value_cols, freq):
+    """Resamples every group of the dataframe to the frequency, values of the same period are averaged.
+
+    All groups are resampled at once: rows are aggregated by groups and periods, then
+    missing periods within the date range of every group are added with empty values.
+    """
+    df = df[group_by + [order_by] + value_cols].copy()
+    df[order_by] = pd.to_datetime(df[order_by])
+    resampled_df = df.groupby(group_by + [pd.Grouper(key=order_by, freq=freq)])[value_cols].mean()
+    if len(resampled_df) == 0:
+        return resampled_df.reset_index()
+
+    # position of every row in the global range of periods
+    dates = resampled_df.index.get_level_values(order_by)
+    periods = pd.date_range(dates.min(), dates.max(), freq=freq)
+    positions = periods.get_indexer(dates)
+
+    # rows are sorted by groups and dates: get first and last row of every group
+    group_codes = resampled_df.groupby(level=group_by).ngroup().to_numpy()
+    first = np.flatnonzero(np.diff(group_codes, prepend=-1))
+    last = np.append(first[1:], len(group_codes)) - 1
+    sizes = positions[last] - positions[first] + 1
+
+    if sizes.sum() > len(resampled_df):
+        # fill gaps
+        offsets = np.arange(sizes.sum()) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        index = [resampled_df.index.get_level_values(col)[first].repeat(sizes) for col in group_by]
+        index.append(periods[np.repeat(positions[first], sizes) + offsets])
+        resampled_df = resampled_df.reindex(pd.MultiIndex.from_arrays(index, names=group_by + [order_by]))
+    return resampled_df.reset_index()
+
+
 def transform_to_nixtla_df(df, settings_dict, exog_vars=[]):
     """Transform dataframes into the specific format required by StatsForecast.
 
@@ -35,17 +67,14 @@ def transform_to_nixtla_df(df, settings_dict, exog_vars=[]):
     nixtla_df = df.copy()
 
     # Resample every group
-    freq = settings_dict['frequency']
-    resampled_df = pd.DataFrame(columns=nixtla_df.columns)
     if settings_dict["group_by"] and settings_dict["group_by"] != ['__group_by']:
-        for group, groupdf in nixtla_df.groupby(by=settings_dict["group_by"]):
-            groupdf.index = pd.to_datetime(groupdf.pop(settings_dict["order_by"]))
-            resampled_groupdf = pd.DataFrame(groupdf[settings_dict['target']].resample(freq).mean())
-            for k, v in zip(settings_dict["group_by"], group):
-                resampled_groupdf[k] = v
-            resampled_groupdf = resampled_groupdf.reset_index()
-            resampled_df = pd.concat([resampled_df, resampled_groupdf])
-        nixtla_df = resampled_df
+        nixtla_df = resample_groups(
+            nixtla_df,
+            group_by=settings_dict["group_by"],
+            order_by=settings_dict["order_by"],
+            value_cols=[settings_dict["target"]] + exog_vars,
+            freq=settings_dict["frequency"],
+        )
 
     # Transform group columns into single unique_id column
     if len(settings_dict["group_by"]) > 1:
@@ -1,7 +1,10 @@
-from typing import Any
+from typing import Any, List, Optional
 
 import sys
 
+import numpy as np
+import pandas as pd
+
 
 def format_exception_error(exception):
     try:
@@ -30,3 +33,36 @@ def get_class_name(instance: Any, default: str = 'unknown'):
     if hasattr(instance.__class__, 'name'):
         return instance.__class__.name
     return default
+
+
+def rows_to_df(rows: List[tuple], columns: List[str], dtypes: List[Optional[str]]) -> pd.DataFrame:
+    """Makes dataframe from rows fetched by db cursor, every column is converted at once
+
+    Args:
+        rows (List[tuple]): fetched rows
+        columns (List[str]): names of columns, could be duplicated
+        dtypes (List[Optional[str]]): numpy dtype of every column (from cursor description),
+            None if dtype has to be inferred. Numeric column with null values is converted to float64
+
+    Returns:
+        pd.DataFrame
+    """
+    data = {}
+    columns_values = zip(*rows) if len(rows) > 0 else [()] * len(columns)
+    for i, values in enumerate(columns_values):
+        array = None
+        dtype = dtypes[i]
+        if dtype is not None:
+            if None in values:
+                dtype = 'float64'
+                values = [np.nan if value is None else value for value in values]
+            try:
+                array = np.array(values, dtype=dtype)
+            except (TypeError, ValueError, OverflowError):
+                pass
+        if array is None:
+            array = pd.Series(list(values), dtype=None if len(values) > 0 else object)
+        data[i] = array
+    df = pd.DataFrame(data, columns=range(len(columns)))
+    df.columns = columns
+    return df
@@ -0,0 +1,84 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from mindsdb.interfaces.storage import db
+
+# count of constructed agents kept in the process
+MAX_AGENTS = 64
+# agent is rebuilt after this time: its tools can depend on objects which are changed without change of agent
+# (knowledge bases, tables of the database)
+AGENT_TTL_SECONDS = 600
+
+
+class CachedAgent:
+    '''Parts of agent executor which don't depend on the request: chat model, embeddings model and tools'''
+
+    def __init__(self, agent_executor, llm, embedding_model=None):
+        # executor without memory, it is used as a template for executors of requests
+        self.agent_executor = agent_executor
+        self.llm = llm
+        self.embedding_model = embedding_model
+        self.created_at = time.monotonic()
+
+
+def get_agent_key(agent: db.Agents, args: Dict) -> tuple:
+    '''
+    Key of the constructed agent. It is changed when the agent or one of its skills is altered.
+    Args are taken into account because they can be changed without change of agent (prompt template of the model)
+    '''
+    skills = tuple(sorted(
+        (skill.id, skill.updated_at) for skill in (agent.skills or [])
+    ))
+    args_hash = hashlib.sha256(
+        json.dumps(args, sort_keys=True, default=str).encode()
+    ).hexdigest()
+    return agent.id, agent.updated_at, skills, args_hash
+
+
+class AgentCache:
+    '''
+    LRU cache of constructed agents.
+
+    Construction of the agent creates clients of LLM and embeddings model and tools from skills, it takes
+    significant time of every completion. Cached agent is shared between requests, the history of the
+    conversation is not stored in the cache and has to be added to executor of the request.
+    '''
+
+    def __init__(self, max_size: int = MAX_AGENTS, ttl: int = AGENT_TTL_SECONDS):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._agents = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[CachedAgent]:
+        with self._lock:
+            item = self._agents.get(key)
+            if item is None:
+                return None
+            if time.monotonic() - item.created_at > self.ttl:
+                del self._agents[key]
+                return None
+            self._agents.move_to_end(key)
+            return item
+
+    def set(self, key: tuple, item: Any):
+        with self._lock:
+            # outdated versions of the same agent are not used anymore
+            agent_id = key[0]
+            for old_key in [k for k in self._agents.keys() if k[0] == agent_id]:
+                del self._agents[old_key]
+
+            self._agents[key] = item
+            while len(self._agents) > self.max_size:
+                self._agents.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._agents.clear()
+
+
+agent_cache = AgentCache()
@@ -10,13 +10,17 @@ from mindsdb.interfaces.model.functions import PredictorRecordNotFound
 from mindsdb.interfaces.storage.db import Predictor
 from mindsdb.interfaces.model.model_controller import ModelController
 from mindsdb.interfaces.skills.skills_controller import SkillsController
+from mindsdb.interfaces.skills.skill_tool import skill_tool
 from mindsdb.interfaces.storage import db
 from mindsdb.interfaces.database.projects import ProjectController
+from mindsdb.utilities import log
 from mindsdb.utilities.context import context as ctx
 
 from .constants import ASSISTANT_COLUMN, SUPPORTED_PROVIDERS, PROVIDER_TO_MODELS
 from .langchain_agent import get_llm_provider
 
+logger = log.getLogger(__name__)
+
 
 class AgentsController:
     '''Handles CRUD operations at the database level for Agents'''
@@ -191,8 +195,17 @@ class AgentsController:
         db.session.add(agent)
         db.session.commit()
 
+        self._warm_up_skills(skills_to_add)
+
         return agent
 
+    def _warm_up_skills(self, skills: List[db.Skills]):
+        for skill in skills:
+            try:
+                skill_tool.warm_up(skill)
+            except Exception as e:
+                logger.warning(f'Unable to prepare skill {skill.name}: {e}')
+
     def update_agent(
             self,
             agent_name: str,
@@ -269,6 +282,8 @@ class AgentsController:
             flag_modified(existing_agent, 'params')
         db.session.commit()
 
+        self._warm_up_skills(new_skills)
+
         return existing_agent
 
     def delete_agent(self, agent_name: str, project_name: str = 'mindsdb'):
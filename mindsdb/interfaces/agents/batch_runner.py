@@ -0,0 +1,110 @@
+import time
+from collections import deque
+from concurrent.futures import TimeoutError as FuturesTimeoutError, wait as wait_futures
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+from mindsdb.utilities import log
+from mindsdb.utilities.context_executor import ContextThreadPoolExecutor
+
+logger = log.getLogger(__name__)
+
+# count of items submitted to workers in advance, relative to count of workers
+QUEUE_SIZE_K = 2
+
+
+class AgentBatchRunner:
+    """
+    Runs agent for every item of the batch (a prompt per row of the query).
+
+    - no more than `max_workers` items are processed at the same time. Requests to LLM are not limited here:
+      the run of an item includes tools and several LLM calls, limits are applied to every LLM call
+    - timeout is applied to every item from the start of its processing
+    - results are yielded in order of input items as soon as the item and all previous items are completed,
+      input is consumed gradually
+
+    Usage:
+        runner = AgentBatchRunner(func, max_workers=8, timeout=60)
+        for result in runner.iter_results(prompts):
+            ...
+    """
+
+    def __init__(
+        self,
+        func: Callable,
+        max_workers: int,
+        timeout: Optional[float] = None,
+        on_error: Optional[Callable[[Exception], Any]] = None,
+        on_timeout: Optional[Callable[[], Any]] = None,
+    ):
+        """
+        :param func: function to call for every item
+        :param max_workers: count of items processed in parallel
+        :param timeout: timeout of processing of every item, seconds
+        :param on_error: returns result of the item in case of exception, if not set: exception is raised
+        :param on_timeout: returns result of the item in case of timeout, if not set: TimeoutError is raised
+        """
+        self.func = func
+        self.max_workers = max(1, int(max_workers))
+        self.timeout = timeout
+        self.on_error = on_error
+        self.on_timeout = on_timeout
+
+    def _process(self, item: Any, task: dict) -> Any:
+        task['started_at'] = time.monotonic()
+        return self.func(item)
+
+    def _get_result(self, task: dict) -> Any:
+        future = task['future']
+        # time of waiting for a free worker is not counted
+        while task['started_at'] is None and not future.done():
+            wait_futures([future], timeout=0.1)
+
+        timeout = None
+        if self.timeout is not None and task['started_at'] is not None:
+            timeout = max(task['started_at'] + self.timeout - time.monotonic(), 0)
+
+        try:
+            return future.result(timeout=timeout)
+        except FuturesTimeoutError:
+            # the worker is not interrupted, but its result is not waited anymore
+            logger.warning(f'Agent execution timed out after {self.timeout} seconds')
+            if self.on_timeout is None:
+                raise
+            return self.on_timeout()
+        except Exception as e:
+            if self.on_error is None:
+                raise
+            return self.on_error(e)
+
+    def iter_results(self, items: Iterable) -> Iterator[Any]:
+        """
+        Processes items
+        :param items: iterable of inputs of func
+        :return: results in the same order as items
+        """
+        items = iter(items)
+        executor = ContextThreadPoolExecutor(max_workers=self.max_workers)
+        queue = deque()
+        try:
+            while True:
+                while len(queue) < self.max_workers * QUEUE_SIZE_K:
+                    try:
+                        item = next(items)
+                    except StopIteration:
+                        break
+                    task = {'started_at': None}
+                    task['future'] = executor.submit(self._process, item, task)
+                    queue.append(task)
+
+                if len(queue) == 0:
+                    break
+                yield self._get_result(queue.popleft())
+        finally:
+            # generator can be closed before the end of processing
+            for task in queue:
+                task['future'].cancel()
+            # workers with timed out items are not waited
+            executor.shutdown(wait=False)
+
+    def run(self, items: Iterable) -> List[Any]:
+        return list(self.iter_results(items))
@@ -1,11 +1,14 @@
 from typing import Any, Dict, List, Union
 import logging
+import threading
 
 from langchain.schema.output import LLMResult
 from langchain_core.agents import AgentAction, AgentFinish
 from langchain_core.callbacks.base import BaseCallbackHandler
 from langchain_core.messages.base import BaseMessage
 
+from mindsdb.integrations.libs.llm.scheduler import RequestScheduler
+
 
 class ContextCaptureCallback(BaseCallbackHandler):
     def __init__(self):
@@ -21,6 +24,47 @@ class ContextCaptureCallback(BaseCallbackHandler):
         return self.context
 
 
+class SchedulerCallbackHandler(BaseCallbackHandler):
+    '''
+    Applies limits of the scheduler to every request of the agent to LLM:
+    a request waits for a slot of the scheduler on start and frees it on the end.
+    Tokens of a request are estimated by length of the prompt
+    '''
+
+    def __init__(self, scheduler: RequestScheduler):
+        self.scheduler = scheduler
+        # run id -> start time of request
+        self._runs = {}
+        self._lock = threading.Lock()
+
+    def _start(self, run_id, text_length: int):
+        start = self.scheduler.acquire(tokens=text_length // 4)
+        with self._lock:
+            self._runs[run_id] = start
+
+    def _end(self, run_id, error: Exception = None):
+        with self._lock:
+            start = self._runs.pop(run_id, None)
+        if start is not None:
+            self.scheduler.release(start, error=error)
+
+    def on_llm_start(self, serialized: Dict[str, Any], prompts: List[str], *, run_id, **kwargs: Any) -> Any:
+        self._start(run_id, sum(len(prompt) for prompt in prompts))
+
+    def on_chat_model_start(
+            self,
+            serialized: Dict[str, Any],
+            messages: List[List[BaseMessage]], *, run_id, **kwargs: Any
+    ) -> Any:
+        self._start(run_id, sum(len(str(message.content)) for message_list in messages for message in message_list))
+
+    def on_llm_end(self, response: LLMResult, *, run_id, **kwargs: Any) -> Any:
+        self._end(run_id)
+
+    def on_llm_error(self, error: Union[Exception, KeyboardInterrupt], *, run_id, **kwargs: Any) -> Any:
+        self._end(run_id, error=error)
+
+
 class LogCallbackHandler(BaseCallbackHandler):
     '''Langchain callback handler that logs agent and chain executions.'''
 
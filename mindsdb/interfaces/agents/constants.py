@@ -163,6 +163,8 @@ PROVIDER_TO_MODELS = MappingProxyType(
 ASSISTANT_COLUMN = "answer"
 CONTEXT_COLUMN = "context"
 DEFAULT_AGENT_TIMEOUT_SECONDS = 300
+# count of prompts processed by agent at the same time
+DEFAULT_AGENT_MAX_WORKERS = 16
 # These should require no additional arguments.
 DEFAULT_AGENT_TOOLS = []
 DEFAULT_AGENT_TYPE = AgentType.CONVERSATIONAL_REACT_DESCRIPTION
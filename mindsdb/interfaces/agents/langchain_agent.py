@@ -1,6 +1,6 @@
 import json
-from concurrent.futures import as_completed, TimeoutError
-from typing import Dict, Iterable, List
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
 from uuid import uuid4
 import os
 import re
@@ -28,24 +28,27 @@ from langfuse.callback import CallbackHandler
 from mindsdb.integrations.handlers.openai_handler.constants import (
     CHAT_MODELS as OPEN_AI_CHAT_MODELS,
 )
+from mindsdb.integrations.libs.llm.scheduler import RequestScheduler, get_scheduler
 from mindsdb.integrations.libs.llm.utils import get_llm_config
 from mindsdb.integrations.utilities.handler_utils import get_api_key
 from mindsdb.integrations.handlers.langchain_embedding_handler.langchain_embedding_handler import (
     construct_model_from_args,
 )
 from mindsdb.utilities import log
-from mindsdb.utilities.context_executor import ContextThreadPoolExecutor
 from mindsdb.interfaces.storage import db
 
 from .mindsdb_chat_model import ChatMindsdb
-from .callback_handlers import LogCallbackHandler, ContextCaptureCallback
+from .callback_handlers import LogCallbackHandler, ContextCaptureCallback, SchedulerCallbackHandler
 from .langfuse_callback_handler import LangfuseCallbackHandler, get_metadata, get_tags, get_tool_usage, get_skills
 
+from .batch_runner import AgentBatchRunner
+from .agent_cache import agent_cache, get_agent_key, CachedAgent
 from .tools import _build_retrieval_tool
 from .safe_output_parser import SafeOutputParser
 
 
 from .constants import (
+    DEFAULT_AGENT_MAX_WORKERS,
     DEFAULT_AGENT_TIMEOUT_SECONDS,
     DEFAULT_AGENT_TYPE,
     DEFAULT_EMBEDDINGS_MODEL_PROVIDER,
@@ -143,6 +146,33 @@ def create_chat_model(args: Dict):
     raise ValueError(f'Unknown provider: {args["provider"]}')
 
 
+@lru_cache(maxsize=16)
+def get_langfuse_client(public_key: str, secret_key: str, host: str, release: str = None) -> Langfuse:
+    """Client is reused for the same credentials, every client starts own threads to send events"""
+    kwargs = {}
+    if release is not None:
+        kwargs['release'] = release
+    return Langfuse(public_key=public_key, secret_key=secret_key, host=host, **kwargs)
+
+
+def get_agent_scheduler(args: Dict) -> Optional[RequestScheduler]:
+    """
+    Scheduler of requests to LLM, shared with the LLM engine of the same provider and model.
+    Limits of the engine are not changed, limits of the agent are used if the engine doesn't have the scheduler yet
+    """
+    provider = args.get("provider")
+    if provider is None or provider == "mindsdb":
+        # requests are made by the model, its engine applies own limits
+        return None
+    return get_scheduler(
+        f"{provider}:{args.get('api_base')}:{args.get('model_name')}",
+        requests_per_minute=args.get("rpm_limit"),
+        tokens_per_minute=args.get("tpm_limit"),
+        max_concurrency=args.get("max_concurrency", DEFAULT_AGENT_MAX_WORKERS),
+        update_limits=False,
+    )
+
+
 def prepare_prompts(df, base_template, input_variables, user_column=USER_COLUMN):
     empty_prompt_ids = np.where(df[input_variables].isna().all(axis=1).values)[0]
     base_template = base_template.replace('{{', '{').replace('}}', '}')
@@ -198,7 +228,7 @@ class LangchainAgent:
 
         self.langfuse = None
         if os.getenv('LANGFUSE_PUBLIC_KEY') is not None:
-            self.langfuse = Langfuse(
+            self.langfuse = get_langfuse_client(
                 public_key=os.getenv('LANGFUSE_PUBLIC_KEY'),
                 secret_key=os.getenv('LANGFUSE_SECRET_KEY'),
                 host=os.getenv('LANGFUSE_HOST'),
@@ -353,6 +383,31 @@ class LangchainAgent:
         self.embedding_model = construct_model_from_args(embeddings_args)
 
     def create_agent(self, df: pd.DataFrame, args: Dict = None) -> AgentExecutor:
+        # Constructed agent is reused between requests, only the memory is created for every request.
+        key = None
+        cached_agent = None
+        if self.agent.id is not None:
+            key = get_agent_key(self.agent, args)
+            cached_agent = agent_cache.get(key)
+
+        if cached_agent is None:
+            cached_agent = self._build_agent(args)
+            if key is not None:
+                agent_cache.set(key, cached_agent)
+        else:
+            self.llm = cached_agent.llm
+            self.embedding_model = cached_agent.embedding_model
+
+        template = cached_agent.agent_executor
+        return AgentExecutor.from_agent_and_tools(
+            agent=template.agent,
+            tools=template.tools,
+            tags=template.tags,
+            memory=self._create_memory(df, args, cached_agent.llm),
+            **self._get_executor_params(args),
+        )
+
+    def _build_agent(self, args: Dict) -> CachedAgent:
         # Set up tools.
         llm = create_chat_model(args)
         self.llm = llm
@@ -365,6 +420,34 @@ class LangchainAgent:
         for skill in skills:
             tools += self.langchain_tools_from_skill(skill, {}, llm)
 
+        agent_type = args.get("agent_type", DEFAULT_AGENT_TYPE)
+        agent_executor = initialize_agent(
+            tools,
+            llm,
+            agent=agent_type,
+            # Use custom output parser to handle flaky LLMs that don't ALWAYS conform to output format.
+            agent_kwargs={"output_parser": SafeOutputParser()},
+            **self._get_executor_params(args),
+        )
+        return CachedAgent(agent_executor, llm, self.embedding_model)
+
+    def _get_executor_params(self, args: Dict) -> Dict:
+        return dict(
+            # Calls the agent’s LLM Chain one final time to generate a final answer based on the previous steps
+            early_stopping_method="generate",
+            handle_parsing_errors=self._handle_parsing_errors,
+            # Timeout per agent invocation.
+            max_execution_time=args.get(
+                "timeout_seconds",
+                args.get("timeout_seconds", DEFAULT_AGENT_TIMEOUT_SECONDS),
+            ),
+            max_iterations=args.get(
+                "max_iterations", args.get("max_iterations", DEFAULT_MAX_ITERATIONS)
+            ),
+            verbose=args.get("verbose", args.get("verbose", True)),
+        )
+
+    def _create_memory(self, df: pd.DataFrame, args: Dict, llm) -> ConversationSummaryBufferMemory:
         # Prefer prediction prompt template over original if provided.
         prompt_template = args["prompt_template"]
 
@@ -388,29 +471,7 @@ class LangchainAgent:
                 memory.chat_memory.add_user_message(question)
             if answer:
                 memory.chat_memory.add_ai_message(answer)
-
-        agent_type = args.get("agent_type", DEFAULT_AGENT_TYPE)
-        agent_executor = initialize_agent(
-            tools,
-            llm,
-            agent=agent_type,
-            # Use custom output parser to handle flaky LLMs that don't ALWAYS conform to output format.
-            agent_kwargs={"output_parser": SafeOutputParser()},
-            # Calls the agent’s LLM Chain one final time to generate a final answer based on the previous steps
-            early_stopping_method="generate",
-            handle_parsing_errors=self._handle_parsing_errors,
-            # Timeout per agent invocation.
-            max_execution_time=args.get(
-                "timeout_seconds",
-                args.get("timeout_seconds", DEFAULT_AGENT_TIMEOUT_SECONDS),
-            ),
-            max_iterations=args.get(
-                "max_iterations", args.get("max_iterations", DEFAULT_MAX_ITERATIONS)
-            ),
-            memory=memory,
-            verbose=args.get("verbose", args.get("verbose", True)),
-        )
-        return agent_executor
+        return memory
 
     def langchain_tools_from_skill(self, skill, pred_args, llm):
         # Makes Langchain compatible tools from a skill
@@ -489,7 +550,7 @@ class LangchainAgent:
                 observation_id = args.get(
                     "observation_id", self.observation_id or uuid4().hex
                 )
-                langfuse = Langfuse(
+                langfuse = get_langfuse_client(
                     host=langfuse_host,
                     public_key=langfuse_public_key,
                     secret_key=langfuse_secret_key,
@@ -509,7 +570,8 @@ class LangchainAgent:
 
         return all_callbacks
 
-    def _handle_parsing_errors(self, error: Exception) -> str:
+    @staticmethod
+    def _handle_parsing_errors(error: Exception) -> str:
         response = str(error)
         for p in _PARSING_ERROR_PREFIXES:
             if response.startswith(p):
@@ -535,48 +597,39 @@ AI: {response}"""
 
         prompts, empty_prompt_ids = prepare_prompts(df, base_template, input_variables, args.get('user_column', USER_COLUMN))
 
-        def _invoke_agent_executor_with_prompt(agent_executor, prompt):
+        # limits of LLM are applied to every request of agent to LLM
+        scheduler = get_agent_scheduler(args)
+        scheduler_callbacks = [SchedulerCallbackHandler(scheduler)] if scheduler is not None else []
+
+        def _invoke_agent_executor_with_prompt(prompt):
             if not prompt:
                 return {CONTEXT_COLUMN: [], ASSISTANT_COLUMN: ""}
-            try:
-                callbacks, context_callback = prepare_callbacks(self, args)
-                result = agent_executor.invoke(prompt, config={'callbacks': callbacks})
-                captured_context = context_callback.get_contexts()
-                output = result['output'] if isinstance(result, dict) and 'output' in result else str(result)
-                return {CONTEXT_COLUMN: captured_context, ASSISTANT_COLUMN: output}
-            except Exception as e:
-                return {CONTEXT_COLUMN: [], ASSISTANT_COLUMN: handle_agent_error(e)}
+            callbacks, context_callback = prepare_callbacks(self, args)
+            result = agent.invoke(prompt, config={'callbacks': callbacks + scheduler_callbacks})
+            captured_context = context_callback.get_contexts()
+            output = result['output'] if isinstance(result, dict) and 'output' in result else str(result)
+            return {CONTEXT_COLUMN: captured_context, ASSISTANT_COLUMN: output}
+
+        timeout_message = "I'm sorry! I couldn't come up with a response in time. Please try again."
+        runner = AgentBatchRunner(
+            _invoke_agent_executor_with_prompt,
+            max_workers=args.get("max_workers") or DEFAULT_AGENT_MAX_WORKERS,
+            timeout=args.get("timeout", DEFAULT_AGENT_TIMEOUT_SECONDS),
+            on_error=lambda e: {CONTEXT_COLUMN: [], ASSISTANT_COLUMN: handle_agent_error(e)},
+            on_timeout=lambda: {CONTEXT_COLUMN: [], ASSISTANT_COLUMN: timeout_message},
+        )
 
+        # results are in order of prompts
         completions = []
         contexts = []
-
-        max_workers = args.get("max_workers", None)
-        agent_timeout_seconds = args.get("timeout", DEFAULT_AGENT_TIMEOUT_SECONDS)
-
-        with ContextThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = [
-                executor.submit(_invoke_agent_executor_with_prompt, agent, prompt)
-                for prompt in prompts
-            ]
-            try:
-                for future in as_completed(futures, timeout=agent_timeout_seconds):
-                    result = future.result()
-                    if result is None:
-                        result = {
-                            CONTEXT_COLUMN: [],
-                            ASSISTANT_COLUMN: "No response generated",
-                        }
-
-                    completions.append(result[ASSISTANT_COLUMN])
-                    contexts.append(result[CONTEXT_COLUMN])
-            except TimeoutError:
-                timeout_message = "I'm sorry! I couldn't come up with a response in time. Please try again."
-                logger.warning(
-                    f"Agent execution timed out after {agent_timeout_seconds} seconds"
-                )
-                for _ in range(len(futures) - len(completions)):
-                    completions.append(timeout_message)
-                    contexts.append([])
+        for result in runner.iter_results(prompts):
+            if result is None:
+                result = {
+                    CONTEXT_COLUMN: [],
+                    ASSISTANT_COLUMN: "No response generated",
+                }
+            completions.append(result[ASSISTANT_COLUMN])
+            contexts.append(result[CONTEXT_COLUMN])
 
         # Add null completion for empty prompts
         for i in sorted(empty_prompt_ids)[:-1]:
@@ -3,6 +3,7 @@ from typing import Dict, List
 from mindsdb.interfaces.agents.agents_controller import AgentsController
 from mindsdb.interfaces.database.projects import ProjectController
 from mindsdb.interfaces.storage import db
+from mindsdb.interfaces.storage.notifications import notify, TASKS_CHANNEL
 
 from mindsdb.utilities.context import context as ctx
 
@@ -215,6 +216,7 @@ class ChatBotController:
         db.session.add(task_record)
 
         db.session.commit()
+        notify(TASKS_CHANNEL)
 
         return bot
 
@@ -291,6 +293,7 @@ class ChatBotController:
             params.update(existing_params)
             existing_chatbot_rec.params = params
         db.session.commit()
+        notify(TASKS_CHANNEL)
 
         return existing_chatbot_rec
 
@@ -321,3 +324,4 @@ class ChatBotController:
         db.session.delete(bot_rec)
 
         db.session.commit()
+        notify(TASKS_CHANNEL)
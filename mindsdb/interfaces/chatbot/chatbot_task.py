@@ -9,7 +9,7 @@ from mindsdb.interfaces.tasks.task import BaseTask
 
 from mindsdb.utilities import log
 
-from .polling import MessageCountPolling, RealtimePolling
+from .polling import MessageCountPolling, IncrementalPolling, RealtimePolling
 from .memory import DBMemory, HandlerMemory
 from .chatbot_executor import MultiModeBotExecutor, BotExecutor, AgentExecutor
 
@@ -57,6 +57,11 @@ class ChatBotTask(BaseTask):
             self.chat_pooling = MessageCountPolling(self, chat_params)
             self.memory = HandlerMemory(self, chat_params)
 
+        elif polling == 'incremental':
+            chat_params = chat_params['tables'] if 'tables' in chat_params else [chat_params]
+            self.chat_pooling = IncrementalPolling(self, chat_params)
+            self.memory = HandlerMemory(self, chat_params)
+
         elif polling == 'realtime':
             self.chat_pooling = RealtimePolling(self, chat_params)
             self.memory = DBMemory(self, chat_params)
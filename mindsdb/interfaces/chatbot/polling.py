@@ -1,7 +1,12 @@
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
-from mindsdb_sql.parser.ast import Identifier, Select, Insert
+import numpy as np
+from mindsdb_sql.parser.ast import Identifier, Select, Insert, BinaryOperation, Constant, OrderBy
 
+from mindsdb.interfaces.storage import db
 from mindsdb.utilities import log
 from mindsdb.utilities.context import context as ctx
 
@@ -9,13 +14,73 @@ from .types import ChatBotMessage, BotException
 
 logger = log.getLogger(__name__)
 
+# count of chats processed at the same time
+MAX_CHAT_WORKERS = 4
+# interval between checks of new messages
+POLLING_INTERVAL_SECONDS = 7
+# max count of new messages fetched at once by incremental polling
+INCREMENTAL_BATCH_SIZE = 1000
+
+
+class ChatsExecutor:
+    """
+    Processes messages of different chats in parallel, messages of one chat are processed in order
+    """
+
+    def __init__(self, max_workers: int = MAX_CHAT_WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='chatbot_worker')
+        # chat_id -> queue of functions to execute
+        self._chats = {}
+        self._lock = threading.Lock()
+
+        # workers might be without context
+        self._ctx_dump = ctx.dump()
+
+    def submit(self, chat_id, fn, *args, **kwargs):
+        with self._lock:
+            chat_queue = self._chats.get(chat_id)
+            if chat_queue is not None:
+                # the chat is processed by other worker
+                chat_queue.append((fn, args, kwargs))
+                return
+            self._chats[chat_id] = deque([(fn, args, kwargs)])
+        self._executor.submit(self._process_chat, chat_id)
+
+    def _process_chat(self, chat_id):
+        ctx.load(self._ctx_dump)
+        try:
+            while True:
+                with self._lock:
+                    chat_queue = self._chats[chat_id]
+                    if len(chat_queue) == 0:
+                        del self._chats[chat_id]
+                        return
+                    fn, args, kwargs = chat_queue.popleft()
+                try:
+                    fn(*args, **kwargs)
+                except Exception as e:
+                    logger.error(f"Error in processing of chat {chat_id}: {e}")
+        finally:
+            db.session.remove()
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True)
+
 
 class BasePolling:
     def __init__(self, chat_task, chat_params):
         self.params = chat_params
         self.chat_task = chat_task
 
-    def start(self, stop_event):
+    def run(self, stop_event):
+        self.chats_executor = ChatsExecutor()
+        try:
+            self._run(stop_event)
+        finally:
+            # wait for processing of received messages
+            self.chats_executor.shutdown()
+
+    def _run(self, stop_event):
         raise NotImplementedError
 
     def send_message(self, message: ChatBotMessage, table_name=None):
@@ -45,30 +110,16 @@ class MessageCountPolling(BasePolling):
         self._to_stop = False
         self.chats_prev = None
 
-    def run(self, stop_event):
+    def _run(self, stop_event):
         while True:
             try:
                 for chat_params in self.params:
                     chat_ids = self.check_message_count(chat_params)
                     logger.debug(f"number of chat ids found: {len(chat_ids)}")
 
+                    table_name = chat_params["chat_table"]["name"]
                     for chat_id in chat_ids:
-                        try:
-                            chat_memory = self.chat_task.memory.get_chat(
-                                chat_id,
-                                table_name=chat_params["chat_table"]["name"],
-                            )
-                        except Exception as e:
-                            logger.error(f"Problem retrieving chat memory: {e}")
-
-                        try:
-                            message = self.get_last_message(chat_memory)
-                        except Exception as e:
-                            logger.error(f"Problem getting last message: {e}")
-                            message = None
-
-                        if message:
-                            self.chat_task.on_message(chat_memory, message, table_name=chat_params["chat_table"]["name"])
+                        self.chats_executor.submit((table_name, chat_id), self.process_chat, chat_id, table_name)
 
             except Exception as e:
                 logger.error(e)
@@ -76,7 +127,26 @@ class MessageCountPolling(BasePolling):
             if stop_event.is_set():
                 return
             logger.debug(f"running {self.chat_task.bot_id}")
-            time.sleep(7)
+            time.sleep(POLLING_INTERVAL_SECONDS)
+
+    def process_chat(self, chat_id, table_name):
+        try:
+            chat_memory = self.chat_task.memory.get_chat(
+                chat_id,
+                table_name=table_name,
+            )
+        except Exception as e:
+            logger.error(f"Problem retrieving chat memory: {e}")
+            return
+
+        try:
+            message = self.get_last_message(chat_memory)
+        except Exception as e:
+            logger.error(f"Problem getting last message: {e}")
+            message = None
+
+        if message:
+            self.chat_task.on_message(chat_memory, message, table_name=table_name)
 
     def get_last_message(self, chat_memory):
         # retrive from history
@@ -132,6 +202,162 @@ class MessageCountPolling(BasePolling):
         self._to_stop = True
 
 
+class IncrementalPolling(BasePolling):
+    """
+    Fetches only messages which are newer than the last seen message.
+    Chat table has to have a column which grows with every new message: 'cursor_col' of polling parameters,
+    'time_col' of chat table is used by default.
+    Cursor column can be not unique: messages with the last value of cursor are fetched again and skipped
+    if they were seen. They are identified by 'id_col' of polling parameters or by all fetched columns
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # table name -> the last seen value of cursor column
+        self.cursors = {}
+        # table name -> keys of seen messages with the last value of cursor column
+        self.cursor_seen = {}
+        # tables with skipped old messages
+        self.started = set()
+
+    def _run(self, stop_event):
+        while True:
+            has_more = False
+            try:
+                for chat_params in self.params:
+                    has_more = self.check_new_messages(chat_params) or has_more
+            except Exception as e:
+                logger.error(e)
+
+            if stop_event.is_set():
+                return
+            if not has_more:
+                time.sleep(POLLING_INTERVAL_SECONDS)
+
+    def _get_cursor_col(self, chat_params):
+        t_params = chat_params["chat_table"]
+        return chat_params.get("polling", {}).get("cursor_col", t_params["time_col"])
+
+    def _get_columns(self, chat_params) -> list:
+        t_params = chat_params["chat_table"]
+        chat_id_cols = t_params["chat_id_col"] if isinstance(t_params["chat_id_col"], list) else [t_params["chat_id_col"]]
+        id_col = chat_params.get("polling", {}).get("id_col")
+
+        columns = []
+        for col in [
+            *chat_id_cols, t_params["username_col"], t_params["text_col"], t_params["time_col"],
+            self._get_cursor_col(chat_params), id_col
+        ]:
+            if col is not None and col not in columns:
+                columns.append(col)
+        return columns
+
+    def _get_message_key(self, chat_params, row: dict):
+        id_col = chat_params.get("polling", {}).get("id_col")
+        if id_col is not None:
+            return row[id_col]
+        return tuple(row[col] for col in self._get_columns(chat_params))
+
+    def _fetch_messages(self, chat_params, cursor=None, initial=False, seen_count=0):
+        t_params = chat_params["chat_table"]
+        cursor_col = self._get_cursor_col(chat_params)
+        columns = self._get_columns(chat_params)
+
+        if initial:
+            # only the last messages are needed to start
+            ast_query = Select(
+                targets=[Identifier(col) for col in columns],
+                from_table=Identifier(t_params["name"]),
+                order_by=[OrderBy(Identifier(cursor_col), direction="DESC")],
+                limit=Constant(INCREMENTAL_BATCH_SIZE),
+            )
+        else:
+            # seen messages with the last value of cursor are fetched again, they don't take place of new ones
+            ast_query = Select(
+                targets=[Identifier(col) for col in columns],
+                from_table=Identifier(t_params["name"]),
+                order_by=[OrderBy(Identifier(cursor_col))],
+                limit=Constant(INCREMENTAL_BATCH_SIZE + seen_count),
+            )
+            if cursor is not None:
+                ast_query.where = BinaryOperation(op=">=", args=[Identifier(cursor_col), Constant(cursor)])
+
+        resp = self.chat_task.chat_handler.query(query=ast_query)
+        if resp.data_frame is None:
+            raise BotException("Error to get new messages")
+        df = resp.data_frame
+        if initial:
+            df = df.iloc[::-1]
+        return df
+
+    def check_new_messages(self, chat_params) -> bool:
+        """
+        Sends new messages to processing
+        :return: True if there could be more new messages
+        """
+        t_params = chat_params["chat_table"]
+        table_name = t_params["name"]
+        cursor_col = self._get_cursor_col(chat_params)
+        chat_id_cols = t_params["chat_id_col"] if isinstance(t_params["chat_id_col"], list) else [t_params["chat_id_col"]]
+
+        initial = table_name not in self.started
+        cursor = self.cursors.get(table_name)
+        seen = self.cursor_seen.get(table_name, set())
+        df = self._fetch_messages(chat_params, cursor, initial=initial, seen_count=len(seen))
+        self.started.add(table_name)
+        if len(df) == 0:
+            return False
+        has_more = len(df) >= INCREMENTAL_BATCH_SIZE + len(seen)
+
+        # messages are ordered by cursor column
+        new_cursor = df[cursor_col].iloc[-1]
+        new_cursor = new_cursor.item() if isinstance(new_cursor, np.generic) else new_cursor
+
+        messages = []
+        new_seen = set()
+        for row in df.to_dict("records"):
+            key = self._get_message_key(chat_params, row)
+            if row[cursor_col] == cursor and key in seen:
+                continue
+            messages.append(row)
+            if row[cursor_col] == new_cursor:
+                new_seen.add(key)
+        if new_cursor == cursor:
+            new_seen |= seen
+
+        self.cursors[table_name] = new_cursor
+        self.cursor_seen[table_name] = new_seen
+        if initial:
+            # first run: existing messages are skipped
+            return False
+
+        # the last message of every chat, older messages are in the history
+        last_messages = {}
+        for row in messages:
+            chat_id = tuple(row[col] for col in chat_id_cols)
+            last_messages[chat_id] = row
+
+        bot_username = self.chat_task.bot_params["bot_username"]
+        for chat_id, row in last_messages.items():
+            if row[t_params["username_col"]] == bot_username:
+                # the last message is from bot
+                continue
+            message = ChatBotMessage(
+                ChatBotMessage.Type.DIRECT,
+                row[t_params["text_col"]],
+                user=row[t_params["username_col"]],
+                sent_at=row[t_params["time_col"]],
+            )
+            self.chats_executor.submit((table_name, chat_id), self.process_message, chat_id, message, table_name)
+
+        return has_more
+
+    def process_message(self, chat_id, message, table_name):
+        chat_memory = self.chat_task.memory.get_chat(chat_id, table_name=table_name)
+        self.chat_task.on_message(chat_memory, message, table_name=table_name)
+
+
 class RealtimePolling(BasePolling):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -156,10 +382,14 @@ class RealtimePolling(BasePolling):
 
         chat_id = row[t_params["chat_id_col"]]
 
+        # subscription is not blocked by processing
+        self.chats_executor.submit(chat_id, self.process_message, chat_id, message)
+
+    def process_message(self, chat_id, message):
         chat_memory = self.chat_task.memory.get_chat(chat_id)
         self.chat_task.on_message(chat_memory, message)
 
-    def run(self, stop_event):
+    def _run(self, stop_event):
         t_params = self.params["chat_table"]
         self.chat_task.chat_handler.subscribe(
             stop_event, self._callback, t_params["name"]
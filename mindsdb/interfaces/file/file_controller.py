@@ -1,8 +1,12 @@
 import json
 import os
 import shutil
+import tempfile
 from pathlib import Path
 
+import duckdb
+import pandas as pd
+
 from mindsdb.integrations.handlers.file_handler import Handler as FileHandler
 from mindsdb.interfaces.storage import db
 from mindsdb.interfaces.storage.fs import FsStore
@@ -12,6 +16,9 @@ from mindsdb.utilities.context import context as ctx
 
 logger = log.getLogger(__name__)
 
+# copy of the file converted to table, it is used in queries instead of source file
+COLUMNAR_FILE_NAME = "_mindsdb_table.parquet"
+
 
 class FileController:
     def __init__(self):
@@ -81,10 +88,20 @@ class FileController:
             file_name = Path(file_path).name
 
         file_dir = None
+        fd, columnar_path = tempfile.mkstemp(prefix="mindsdb_file_", suffix=".parquet")
+        os.close(fd)
+        columnar_path = Path(columnar_path)
         try:
-            df, _col_map = FileHandler._handle_source(file_path)
+            # csv is converted to columnar copy without loading in memory
+            stream_result = FileHandler._stream_csv_source(file_path, columnar_path)
+            if stream_result is not None:
+                df = None
+                row_count, column_names = stream_result
+            else:
+                df, _col_map = FileHandler._handle_source(file_path)
+                row_count, column_names = len(df), list(df.columns)
 
-            ds_meta = {"row_count": len(df), "column_names": list(df.columns)}
+            ds_meta = {"row_count": row_count, "column_names": column_names}
 
             file_record = db.File(
                 name=name,
@@ -106,15 +123,48 @@ class FileController:
             # NOTE may be delay between db record exists and file is really in folder
             shutil.move(file_path, str(source))
 
+            if df is None:
+                shutil.move(str(columnar_path), str(file_dir.joinpath(COLUMNAR_FILE_NAME)))
+            else:
+                self._save_columnar(df, file_dir.joinpath(COLUMNAR_FILE_NAME))
+
             self.fs_store.put(store_file_path, base_dir=self.dir)
         except Exception as e:
             logger.error(e)
             if file_dir is not None:
                 shutil.rmtree(file_dir)
             raise
+        finally:
+            columnar_path.unlink(missing_ok=True)
 
         return file_record.id
 
+    @staticmethod
+    def _save_columnar(df: pd.DataFrame, path: Path) -> bool:
+        """Saves table to parquet file, it is skipped if table has columns with values of mixed or complex types"""
+        # folder of the file can be left from the previous file with the same id
+        if path.exists():
+            path.unlink()
+        for column_name in df.columns:
+            if df[column_name].dtype == object and pd.api.types.infer_dtype(
+                df[column_name], skipna=True
+            ) not in ("string", "empty"):
+                logger.debug(f"Columnar copy of file is not created, column has complex values: {column_name}")
+                return False
+        con = duckdb.connect(database=":memory:")
+        try:
+            con.register("df_table", df)
+            path_str = str(path).replace("'", "''")
+            con.execute(f"copy df_table to '{path_str}' (format parquet)")
+        except Exception as e:
+            logger.warning(f"Can't create columnar copy of file: {e}")
+            if path.exists():
+                path.unlink()
+            return False
+        finally:
+            con.close()
+        return True
+
     def delete_file(self, name):
         file_record = (
             db.session.query(db.File)
@@ -129,7 +179,7 @@ class FileController:
         self.fs_store.delete(f"file_{ctx.company_id}_{file_id}")
         return True
 
-    def get_file_path(self, name):
+    def _get_file_dir(self, name) -> tuple:
         file_record = (
             db.session.query(db.File)
             .filter_by(company_id=ctx.company_id, name=name)
@@ -139,8 +189,19 @@ class FileController:
             raise Exception(f"File '{name}' does not exists")
         file_dir = f"file_{ctx.company_id}_{file_record.id}"
         self.fs_store.get(file_dir, base_dir=self.dir)
-        return str(
-            Path(self.dir)
-            .joinpath(file_dir)
-            .joinpath(Path(file_record.source_file_path).name)
-        )
+        return Path(self.dir).joinpath(file_dir), file_record
+
+    def get_file_path(self, name):
+        file_dir, file_record = self._get_file_dir(name)
+        return str(file_dir.joinpath(Path(file_record.source_file_path).name))
+
+    def get_columnar_file_path(self, name):
+        """
+        Path to parquet copy of the file
+        :return: path or None if file doesn't have it
+        """
+        file_dir, _ = self._get_file_dir(name)
+        path = file_dir.joinpath(COLUMNAR_FILE_NAME)
+        if not path.exists():
+            return None
+        return str(path)
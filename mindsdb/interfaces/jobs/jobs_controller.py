@@ -1,7 +1,7 @@
 import re
 import datetime as dt
 from dateutil.relativedelta import relativedelta
-from typing import List
+from typing import List, Optional
 
 import sqlalchemy as sa
 
@@ -12,6 +12,7 @@ from mindsdb_sql.parser.ast import Select, Star, Identifier, BinaryOperation, Co
 from mindsdb.utilities.context import context as ctx
 from mindsdb.utilities.exception import EntityNotExistsError, EntityExistsError
 from mindsdb.interfaces.storage import db
+from mindsdb.interfaces.storage.notifications import notify, JOBS_CHANNEL
 from mindsdb.interfaces.database.projects import ProjectController
 from mindsdb.interfaces.query_context.context_controller import query_context_controller
 from mindsdb.interfaces.database.log import LogDBController
@@ -186,6 +187,7 @@ class JobsController:
         )
         db.session.add(record)
         db.session.commit()
+        notify(JOBS_CHANNEL)
 
         return name
 
@@ -244,6 +246,7 @@ class JobsController:
 
         self._delete_record(record)
         db.session.commit()
+        notify(JOBS_CHANNEL)
 
         # delete context
         query_context_controller.drop_query_context('job', record.id)
@@ -355,6 +358,19 @@ class JobsExecutor:
 
         return query.all()
 
+    def get_next_run_at(self, exclude_ids: List[int] = None) -> Optional[dt.datetime]:
+        """
+        Planned time of the nearest job
+        :param exclude_ids: ids of jobs to skip, for example running jobs
+        """
+        query = db.session.query(sa.func.min(db.Jobs.next_run_at)).filter(
+            db.Jobs.deleted_at == sa.null(),
+            db.Jobs.active == True,  # noqa
+        )
+        if exclude_ids:
+            query = query.filter(db.Jobs.id.notin_(exclude_ids))
+        return query.scalar()
+
     def update_task_schedule(self, record):
         # calculate next run
 
@@ -547,3 +563,5 @@ class JobsExecutor:
         history_record.query_str = executed_sql
 
         db.session.commit()
+        # next run is changed
+        notify(JOBS_CHANNEL)
@@ -1,121 +1,245 @@
 import datetime as dt
-import queue
 import random
 import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures
 
 from mindsdb.interfaces.jobs.jobs_controller import JobsExecutor
 from mindsdb.interfaces.storage import db
+from mindsdb.interfaces.storage.notifications import ChangeListener, JOBS_CHANNEL
+from mindsdb.metrics.metrics import JOBS_RUNNING, JOBS_SCHEDULE_LAG
 from mindsdb.utilities import log
 from mindsdb.utilities.config import Config
 from mindsdb.utilities.sentry import sentry_sdk  # noqa: F401
 
 logger = log.getLogger(__name__)
 
+# count of jobs executed at the same time
+DEFAULT_MAX_WORKERS = 4
+# count of jobs of one company or project executed at the same time
+DEFAULT_MAX_COMPANY_TASKS = 2
+DEFAULT_MAX_PROJECT_TASKS = 1
+# interval of update of 'updated_at' of running jobs in history, lock of job is released after 30 seconds
+HEARTBEAT_INTERVAL = 10
+# interval of checks of jobs table if changes are notified by database
+NOTIFIED_CHECK_INTERVAL = 300
+
+
+def execute_async(record_id, history_id):
+    executor = JobsExecutor()
+    try:
+        executor.execute_task_local(record_id, history_id)
+    except (KeyboardInterrupt, SystemExit):
+        raise
+
+    except Exception as e:
+        logger.error(f"Error in job {record_id}: {e}")
+        db.session.rollback()
+    finally:
+        db.session.remove()
 
-def execute_async(q_in, q_out):
-
-    while True:
-        task = q_in.get()
-
-        if task["type"] != "task":
-            return
-
-        record_id = task["record_id"]
-        history_id = task["history_id"]
-
-        executor = JobsExecutor()
-        try:
-            executor.execute_task_local(record_id, history_id)
-        except (KeyboardInterrupt, SystemExit):
-            q_out.put(True)
-            raise
 
-        except Exception:
-            db.session.rollback()
+def fair_order(records: list) -> list:
+    """
+    Orders due jobs: companies take turns, jobs of one company are ordered by planned time.
+    It prevents one company with many due jobs from delaying jobs of other companies
+    """
+    by_company = OrderedDict()
+    for record in records:
+        by_company.setdefault(record.company_id, []).append(record)
 
-        q_out.put(True)
+    ordered = []
+    queues = list(by_company.values())
+    while queues:
+        for items in queues:
+            ordered.append(items.pop(0))
+        queues = [items for items in queues if len(items) > 0]
+    return ordered
 
 
 class Scheduler:
     def __init__(self, config=None):
         self.config = config
 
-        self.q_in = queue.Queue()
-        self.q_out = queue.Queue()
-        self.work_thread = threading.Thread(
-            target=execute_async, args=(self.q_in, self.q_out)
-        )
-        self.work_thread.start()
+        self.executor = None
+        # record_id -> running task
+        self.tasks = {}
+        self.lock = threading.Lock()
+        # wakes up the monitor on changes of jobs
+        self.listener = None
 
     def __del__(self):
         self.stop_thread()
 
+    def _get_config(self, name, default):
+        return (self.config or {}).get("jobs", {}).get(name, default)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(
+                max_workers=self._get_config("max_workers", DEFAULT_MAX_WORKERS),
+                thread_name_prefix="job_worker",
+            )
+        return self.executor
+
     def stop_thread(self):
-        self.q_in.put({"type": "exit"})
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    def _running_count(self) -> int:
+        with self.lock:
+            return len(self.tasks)
 
     def scheduler_monitor(self):
-        check_interval = self.config.get("jobs", {}).get("check_interval", 30)
+        self.listener = ChangeListener(JOBS_CHANNEL)
 
-        while True:
+        check_interval = self._get_config("check_interval", 30)
+        if self.listener.uses_db:
+            # changes are notified, jobs table is checked only in case of lost notifications
+            check_interval = max(check_interval, NOTIFIED_CHECK_INTERVAL)
 
+        next_heartbeat = time.monotonic() + HEARTBEAT_INTERVAL
+        while True:
             logger.debug("Scheduler check timetable")
+            next_run_at = None
             try:
                 self.check_timetable()
+                with self.lock:
+                    running_ids = list(self.tasks.keys())
+                next_run_at = JobsExecutor().get_next_run_at(exclude_ids=running_ids)
+                db.session.remove()
             except (SystemExit, KeyboardInterrupt):
                 raise
             except Exception as e:
                 logger.error(e)
+                db.session.rollback()
 
             # different instances should start in not the same time
+            wake_at = time.monotonic() + check_interval + random.randint(1, 10)
+            if next_run_at is not None:
+                delay = (next_run_at - dt.datetime.now()).total_seconds()
+                # past time: job is waiting for free worker or is executed by other instance
+                if delay > 0:
+                    wake_at = min(wake_at, time.monotonic() + delay)
+
+            # sleep until the next job, changes of jobs and the end of running jobs wake up earlier
+            while True:
+                if self._running_count() > 0 and time.monotonic() >= next_heartbeat:
+                    try:
+                        self.update_heartbeats()
+                    except (SystemExit, KeyboardInterrupt):
+                        raise
+                    except Exception as e:
+                        logger.error(f"Unable to update jobs history: {e}")
+                        db.session.rollback()
+                    next_heartbeat = time.monotonic() + HEARTBEAT_INTERVAL
+
+                timeout = wake_at - time.monotonic()
+                if timeout <= 0:
+                    break
+                if self._running_count() > 0:
+                    timeout = min(timeout, max(next_heartbeat - time.monotonic(), 0))
+                if self.listener.wait(timeout):
+                    break
 
-            time.sleep(check_interval + random.randint(1, 10))
-
-    def check_timetable(self):
+    def check_timetable(self, wait: bool = False):
+        """
+        Starts due jobs in workers, doesn't wait for them
+        :param wait: wait for the end of started jobs
+        """
         executor = JobsExecutor()
 
-        exec_method = self.config.get("jobs", {}).get("executor", "local")
+        exec_method = self._get_config("executor", "local")
 
-        for record in executor.get_next_tasks():
+        for record in fair_order(executor.get_next_tasks()):
+            if not self.can_execute(record):
+                continue
             logger.info(f"Job execute: {record.name}({record.id})")
-            self.execute_task(record.id, exec_method)
+            self.execute_task(record, exec_method)
 
         db.session.remove()
 
-    def execute_task(self, record_id, exec_method):
+        if wait:
+            self.wait_tasks()
+
+    def can_execute(self, record) -> bool:
+        with self.lock:
+            if record.id in self.tasks:
+                # is still running
+                return False
+
+            running = list(self.tasks.values())
+
+        max_workers = self._get_config("max_workers", DEFAULT_MAX_WORKERS)
+        max_company_tasks = self._get_config("max_company_tasks", DEFAULT_MAX_COMPANY_TASKS)
+        max_project_tasks = self._get_config("max_project_tasks", DEFAULT_MAX_PROJECT_TASKS)
+        if (
+            len(running) >= max_workers
+            or len([task for task in running if task["company_id"] == record.company_id]) >= max_company_tasks
+            or len([task for task in running if task["project_id"] == record.project_id]) >= max_project_tasks
+        ):
+            return False
+        return True
+
+    def execute_task(self, record, exec_method):
 
         executor = JobsExecutor()
         if exec_method == "local":
-            history_id = executor.lock_record(record_id)
+            history_id = executor.lock_record(record.id)
             if history_id is None:
                 # db.session.remove()
-                logger.info(f"Unable create history record for {record_id}, is locked?")
+                logger.info(f"Unable create history record for {record.id}, is locked?")
                 return
 
-            # run in thread
+            JOBS_SCHEDULE_LAG.observe(max((dt.datetime.now() - record.next_run_at).total_seconds(), 0))
 
-            self.q_in.put(
-                {
-                    "type": "task",
-                    "record_id": record_id,
-                    "history_id": history_id,
-                }
-            )
+            # run in thread
+            task = {
+                "company_id": record.company_id,
+                "project_id": record.project_id,
+                "history_id": history_id,
+            }
+            with self.lock:
+                self.tasks[record.id] = task
+            JOBS_RUNNING.inc()
 
-            while True:
-                try:
-                    self.q_out.get(timeout=3)
-                    break
-                except queue.Empty:
-                    # update last date:
-                    history_record = db.JobsHistory.query.get(history_id)
-                    history_record.updated_at = dt.datetime.now()
-                    db.session.commit()
+            task["future"] = self._get_executor().submit(self._execute_task, record.id, history_id)
 
         else:
             # TODO add microservice mode
             raise NotImplementedError()
 
+    def _execute_task(self, record_id, history_id):
+        try:
+            execute_async(record_id, history_id)
+        finally:
+            with self.lock:
+                self.tasks.pop(record_id, None)
+            JOBS_RUNNING.dec()
+            if self.listener is not None:
+                self.listener.wake()
+
+    def update_heartbeats(self):
+        """
+        Updates last date of all running jobs in one query
+        """
+        with self.lock:
+            history_ids = [task["history_id"] for task in self.tasks.values()]
+        if len(history_ids) == 0:
+            return
+
+        db.session.query(db.JobsHistory).filter(
+            db.JobsHistory.id.in_(history_ids)
+        ).update({"updated_at": dt.datetime.now()}, synchronize_session=False)
+        db.session.commit()
+
+    def wait_tasks(self):
+        with self.lock:
+            futures = [task["future"] for task in self.tasks.values() if "future" in task]
+        wait_futures(futures)
+
     def start(self):
 
         config = Config()
@@ -1,6 +1,8 @@
 import os
 import copy
-from typing import List
+import json
+import hashlib
+from typing import List, Optional
 
 import pandas as pd
 
@@ -12,18 +14,36 @@ from mindsdb_sql.parser.ast import (
     Select,
     Update,
     Delete,
-    Star
+    Star,
+    Tuple
 )
 from mindsdb_sql.parser.dialects.mindsdb import CreatePredictor
 
 import mindsdb.interfaces.storage.db as db
 from mindsdb.integrations.libs.vectordatabase_handler import TableField
+from mindsdb.integrations.libs.vector_column import to_vector_column
+from mindsdb.integrations.utilities.sql_utils import (
+    extract_comparison_conditions, filter_dataframe, project_dataframe
+)
 from mindsdb.interfaces.database.projects import ProjectController
+from mindsdb.interfaces.knowledge_base.keyword_index import KeywordIndex, KeywordIndexStore, reciprocal_rank_fusion
 from mindsdb.interfaces.model.functions import PredictorRecordNotFound
+from mindsdb.interfaces.storage.fs import FileStorage, RESOURCE_GROUP
 from mindsdb.utilities.exception import EntityExistsError, EntityNotExistsError
+from mindsdb.utilities import log
 
 from mindsdb.api.executor.command_executor import ExecuteCommands
 
+logger = log.getLogger(__name__)
+
+
+def is_hybrid_search_enabled(params: Optional[dict]) -> bool:
+    """Checks hybrid_search param of KB, it can be bool or string"""
+    value = (params or {}).get('hybrid_search', False)
+    if isinstance(value, str):
+        return value.lower() in ('true', '1')
+    return bool(value)
+
 
 class KnowledgeBaseTable:
     """
@@ -31,6 +51,11 @@ class KnowledgeBaseTable:
     Handlers requests to KB table and modifies data in linked vector db table
     """
 
+    DEFAULT_LIMIT = 10
+    # hybrid search: number of candidates from every retriever is limit * fetch factor
+    HYBRID_FETCH_FACTOR = 4
+    RRF_K = 60
+
     def __init__(self, kb: db.KnowledgeBase, session):
         self._kb = kb
         self._vector_db = None
@@ -44,6 +69,11 @@ class KnowledgeBaseTable:
         :return: dataframe with the result table
         """
 
+        if is_hybrid_search_enabled(self._kb.params):
+            df = self._hybrid_select(query)
+            if df is not None:
+                return df
+
         # replace content with embeddings
 
         utils.query_traversal(query.where, self._replace_query_content)
@@ -90,10 +120,28 @@ class KnowledgeBaseTable:
         # set table name
         query.table = Identifier(parts=[self._kb.vector_database_table])
 
+        updated_ids = None
+        if is_hybrid_search_enabled(self._kb.params) and cont_col in query.update_columns:
+            updated_ids = self._select_ids(query.where)
+
         # send to vectordb
         db_handler = self.get_vector_db()
         db_handler.query(query)
 
+        if updated_ids is not None and len(updated_ids) > 0:
+            content = query.update_columns[cont_col]
+            if isinstance(content, Constant):
+                contents = [content.value] * len(updated_ids)
+            else:
+                # content is an expression, read values which vector db stored
+                df = self._select_candidates(BinaryOperation(op='in', args=[
+                    Identifier(TableField.ID.value),
+                    Tuple([Constant(doc_id) for doc_id in updated_ids])
+                ]), [])
+                updated_ids = list(df[TableField.ID.value].astype(str))
+                contents = list(df[TableField.CONTENT.value])
+            self._get_keyword_store().update('add', updated_ids, contents)
+
     def delete_query(self, query: Delete):
         """
         Handles delete query to KB table.
@@ -105,10 +153,17 @@ class KnowledgeBaseTable:
         # set table name
         query.table = Identifier(parts=[self._kb.vector_database_table])
 
+        deleted_ids = None
+        if is_hybrid_search_enabled(self._kb.params):
+            deleted_ids = self._select_ids(query.where)
+
         # send to vectordb
         db_handler = self.get_vector_db()
         db_handler.query(query)
 
+        if deleted_ids is not None:
+            self._get_keyword_store().update('remove', deleted_ids)
+
     def clear(self):
         """
         Clear data in KB table
@@ -117,6 +172,9 @@ class KnowledgeBaseTable:
         db_handler = self.get_vector_db()
         db_handler.delete(self._kb.vector_database_table)
 
+        if is_hybrid_search_enabled(self._kb.params):
+            self._get_keyword_store().update('clear')
+
     def insert(self, df: pd.DataFrame):
         """
         Insert dataframe to KB table
@@ -129,6 +187,11 @@ class KnowledgeBaseTable:
 
         df = self._adapt_column_names(df)
 
+        hybrid_search = is_hybrid_search_enabled(self._kb.params)
+        if hybrid_search:
+            # keyword index needs ids: generate them in the same way as vector handler does
+            df = self._fill_ids(df)
+
         # add embeddings
         df_emb = self._df_to_embeddings(df)
         df = pd.concat([df, df_emb], axis=1)
@@ -137,6 +200,232 @@ class KnowledgeBaseTable:
         db_handler = self.get_vector_db()
         db_handler.do_upsert(self._kb.vector_database_table, df)
 
+        if hybrid_search:
+            self._get_keyword_store().update('add', df[TableField.ID.value], df[TableField.CONTENT.value])
+
+    @staticmethod
+    def _fill_ids(df: pd.DataFrame) -> pd.DataFrame:
+        id_col = TableField.ID.value
+
+        def gen_hash(v):
+            return hashlib.md5(str(v).encode()).hexdigest()
+
+        df = df.reset_index(drop=True)
+        content_ids = df[TableField.CONTENT.value].apply(gen_hash)
+        if id_col not in df.columns:
+            df[id_col] = content_ids
+        else:
+            df[id_col] = df[id_col].where(df[id_col].notna(), content_ids)
+        df[id_col] = df[id_col].apply(str)
+        return df
+
+    def _hybrid_select(self, query: Select) -> Optional[pd.DataFrame]:
+        """
+        Hybrid retrieval: vector top-k from vector db and BM25 top-k from the keyword index,
+        merged with reciprocal rank fusion.
+        Metadata filters are sent to vector db, if it can't handle them they are applied to candidates locally.
+        Returns None if query can't be handled in hybrid mode (no content search, OR in conditions)
+        """
+        nodes = self._split_where(query.where)
+        if nodes is None:
+            return None
+
+        content_nodes = [node for node in nodes if self._is_content_condition(node)]
+        if len(content_nodes) != 1 or content_nodes[0].op != '=':
+            return None
+        filters = [node for node in nodes if node is not content_nodes[0]]
+        text = content_nodes[0].args[1].value
+
+        limit = query.limit.value if query.limit is not None else self.DEFAULT_LIMIT
+        offset = query.offset.value if query.offset is not None else 0
+        params = self._kb.params or {}
+        fetch_limit = (limit + offset) * int(params.get('hybrid_fetch_factor', self.HYBRID_FETCH_FACTOR))
+
+        id_col = TableField.ID.value
+
+        # vector search
+        search = BinaryOperation(op='=', args=[
+            Identifier(TableField.EMBEDDINGS.value),
+            Constant([self._content_to_embeddings(text)])
+        ])
+        candidates = self._select_candidates(search, filters, fetch_limit)
+        candidates[id_col] = candidates[id_col].astype(str)
+        vector_ranking = list(candidates[id_col])
+
+        # keyword search
+        keyword_ids = [doc_id for doc_id, _ in self.get_keyword_index().search(text, fetch_limit)]
+        missed_ids = list(set(keyword_ids).difference(vector_ranking))
+        if len(missed_ids) > 0:
+            by_ids = BinaryOperation(op='in', args=[
+                Identifier(id_col),
+                Tuple([Constant(doc_id) for doc_id in missed_ids])
+            ])
+            keyword_candidates = self._select_candidates(by_ids, filters)
+            keyword_candidates[id_col] = keyword_candidates[id_col].astype(str)
+            candidates = pd.concat([candidates, keyword_candidates], ignore_index=True)
+        # rows filtered out by vector db are excluded from ranking
+        found_ids = set(candidates[id_col])
+        keyword_ranking = [doc_id for doc_id in keyword_ids if doc_id in found_ids]
+
+        fused = reciprocal_rank_fusion(
+            [vector_ranking, keyword_ranking],
+            k=int(params.get('rrf_k', self.RRF_K))
+        )[offset:offset + limit]
+
+        candidates = candidates.drop_duplicates(id_col).set_index(id_col)
+        df = candidates.loc[[doc_id for doc_id, _ in fused]].reset_index()
+        df['relevance'] = [score for _, score in fused]
+
+        table_columns = [TableField.ID.value, TableField.CONTENT.value, TableField.METADATA.value]
+        if TableField.DISTANCE.value in df.columns:
+            table_columns.append(TableField.DISTANCE.value)
+        table_columns.append('relevance')
+        targets = [
+            target for target in query.targets
+            if isinstance(target, Star)
+            or isinstance(target, Identifier) and target.parts[-1].lower() != TableField.EMBEDDINGS.value
+        ]
+        return project_dataframe(df, targets, table_columns)
+
+    @staticmethod
+    def _split_where(where) -> Optional[list]:
+        """
+        Splits 'and' chain to list of conditions.
+        Returns None if there are other operations (OR, NOT)
+        """
+        if where is None:
+            return []
+        if not isinstance(where, BinaryOperation):
+            return None
+        if where.op.lower() == 'and':
+            left = KnowledgeBaseTable._split_where(where.args[0])
+            right = KnowledgeBaseTable._split_where(where.args[1])
+            if left is None or right is None:
+                return None
+            return left + right
+        if where.op.lower() == 'or':
+            return None
+        return [where]
+
+    @staticmethod
+    def _is_content_condition(node: BinaryOperation) -> bool:
+        return (
+            isinstance(node.args[0], Identifier)
+            and isinstance(node.args[1], Constant)
+            and node.args[0].parts[-1].lower() == TableField.CONTENT.value
+        )
+
+    def _select_candidates(self, condition: BinaryOperation, filters: list, limit: int = None) -> pd.DataFrame:
+        """
+        Selects id, content and metadata from vector db
+        Filters are pushed down to vector db, on error they are applied to the result
+        """
+        where = condition
+        for node in filters:
+            where = BinaryOperation(op='and', args=[where, copy.deepcopy(node)])
+
+        query = Select(
+            targets=[
+                Identifier(TableField.ID.value),
+                Identifier(TableField.CONTENT.value),
+                Identifier(TableField.METADATA.value),
+            ],
+            from_table=Identifier(parts=[self._kb.vector_database_table]),
+            where=where,
+            limit=Constant(limit) if limit is not None else None
+        )
+        db_handler = self.get_vector_db()
+        try:
+            return db_handler.query(query).data_frame
+        except Exception as e:
+            if len(filters) == 0:
+                raise
+            logger.info(f'Vector database can not apply filters, filtering locally: {e}')
+
+        query.where = condition
+        df = db_handler.query(query).data_frame
+        return self._filter_candidates(df, filters)
+
+    @staticmethod
+    def _filter_candidates(df: pd.DataFrame, filters: list) -> pd.DataFrame:
+        """
+        Applies conditions to id, content and metadata fields of rows
+        """
+        if df.empty:
+            return df
+
+        def parse_metadata(value):
+            if isinstance(value, str):
+                try:
+                    value = json.loads(value)
+                except ValueError:
+                    value = None
+            return value if isinstance(value, dict) else {}
+
+        id_col = TableField.ID.value
+        content_col = TableField.CONTENT.value
+        metadata_prefix = TableField.METADATA.value + '.'
+
+        conditions = []
+        for node in filters:
+            for op, column, value in extract_comparison_conditions(node):
+                column = column.strip('`')
+                if column.startswith(metadata_prefix):
+                    column = column[len(metadata_prefix):]
+                conditions.append([op, column, value])
+
+        df = df.reset_index(drop=True)
+        if TableField.METADATA.value in df.columns:
+            values = [parse_metadata(value) for value in df[TableField.METADATA.value]]
+        else:
+            values = [{}] * len(df)
+        fields = pd.DataFrame(values, index=df.index)
+        fields[id_col] = df[id_col].values
+        fields[content_col] = df[content_col].values
+        fields['_row_num'] = range(len(df))
+        for _, column, _ in conditions:
+            if column not in fields.columns:
+                fields[column] = None
+
+        filtered = filter_dataframe(fields, conditions)
+        return df.iloc[list(filtered['_row_num'])].reset_index(drop=True)
+
+    def _select_ids(self, where) -> List[str]:
+        """Ids of records in vector db which match the condition"""
+        query = Select(
+            targets=[Identifier(TableField.ID.value)],
+            from_table=Identifier(parts=[self._kb.vector_database_table]),
+            where=copy.deepcopy(where)
+        )
+        df = self.get_vector_db().query(query).data_frame
+        return list(df[TableField.ID.value].astype(str))
+
+    def _get_keyword_store(self) -> KeywordIndexStore:
+        """
+        Returns storage of keyword index of KB. If index doesn't exist it is built from vector db table
+        """
+        def build() -> KeywordIndex:
+            df = self.get_vector_db().query(Select(
+                targets=[Identifier(TableField.ID.value), Identifier(TableField.CONTENT.value)],
+                from_table=Identifier(parts=[self._kb.vector_database_table]),
+            )).data_frame
+            index = KeywordIndex()
+            index.add(df[TableField.ID.value], df[TableField.CONTENT.value])
+            return index
+
+        storage = FileStorage(
+            resource_group=RESOURCE_GROUP.KNOWLEDGE_BASE,
+            resource_id=self._kb.id,
+            sync=False
+        )
+        return KeywordIndexStore(storage, build)
+
+    def get_keyword_index(self) -> KeywordIndex:
+        """
+        Returns keyword index of KB, loaded index is reused and only new changes are applied to it.
+        """
+        return self._get_keyword_store().get()
+
     def _adapt_column_names(self, df: pd.DataFrame) -> pd.DataFrame:
 
         '''
@@ -305,6 +594,8 @@ class KnowledgeBaseTable:
             # adapt output for vectordb
             df_out = df_out.rename(columns={target: TableField.EMBEDDINGS.value})
         df_out = df_out[[TableField.EMBEDDINGS.value]]
+        # send vectors to vector db as float32 arrays
+        df_out[TableField.EMBEDDINGS.value] = to_vector_column(df_out[TableField.EMBEDDINGS.value])
 
         return df_out
 
@@ -316,7 +607,7 @@ class KnowledgeBaseTable:
         """
         df = pd.DataFrame([[content]], columns=[TableField.CONTENT.value])
         res = self._df_to_embeddings(df)
-        return res[TableField.EMBEDDINGS.value][0]
+        return res[TableField.EMBEDDINGS.value][0].tolist()
 
 
 class KnowledgeBaseController:
@@ -506,6 +797,11 @@ class KnowledgeBaseController:
                 kb.vector_database_table
             )
 
+        if is_hybrid_search_enabled(kb.params):
+            storage = FileStorage(resource_group=RESOURCE_GROUP.KNOWLEDGE_BASE, resource_id=kb.id)
+            KeywordIndexStore(storage).forget()
+            storage.delete()
+
         # kb exists
         db.session.delete(kb)
         db.session.commit()
@@ -0,0 +1,268 @@
+import re
+import math
+import heapq
+import pickle
+import threading
+from collections import Counter
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from mindsdb.interfaces.storage.fs import FileStorage, FileLock
+
+
+TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+SNAPSHOT_FILE = 'keyword_index.pkl'
+DELTA_FILE_PATTERN = re.compile(r'^keyword_index_delta_(\d+)\.pkl$')
+# name of the folder with lock file, it is separated from the lock of the storage folder
+LOCK_NAME = 'keyword_index_lock'
+# deltas are merged to snapshot if there are more files than this
+MAX_DELTAS = 1000
+
+# loaded indexes: storage folder name -> (snapshot seq, last applied delta seq, index)
+_loaded_indexes = {}
+_thread_lock = threading.RLock()
+
+
+def tokenize(text) -> List[str]:
+    if text is None:
+        return []
+    return TOKEN_PATTERN.findall(str(text).lower())
+
+
+class KeywordIndex:
+    """
+    Inverted index of knowledge base content with BM25 ranking.
+    Documents are identified by the id of the record in the vector db
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        # term -> {doc id: term frequency}
+        self._postings = {}
+        # doc id -> (terms, document length)
+        self._docs = {}
+        self._total_length = 0
+
+    def __len__(self):
+        return len(self._docs)
+
+    def __contains__(self, doc_id):
+        return doc_id in self._docs
+
+    def clear(self):
+        self._postings = {}
+        self._docs = {}
+        self._total_length = 0
+
+    def add(self, ids: Iterable, contents: Iterable):
+        """Adds documents, documents with existing ids are replaced"""
+        for doc_id, content in zip(ids, contents):
+            doc_id = str(doc_id)
+            self._remove(doc_id)
+
+            counts = Counter(tokenize(content))
+            length = sum(counts.values())
+            for term, tf in counts.items():
+                self._postings.setdefault(term, {})[doc_id] = tf
+            self._docs[doc_id] = (tuple(counts.keys()), length)
+            self._total_length += length
+
+    def remove(self, ids: Iterable):
+        for doc_id in ids:
+            self._remove(str(doc_id))
+
+    def _remove(self, doc_id: str):
+        doc = self._docs.pop(doc_id, None)
+        if doc is None:
+            return
+        terms, length = doc
+        for term in terms:
+            postings = self._postings[term]
+            del postings[doc_id]
+            if len(postings) == 0:
+                del self._postings[term]
+        self._total_length -= length
+
+    def search(self, query: str, limit: int) -> List[Tuple[str, float]]:
+        """
+        Ranks documents by BM25 score
+        :param query: text to search
+        :param limit: number of documents to return
+        :return: list of (doc id, score), the best first
+        """
+        count = len(self._docs)
+        if count == 0 or limit <= 0:
+            return []
+        avg_length = self._total_length / count
+
+        scores = {}
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, tf in postings.items():
+                length = self._docs[doc_id][1]
+                norm = self.k1 * (1 - self.b + self.b * length / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0) + idf * tf * (self.k1 + 1) / (tf + norm)
+
+        return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+
+    def apply(self, operation: str, args: tuple):
+        """Applies change which was stored in delta: ('add', ids, contents), ('remove', ids) or ('clear',)"""
+        if operation == 'add':
+            self.add(*args)
+        elif operation == 'remove':
+            self.remove(*args)
+        elif operation == 'clear':
+            self.clear()
+        else:
+            raise ValueError(f'Unknown operation: {operation}')
+
+    def to_bytes(self) -> bytes:
+        return pickle.dumps(self.__dict__, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'KeywordIndex':
+        index = cls()
+        index.__dict__.update(pickle.loads(data))
+        return index
+
+
+def _delta_file_name(seq: int) -> str:
+    return f'keyword_index_delta_{seq:010d}.pkl'
+
+
+class KeywordIndexStore:
+    """
+    Keeps keyword index in the file storage as a snapshot and a log of changes (deltas).
+
+    A change is written as a small delta file, so the cost of a write depends on the size of the change,
+    not of the index. Deltas are merged into the snapshot when their size exceeds the size of the snapshot.
+    The index is read and changed under the lock, so concurrent writers don't lose updates of each other.
+
+    Loaded index is kept in memory and only new deltas are applied to it on the next read.
+    """
+
+    def __init__(self, storage: FileStorage, build: Optional[Callable[[], KeywordIndex]] = None):
+        """
+        :param storage: file storage of the knowledge base
+        :param build: function to build the index if it is not stored yet
+        """
+        self.storage = storage
+        self.build = build
+        self._key = storage.folder_name
+
+    def _lock(self) -> FileLock:
+        return FileLock(self.storage.folder_path / LOCK_NAME, mode='w')
+
+    def _list_deltas(self) -> List[Tuple[int, str]]:
+        deltas = []
+        for path in self.storage.folder_path.iterdir():
+            match = DELTA_FILE_PATTERN.match(path.name)
+            if match is not None:
+                deltas.append((int(match.group(1)), path.name))
+        return sorted(deltas)
+
+    def _snapshot_stamp(self) -> Optional[tuple]:
+        path = self.storage.folder_path / SNAPSHOT_FILE
+        if not path.exists():
+            return None
+        stat = path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read_snapshot(self) -> Tuple[int, Optional[KeywordIndex]]:
+        if self._snapshot_stamp() is None:
+            return 0, None
+        snapshot = pickle.loads(self.storage.file_get(SNAPSHOT_FILE))
+        return snapshot['seq'], KeywordIndex.from_bytes(snapshot['index'])
+
+    def _write_snapshot(self, seq: int, index: KeywordIndex):
+        snapshot = {'seq': seq, 'index': index.to_bytes()}
+        self.storage.file_set(SNAPSHOT_FILE, pickle.dumps(snapshot, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def _load(self, build: bool = True) -> Tuple[int, KeywordIndex]:
+        # has to be called under the lock
+        deltas = self._list_deltas()
+        stamp = self._snapshot_stamp()
+
+        cached = _loaded_indexes.get(self._key)
+        if cached is not None and cached[0] == stamp:
+            # snapshot wasn't replaced by another process
+            _, seq, index = cached
+        else:
+            seq, index = self._read_snapshot()
+            if index is None:
+                index = KeywordIndex()
+                if build and self.build is not None and len(deltas) == 0:
+                    index = self.build()
+                    self._write_snapshot(seq, index)
+                    stamp = self._snapshot_stamp()
+
+        for delta_seq, name in deltas:
+            if delta_seq <= seq:
+                # it is already merged to snapshot
+                continue
+            operation, args = pickle.loads(self.storage.file_get(name))
+            index.apply(operation, args)
+            seq = delta_seq
+
+        _loaded_indexes[self._key] = (stamp, seq, index)
+        return seq, index
+
+    def get(self) -> KeywordIndex:
+        """
+        :return: current index
+        """
+        with _thread_lock, self._lock():
+            self.storage.pull()
+            return self._load()[1]
+
+    def update(self, operation: str, *args):
+        """
+        Stores change of the index and applies it to the loaded index
+        :param operation: 'add' (args: ids, contents), 'remove' (args: ids) or 'clear'
+        """
+        args = tuple(list(arg) for arg in args)
+        with _thread_lock, self._lock():
+            self.storage.pull()
+            # index is not built if it is cleared anyway
+            seq, index = self._load(build=operation != 'clear')
+            index.apply(operation, args)
+            seq += 1
+
+            deltas = self._list_deltas()
+            if operation == 'clear':
+                merge = True
+            else:
+                name = _delta_file_name(seq)
+                self.storage.file_set(name, pickle.dumps((operation, args), protocol=pickle.HIGHEST_PROTOCOL))
+                deltas.append((seq, name))
+                snapshot_size = (self._snapshot_stamp() or (0, 0))[1]
+                deltas_size = sum((self.storage.folder_path / name).stat().st_size for _, name in deltas)
+                merge = deltas_size > snapshot_size or len(deltas) > MAX_DELTAS
+
+            if merge:
+                self._write_snapshot(seq, index)
+                for _, name in deltas:
+                    (self.storage.folder_path / name).unlink(missing_ok=True)
+            _loaded_indexes[self._key] = (self._snapshot_stamp(), seq, index)
+            self.storage.push()
+
+    def forget(self):
+        """Removes loaded index from memory"""
+        with _thread_lock:
+            _loaded_indexes.pop(self._key, None)
+
+
+def reciprocal_rank_fusion(rankings: List[List[str]], k: int = 60) -> List[Tuple[str, float]]:
+    """
+    Merges ranked lists of ids: score of id is sum of 1 / (k + rank) over lists
+    :return: list of (id, score), the best first
+    """
+    scores = {}
+    for ranking in rankings:
+        for rank, doc_id in enumerate(ranking, start=1):
+            scores[doc_id] = scores.get(doc_id, 0) + 1 / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
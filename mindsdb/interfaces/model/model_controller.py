@@ -283,6 +283,10 @@ class ModelController():
             join_learn_process = problem_definition['using']['join_learn_process']
             del problem_definition['using']['join_learn_process']
 
+        # is not passed to the engine, but kept for retraining
+        if 'stream_training_data' in problem_definition.get('using', {}):
+            problem_definition['stream_training_data'] = problem_definition['using'].pop('stream_training_data')
+
         return dict(
             model_name=model_name,
             project_name=project_name,
@@ -362,6 +366,7 @@ class ModelController():
             args = statement.using
 
         join_learn_process = args.pop('join_learn_process', False)
+        stream_training_data = args.pop('stream_training_data', None)
 
         base_predictor_record = get_model_record(
             name=model_name,
@@ -383,6 +388,7 @@ class ModelController():
             base_model_version=model_version,
             args=args,
             join_learn_process=join_learn_process,
+            stream_training_data=stream_training_data,
             label=label,
             set_active=set_active
         )
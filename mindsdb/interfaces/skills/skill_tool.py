@@ -68,7 +68,7 @@ class SkillToolController:
                 'To use the text-to-SQL skill, please install langchain with `pip install mindsdb[langchain]`')
         database = skill.params['database']
         tables = skill.params['tables']
-        tables_to_include = [f'{database}.{table}' for table in tables]
+        tables_to_include = self._get_sql_skill_tables(skill)
         db = MindsDBSQL(
             engine=self.get_command_executor(),
             database=database,
@@ -94,6 +94,22 @@ class SkillToolController:
                 sql_database_tools[i] = tool
         return sql_database_tools
 
+    @staticmethod
+    def _get_sql_skill_tables(skill: db.Skills) -> List[str]:
+        database = skill.params['database']
+        return [f'{database}.{table}' for table in skill.params['tables']]
+
+    def warm_up(self, skill: db.Skills):
+        """
+        Prepares the skill to be used by agent: info of tables of text-to-SQL skill is collected in background
+        """
+        if skill.type not in (SkillType.TEXT2SQL.value, SkillType.TEXT2SQL_LEGACY.value):
+            return
+        self.get_sql_agent(
+            skill.params['database'],
+            include_tables=self._get_sql_skill_tables(skill),
+        ).warm_up()
+
     def _make_retrieval_tools(self, skill: db.Skills, llm) -> dict:
         """
         creates advanced retrieval tool i.e. RAG
@@ -116,10 +132,11 @@ class SkillToolController:
     def _get_rag_query_function(self, skill: db.Skills):
 
         session_controller = self.get_command_executor().session
+        # tool can be used after the end of db session where the skill was loaded
+        knowledge_base_name = skill.params['source']
+        project_id = skill.project_id
 
         def _answer_question(question: str) -> str:
-            knowledge_base_name = skill.params['source']
-
             # make select in KB table
             query = Select(
                 targets=[Star()],
@@ -128,7 +145,7 @@ class SkillToolController:
                 ]),
                 limit=Constant(_DEFAULT_TOP_K_SIMILARITY_SEARCH),
             )
-            kb_table = session_controller.kb_controller.get_table(knowledge_base_name, skill.project_id)
+            kb_table = session_controller.kb_controller.get_table(knowledge_base_name, project_id)
 
             res = kb_table.select_query(query)
             return '\n'.join(res.content)
@@ -1,7 +1,11 @@
-from typing import Iterable, List, Optional
+from typing import Callable, Iterable, List, Optional
 
 import re
+import time
 import hashlib
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 from mindsdb_sql.parser.ast import Select, Show, Describe, Explain
 
 import pandas as pd
@@ -9,11 +13,54 @@ from mindsdb_sql import parse_sql
 from mindsdb_sql.parser.ast import Identifier
 from mindsdb_sql.planner.utils import query_traversal
 
+from mindsdb.interfaces.storage import db
 from mindsdb.utilities import log
 from mindsdb.utilities.context import context as ctx
+from mindsdb.utilities.context_executor import ContextThreadPoolExecutor
 
 logger = log.getLogger(__name__)
 
+# cached info is returned and refreshed in background if it is older
+TABLE_INFO_REFRESH_SECONDS = 300
+# count of tables which info is fetched at the same time
+TABLE_INFO_MAX_WORKERS = 8
+
+_background_executor = None
+_background_keys = set()
+_background_lock = threading.Lock()
+
+
+def run_in_background(key: str, func: Callable):
+    """
+    Calls func in background thread with the current context.
+    Call is skipped if the function with the same key is still running
+    """
+    global _background_executor
+
+    with _background_lock:
+        if key in _background_keys:
+            return
+        _background_keys.add(key)
+        if _background_executor is None:
+            _background_executor = ThreadPoolExecutor(
+                max_workers=TABLE_INFO_MAX_WORKERS,
+                thread_name_prefix='sql_agent'
+            )
+
+    context = contextvars.copy_context()
+
+    def _run():
+        try:
+            context.run(func)
+        except Exception as e:
+            logger.warning(f'Background task {key} failed: {e}')
+        finally:
+            db.session.remove()
+            with _background_lock:
+                _background_keys.discard(key)
+
+    _background_executor.submit(_run)
+
 
 class SQLAgent:
 
@@ -73,37 +120,67 @@ class SQLAgent:
 
             query_traversal(ast_query, _check_f)
 
-    def get_usable_table_names(self) -> Iterable[str]:
+    def _get_catalog_version(self) -> tuple:
+        # Top-level import produces circular import
+        from mindsdb.api.executor.controllers.session_pool import get_catalog_version
 
-        cache_key = f'{ctx.company_id}_{self._database}_tables'
+        return get_catalog_version(ctx.company_id)
 
-        # first check cache and return if found
-        if self._cache:
-            cached_tables = self._cache.get(cache_key)
-            if cached_tables:
-                return cached_tables
+    def _get_cache_key(self, version: tuple, *parts) -> str:
+        """
+        Cache key of the info in the version of the catalog: info is not used after integrations or projects are changed
+        """
+        full_key = '_'.join(
+            [str(ctx.company_id), self._database, str(version)]
+            + [str(part) for part in parts]
+        )
+        # Hash the full key to ensure a constant length
+        return hashlib.sha256(full_key.encode()).hexdigest()
 
+    def _get_cached(self, cache_key: str, fetch: Callable):
+        """
+        Returns value from the cache, missing value is fetched and saved to the cache.
+        Outdated value is returned and refreshed in background
+        """
+        if not self._cache:
+            return fetch()
+
+        def _fetch_to_cache():
+            value = fetch()
+            self._cache.set(cache_key, {'value': value, 'created_at': time.time()})
+            return value
+
+        cached = self._cache.get(cache_key)
+        if cached is None:
+            return _fetch_to_cache()
+
+        if time.time() - cached['created_at'] > TABLE_INFO_REFRESH_SECONDS:
+            run_in_background(cache_key, _fetch_to_cache)
+        return cached['value']
+
+    def get_usable_table_names(self) -> Iterable[str]:
         if self._tables_to_include:
             return self._tables_to_include
 
+        cache_key = self._get_cache_key(self._get_catalog_version(), 'tables', sorted(self._tables_to_ignore))
+        return self._get_cached(cache_key, self._fetch_usable_table_names)
+
+    def _fetch_usable_table_names(self) -> List[str]:
         ret = self._call_engine('show databases;')
         dbs = [lst[0] for lst in ret.data.to_lists() if lst[0] != 'information_schema']
         usable_tables = []
-        for db in dbs:
-            if db != 'mindsdb' and db == self._database:
+        for db_name in dbs:
+            if db_name != 'mindsdb' and db_name == self._database:
                 try:
-                    ret = self._call_engine('show tables', database=db)
+                    ret = self._call_engine('show tables', database=db_name)
                     tables = [lst[0] for lst in ret.data.to_lists() if lst[0] != 'information_schema']
                     for table in tables:
                         # By default, include all tables in a database unless expilcitly ignored.
-                        table_name = f'{db}.{table}'
+                        table_name = f'{db_name}.{table}'
                         if table_name not in self._tables_to_ignore:
                             usable_tables.append(table_name)
                 except Exception as e:
-                    logger.warning('Unable to get tables for %s: %s', db, str(e))
-        if self._cache:
-            self._cache.set(cache_key, set(usable_tables))
-
+                    logger.warning('Unable to get tables for %s: %s', db_name, str(e))
         return usable_tables
 
     def _resolve_table_names(self, table_names: List[str], all_tables: List[Identifier]) -> List[Identifier]:
@@ -145,60 +222,52 @@ class SQLAgent:
         appended to each table description. This can increase performance as demonstrated in the paper.
         """
         try:
-            cache_key = self._generate_cache_key(table_names)
-            tables_info = self._get_info_from_cache(cache_key, table_names)
-
-            if not tables_info:
-                tables_info = self._fetch_table_info(table_names)
-                self._update_cache(cache_key, tables_info)
-
+            tables_info = self._fetch_table_info(table_names)
             return "\n\n".join(tables_info.values())
         except Exception as e:
             logger.error(f"Error fetching table info: {e}")
             return f"Error fetching table info: {e}"
 
-    def _generate_cache_key(self, table_names: Optional[List[str]]) -> str:
-        # Base part of the cache key
-        base_key = f"{ctx.company_id}_{self._database}_table_info"
-
-        # If table names are provided, sort and concatenate them
-        if table_names:
-            sorted_names = "_".join(sorted(table_names))
-            full_key = f"{base_key}_{sorted_names}"
-        else:
-            full_key = base_key
-
-        # Hash the full key to ensure a constant length
-        hashed_key = hashlib.sha256(full_key.encode()).hexdigest()
-
-        return hashed_key
-
-    def _get_info_from_cache(self, cache_key: str, table_names: Optional[List[str]]) -> dict:
-        """Retrieve table information from cache if available."""
-        cached_info = self._cache.get(cache_key) if self._cache else None
-        if cached_info and table_names:
-            # Verify all requested tables are in cache
-            missing_tables = set([name for name in table_names if name not in cached_info])
-            if not missing_tables:
-                return {name: cached_info[name] for name in table_names}
-        return cached_info if not table_names else {}
-
     def _fetch_table_info(self, table_names: Optional[List[str]]) -> dict:
-        """Fetch table information from the database."""
+        """
+        Fetch information of tables. Info of every table is cached, missing tables are fetched in parallel
+        """
         all_tables = [Identifier(name) for name in self.get_usable_table_names()]
 
         if table_names is not None:
             all_tables = self._resolve_table_names(table_names, all_tables)
 
+        version = self._get_catalog_version()
+        cache_keys = [
+            self._get_cache_key(version, 'table_info', table.to_string(), self._sample_rows_in_table_info)
+            for table in all_tables
+        ]
+
+        def _get_info(i):
+            return self._get_cached(cache_keys[i], lambda: self._get_single_table_info(all_tables[i]))
+
+        def _get_info_in_thread(i):
+            try:
+                return _get_info(i)
+            finally:
+                db.session.remove()
+
+        if len(all_tables) <= 1:
+            infos = [_get_info(i) for i in range(len(all_tables))]
+        else:
+            with ContextThreadPoolExecutor(max_workers=min(TABLE_INFO_MAX_WORKERS, len(all_tables))) as executor:
+                infos = list(executor.map(_get_info_in_thread, range(len(all_tables))))
+
         tables_info = {}
-        for table in all_tables:
-            tables_info[table.parts[-1]] = self._get_single_table_info(table)
+        for table, info in zip(all_tables, infos):
+            tables_info[table.parts[-1]] = info
         return tables_info
 
-    def _update_cache(self, cache_key: str, tables_info: dict) -> None:
-        """Update the cache with the provided table information."""
-        if self._cache:
-            self._cache.set(cache_key, tables_info)
+    def warm_up(self):
+        """
+        Fills the cache with info of usable tables in background, so the first question to the agent doesn't wait for it
+        """
+        run_in_background(self._get_cache_key(self._get_catalog_version(), 'warm_up'), self.get_table_info)
 
     def _get_single_table_info(self, table: Identifier) -> str:
         if len(table.parts) < 2:
@@ -38,6 +38,7 @@ class RESOURCE_GROUP:
     PREDICTOR = 'predictor'
     INTEGRATION = 'integration'
     TAB = 'tab'
+    KNOWLEDGE_BASE = 'knowledge_base'
 
 
 RESOURCE_GROUP = RESOURCE_GROUP()
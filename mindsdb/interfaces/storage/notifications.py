@@ -0,0 +1,149 @@
+"""
+Notifications about changes of records in the metadata database.
+
+Processes which wait for changes (jobs scheduler, task monitor) use ChangeListener instead of polling of
+tables. If the database is postgres, notifications are sent between processes with LISTEN/NOTIFY,
+otherwise only listeners in the same process are notified and the waiting process has to poll the database.
+"""
+import select
+import socket
+import threading
+
+import sqlalchemy as sa
+
+from mindsdb.interfaces.storage import db
+from mindsdb.utilities import log
+
+logger = log.getLogger(__name__)
+
+JOBS_CHANNEL = 'mindsdb_jobs'
+TASKS_CHANNEL = 'mindsdb_tasks'
+
+_listeners = {}
+_listeners_lock = threading.Lock()
+
+
+def _is_postgres() -> bool:
+    return db.engine is not None and db.engine.dialect.name == 'postgresql'
+
+
+def notify(channel: str):
+    """
+    Notifies listeners about change in the channel. Has to be called after commit of the change
+    :param channel: name of the channel
+    """
+    if _is_postgres():
+        try:
+            db.session.execute(sa.text('select pg_notify(:channel, :payload)'), {'channel': channel, 'payload': ''})
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.warning(f'Unable to send notification to {channel}: {e}')
+
+    with _listeners_lock:
+        listeners = list(_listeners.get(channel, []))
+    for listener in listeners:
+        listener.wake()
+
+
+class ChangeListener:
+    """
+    Waits for notifications in the channel
+
+    Usage:
+        listener = ChangeListener(JOBS_CHANNEL)
+        while True:
+            ...
+            listener.wait(timeout)
+    """
+
+    def __init__(self, channel: str):
+        self.channel = channel
+        self._connection = None
+
+        # is used to wake up from select
+        self._wakeup_r, self._wakeup_w = socket.socketpair()
+        self._wakeup_r.setblocking(False)
+        self._wakeup_w.setblocking(False)
+
+        self._listen()
+
+        with _listeners_lock:
+            _listeners.setdefault(channel, set()).add(self)
+
+    @property
+    def uses_db(self) -> bool:
+        """Notifications from other processes are received"""
+        return self._connection is not None
+
+    def _listen(self):
+        if not _is_postgres() or db.engine.dialect.driver != 'psycopg2':
+            return
+        try:
+            # dedicated connection, it is not returned to the pool
+            connection = db.engine.raw_connection()
+            connection.detach()
+            connection = connection.driver_connection
+            connection.autocommit = True
+            with connection.cursor() as cursor:
+                cursor.execute(f'LISTEN {self.channel}')
+            self._connection = connection
+        except Exception as e:
+            logger.warning(f'Unable to listen {self.channel}, changes will be polled: {e}')
+
+    def _close_connection(self):
+        try:
+            self._connection.close()
+        except Exception:
+            pass
+        self._connection = None
+
+    def wake(self):
+        """Interrupts waiting"""
+        try:
+            self._wakeup_w.send(b'\0')
+        except (BlockingIOError, OSError):
+            # buffer is full: listener is already woken up
+            pass
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Waits for notification
+        :param timeout: maximum time of waiting in seconds
+        :return: True if notification was received
+        """
+        sockets = [self._wakeup_r]
+        if self._connection is not None:
+            sockets.append(self._connection)
+
+        ready, _, _ = select.select(sockets, [], [], max(timeout, 0))
+
+        notified = False
+        if self._wakeup_r in ready:
+            try:
+                while self._wakeup_r.recv(1024):
+                    pass
+            except (BlockingIOError, OSError):
+                pass
+            notified = True
+
+        if self._connection is not None and self._connection in ready:
+            try:
+                self._connection.poll()
+                if len(self._connection.notifies) > 0:
+                    self._connection.notifies.clear()
+                    notified = True
+            except Exception as e:
+                # notifications could be lost, caller has to check changes
+                logger.warning(f'Connection for notifications is lost, changes will be polled: {e}')
+                self._close_connection()
+                notified = True
+        return notified
+
+    def close(self):
+        with _listeners_lock:
+            _listeners.get(self.channel, set()).discard(self)
+        if self._connection is not None:
+            self._close_connection()
+        self._wakeup_r.close()
+        self._wakeup_w.close()
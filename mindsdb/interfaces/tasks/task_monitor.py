@@ -1,11 +1,11 @@
 import datetime as dt
 import os
 import socket
-import time
 
 import sqlalchemy as sa
 
 from mindsdb.interfaces.storage import db
+from mindsdb.interfaces.storage.notifications import ChangeListener, TASKS_CHANNEL
 from mindsdb.utilities import log
 from mindsdb.utilities.config import Config
 
@@ -17,6 +17,8 @@ logger = log.getLogger(__name__)
 class TaskMonitor:
 
     MONITOR_INTERVAL_SECONDS = 2
+    # interval of checks if changes of tasks are notified by database
+    NOTIFIED_INTERVAL_SECONDS = 10
     LOCK_EXPIRED_SECONDS = MONITOR_INTERVAL_SECONDS * 30
 
     def __init__(self):
@@ -27,15 +29,21 @@ class TaskMonitor:
         db.init()
         self.config = config
 
+        listener = ChangeListener(TASKS_CHANNEL)
+        # without notifications tasks table is polled
+        interval = self.NOTIFIED_INTERVAL_SECONDS if listener.uses_db else self.MONITOR_INTERVAL_SECONDS
+
         while True:
             try:
                 self.check_tasks()
 
                 db.session.rollback()  # disable cache
-                time.sleep(self.MONITOR_INTERVAL_SECONDS)
+                # tasks are changed or interval is passed
+                listener.wait(interval)
 
             except (SystemExit, KeyboardInterrupt):
                 self.stop_all_tasks()
+                listener.close()
                 return
 
             except Exception as e:
@@ -49,16 +57,17 @@ class TaskMonitor:
             self.stop_task(task_id)
 
     def check_tasks(self):
-        allowed_tasks = set()
+        allowed_tasks = {}
 
         for task in db.session.query(db.Tasks).filter(db.Tasks.active == True):  # noqa
-            allowed_tasks.add(task.id)
+            allowed_tasks[task.id] = task
 
             # start new tasks
             if task.id not in self._active_tasks:
                 self.start_task(task)
 
         # Check active tasks
+        alive_tasks = []
         active_tasks = list(self._active_tasks.items())
         for task_id, task in active_tasks:
 
@@ -72,13 +81,15 @@ class TaskMonitor:
 
             else:
                 # need to be reloaded ?
-                record = db.Tasks.query.get(task_id)
+                record = allowed_tasks[task_id]
                 if record.reload:
                     record.reload = False
                     self.stop_task(task_id)
                 else:
-                    # set alive time of running tasks
-                    self._set_alive(task_id)
+                    alive_tasks.append(task_id)
+
+        # set alive time of running tasks
+        self._set_alive(alive_tasks)
 
     def _lock_task(self, task):
         run_by = f"{socket.gethostname()} {os.getpid()}"
@@ -105,10 +116,12 @@ class TaskMonitor:
         db.session.commit()
         return True
 
-    def _set_alive(self, task_id):
-        db_date = db.session.query(sa.func.current_timestamp()).first()[0]
-        task = db.Tasks.query.get(task_id)
-        task.alive_time = db_date
+    def _set_alive(self, task_ids: list):
+        if len(task_ids) == 0:
+            return
+        db.session.query(db.Tasks).filter(db.Tasks.id.in_(task_ids)).update(
+            {"alive_time": sa.func.current_timestamp()}, synchronize_session=False
+        )
         db.session.commit()
 
     def _unlock_task(self, task_id):
@@ -1,4 +1,7 @@
 import copy
+import queue
+import threading
+import time
 import traceback
 from mindsdb_sql import parse_sql
 from mindsdb_sql.parser.ast import Data, Identifier
@@ -18,6 +21,10 @@ logger = log.getLogger(__name__)
 
 
 class TriggerTask(BaseTask):
+    # incoming rows are executed in batches: by count of rows or by time since the first row of batch
+    BATCH_SIZE = 500
+    BATCH_WINDOW_SECONDS = 0.2
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.command_executor = None
@@ -26,6 +33,9 @@ class TriggerTask(BaseTask):
         # callback might be without context
         self._ctx_dump = ctx.dump()
 
+        # subscription waits if batches are not executed in time
+        self._rows = queue.Queue(maxsize=self.BATCH_SIZE * 10)
+
     def run(self, stop_event):
         trigger = db.Triggers.query.get(self.object_id)
 
@@ -53,21 +63,65 @@ class TriggerTask(BaseTask):
             else:
                 columns = columns.split('|')
 
-        data_handler.subscribe(stop_event, self._callback, trigger.table_name, columns=columns)
+        # batches are executed one by one in the order of rows
+        batch_thread = threading.Thread(target=self._batch_loop, name=f'trigger_{self.object_id}_batches')
+        batch_thread.start()
+        try:
+            data_handler.subscribe(stop_event, self._callback, trigger.table_name, columns=columns)
+        finally:
+            # execute the rest of rows and stop
+            self._rows.put(None)
+            batch_thread.join()
 
     def _callback(self, row, key=None):
         logger.debug(f'trigger call: {row}, {key}')
 
+        if key is not None:
+            row.update(key)
+        self._rows.put(row)
+
+    def _get_batch(self):
+        """
+        Collects rows to batch
+        :return: rows of batch and flag of the end of input
+        """
+        row = self._rows.get()
+        if row is None:
+            return [], True
+
+        rows = [row]
+        deadline = time.monotonic() + self.BATCH_WINDOW_SECONDS
+        while len(rows) < self.BATCH_SIZE:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                row = self._rows.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if row is None:
+                return rows, True
+            rows.append(row)
+        return rows, False
+
+    def _batch_loop(self):
         # set up environment
         ctx.load(self._ctx_dump)
 
         try:
-            if key is not None:
-                row.update(key)
-            table = [
-                row
-            ]
+            while True:
+                rows, finished = self._get_batch()
+                if len(rows) > 0:
+                    self._execute(rows)
+                if finished:
+                    return
+        finally:
+            db.session.remove()
+
+    def _execute(self, table):
+        logger.debug(f'trigger execute batch: {len(table)} rows')
 
+        try:
             # inject data to query
             query = copy.deepcopy(self.query)
 
@@ -89,7 +143,13 @@ class TriggerTask(BaseTask):
             if ret.error_code is not None:
                 self.set_error(ret.error_message)
 
+            db.session.commit()
         except Exception:
-            self.set_error(str(traceback.format_exc()))
-
-        db.session.commit()
+            # batch is failed, next batches have to be executed
+            db.session.rollback()
+            error = traceback.format_exc()
+            try:
+                self.set_error(error)
+            except Exception as e:
+                logger.error(f'Unable to save error of trigger {self.object_id}: {e}')
+                db.session.rollback()
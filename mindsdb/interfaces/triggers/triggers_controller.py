@@ -3,6 +3,7 @@ from mindsdb_sql.parser.ast import Identifier
 from mindsdb_sql import parse_sql, ParsingException
 
 from mindsdb.interfaces.storage import db
+from mindsdb.interfaces.storage.notifications import notify, TASKS_CHANNEL
 from mindsdb.interfaces.database.projects import ProjectController
 from mindsdb.utilities.context import context as ctx
 
@@ -84,6 +85,7 @@ class TriggersController:
         )
         db.session.add(task_record)
         db.session.commit()
+        notify(TASKS_CHANNEL)
 
     def delete(self, name, project_name):
         # check exists
@@ -104,6 +106,7 @@ class TriggersController:
         db.session.delete(trigger)
 
         db.session.commit()
+        notify(TASKS_CHANNEL)
 
     def get_trigger_record(self, name, project_name):
         project_controller = ProjectController()
@@ -2,7 +2,7 @@ from http import HTTPStatus
 import functools
 import time
 
-from prometheus_client import Histogram, Summary
+from prometheus_client import Gauge, Histogram, Summary
 
 
 INTEGRATION_HANDLER_QUERY_TIME = Summary(
@@ -23,6 +23,17 @@ _REST_API_LATENCY = Histogram(
     ('method', 'endpoint', 'status')
 )
 
+JOBS_SCHEDULE_LAG = Histogram(
+    'mindsdb_jobs_schedule_lag_seconds',
+    'Delay between planned and actual start of jobs',
+    buckets=(1, 5, 15, 30, 60, 120, 300, 600, 1800, 3600, 4 * 3600)
+)
+
+JOBS_RUNNING = Gauge(
+    'mindsdb_jobs_running',
+    'How many jobs are executed by the scheduler at the moment'
+)
+
 
 def api_endpoint_metrics(method: str, uri: str):
     def decorator_metrics(endpoint_func):
@@ -20,6 +20,7 @@ Configuration:
 
 - max_size size of cache in count of records, default is 500
 - serializer, module for serialization, default is dill
+- ttl, time to live of records in seconds, default is None (no expiration)
 
 It can be set via:
 - get_cache function:
@@ -88,11 +89,12 @@ def str_checksum(obj: str):
 
 
 class BaseCache(ABC):
-    def __init__(self, max_size=None, serializer=None):
+    def __init__(self, max_size=None, serializer=None, ttl=None):
         self.config = Config()
         if max_size is None:
             max_size = self.config["cache"].get("max_size", _CACHE_MAX_SIZE)
         self.max_size = max_size
+        self.ttl = ttl
         if serializer is None:
             serializer_module = self.config["cache"].get('serializer')
             if serializer_module == 'pickle':
@@ -153,6 +155,11 @@ class FileCache(BaseCache):
     def file_path(self, name):
         return self.path / name
 
+    def is_expired(self, path):
+        if self.ttl is None:
+            return False
+        return time.time() - os.path.getmtime(path) > self.ttl
+
     def set_df(self, name, df):
         path = self.file_path(name)
         df.to_pickle(path)
@@ -169,7 +176,7 @@ class FileCache(BaseCache):
     def get_df(self, name):
         path = self.file_path(name)
         with FileLock(self.path):
-            if not os.path.exists(path):
+            if not os.path.exists(path) or self.is_expired(path):
                 return None
             value = pd.read_pickle(path)
         return value
@@ -178,7 +185,7 @@ class FileCache(BaseCache):
         path = self.file_path(name)
 
         with FileLock(self.path):
-            if not os.path.exists(path):
+            if not os.path.exists(path) or self.is_expired(path):
                 return None
             with open(path, 'rb') as fd:
                 value = fd.read()
@@ -234,7 +241,7 @@ class RedisCache(BaseCache):
         key = self.redis_key(name)
         value = self.serialize(value)
 
-        self.client.set(key, value)
+        self.client.set(key, value, ex=self.ttl)
         # using key with category name to store all keys with modify time
         self.client.hset(self.category, key, int(time.time() * 1000))
 
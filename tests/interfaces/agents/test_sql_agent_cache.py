@@ -1,28 +1,99 @@
+import time
+import threading
+
 import pytest
 from unittest.mock import MagicMock, patch
 
+from mindsdb.interfaces.skills import sql_agent as sql_agent_module
 from mindsdb.interfaces.skills.sql_agent import SQLAgent
 
 
+class DictCache:
+    def __init__(self):
+        self.data = {}
+
+    def get(self, name):
+        return self.data.get(name)
+
+    def set(self, name, value):
+        self.data[name] = value
+
+
 @pytest.fixture
 def sql_agent_setup():
     command_executor = MagicMock()
-    cache_mock = MagicMock()
-    sql_agent = SQLAgent(command_executor=command_executor, database='test_db', cache=cache_mock)
-    return sql_agent, cache_mock
+    cache = DictCache()
+    tables = [f'test_db.table{i}' for i in range(20)]
+    sql_agent = SQLAgent(command_executor=command_executor, database='test_db', include_tables=tables, cache=cache)
+    with patch.object(SQLAgent, '_get_catalog_version', return_value=(1,)), \
+            patch.object(sql_agent_module, 'db'):
+        yield sql_agent, cache
 
 
 def test_get_table_info_cache_miss(sql_agent_setup):
-    sql_agent, cache_mock = sql_agent_setup
-    cache_mock.get.return_value = None
-    with patch.object(SQLAgent, '_fetch_table_info') as mock_fetch_table_info:
-        sql_agent.get_table_info(['test_table'])
-        mock_fetch_table_info.assert_called_once()
+    sql_agent, cache = sql_agent_setup
+    with patch.object(SQLAgent, '_get_single_table_info', side_effect=lambda table: f'info {table}') as mock_info:
+        info = sql_agent.get_table_info(['table1', 'table2'])
+        assert mock_info.call_count == 2
+
+    assert info == 'info test_db.table1\n\ninfo test_db.table2'
+    # every table is cached separately
+    assert len(cache.data) == 2
 
 
 def test_get_table_info_cache_hit(sql_agent_setup):
-    sql_agent, cache_mock = sql_agent_setup
-    cache_mock.get.return_value = {'test_table': 'table_info'}
-    with patch.object(SQLAgent, '_fetch_table_info') as mock_fetch_table_info:
-        sql_agent.get_table_info(['test_table'])
-        assert not mock_fetch_table_info.called
+    sql_agent, cache = sql_agent_setup
+    with patch.object(SQLAgent, '_get_single_table_info', side_effect=lambda table: f'info {table}') as mock_info:
+        sql_agent.get_table_info(['table1'])
+        info = sql_agent.get_table_info(['table2', 'table1'])
+        # only missing table is fetched
+        assert mock_info.call_count == 2
+
+    assert info == 'info test_db.table2\n\ninfo test_db.table1'
+
+    # catalog is changed: cache is not used
+    with patch.object(SQLAgent, '_get_catalog_version', return_value=(2,)), \
+            patch.object(SQLAgent, '_get_single_table_info', return_value='new info') as mock_info:
+        assert sql_agent.get_table_info(['table1']) == 'new info'
+        assert mock_info.call_count == 1
+
+
+def test_get_table_info_refresh(sql_agent_setup):
+    sql_agent, cache = sql_agent_setup
+    with patch.object(SQLAgent, '_get_single_table_info', return_value='old info'):
+        sql_agent.get_table_info(['table1'])
+
+    # make cached info outdated
+    for value in cache.data.values():
+        value['created_at'] = time.time() - sql_agent_module.TABLE_INFO_REFRESH_SECONDS - 1
+
+    with patch.object(SQLAgent, '_get_single_table_info', return_value='new info'), \
+            patch.object(sql_agent_module, 'run_in_background', side_effect=lambda key, func: func()) as bg:
+        # outdated info is returned and refreshed in background
+        assert sql_agent.get_table_info(['table1']) == 'old info'
+        assert bg.call_count == 1
+        assert sql_agent.get_table_info(['table1']) == 'new info'
+
+
+def test_get_table_info_parallel(sql_agent_setup):
+    sql_agent, cache = sql_agent_setup
+
+    active = []
+    max_active = [0]
+    lock = threading.Lock()
+
+    def get_info(table):
+        with lock:
+            active.append(table)
+            max_active[0] = max(max_active[0], len(active))
+        time.sleep(0.02)
+        with lock:
+            active.remove(table)
+        return f'info {table}'
+
+    with patch.object(SQLAgent, '_get_single_table_info', side_effect=get_info):
+        info = sql_agent.get_table_info()
+
+    # order of tables is kept
+    assert info == '\n\n'.join(f'info test_db.table{i}' for i in range(20))
+    assert 1 < max_active[0] <= sql_agent_module.TABLE_INFO_MAX_WORKERS
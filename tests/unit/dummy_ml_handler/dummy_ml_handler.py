@@ -4,6 +4,7 @@ from mindsdb.integrations.libs.base import BaseMLEngine
 
 class DummyHandler(BaseMLEngine):
     name = 'dummy_ml'
+    accepts_training_data = True
 
     @staticmethod
     def create_validation(target, args=None, **kwargs):
@@ -12,8 +13,11 @@ class DummyHandler(BaseMLEngine):
         if 'error' in args.get('using', {}):
             raise RuntimeError()
 
-    def create(self, target, args=None, **kwargs):
+    def create(self, target, args=None, df=None, **kwargs):
         self.model_storage.json_set('args', args['using'])
+        if hasattr(df, 'iter_batches'):
+            # sizes of batches of streamed training data
+            self.model_storage.json_set('training_data', {'batches': [len(batch) for batch in df.iter_batches()]})
 
     def predict(self, df, args=None):
         df['predicted'] = 42
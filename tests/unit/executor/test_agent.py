@@ -149,6 +149,38 @@ class TestAgent(BaseExecutorDummyML):
         if not found:
             raise AttributeError('Agent response is not found')
 
+    @patch('openai.OpenAI')
+    def test_agent_cache(self, mock_openai):
+        from mindsdb.interfaces.agents import langchain_agent
+
+        agent_response = 'how can I assist you today?'
+        set_openai_completion(mock_openai, agent_response)
+
+        self.run_sql('''
+            CREATE AGENT my_agent
+            USING
+             provider='openai',
+             model = "gpt-3.5-turbo",
+             openai_api_key='--',
+             prompt_template="Answer the user input in a helpful way"
+         ''')
+
+        with patch.object(
+            langchain_agent, 'create_chat_model', wraps=langchain_agent.create_chat_model
+        ) as create_chat_model:
+            for i in range(3):
+                ret = self.run_sql(f"select * from my_agent where question = 'hi {i}'")
+                assert agent_response in ret.answer[0]
+
+            # agent is constructed once
+            assert create_chat_model.call_count == 1
+
+            # altered agent is constructed again
+            self.run_sql("update agent my_agent set prompt_template='Answer the user input shortly'")
+            ret = self.run_sql("select * from my_agent where question = 'hi'")
+            assert agent_response in ret.answer[0]
+            assert create_chat_model.call_count == 2
+
     @patch('openai.OpenAI')
     def test_agent_retrieval(self, mock_openai):
 
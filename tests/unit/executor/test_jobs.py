@@ -1,4 +1,6 @@
 import datetime as dt
+import threading
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
@@ -72,7 +74,7 @@ class TestJobs(BaseExecutorDummyML):
         self.run_sql('drop job proj1.j1')
 
         # ------------ executing
-        scheduler.check_timetable()
+        scheduler.check_timetable(wait=True)
 
         # check query to integration
         job = self.db.Jobs.query.filter(self.db.Jobs.name == 'j2').first()
@@ -90,7 +92,7 @@ class TestJobs(BaseExecutorDummyML):
         assert ret.project[0] == 'proj2' and ret.name[0] == 'j2'
 
         # run once again
-        scheduler.check_timetable()
+        scheduler.check_timetable(wait=True)
 
         # job wasn't executed
         ret = self.run_sql('select * from log.jobs_history', database='proj2')
@@ -101,7 +103,7 @@ class TestJobs(BaseExecutorDummyML):
         job.next_run_at = job.start_at - dt.timedelta(seconds=1)  # different time because there is unique key
         self.db.session.commit()
 
-        scheduler.check_timetable()
+        scheduler.check_timetable(wait=True)
 
         ret = self.run_sql('select * from log.jobs_history', database='proj2')
         assert len(ret) == 2  # was executed
@@ -132,7 +134,7 @@ class TestJobs(BaseExecutorDummyML):
         self.db.session.commit()
 
         # run scheduler
-        scheduler.check_timetable()
+        scheduler.check_timetable(wait=True)
 
         ret = self.run_sql('select * from log.jobs_history')
         # no history
@@ -164,7 +166,7 @@ class TestJobs(BaseExecutorDummyML):
         assert len(ret) == 1, "should be 1 job"
 
         # run scheduler
-        scheduler.check_timetable()
+        scheduler.check_timetable(wait=True)
 
         # check no models created
         ret = self.run_sql('select * from models where name="pred"')
@@ -179,7 +181,7 @@ class TestJobs(BaseExecutorDummyML):
         assert len(ret) == 1, "should be 1 job"
 
         # run scheduler
-        scheduler.check_timetable()
+        scheduler.check_timetable(wait=True)
 
         # check 1 model
         ret = self.run_sql('select * from models where name="pred"')
@@ -218,7 +220,7 @@ class TestJobs(BaseExecutorDummyML):
           every hour
         ''')
 
-        scheduler.check_timetable()
+        scheduler.check_timetable(wait=True)
 
         # table size didn't change
         calls = data_handler().query.call_args_list
@@ -236,7 +238,7 @@ class TestJobs(BaseExecutorDummyML):
         job.next_run_at = job.start_at - dt.timedelta(seconds=1)  # different time because there is unique key
         self.db.session.commit()
 
-        scheduler.check_timetable()
+        scheduler.check_timetable(wait=True)
 
         calls = data_handler().query.call_args_list
 
@@ -245,3 +247,75 @@ class TestJobs(BaseExecutorDummyML):
         # getting next value, greater than max previous
         assert 'a > 2' in sql
         assert "b = 'b'" in sql
+
+    def test_concurrent_jobs(self):
+        from mindsdb.interfaces.jobs.scheduler import Scheduler, fair_order
+
+        self.run_sql('create database proj1')
+        self.run_sql('create job proj1.j1 (select 1)')
+        self.run_sql('create job proj1.j2 (select 1)')
+        self.run_sql('create job mindsdb.j3 (select 1)')
+
+        scheduler = Scheduler({'jobs': {'max_workers': 4, 'max_project_tasks': 1, 'max_company_tasks': 4}})
+
+        release = threading.Event()
+        started = []
+
+        def execute(record_id, history_id):
+            started.append(record_id)
+            release.wait(10)
+
+        with patch('mindsdb.interfaces.jobs.scheduler.execute_async', side_effect=execute):
+            scheduler.check_timetable()
+
+            # one job per project is started, dispatch doesn't wait for jobs
+            assert len(started) == 2
+            history_ids = [task['history_id'] for task in scheduler.tasks.values()]
+
+            # last date of all running jobs is updated
+            updated_at = dt.datetime.now() - dt.timedelta(seconds=1)
+            scheduler.update_heartbeats()
+            for history_id in history_ids:
+                assert self.db.JobsHistory.query.get(history_id).updated_at > updated_at
+
+            # running jobs are not started again
+            scheduler.check_timetable()
+            assert len(started) == 2
+
+            release.set()
+            scheduler.wait_tasks()
+
+            scheduler.check_timetable(wait=True)
+            assert len(started) == 3
+        scheduler.stop_thread()
+
+        # companies take turns
+        records = [
+            SimpleNamespace(id=1, company_id=1),
+            SimpleNamespace(id=2, company_id=1),
+            SimpleNamespace(id=3, company_id=2),
+        ]
+        assert [record.id for record in fair_order(records)] == [1, 3, 2]
+
+    def test_job_notifications(self):
+        from mindsdb.interfaces.jobs.jobs_controller import JobsExecutor
+        from mindsdb.interfaces.storage.notifications import ChangeListener, JOBS_CHANNEL
+
+        listener = ChangeListener(JOBS_CHANNEL)
+        try:
+            # sqlite doesn't send notifications between processes
+            assert not listener.uses_db
+            assert listener.wait(0) is False
+
+            # scheduler is woken up by new job
+            self.run_sql("create job j1 (select 1) start '2090-01-01'")
+            assert listener.wait(1) is True
+            assert listener.wait(0) is False
+        finally:
+            listener.close()
+
+        # scheduler sleeps until the next job
+        job = self.db.Jobs.query.filter(self.db.Jobs.name == 'j1').first()
+        executor = JobsExecutor()
+        assert executor.get_next_run_at() == dt.datetime(2090, 1, 1)
+        assert executor.get_next_run_at(exclude_ids=[job.id]) is None
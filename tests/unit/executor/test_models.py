@@ -1,3 +1,4 @@
+import os
 import datetime as dt
 import pytest
 
@@ -148,6 +149,62 @@ class TestModels(BaseExecutorDummyML):
         ''')
         assert ret['a'][0] == 10
 
+    def test_stream_training_data(self):
+        from mindsdb.utilities.config import Config
+
+        df = pd.DataFrame([
+            {'a': 1, 'b': dt.datetime(2020, 1, 1)},
+            {'a': 2, 'b': None},
+            {'a': 3, 'b': dt.datetime(2020, 1, 3)},
+        ])
+        self.save_file('tasks', df)
+
+        self.run_sql(
+            '''
+                CREATE model mindsdb.task_model
+                from files (select * from tasks)
+                PREDICT a
+                using engine='dummy_ml',
+                stream_training_data=true,
+                join_learn_process=true
+            '''
+        )
+        self.wait_predictor('mindsdb', 'task_model')
+
+        record = self.db.Predictor.query.filter_by(name='task_model').first()
+        assert record.status == 'complete'
+        assert record.training_data_rows_count == 3
+        assert record.training_data_columns_count == 2
+
+        # the option isn't passed to the engine
+        assert record.learn_args['stream_training_data'] is True
+        assert 'stream_training_data' not in record.learn_args['using']
+
+        # files can't be fetched by batches: the engine gets dataframe
+        assert self.db.JsonStorage.query.filter_by(name='training_data', resource_id=record.id).first() is None
+
+        # data is fetched from integration by batches and passed to the engine
+        self.set_data('tasks', df)
+        self.run_sql(
+            '''
+                CREATE model mindsdb.task_model2
+                from dummy_data (select * from tasks)
+                PREDICT a
+                using engine='dummy_ml',
+                stream_training_data=true,
+                join_learn_process=true
+            '''
+        )
+        self.wait_predictor('mindsdb', 'task_model2')
+        record = self.db.Predictor.query.filter_by(name='task_model2').first()
+        assert record.training_data_rows_count == 3
+        storage = self.db.JsonStorage.query.filter_by(name='training_data', resource_id=record.id).first()
+        assert storage.content == {'batches': [3]}
+
+        # spilled data is removed after training
+        tmp_dir = Config()['paths']['tmp']
+        assert not [name for name in os.listdir(tmp_dir) if name.startswith('training_data_')]
+
     def test_predict_partition(self):
         df = pd.DataFrame([
             {'a': 1, 'b': dt.datetime(2020, 1, 1)},
@@ -21,6 +21,13 @@ from tests.unit.executor_test_base import BaseUnitTest
 class TestMongoDBServer(BaseUnitTest):
 
     def test_mongo_server(self):
+        self.run_server_tests(server_config=None)
+
+    def test_async_mongo_server(self):
+        # every connection of the client is served by the same two workers
+        self.run_server_tests(server_config={'type': 'async', 'workers': 2})
+
+    def run_server_tests(self, server_config):
 
         # mock sqlquery
         with patch('mindsdb.api.executor.command_executor.ExecuteCommands.execute_command') as mock_executor:
@@ -42,9 +49,13 @@ class TestMongoDBServer(BaseUnitTest):
 
             os.environ['MINDSDB_CONFIG_PATH'] = cfg_file
 
-            from mindsdb.api.mongo.server import MongoServer
+            from mindsdb.api.mongo.server import MongoServer, AsyncMongoServer
 
-            server = MongoServer(config)
+            if server_config is None:
+                server = MongoServer(config)
+            else:
+                config['api']['mongodb']['server'] = server_config
+                server = AsyncMongoServer(config)
             server_thread = threading.Thread(
                 name='Mongo server',
                 target=server.serve_forever,
@@ -94,6 +105,35 @@ class TestMongoDBServer(BaseUnitTest):
         '''
         assert parse_sql(expected_sql, 'mindsdb').to_string() == ast.to_string()
 
+    def t_get_more(self, client_con, mock_executor):
+        # ==== test cursor with several batches ===
+        mock_executor.side_effect = lambda x: ExecuteAnswer(
+            data=ResultSet(columns=[Column('a')], values=[[i] for i in range(250)])
+        )
+
+        res = list(client_con.mindsdb.fish_model1.find({}, batch_size=100))
+        assert [row['a'] for row in res] == list(range(250))
+        # the query is executed once
+        assert mock_executor.call_count == 1
+
+        cursor = client_con.mindsdb.fish_model1.aggregate([{'$match': {}}], batchSize=10)
+        assert len(list(cursor)) == 250
+
+        # first batch and cursor id
+        ret = client_con.mindsdb.command('find', 'fish_model1', filter={}, batchSize=100)
+        assert len(ret['cursor']['firstBatch']) == 100
+        cursor_id = ret['cursor']['id']
+        assert cursor_id != 0
+
+        ret = client_con.mindsdb.command('getMore', cursor_id, collection='fish_model1', batchSize=100)
+        assert [row['a'] for row in ret['cursor']['nextBatch']] == list(range(100, 200))
+
+        ret = client_con.mindsdb.command('killCursors', 'fish_model1', cursors=[cursor_id])
+        assert ret['cursorsKilled'] == [cursor_id]
+
+        ret = client_con.mindsdb.command('getMore', cursor_id, collection='fish_model1', check=False)
+        assert ret['code'] == 43
+
     def t_single_join(self, client_con, mock_executor):
         # ==== test join ===
 
@@ -0,0 +1,182 @@
+import datetime as dt
+import struct
+import threading
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import psycopg2
+
+from mindsdb.api.executor import ResultSet
+from mindsdb.api.executor.data_types.answer import ExecuteAnswer
+from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_encoding import encode_column, iter_data_rows
+from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_fields import POSTGRES_TYPES, TypedField
+
+from tests.unit.executor_test_base import BaseUnitTest
+
+
+def get_test_df():
+    return pd.DataFrame({
+        'i': [1, 2, 3],
+        'f': [1.5, np.nan, np.inf],
+        's': ['a', None, 'c'],
+        'b': [True, False, True],
+        't': pd.to_datetime(['2024-01-02 03:04:05', '2024-01-02 00:00:00', None]),
+        'o': [{'x': 1}, [1, 2], dt.date(2024, 1, 2)],
+    })
+
+
+class TestPostgresEncoding:
+
+    def test_text(self):
+        df = get_test_df()
+        fields = [TypedField(name=name, postgres_type=POSTGRES_TYPES.VARCHAR) for name in df.columns]
+
+        chunks = list(iter_data_rows(df, fields, chunk_size=1))
+        # chunk per row
+        assert len(chunks) == 3
+        row = chunks[1]
+        assert row[:1] == b'D'
+        assert struct.unpack('!i', row[1:5])[0] == len(row) - 1
+        assert struct.unpack('!h', row[5:7])[0] == 6
+
+        assert encode_column(df['i'], fields[0]) == [b'\x00\x00\x00\x011', b'\x00\x00\x00\x012', b'\x00\x00\x00\x013']
+        assert encode_column(df['f'], fields[1])[1:] == [b'\xff\xff\xff\xff', b'\x00\x00\x00\x08Infinity']
+        assert encode_column(df['b'], fields[3])[1] == b'\x00\x00\x00\x05false'
+        assert encode_column(df['t'], fields[4]) == [
+            b'\x00\x00\x00\x132024-01-02 03:04:05', b'\x00\x00\x00\x132024-01-02 00:00:00', b'\xff\xff\xff\xff'
+        ]
+        assert encode_column(df['o'], fields[5]) == [
+            b'\x00\x00\x00\x08{"x": 1}', b'\x00\x00\x00\x06[1, 2]', b'\x00\x00\x00\x0a2024-01-02'
+        ]
+
+    def test_binary(self):
+        df = get_test_df()
+
+        field = TypedField(name='i', postgres_type=POSTGRES_TYPES.LONG, format_code=1)
+        assert encode_column(df['i'], field)[2] == struct.pack('!iq', 8, 3)
+
+        field = TypedField(name='f', postgres_type=POSTGRES_TYPES.DOUBLE, format_code=1)
+        cells = encode_column(df['f'], field)
+        assert cells[0] == struct.pack('!id', 8, 1.5)
+        assert cells[1] == b'\xff\xff\xff\xff'
+
+        field = TypedField(name='t', postgres_type=POSTGRES_TYPES.DATETIME, format_code=1)
+        cells = encode_column(df['t'], field)
+        microseconds = (dt.datetime(2024, 1, 2, 3, 4, 5) - dt.datetime(2000, 1, 1)) // dt.timedelta(microseconds=1)
+        assert cells[0] == struct.pack('!iq', 8, microseconds)
+        assert cells[2] == b'\xff\xff\xff\xff'
+
+        field = TypedField(name='b', postgres_type=POSTGRES_TYPES.BOOL, format_code=1)
+        assert encode_column(df['b'], field) == [b'\x00\x00\x00\x01\x01', b'\x00\x00\x00\x01\x00', b'\x00\x00\x00\x01\x01']
+
+        # values out of range of int4 are sent as NULL
+        field = TypedField(name='i', postgres_type=POSTGRES_TYPES.INT, format_code=1)
+        cells = encode_column(pd.Series([1, 2 ** 31, -2 ** 31]), field)
+        assert cells == [struct.pack('!ii', 4, 1), b'\xff\xff\xff\xff', struct.pack('!ii', 4, -2 ** 31)]
+
+        # binary text is the same as text
+        field = TypedField(name='s', postgres_type=POSTGRES_TYPES.VARCHAR, format_code=1)
+        assert encode_column(df['s'], field)[0] == b'\x00\x00\x00\x01a'
+
+
+class TestPostgresServer(BaseUnitTest):
+
+    def test_select(self):
+        from mindsdb.api.postgres.postgres_proxy.postgres_proxy import PostgresProxyHandler, TcpServer
+
+        df = get_test_df()
+
+        server = TcpServer(('127.0.0.1', 55439), PostgresProxyHandler)
+        server.connection_id = 0
+        server.check_auth = lambda *args, **kwargs: {'success': True, 'username': 'mindsdb'}
+        server.daemon_threads = True
+        server.block_on_close = False
+        server_thread = threading.Thread(name='Postgres server', target=server.serve_forever)
+        server_thread.start()
+
+        try:
+            with patch('mindsdb.api.executor.command_executor.ExecuteCommands.execute_command') as mock_executor:
+                mock_executor.side_effect = lambda x: ExecuteAnswer(data=ResultSet().from_df(df))
+
+                con = psycopg2.connect(host='127.0.0.1', port=55439, user='mindsdb', dbname='mindsdb')
+                con.autocommit = True
+                cur = con.cursor()
+                cur.execute('select * from tbl')
+                rows = cur.fetchall()
+                con.close()
+        finally:
+            server.shutdown()
+            server_thread.join()
+            server.server_close()
+
+        # values are converted by client using types from RowDescription
+        assert rows[0][:5] == (1, 1.5, 'a', True, dt.datetime(2024, 1, 2, 3, 4, 5))
+        assert rows[1][:5] == (2, None, None, False, dt.datetime(2024, 1, 2))
+        assert rows[2][1] == float('inf')
+        assert rows[2][4] is None
+        assert [row[5] for row in rows] == ['{"x": 1}', '[1, 2]', '2024-01-02']
+
+    def test_mysql_types(self):
+        from mindsdb.api.postgres.postgres_proxy.postgres_proxy import PostgresProxyHandler, TcpServer
+
+        server = TcpServer(('127.0.0.1', 55441), PostgresProxyHandler)
+        server.connection_id = 0
+        server.check_auth = lambda *args, **kwargs: {'success': True, 'username': 'mindsdb'}
+        server.daemon_threads = True
+        server.block_on_close = False
+        server_thread = threading.Thread(name='Postgres server', target=server.serve_forever)
+        server_thread.start()
+
+        try:
+            con = psycopg2.connect(host='127.0.0.1', port=55441, user='mindsdb', dbname='mindsdb')
+            con.autocommit = True
+            cur = con.cursor()
+            # columns of the answer have mysql types
+            cur.execute('show create table tbl')
+            rows = cur.fetchall()
+            description = cur.description
+            con.close()
+        finally:
+            server.shutdown()
+            server_thread.join()
+            server.server_close()
+
+        # var_string is sent as text
+        assert [column.type_code for column in description] == [25, 25]
+        assert rows[0][1].startswith('create table')
+
+    def test_async_server(self):
+        from mindsdb.api.common.async_server import AsyncServer
+        from mindsdb.api.postgres.postgres_proxy.postgres_proxy import AsyncPostgresProxyHandler
+
+        df = get_test_df()
+
+        server = AsyncServer(('127.0.0.1', 55440), AsyncPostgresProxyHandler, {'workers': 2, 'idle_timeout': 60})
+        server.connection_id = 0
+        server.check_auth = lambda *args, **kwargs: {'success': True, 'username': 'mindsdb'}
+        server_thread = threading.Thread(name='Postgres async server', target=server.serve_forever)
+        server_thread.start()
+
+        connections = []
+        try:
+            with patch('mindsdb.api.executor.command_executor.ExecuteCommands.execute_command') as mock_executor:
+                mock_executor.side_effect = lambda x: ExecuteAnswer(data=ResultSet().from_df(df))
+
+                # idle connections don't hold workers
+                for _ in range(10):
+                    con = psycopg2.connect(host='127.0.0.1', port=55440, user='mindsdb', dbname='mindsdb')
+                    con.autocommit = True
+                    connections.append(con)
+
+                for con in connections:
+                    cur = con.cursor()
+                    cur.execute('select * from tbl')
+                    assert len(cur.fetchall()) == 3
+                assert len(server.connections) == 10
+        finally:
+            for con in connections:
+                con.close()
+            server.shutdown()
+            server_thread.join()
+            server.server_close()
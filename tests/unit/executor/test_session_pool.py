@@ -0,0 +1,34 @@
+from tests.unit.executor_test_base import BaseExecutorDummyML
+
+
+class TestSessionPool(BaseExecutorDummyML):
+
+    def test_reuse(self):
+        from mindsdb.api.executor.controllers import SessionPool
+        from mindsdb.api.mysql.mysql_proxy.classes.fake_mysql_proxy import FakeMysqlProxy
+
+        pool = SessionPool()
+        with pool.session() as session:
+            proxy = FakeMysqlProxy(session=session)
+            proxy.set_context({'db': 'proj', 'show_secrets': True})
+            session.register_stmt(None)
+
+        with pool.session() as session2:
+            # state is reset, controllers are kept
+            assert session2 is session
+            assert session2.database is None
+            assert session2.prepared_stmts == {}
+            assert session2.show_secrets is False
+
+            # session in use is not shared
+            with pool.session() as session3:
+                assert session3 is not session2
+
+        # catalog is changed
+        self.run_sql('create project proj2')
+        with pool.session() as session4:
+            assert session4 is not session
+            assert session4 is not session3
+
+        with pool.session() as session5:
+            assert session5 is session4
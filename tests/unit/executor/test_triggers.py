@@ -0,0 +1,96 @@
+import threading
+import time
+from unittest.mock import patch
+
+from mindsdb_sql.parser.ast import Data
+
+from mindsdb.api.executor.data_types.answer import ExecuteAnswer
+
+from tests.unit.executor_test_base import BaseExecutorDummyML
+
+
+class TestTriggers(BaseExecutorDummyML):
+
+    def test_batches(self):
+        from mindsdb.interfaces.triggers.trigger_task import TriggerTask
+
+        self.run_sql('''
+              create trigger trigger1
+              on dummy_data.table1 (select * from TABLE_DELTA)
+        ''')
+        trigger = self.db.Triggers.query.filter_by(name='trigger1').first()
+        task = self.db.Tasks.query.filter_by(object_type='trigger', object_id=trigger.id).first()
+
+        def subscribe(stop_event, callback, table_name, columns=None, **kwargs):
+            for i in range(1200):
+                callback({'a': i})
+            # the last row comes after time window
+            time.sleep(TriggerTask.BATCH_WINDOW_SECONDS * 2)
+            callback({'a': 1200})
+
+        batches = []
+
+        def execute_command(query):
+            assert isinstance(query.from_table, Data)
+            batches.append(query.from_table.data)
+            return ExecuteAnswer()
+
+        with patch(
+            'mindsdb.integrations.handlers.dummy_data_handler.dummy_data_handler.DummyHandler.subscribe',
+            side_effect=subscribe
+        ), patch(
+            'mindsdb.api.executor.command_executor.ExecuteCommands.execute_command',
+            side_effect=execute_command
+        ):
+            TriggerTask(task.id, trigger.id).run(threading.Event())
+
+        # rows are executed by batches in the order of input
+        assert [len(batch) for batch in batches][:2] == [500, 500]
+        assert len(batches[-1]) == 1
+        assert [row['a'] for batch in batches for row in batch] == list(range(1201))
+
+    def test_failed_batch(self):
+        from mindsdb.interfaces.triggers.trigger_task import TriggerTask
+
+        self.run_sql('''
+              create trigger trigger1
+              on dummy_data.table1 (select * from TABLE_DELTA)
+        ''')
+        trigger = self.db.Triggers.query.filter_by(name='trigger1').first()
+        task = self.db.Tasks.query.filter_by(object_type='trigger', object_id=trigger.id).first()
+
+        def subscribe(stop_event, callback, table_name, columns=None, **kwargs):
+            for i in range(3):
+                callback({'a': i})
+                time.sleep(TriggerTask.BATCH_WINDOW_SECONDS * 2)
+
+        batches = []
+        commit = self.db.session.commit
+
+        def execute_command(query):
+            batches.append(query.from_table.data)
+            return ExecuteAnswer()
+
+        calls = []
+
+        # commit of the first batch fails
+        def failing_commit():
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError('lost connection')
+            return commit()
+
+        with patch(
+            'mindsdb.integrations.handlers.dummy_data_handler.dummy_data_handler.DummyHandler.subscribe',
+            side_effect=subscribe
+        ), patch(
+            'mindsdb.api.executor.command_executor.ExecuteCommands.execute_command',
+            side_effect=execute_command
+        ), patch('mindsdb.interfaces.triggers.trigger_task.db.session.commit', side_effect=failing_commit):
+            TriggerTask(task.id, trigger.id).run(threading.Event())
+
+        # failed batch doesn't stop the next ones
+        assert len(batches) == 3
+        self.db.session.expire_all()
+        task = self.db.Tasks.query.get(task.id)
+        assert 'lost connection' in task.last_error
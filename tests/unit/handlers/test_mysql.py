@@ -1,10 +1,13 @@
 from collections import OrderedDict
+import datetime as dt
 import unittest
-from unittest.mock import patch
+from unittest.mock import patch, MagicMock
 
-from mysql.connector import Error as MySQLError
+import pandas as pd
+from mysql.connector import Error as MySQLError, FieldType
 
-from base_handler_test import BaseDatabaseHandlerTest
+from base_handler_test import BaseDatabaseHandlerTest, MockCursorContextManager
+from mindsdb.integrations.handlers.mysql_handler import mysql_handler as mysql_handler_module
 from mindsdb.integrations.handlers.mysql_handler.mysql_handler import MySQLHandler
 
 
@@ -51,6 +54,67 @@ class TestMySQLHandler(BaseDatabaseHandlerTest, unittest.TestCase):
     def create_patcher(self):
         return patch('mysql.connector.connect')
 
+    def test_native_query_batches(self):
+        """
+        Tests the `native_query_batches` method to ensure it fetches rows by batches using an unbuffered cursor
+        of a separate connection and doesn't read the rest of the result when the limit is reached
+        """
+        rows = [(i, f'text{i}') for i in range(5)]
+
+        mock_cursor = MagicMock()
+        mock_cursor.with_rows = True
+        mock_cursor.description = [('a', FieldType.LONG), ('b', FieldType.VAR_STRING)]
+        mock_cursor.fetchmany.side_effect = lambda size: [rows.pop(0) for _ in range(min(size, len(rows)))]
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value = mock_cursor
+        self.mock_connect.return_value = mock_conn
+
+        batches = list(self.handler.native_query_batches('SELECT * FROM table', batch_size=2))
+        mock_conn.cursor.assert_called_once_with(buffered=False)
+        assert [len(df) for df in batches] == [2, 2, 1]
+        assert str(batches[0]['a'].dtype) == 'int64'
+        assert batches[2]['b'].tolist() == ['text4']
+        mock_conn.close.assert_called_once()
+
+        rows = [(i, 'text') for i in range(5)]
+        mock_conn.reset_mock()
+        batches = list(self.handler.native_query_batches('SELECT * FROM table', batch_size=2, limit=2))
+        assert [len(df) for df in batches] == [2]
+        assert len(rows) == 3
+        mock_conn.shutdown.assert_called_once()
+        mock_conn.close.assert_not_called()
+
+    def test_insert(self):
+        """
+        Tests the `insert` method to ensure it inserts rows by batches and converts values to python types
+        """
+        mock_conn = MagicMock()
+        mock_cursor = MockCursorContextManager()
+        self.handler.connect = MagicMock(return_value=mock_conn)
+        mock_conn.cursor = MagicMock(return_value=mock_cursor)
+
+        df = pd.DataFrame({
+            'a': [1, 2, 3],
+            'b': [1.5, None, 2.0],
+            'c': pd.to_datetime(['2020-01-01', None, '2020-01-03'])
+        })
+        self.handler.insert('table1', df, batch_size=2)
+
+        assert mock_cursor.executemany.call_count == 2
+        query, rows = mock_cursor.executemany.call_args_list[0][0]
+        assert query == 'INSERT INTO `table1` (`a`, `b`, `c`) VALUES (%s, %s, %s)'
+        assert rows == [(1, 1.5, dt.datetime(2020, 1, 1)), (2, None, None)]
+        assert type(rows[0][0]) is int
+        assert type(rows[0][2]) is dt.datetime
+
+        # error in the second batch: rows of the first one are committed
+        mock_cursor.executemany.side_effect = [None, MySQLError('error')]
+        with self.assertLogs(mysql_handler_module.logger, level='ERROR') as logs:
+            with self.assertRaises(MySQLError):
+                self.handler.insert('table1', df, batch_size=2)
+        assert '2 of 3 rows were inserted' in logs.output[0]
+        mock_conn.rollback.assert_not_called()
+
 
 if __name__ == '__main__':
     unittest.main()
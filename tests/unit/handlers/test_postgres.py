@@ -1,4 +1,4 @@
-from collections import OrderedDict
+from collections import OrderedDict, namedtuple
 import unittest
 from unittest.mock import patch, MagicMock
 
@@ -89,6 +89,37 @@ class TestPostgresHandler(BaseDatabaseHandlerTest, unittest.TestCase):
         assert isinstance(data, Response)
         self.assertFalse(data.error_code)
 
+    def test_native_query_batches(self):
+        """
+        Tests the `native_query_batches` method to ensure it fetches rows by batches using a server-side cursor
+        of a separate connection, converts columns basing on cursor description and stops fetching at the limit
+        """
+        Column = namedtuple('Column', ['name', 'type_code'])
+        rows = [(i, f'text{i}', None if i == 3 else i / 2) for i in range(5)]
+
+        mock_cursor = MagicMock()
+        # int4, text, numeric
+        mock_cursor.description = [Column('a', 23), Column('b', 25), Column('c', 1700)]
+        mock_cursor.fetchmany.side_effect = lambda size: [rows.pop(0) for _ in range(min(size, len(rows)))]
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value = mock_cursor
+        self.mock_connect.return_value = mock_conn
+
+        batches = list(self.handler.native_query_batches('SELECT * FROM table', batch_size=2))
+        mock_conn.cursor.assert_called_once_with(name='mindsdb_batches')
+        mock_conn.close.assert_called_once()
+        assert [len(df) for df in batches] == [2, 2, 1]
+        assert str(batches[0]['a'].dtype) == 'int32'
+        assert batches[0]['b'].tolist() == ['text0', 'text1']
+        # null value in numeric column
+        assert str(batches[1]['c'].dtype) == 'float64'
+
+        rows = [(i, 'text', i) for i in range(5)]
+        batches = list(self.handler.native_query_batches('SELECT * FROM table', batch_size=2, limit=3))
+        assert [len(df) for df in batches] == [2, 1]
+        # the rest isn't fetched
+        assert len(rows) == 2
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -6,6 +6,11 @@ import pandas as pd
 import pytest
 from mindsdb_sql import parse_sql
 
+from mindsdb.integrations.handlers.langchain_embedding_handler.langchain_embedding_handler import (
+    embed_documents,
+    split_into_batches,
+)
+
 from ..executor_test_base import BaseExecutorTest
 
 
@@ -360,3 +365,48 @@ class TestLangchainEmbedding(BaseExecutorTest):
                     wrong_argument_name = 512
                 """
             )
+
+
+class TestBatchedEmbedding:
+
+    def test_split_into_batches(self):
+        texts = ["a" * 40] * 5
+        assert [len(batch) for batch in split_into_batches(texts, batch_size=2)] == [2, 2, 1]
+        # ~11 tokens per text
+        assert [len(batch) for batch in split_into_batches(texts, batch_size=10, max_batch_tokens=25)] == [2, 2, 1]
+        # too big text is sent alone
+        assert split_into_batches(["a" * 400, "b"], max_batch_tokens=10) == [["a" * 400], ["b"]]
+
+    def test_order_and_retry(self):
+        class ServerError(Exception):
+            status_code = 503
+
+        class Model:
+            def __init__(self):
+                self.calls = {}
+
+            def embed_documents(self, texts):
+                key = texts[0]
+                self.calls[key] = self.calls.get(key, 0) + 1
+                if key == "4" and self.calls[key] == 1:
+                    raise ServerError()
+                time.sleep(0.01 * (10 - int(key)))
+                return [[float(text)] for text in texts]
+
+        model = Model()
+        texts = [str(i) for i in range(10)]
+        embeddings = embed_documents(model, texts, batch_size=2, retry_backoff=0)
+        assert embeddings == [[float(i)] for i in range(10)]
+        # only failed batch is retried
+        assert model.calls == {"0": 1, "2": 1, "4": 2, "6": 1, "8": 1}
+
+        # other errors are raised
+        class WrongArgs(Exception):
+            pass
+
+        class BrokenModel:
+            def embed_documents(self, texts):
+                raise WrongArgs()
+
+        with pytest.raises(WrongArgs):
+            embed_documents(BrokenModel(), texts, batch_size=2)
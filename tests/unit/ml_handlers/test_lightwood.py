@@ -1,3 +1,4 @@
+import json
 import time
 from unittest.mock import patch
 import pandas as pd
@@ -72,6 +73,20 @@ class TestLW(BaseExecutorTest):
         # value is around 1
         assert (avg_c > 0.9) and (avg_c < 1.1)
 
+        # input values and explanation of every row
+        ret = self.run_sql('''
+           SELECT t.a, p.a as p_a, p.c, p.c_original, p.c_confidence, p.c_explain
+           FROM pg.df as t
+           JOIN proj.modelx as p
+           where t.a > 40
+        ''')
+        assert len(ret) == 9
+        assert list(ret.a) == list(ret.p_a)
+        for _, row in ret.iterrows():
+            explain = json.loads(row['c_explain'])
+            assert explain['predicted_value'] == row['c']
+            assert explain['confidence'] == row['c_confidence']
+
         # test describe
         ret = self.run_sql('describe proj.modelx.info')
         assert len(ret) == 1
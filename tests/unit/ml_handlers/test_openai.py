@@ -1,9 +1,12 @@
+import os
 import pandas
+import tempfile
 import unittest
 from collections import OrderedDict
 from unittest.mock import patch, MagicMock
 
 from mindsdb.integrations.handlers.openai_handler.openai_handler import OpenAIHandler
+from mindsdb.integrations.libs.training_data import TrainingData
 
 
 class TestOpenAI(unittest.TestCase):
@@ -667,6 +670,29 @@ class TestOpenAI(unittest.TestCase):
         with self.assertRaisesRegex(Exception, "^This model cannot be finetuned."):
             self.handler.finetune('dummy_target', args={'using': {'model_name': 'dummy_unsupported_model_name', 'prompt_template': 'dummy_prompt_template'}})
 
+    @patch('mindsdb.integrations.handlers.openai_handler.openai_handler.subprocess.run')
+    def test_prepare_ft_jsonl_from_training_data(self, mock_subprocess_run):
+        """
+        Test if training data streamed to files is written to the fine-tuning file by batches.
+        """
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            training_data = TrainingData.from_batches(
+                [
+                    pandas.DataFrame({'prompt': ['a', 'b'], 'completion': ['1', '2']}),
+                    pandas.DataFrame({'prompt': ['c'], 'completion': ['3']}),
+                ],
+                path=temp_dir
+            )
+
+            file_path = os.path.join(temp_dir, 'ft.jsonl')
+            self.handler._prepare_ft_jsonl(training_data, temp_dir, 'ft', file_path)
+
+            pandas.testing.assert_frame_equal(
+                pandas.read_json(file_path, lines=True),
+                pandas.DataFrame({'prompt': ['a', 'b', 'c'], 'completion': [1, 2, 3]})
+            )
+
     # TODO: Add more unit tests for the finetune method
 
 
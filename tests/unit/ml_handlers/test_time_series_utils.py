@@ -8,6 +8,7 @@ from mindsdb.integrations.utilities.time_series_utils import (
     spec_hierarchy_from_list,
     get_hierarchy_from_df,
     reconcile_forecasts,
+    resample_groups,
 )
 
 
@@ -80,6 +81,28 @@ def test_statsforecast_df_transformations():
     assert nixtla_df.columns.tolist() == ["unique_id", "ds", "y", "group_col_2", "group_col_3"]
 
 
+def test_resample_groups():
+    df = create_mock_df(freq="D")
+    # create gaps in both groups, and 2 values in one day
+    df = df.drop([3, 4, 40]).reset_index(drop=True)
+    df.loc[0, "time_col"] = df.loc[1, "time_col"]
+
+    resampled_df = resample_groups(df, ["group_col", "group_col_2"], "time_col", ["target_col"], "D")
+    assert resampled_df.columns.tolist() == ["group_col", "group_col_2", "time_col", "target_col"]
+
+    # every group has the full range of days
+    group_a = resampled_df[resampled_df["group_col"] == "a"]
+    assert len(group_a) == 30
+    assert group_a["time_col"].diff().dropna().eq(pd.Timedelta("1D")).all()
+    assert group_a["target_col"].iloc[0] == 1.5
+    assert group_a["target_col"].iloc[1:4].isna().tolist() == [False, True, True]
+
+    group_b = resampled_df[resampled_df["group_col"] == "b"]
+    assert len(group_b) == 31
+    assert group_b["target_col"].isna().sum() == 1
+    assert (group_b["group_col_2"] == "b2").all()
+
+
 def test_get_best_model_from_results_df():
     nixtla_df = AirPassengersDF.copy()
     nixtla_df["AutoARIMA"] = nixtla_df["y"] + 1
@@ -0,0 +1,89 @@
+import time
+import threading
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from mindsdb.integrations.libs.llm.scheduler import RequestScheduler
+from mindsdb.interfaces.agents.batch_runner import AgentBatchRunner
+from mindsdb.interfaces.agents.callback_handlers import SchedulerCallbackHandler
+
+
+class TestAgentBatchRunner:
+
+    def test_order_and_concurrency(self):
+        active = []
+        lock = threading.Lock()
+        max_active = [0]
+
+        def func(item):
+            with lock:
+                active.append(item)
+                max_active[0] = max(max_active[0], len(active))
+            # later items are completed earlier
+            time.sleep(0.005 * (20 - item))
+            with lock:
+                active.remove(item)
+            return item * 2
+
+        runner = AgentBatchRunner(func, max_workers=4)
+        assert runner.run(range(20)) == [i * 2 for i in range(20)]
+        assert max_active[0] <= 4
+
+    def test_scheduler(self):
+        scheduler = RequestScheduler(max_concurrency=2)
+        callbacks = [SchedulerCallbackHandler(scheduler)]
+        llm = FakeListChatModel(responses=['answer'])
+
+        def func(item):
+            # agent makes several requests to LLM
+            llm.invoke(f'question {item}', config={'callbacks': callbacks})
+            return llm.invoke('next question', config={'callbacks': callbacks}).content
+
+        runner = AgentBatchRunner(func, max_workers=8)
+        assert runner.run(range(10)) == ['answer'] * 10
+
+        # every request to LLM is counted, slots are released
+        metrics = scheduler.get_metrics()
+        assert metrics['requests'] == 20
+        assert metrics['tokens'] > 0
+        assert scheduler._active == 0
+
+    def test_timeout_and_errors(self):
+        def func(item):
+            if item == 1:
+                time.sleep(1)
+            if item == 2:
+                raise ValueError('error')
+            return item
+
+        runner = AgentBatchRunner(
+            func,
+            max_workers=2,
+            timeout=0.2,
+            on_error=lambda e: str(e),
+            on_timeout=lambda: 'timeout',
+        )
+        # only the slow item is timed out
+        assert runner.run(range(5)) == [0, 'timeout', 'error', 3, 4]
+
+        # without handler error is raised
+        runner = AgentBatchRunner(func, max_workers=2)
+        with pytest.raises(ValueError):
+            runner.run([0, 2])
+
+    def test_streaming(self):
+        consumed = []
+
+        def items():
+            for i in range(100):
+                consumed.append(i)
+                yield i
+
+        runner = AgentBatchRunner(lambda item: item, max_workers=2)
+        results = runner.iter_results(items())
+        assert next(results) == 0
+
+        # input is consumed gradually
+        assert len(consumed) < 10
+        results.close()
@@ -0,0 +1,123 @@
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+from mindsdb.api.executor.utilities.sql import query_df
+from mindsdb.integrations.libs.response import HandlerResponse, RESPONSE_TYPE
+from mindsdb.interfaces.chatbot import polling as polling_module
+from mindsdb.interfaces.chatbot.polling import ChatsExecutor, IncrementalPolling
+
+
+class FakeChatHandler:
+    def __init__(self):
+        self.messages = pd.DataFrame(columns=['id', 'chat_id', 'user', 'text', 'sent_at'])
+        self.queries = []
+
+    def add(self, chat_id, user, text, sent_at=None):
+        if sent_at is None:
+            sent_at = len(self.messages)
+        self.messages.loc[len(self.messages)] = [len(self.messages) + 1, chat_id, user, text, sent_at]
+
+    def query(self, query):
+        self.queries.append(query)
+        return HandlerResponse(RESPONSE_TYPE.TABLE, data_frame=query_df(self.messages, query))
+
+
+def get_chat_params():
+    return [{
+        'polling': {'type': 'incremental', 'cursor_col': 'id'},
+        'chat_table': {
+            'name': 'messages',
+            'chat_id_col': 'chat_id',
+            'username_col': 'user',
+            'text_col': 'text',
+            'time_col': 'sent_at',
+        }
+    }]
+
+
+class TestIncrementalPolling:
+
+    def test_new_messages(self):
+        chat_task = MagicMock()
+        chat_task.chat_handler = FakeChatHandler()
+        chat_task.bot_params = {'bot_username': 'bot'}
+
+        received = []
+        chat_task.on_message.side_effect = lambda chat_memory, message, table_name: received.append(message.text)
+
+        chat_task.chat_handler.add(1, 'user1', 'old message')
+
+        polling = IncrementalPolling(chat_task, get_chat_params())
+        polling.chats_executor = ChatsExecutor()
+
+        # existing messages are skipped
+        assert polling.check_new_messages(polling.params[0]) is False
+        assert polling.cursors['messages'] == 1
+
+        chat_task.chat_handler.add(1, 'user1', 'question 1')
+        chat_task.chat_handler.add(1, 'user1', 'question 2')
+        chat_task.chat_handler.add(2, 'user2', 'question 3')
+        chat_task.chat_handler.add(2, 'bot', 'answer 3')
+
+        polling.check_new_messages(polling.params[0])
+        polling.chats_executor.shutdown()
+
+        # only the last message of chat is answered, chat with the answer of bot is skipped
+        assert received == ['question 2']
+        assert polling.cursors['messages'] == 5
+
+        # only new messages are requested
+        assert 'WHERE `id` >= 1' in str(chat_task.chat_handler.queries[-1])
+
+    def test_same_cursor_value(self):
+        chat_task = MagicMock()
+        chat_task.chat_handler = FakeChatHandler()
+        chat_task.bot_params = {'bot_username': 'bot'}
+
+        received = []
+        chat_task.on_message.side_effect = lambda chat_memory, message, table_name: received.append(message.text)
+
+        chat_task.chat_handler.add(1, 'user1', 'old message 1', sent_at=10)
+        chat_task.chat_handler.add(2, 'user2', 'old message 2', sent_at=10)
+
+        # time column is used as cursor
+        params = get_chat_params()
+        del params[0]['polling']['cursor_col']
+        polling = IncrementalPolling(chat_task, params)
+        polling.chats_executor = ChatsExecutor()
+        polling.check_new_messages(polling.params[0])
+
+        # messages with the same time are on the border of batch
+        for chat_id in (3, 4, 5):
+            chat_task.chat_handler.add(chat_id, 'user', f'question {chat_id}', sent_at=20)
+        with patch.object(polling_module, 'INCREMENTAL_BATCH_SIZE', 2):
+            assert polling.check_new_messages(polling.params[0]) is True
+            chat_task.chat_handler.add(6, 'user', 'question 6', sent_at=20)
+            polling.check_new_messages(polling.params[0])
+            assert polling.check_new_messages(polling.params[0]) is False
+        polling.chats_executor.shutdown()
+
+        # every new message is received once, old messages are skipped
+        assert sorted(received) == ['question 3', 'question 4', 'question 5', 'question 6']
+
+    def test_chats_order(self):
+        executor = ChatsExecutor(max_workers=2)
+        processed = []
+        lock = threading.Lock()
+
+        def process(chat_id, i):
+            time.sleep(0.01)
+            with lock:
+                processed.append((chat_id, i))
+
+        for i in range(5):
+            for chat_id in ('a', 'b', 'c'):
+                executor.submit(chat_id, process, chat_id, i)
+        executor.shutdown()
+
+        # messages of one chat are processed in order
+        for chat_id in ('a', 'b', 'c'):
+            assert [i for chat, i in processed if chat == chat_id] == list(range(5))
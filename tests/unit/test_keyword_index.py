@@ -0,0 +1,96 @@
+import threading
+from unittest.mock import patch
+
+import pandas as pd
+from mindsdb_sql import parse_sql
+
+from mindsdb.interfaces.knowledge_base import keyword_index as keyword_index_module
+from mindsdb.interfaces.knowledge_base.controller import KnowledgeBaseTable
+from mindsdb.interfaces.knowledge_base.keyword_index import KeywordIndex, KeywordIndexStore, reciprocal_rank_fusion
+
+
+class Storage:
+    def __init__(self, path):
+        self.folder_path = path
+        self.folder_name = str(path)
+
+    def file_set(self, name, content):
+        (self.folder_path / name).write_bytes(content)
+
+    def file_get(self, name):
+        return (self.folder_path / name).read_bytes()
+
+    def pull(self):
+        pass
+
+    def push(self):
+        pass
+
+
+class TestKeywordIndex:
+
+    def test_bm25(self):
+        index = KeywordIndex()
+        index.add(
+            ['1', '2', '3'],
+            ['The quick brown fox', 'A lazy dog sleeps, the dog is lazy', 'Brown bread']
+        )
+
+        result = index.search('lazy dog', 10)
+        assert [doc_id for doc_id, _ in result] == ['2']
+
+        result = index.search('brown fox', 10)
+        assert [doc_id for doc_id, _ in result] == ['1', '3']
+
+        # replace and remove
+        index.add(['3'], ['fox'])
+        index.remove(['1'])
+        assert len(index) == 2
+        assert [doc_id for doc_id, _ in index.search('brown fox', 10)] == ['3']
+
+        index2 = KeywordIndex.from_bytes(index.to_bytes())
+        assert index2.search('fox dog', 10) == index.search('fox dog', 10)
+
+    def test_store(self, tmp_path):
+        def build():
+            index = KeywordIndex()
+            index.add(['0'], ['stored before'])
+            return index
+
+        lock = threading.Lock()
+        with patch.object(KeywordIndexStore, '_lock', lambda self: lock):
+            store = KeywordIndexStore(Storage(tmp_path), build)
+            for i in range(1, 20):
+                store.update('add', [str(i)], [f'word{i} text'])
+            store.update('remove', ['5'])
+
+            # small changes are stored as deltas
+            deltas = [path for path in tmp_path.iterdir() if path.name.startswith('keyword_index_delta')]
+            assert 0 < len(deltas) < 20
+
+            # index is loaded from snapshot and deltas
+            keyword_index_module._loaded_indexes.clear()
+            index = store.get()
+            assert len(index) == 19
+            assert '0' in index and '5' not in index
+            assert [doc_id for doc_id, _ in index.search('word7', 10)] == ['7']
+
+            store.update('clear')
+            keyword_index_module._loaded_indexes.clear()
+            assert len(store.get()) == 0
+
+    def test_rrf(self):
+        fused = reciprocal_rank_fusion([['a', 'b', 'c'], ['b', 'd']], k=60)
+        assert [doc_id for doc_id, _ in fused] == ['b', 'a', 'd', 'c']
+
+    def test_local_filters(self):
+        df = pd.DataFrame({
+            'id': ['1', '2', '3'],
+            'content': ['a', 'b', 'c'],
+            'metadata': [{'type': 'x', 'size': 1}, '{"type": "y", "size": 2}', None],
+        })
+        query = parse_sql("select * from kb where `metadata.type` = 'y' and size > 1 and id != '3'")
+        filters = KnowledgeBaseTable._split_where(query.where)
+
+        ret = KnowledgeBaseTable._filter_candidates(df, filters)
+        assert list(ret['id']) == ['2']
@@ -444,3 +444,58 @@ class TestKnowledgeBase(BaseExecutorTest):
 
         # id = 200
         assert ret.id[0] == '200'
+
+    def test_hybrid_search(self):
+        df = pd.DataFrame([
+            {'id': 'h1', 'content': 'red apple', 'category': 'fruit'},
+            {'id': 'h2', 'content': 'green apple pie', 'category': 'dessert'},
+            {'id': 'h3', 'content': 'banana bread', 'category': 'dessert'},
+            {'id': 'h4', 'content': 'yellow banana', 'category': 'fruit'},
+        ])
+        self.save_file('food', df)
+
+        self.run_sql(f"""
+            CREATE KNOWLEDGE BASE test_kb
+            USING
+            MODEL = {self.embedding_model_name},
+            STORAGE = {self.vector_database_name}.{self.vector_database_table_name},
+            content_columns = ['content'],
+            metadata_columns = ['category'],
+            hybrid_search = true
+        """)
+        self.run_sql('INSERT INTO test_kb SELECT * FROM files.food')
+
+        # embeddings are random: the only keyword match goes first after fusion
+        ret = self.run_sql("SELECT * FROM test_kb WHERE content = 'pie' LIMIT 1")
+        assert list(ret['id']) == ['h2']
+        assert 'relevance' in ret.columns
+
+        # with metadata filter
+        ret = self.run_sql("""
+            SELECT id FROM test_kb
+            WHERE content = 'apple pie' AND `metadata.category` = 'fruit'
+            LIMIT 1
+        """)
+        assert list(ret['id']) == ['h1']
+
+        # deleted records are removed from keyword index
+        self.run_sql("DELETE FROM test_kb WHERE id = 'h2'")
+        ret = self.run_sql("SELECT id FROM test_kb WHERE content = 'apple pie' LIMIT 1")
+        assert list(ret['id']) == ['h1']
+
+        # updated content is indexed
+        self.run_sql("UPDATE test_kb SET content = 'cherry pie' WHERE id = 'h3'")
+        ret = self.run_sql("SELECT id FROM test_kb WHERE content = 'cherry' LIMIT 1")
+        assert list(ret['id']) == ['h3']
+
+        self.run_sql('DROP KNOWLEDGE BASE test_kb')
+
+        # hybrid search is disabled by string value
+        self.run_sql(f"""
+            CREATE KNOWLEDGE BASE test_kb
+            USING
+            MODEL = {self.embedding_model_name},
+            STORAGE = {self.vector_database_name}.{self.vector_database_table_name},
+            hybrid_search = 'false'
+        """)
+        self.run_sql('DROP KNOWLEDGE BASE test_kb')
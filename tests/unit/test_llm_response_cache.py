@@ -0,0 +1,63 @@
+import os
+import time
+import uuid
+
+from mindsdb.integrations.libs.llm.response_cache import LLMResponseCache, get_cache_stats, is_deterministic
+from mindsdb.utilities.cache import FileCache
+
+
+class TestLLMResponseCache:
+
+    def test_cache(self, monkeypatch):
+        category = f'test_llm_responses_{uuid.uuid4().hex}'
+        monkeypatch.setattr(
+            'mindsdb.integrations.libs.llm.response_cache.get_cache',
+            lambda _, **kwargs: FileCache(category, **kwargs)
+        )
+        calls = []
+
+        def func(prompts):
+            calls.append(prompts)
+            return [prompt.upper() for prompt in prompts]
+
+        cache = LLMResponseCache('test_engine', 'model', {'temperature': 0, 'api_key': 'a'})
+        assert cache.complete(['a', 'b', 'a'], func) == ['A', 'B', 'A']
+        # identical prompts are sent once
+        assert calls == [['a', 'b']]
+
+        # api key doesn't change the key, prompt is normalized
+        cache = LLMResponseCache('test_engine', 'model', {'temperature': 0, 'api_key': 'b'})
+        assert cache.complete(['b', 'c', 'a \r\n'], func) == ['B', 'C', 'A']
+        assert calls[-1] == ['c']
+
+        # other params - other records
+        cache = LLMResponseCache('test_engine', 'model', {'temperature': 0, 'max_tokens': 10})
+        cache.complete(['a'], func)
+        assert calls[-1] == ['a']
+
+        stats = get_cache_stats()['test_engine']
+        assert stats['hits'] == 2 and stats['misses'] == 5
+
+    def test_bypass(self):
+        assert is_deterministic({'temperature': 0})
+        assert not is_deterministic({})
+        assert not is_deterministic({'temperature': 0.7})
+        assert not is_deterministic({'temperature': 0, 'n': 2})
+
+        calls = []
+        cache = LLMResponseCache('test_engine', 'model', {'temperature': 1})
+        assert not cache.enabled
+        cache.complete(['a'], lambda prompts: calls.append(prompts) or prompts)
+        cache.complete(['a'], lambda prompts: calls.append(prompts) or prompts)
+        assert len(calls) == 2
+
+    def test_ttl(self):
+        cache = FileCache(f'test_ttl_{uuid.uuid4().hex}', ttl=60)
+        cache.set('key', 'value')
+        assert cache.get('key') == 'value'
+
+        # make record older than ttl
+        path = cache.file_path('key')
+        old = time.time() - 120
+        os.utime(path, (old, old))
+        assert cache.get('key') is None
@@ -0,0 +1,65 @@
+import time
+import threading
+
+import pytest
+
+from mindsdb.integrations.libs.llm.scheduler import RequestScheduler, TokenBucket, get_scheduler
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+class TestRequestScheduler:
+
+    def test_order_and_concurrency(self):
+        scheduler = RequestScheduler(max_concurrency=4)
+        active = []
+        lock = threading.Lock()
+        max_active = [0]
+
+        def func(item):
+            with lock:
+                active.append(item)
+                max_active[0] = max(max_active[0], len(active))
+            time.sleep(0.01 * (10 - item))
+            with lock:
+                active.remove(item)
+            return item * 2
+
+        assert scheduler.run(func, list(range(10))) == [i * 2 for i in range(10)]
+        assert max_active[0] <= 4
+        assert scheduler.get_metrics()['requests'] == 10
+
+    def test_rate_limit_retry(self):
+        scheduler = RequestScheduler(max_concurrency=4, initial_backoff=0.01)
+        calls = {}
+
+        def func(item):
+            calls[item] = calls.get(item, 0) + 1
+            if item % 2 == 0 and calls[item] == 1:
+                raise RateLimitError()
+            return item
+
+        assert scheduler.run(func, list(range(6))) == list(range(6))
+        metrics = scheduler.get_metrics()
+        assert metrics['rate_limited'] == 3
+        # concurrency is reduced
+        assert metrics['concurrency'] < 4
+
+        # other errors are raised
+        def fail(item):
+            raise ValueError('wrong')
+
+        with pytest.raises(ValueError):
+            scheduler.run(fail, [1, 2])
+
+    def test_token_bucket(self):
+        bucket = TokenBucket(per_minute=600)
+        assert bucket.reserve(600) == 0
+        # 10 tokens per second
+        assert bucket.reserve(5) == pytest.approx(0.5, abs=0.05)
+
+    def test_shared(self):
+        scheduler = get_scheduler('test:model', requests_per_minute=100)
+        assert get_scheduler('test:model', requests_per_minute=100) is scheduler
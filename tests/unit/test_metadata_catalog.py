@@ -0,0 +1,97 @@
+import time
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from mindsdb.api.executor.datahub import metadata_catalog as metadata_catalog_module
+from mindsdb.api.executor.datahub.metadata_catalog import MetadataCatalog
+
+
+@pytest.fixture
+def catalog():
+    with patch.object(MetadataCatalog, '_get_catalog_version', return_value=(1,)), \
+            patch.object(metadata_catalog_module, 'db'):
+        yield MetadataCatalog(ttl=60, timeout=0.5)
+
+
+class Fetcher:
+    def __init__(self, value, delay=0):
+        self.value = value
+        self.delay = delay
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        time.sleep(self.delay)
+        if isinstance(self.value, Exception):
+            raise self.value
+        return self.value
+
+
+class TestMetadataCatalog:
+
+    def test_cache(self, catalog):
+        fetch1, fetch2 = Fetcher(['t1']), Fetcher(['t2'])
+        requests = {('db1', 'tables'): fetch1, ('db2', 'tables'): fetch2}
+
+        assert catalog.get_many(requests) == {('db1', 'tables'): ['t1'], ('db2', 'tables'): ['t2']}
+        catalog.get_many(requests)
+        assert fetch1.calls == 1 and fetch2.calls == 1
+
+        # table is created in db1
+        catalog.invalidate('db1')
+        catalog.get_many(requests)
+        assert fetch1.calls == 2 and fetch2.calls == 1
+
+        # database is changed
+        with patch.object(MetadataCatalog, '_get_catalog_version', return_value=(2,)):
+            catalog.get_many(requests)
+        assert fetch1.calls == 3 and fetch2.calls == 2
+
+    def test_parallel_and_timeout(self, catalog):
+        active = []
+        max_active = [0]
+        lock = threading.Lock()
+
+        def fetch():
+            with lock:
+                active.append(1)
+                max_active[0] = max(max_active[0], len(active))
+            time.sleep(0.1)
+            with lock:
+                active.pop()
+            return 'value'
+
+        requests = {(f'db{i}', 'tables'): fetch for i in range(5)}
+        slow = Fetcher('slow value', delay=1)
+        requests[('slow', 'tables')] = slow
+        requests[('broken', 'tables')] = Fetcher(ValueError('error'))
+
+        start = time.time()
+        results = catalog.get_many(requests)
+        # slow integration doesn't stall others
+        assert time.time() - start < 0.9
+        assert max_active[0] > 1
+        assert results[('db0', 'tables')] == 'value'
+        assert isinstance(results[('slow', 'tables')], TimeoutError)
+        assert isinstance(results[('broken', 'tables')], ValueError)
+
+        # value is cached when it is fetched
+        time.sleep(1)
+        assert catalog.get_many({('slow', 'tables'): slow}) == {('slow', 'tables'): 'slow value'}
+        assert slow.calls == 1
+
+    def test_refresh_outdated(self, catalog):
+        catalog.get_many({('db1', 'tables'): Fetcher('old')})
+
+        # make cached data outdated
+        for key, (created_at, value) in catalog._data.items():
+            catalog._data[key] = (created_at - catalog.ttl - 1, value)
+
+        fetch = Fetcher('new', delay=0.1)
+        # outdated value is returned and refreshed in background
+        assert catalog.get_many({('db1', 'tables'): fetch}) == {('db1', 'tables'): 'old'}
+        time.sleep(0.3)
+        assert fetch.calls == 1
+        assert catalog.get_many({('db1', 'tables'): fetch}) == {('db1', 'tables'): 'new'}
@@ -0,0 +1,72 @@
+import os
+import datetime as dt
+
+import pandas as pd
+import pyarrow as pa
+
+from mindsdb.integrations.libs.training_data import TrainingData
+
+
+def get_batches():
+    # column 'b' doesn't have values in the first batch
+    yield pd.DataFrame({'a': [1, 2], 'b': [None, None], 'c': ['x', 'y']})
+    yield pd.DataFrame({'a': [3, 4], 'b': [1.5, None], 'c': ['z', None]})
+    yield pd.DataFrame({'a': [5], 'b': [-1.0], 'c': ['w']})
+
+
+class TestTrainingData:
+
+    def test_read(self):
+        with TrainingData.from_batches(get_batches()) as training_data:
+            assert training_data.rows_count == 5
+            assert training_data.columns_count == 3
+            assert len(training_data.files) == 3
+
+            df = training_data.to_df()
+            assert df['a'].tolist() == [1, 2, 3, 4, 5]
+            assert df['b'].dtype == float
+            assert df['b'].isna().sum() == 3
+
+            # batches have the same types
+            batches = list(training_data.iter_batches(columns=['b', 'a']))
+            assert [len(batch) for batch in batches] == [2, 2, 1]
+            assert all(batch['b'].dtype == float for batch in batches)
+            assert batches[0].columns.tolist() == ['b', 'a']
+
+            table = training_data.to_table()
+            assert isinstance(table, pa.Table)
+            assert table.num_rows == 5
+
+            path = training_data.path
+            assert os.path.exists(path)
+
+        # files are removed
+        assert not os.path.exists(path)
+
+    def test_stats(self):
+        with TrainingData.from_batches(get_batches()) as training_data:
+            stats = training_data.stats
+        assert stats['a'] == {'nulls': 0, 'min': 1, 'max': 5}
+        assert stats['b'] == {'nulls': 3, 'min': -1.0, 'max': 1.5}
+        assert stats['c'] == {'nulls': 1, 'min': None, 'max': None}
+
+    def test_types(self):
+        batches = [
+            pd.DataFrame({'d': [dt.datetime(2020, 1, 1)], 'mixed': [{'x': 1}], 'n': [1]}),
+            pd.DataFrame({'d': [dt.datetime(2021, 1, 1)], 'mixed': [2], 'n': ['text']}),
+        ]
+        with TrainingData.from_batches(batches) as training_data:
+            df = training_data.to_df()
+            assert training_data.stats['d']['max'] == dt.datetime(2021, 1, 1)
+
+        assert pd.api.types.is_datetime64_any_dtype(df['d'])
+        # incompatible types are converted to string
+        assert df['n'].tolist() == ['1', 'text']
+
+    def test_empty(self):
+        with TrainingData.from_batches([pd.DataFrame(columns=['a', 'b'])]) as training_data:
+            assert training_data.rows_count == 0
+            assert training_data.columns == ['a', 'b']
+            df = training_data.to_df()
+        assert len(df) == 0
+        assert df.columns.tolist() == ['a', 'b']
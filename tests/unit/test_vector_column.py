@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+
+from mindsdb_sql import parse_sql
+
+from mindsdb.api.executor.sql_query.result_set import ResultSet
+from mindsdb.api.executor.utilities.sql import query_df
+from mindsdb.integrations.libs.vector_column import (
+    VECTOR_TYPE, is_vector_column, to_vector_column, vectors_to_matrix
+)
+
+
+class TestVectorColumn:
+
+    def test_convert(self):
+        column = to_vector_column(['[1.0, 2.0]', [3, 4], None, np.array([5, 6])])
+
+        assert is_vector_column(column)
+        assert column[2] is None
+        assert column[0].dtype == np.float32
+        # rows share one matrix
+        assert column[0].base is column[1].base
+
+        matrix = vectors_to_matrix(column.dropna())
+        assert matrix.shape == (3, 2)
+        assert matrix.tolist() == [[1, 2], [3, 4], [5, 6]]
+
+        assert not is_vector_column(pd.Series(['[1.0, 2.0]']))
+        assert not is_vector_column(pd.Series([[1.0, 2.0]]))
+
+    def test_result_set_output(self):
+        vectors = np.random.rand(2, 1536).astype(np.float32)
+        df = pd.DataFrame({'id': ['a', 'b'], 'embeddings': list(vectors)})
+
+        result_set = ResultSet().from_df(df)
+        assert result_set.columns[1].type == VECTOR_TYPE
+
+        # text for mysql wire, without truncation
+        rows = result_set.to_lists()
+        assert isinstance(rows[0][1], str)
+        assert np.allclose(np.array(eval(rows[0][1])), vectors[0])
+
+        # lists for json
+        rows = result_set.to_lists(json_types=True)
+        assert rows[1][1] == vectors[1].tolist()
+
+        # internal data stays binary
+        assert isinstance(result_set.get_raw_df()[1][0], np.ndarray)
+
+    def test_query_df_keeps_vectors(self):
+        vectors = np.random.rand(3, 4).astype(np.float32)
+        df = pd.DataFrame({'id': ['a', 'b', 'c'], 'embeddings': list(vectors)})
+
+        ret = query_df(df, parse_sql("select * from df where id != 'a'"))
+        assert is_vector_column(ret['embeddings'])
+        assert np.array_equal(vectors_to_matrix(ret['embeddings']), vectors[1:])